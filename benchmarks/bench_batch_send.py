@@ -0,0 +1,71 @@
+"""
+Batched send benchmark
+
+Compares one sendto per datagram with NetSocket.send_batch (sendmmsg) for
+a tick's worth of small datagrams sent to a loopback receiver.
+
+Usage: python benchmarks/bench_batch_send.py
+"""
+
+import os
+import socket
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from litenetlib import NetSocket
+from litenetlib.utils import SENDMMSG_AVAILABLE
+
+
+class _NullManager:
+    def on_message_received(self, data, address, release=None):
+        pass
+
+    def on_network_error(self, address, error):
+        pass
+
+
+def bench(batch_sizes=(16, 128, 512), payload_size=64, number=200):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+    receiver.setblocking(False)
+    address = receiver.getsockname()
+    net_socket = NetSocket(_NullManager())
+    net_socket.start(0, True, False)
+
+    def drain():
+        try:
+            while True:
+                receiver.recv(2048)
+        except BlockingIOError:
+            pass
+
+    print(f"sendmmsg available: {SENDMMSG_AVAILABLE}")
+    print(f"{'batch':>6} {'sendto us':>10} {'batch us':>10} {'speedup':>8}")
+    try:
+        for batch_size in batch_sizes:
+            payload = bytes(payload_size)
+            datagrams = [((payload,), address)] * batch_size
+
+            def loop():
+                for buffers, addr in datagrams:
+                    net_socket.send_packet(buffers[0], addr)
+                drain()
+
+            def batch():
+                net_socket.send_batch(datagrams)
+                drain()
+
+            t_old = timeit.timeit(loop, number=number)
+            t_new = timeit.timeit(batch, number=number)
+            print(f"{batch_size:>6} {t_old / number * 1e6:>10.1f} {t_new / number * 1e6:>10.1f} "
+                  f"{t_old / t_new:>7.1f}x")
+    finally:
+        net_socket.stop()
+        receiver.close()
+
+
+if __name__ == "__main__":
+    bench()
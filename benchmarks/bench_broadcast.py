@@ -0,0 +1,55 @@
+"""
+Broadcast benchmark
+
+Measures NetManager.send_to_all to 1000 peers against sending the same message
+with peer.send per peer (the old path: every peer fragments and copies the
+payload itself). Only enqueueing is timed; channels are drained between runs.
+
+Usage: python benchmarks/bench_broadcast.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod
+from litenetlib.net_peer import NetPeer
+
+
+def _drain(manager, peers):
+    for peer in peers:
+        channel = peer.create_channel(DeliveryMethod.ReliableOrdered)
+        while channel.outgoing_queue:
+            manager.pool_recycle(channel.outgoing_queue.popleft())
+
+
+def bench(peer_count=1000, sizes=(100, 1000, 16 * 1024, 64 * 1024), rounds=5):
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    peers = [NetPeer(manager, ("10.0.%d.%d" % (i // 256, i % 256), 9000), i) for i in range(peer_count)]
+    for peer in peers:
+        manager.add_peer(peer)
+
+    print(f"{peer_count} peers")
+    print(f"{'bytes':>8} {'per-peer ms':>12} {'send_to_all ms':>15} {'speedup':>8}")
+    for size in sizes:
+        data = os.urandom(size)
+        per_peer = shared = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for peer in peers:
+                peer.send(data, 0, DeliveryMethod.ReliableOrdered)
+            per_peer = min(per_peer, time.perf_counter() - start)
+            _drain(manager, peers)
+
+            start = time.perf_counter()
+            manager.send_to_all(data, 0, DeliveryMethod.ReliableOrdered)
+            shared = min(shared, time.perf_counter() - start)
+            _drain(manager, peers)
+        print(f"{size:>8} {per_peer * 1000:>12.2f} {shared * 1000:>15.2f} {per_peer / shared:>7.2f}x")
+
+
+if __name__ == "__main__":
+    bench()
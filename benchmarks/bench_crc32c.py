@@ -0,0 +1,52 @@
+"""
+CRC32C throughput benchmark
+
+Reports MB/s for the byte-at-a-time reference loop, the pure Python
+slicing-by-8 engine and, when installed, the native C extension.
+
+Usage: python benchmarks/bench_crc32c.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from litenetlib.utils import CRC32C
+
+
+def _bytewise(data):
+    CRC32C._initialize_table()
+    table = CRC32C._TABLE
+    crc = 0xFFFFFFFF
+    for b in data:
+        crc = table[(crc ^ b) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _throughput(func, data, min_time=0.5):
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        func(data)
+        count += 1
+        elapsed = time.perf_counter() - start
+    return len(data) * count / elapsed / 1e6
+
+
+def bench(sizes=(64, 1400, 65536)):
+    engines = [("bytewise", _bytewise), ("slicing-by-8", CRC32C.compute_python)]
+    if CRC32C.use_native(True):
+        engines.append((CRC32C.engine, lambda d: CRC32C.compute(d)))
+
+    print(f"{'size':>8} " + " ".join(f"{name:>16}" for name, _ in engines) + "   (MB/s)")
+    for size in sizes:
+        data = bytearray(os.urandom(size))
+        results = [_throughput(func, data) for _, func in engines]
+        print(f"{size:>8} " + " ".join(f"{r:>16.2f}" for r in results))
+
+
+if __name__ == "__main__":
+    bench()
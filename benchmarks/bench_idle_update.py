@@ -0,0 +1,54 @@
+"""
+Idle update benchmark
+
+Measures LiteNetManager.manual_update cost with many peers that each have a
+full reliable window in flight but nothing due. With the timer wheel an
+update only touches expired timers, so the per-update time should stay
+flat as peers grow; the last column shows an update where every resend
+timer fires.
+
+Usage: python benchmarks/bench_idle_update.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.net_peer import NetPeer
+
+
+def _setup(peer_count):
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    for i in range(peer_count):
+        peer = NetPeer(manager, ("10.0.%d.%d" % (i // 256 % 256, i % 256), 9000 + i), i)
+        peer.send_user_data = lambda packet: None
+        manager.add_peer(peer)
+        for _ in range(NetConstants.DefaultWindowSize):
+            peer.send(b"x" * 32, 0, DeliveryMethod.ReliableOrdered)
+    manager.manual_update(1)  # first send of every window
+    return manager
+
+
+def bench(peer_counts=(10, 100, 1000, 3000), updates=200):
+    print(f"{'peers':>8} {'in flight':>10} {'idle us/update':>15} {'resend ms/update':>17}")
+    for count in peer_counts:
+        manager = _setup(count)
+        start = time.perf_counter()
+        for _ in range(updates):
+            manager.manual_update(0.1)
+        idle = (time.perf_counter() - start) / updates
+
+        start = time.perf_counter()
+        manager.manual_update(1000)
+        resend = time.perf_counter() - start
+
+        in_flight = count * NetConstants.DefaultWindowSize
+        print(f"{count:>8} {in_flight:>10} {idle * 1e6:>15.1f} {resend * 1e3:>17.1f}")
+
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,57 @@
+"""
+Object memory benchmark
+
+Reports traced bytes per pooled packet, per pooled event and per connected
+peer (a NetPeer with one reliable ordered channel, whose window holds the
+PendingPacket slots) using tracemalloc.
+
+Usage: python benchmarks/bench_memory.py
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod
+from litenetlib.net_event import NetEvent
+from litenetlib.net_peer import NetPeer
+
+
+def _measure(factory, count):
+    """Return traced bytes per object created by factory()"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def bench(count=10000, packet_size=64):
+    manager = NetManager(EventBasedNetListener())
+
+    def pooled_packet(_):
+        return manager.pool_get_packet(packet_size)
+
+    def pooled_event(_):
+        return NetEvent(manager)
+
+    def connected_peer(i):
+        peer = NetPeer(manager, ("10.0.%d.%d" % (i // 256 % 256, i % 256), 9000 + i), i)
+        peer.create_channel(DeliveryMethod.ReliableOrdered)
+        manager.add_peer(peer)
+        return peer
+
+    print(f"{'object':>16} {'bytes/object':>14}")
+    print(f"{'packet (%dB)' % packet_size:>16} {_measure(pooled_packet, count):>14.0f}")
+    print(f"{'event':>16} {_measure(pooled_event, count):>14.0f}")
+    print(f"{'peer':>16} {_measure(connected_peer, count // 10):>14.0f}")
+
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,69 @@
+"""
+Peer group benchmark
+
+Measures per-room broadcasts with PeerGroup against the list-based
+alternative (filtering the manager's peers per send), and the cost of a
+union/difference send. Only enqueueing is timed.
+
+Usage: python benchmarks/bench_peer_group.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod
+from litenetlib.net_peer import NetPeer
+
+
+def _drain(manager, peers):
+    for peer in peers:
+        channel = peer.create_channel(DeliveryMethod.ReliableOrdered)
+        while channel.outgoing_queue:
+            manager.pool_recycle(channel.outgoing_queue.popleft())
+
+
+def bench(room_counts=(10, 100, 1000, 2000), room_size=8, message=b"s" * 200):
+    print(f"{'rooms':>6} {'list ms':>9} {'group ms':>9} {'union-diff ms':>14}")
+    for rooms in room_counts:
+        manager = NetManager(EventBasedNetListener())
+        manager._manual_mode = True
+        peers = [NetPeer(manager, ("10.%d.%d.%d" % (i >> 16, i >> 8 & 255, i & 255), 9000), i)
+                 for i in range(rooms * room_size)]
+        for peer in peers:
+            manager.add_peer(peer)
+        groups = [manager.create_peer_group() for _ in range(rooms)]
+        room_of = {}
+        for i, peer in enumerate(peers):
+            groups[i % rooms].add(peer)
+            room_of[peer] = i % rooms
+
+        # List-based: every room send filters all peers
+        start = time.perf_counter()
+        for room in range(rooms):
+            for peer in manager.get_peers():
+                if room_of[peer] == room:
+                    peer.send(message, 0, DeliveryMethod.ReliableOrdered)
+        t_list = time.perf_counter() - start
+        _drain(manager, peers)
+
+        start = time.perf_counter()
+        for group in groups:
+            group.send(message, 0, DeliveryMethod.ReliableOrdered)
+        t_group = time.perf_counter() - start
+        _drain(manager, peers)
+
+        muted = manager.create_peer_group()
+        muted.add(peers[0])
+        start = time.perf_counter()
+        for a, b in zip(groups, groups[1:] + groups[:1]):
+            ((a | b) - muted).send(message, 0, DeliveryMethod.ReliableOrdered)
+        t_expr = time.perf_counter() - start
+        _drain(manager, peers)
+        print(f"{rooms:>6} {t_list * 1000:>9.1f} {t_group * 1000:>9.1f} {t_expr * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,44 @@
+"""
+Peer lookup benchmark
+
+Measures LiteNetManager.try_get_peer / try_get_peer_by_id cost as the number
+of peers grows. With the hash index the per-lookup time should stay flat.
+
+Usage: python benchmarks/bench_peer_lookup.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from litenetlib import NetManager, EventBasedNetListener
+
+
+class _BenchPeer:
+    """Minimal peer carrying the fields used by the manager's peer list"""
+
+    def __init__(self, id, remote_end_point):
+        self.id = id
+        self.remote_end_point = remote_end_point
+        self.next_peer = None
+        self.prev_peer = None
+
+
+def bench(peer_counts=(10, 100, 1000, 5000, 20000), lookups=200000):
+    print(f"{'peers':>8} {'endpoint ns/op':>16} {'id ns/op':>10}")
+    for count in peer_counts:
+        manager = NetManager(EventBasedNetListener())
+        for i in range(count):
+            manager.add_peer(_BenchPeer(i, ("10.0.%d.%d" % (i // 256 % 256, i % 256), 9000 + i)))
+
+        # The first peer added sits at the tail of the peer list (worst case for a linear scan)
+        end_point = ("10.0.0.0", 9000)
+        t_ep = timeit.timeit(lambda: manager.try_get_peer(end_point), number=lookups)
+        t_id = timeit.timeit(lambda: manager.try_get_peer_by_id(0), number=lookups)
+        print(f"{count:>8} {t_ep / lookups * 1e9:>16.1f} {t_id / lookups * 1e9:>10.1f}")
+
+
+if __name__ == "__main__":
+    bench()
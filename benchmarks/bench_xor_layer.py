@@ -0,0 +1,37 @@
+"""
+XorEncryptLayer benchmark
+
+Compares the per-byte XOR loop with the key stream implementation in
+XorEncryptLayer for typical packet sizes.
+
+Usage: python benchmarks/bench_xor_layer.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from litenetlib.layers import XorEncryptLayer
+
+
+def _bytewise(key, data, offset, length):
+    key_length = len(key)
+    for i in range(length):
+        data[offset + i] ^= key[i % key_length]
+
+
+def bench(sizes=(32, 512, 1400), number=2000):
+    key = b"litenetlib-key"
+    layer = XorEncryptLayer(key)
+    print(f"{'size':>6} {'bytewise us':>12} {'key stream us':>14} {'speedup':>8}")
+    for size in sizes:
+        data = bytearray(os.urandom(size))
+        t_old = timeit.timeit(lambda: _bytewise(key, data, 0, size), number=number)
+        t_new = timeit.timeit(lambda: layer.process_out_bound_packet(data, 0, size), number=number)
+        print(f"{size:>6} {t_old / number * 1e6:>12.2f} {t_new / number * 1e6:>14.2f} {t_old / t_new:>7.0f}x")
+
+
+if __name__ == "__main__":
+    bench()
@@ -14,10 +14,13 @@ from .net_utils import *
 from .net_manager import *
 from .net_peer import *
 from .net_socket import *
+from .async_net_socket import *
 from .net_statistics import *
 from .connection_request import *
 from .event_interfaces import *
 from .nat_punch_module import *
+from .sharded_server import *
+from .peer_group import *
 
 __all__ = [
     "DeliveryMethod",
@@ -32,9 +35,14 @@ __all__ = [
     "NetManager",
     "NetPeer",
     "NetSocket",
+    "AsyncNetSocket",
     "NetStatistics",
+    "TickStatistics",
     "ConnectionRequest",
     "INetEventListener",
     "EventBasedNetListener",
     "NatPunchModule",
+    "ShardedNetServer",
+    "PeerSet",
+    "PeerGroup",
 ]
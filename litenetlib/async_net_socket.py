@@ -0,0 +1,211 @@
+"""
+asyncio socket backend
+
+Alternative to NetSocket built on loop.create_datagram_endpoint. Datagrams
+and manager updates are delivered on the event loop thread, so no receive
+threads are started.
+"""
+
+import asyncio
+import socket
+from typing import Optional, Sequence, Tuple
+from .constants import NetConstants
+
+
+class _NetDatagramProtocol(asyncio.DatagramProtocol):
+    """Forwards datagrams from an asyncio transport to the manager"""
+
+    def __init__(self, owner: 'AsyncNetSocket'):
+        self._owner = owner
+        self._on_message_received = owner._net_manager.on_message_received
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self._on_message_received(data, (addr[0], addr[1]))
+
+    def error_received(self, exc: Exception) -> None:
+        if self._owner.is_running:
+            self._owner._net_manager.on_network_error(None, exc)
+
+
+class AsyncNetSocket:
+    """
+    UDP socket backend for asyncio
+
+    Same interface as NetSocket except that start() is a coroutine. While
+    running, a loop timer calls net_manager.manual_update every
+    net_manager.update_time milliseconds and the manager is switched to
+    manual mode, so listener callbacks run inline on the loop thread instead
+    of being queued for poll_events. stop() restores the previous mode.
+    """
+
+    def __init__(self, net_manager, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Initialize socket
+
+        Args:
+            net_manager: Manager receiving on_message_received/manual_update calls
+            loop: Event loop to use (running loop if None)
+        """
+        self._net_manager = net_manager
+        self._loop = loop
+        self._transport_v4: Optional[asyncio.DatagramTransport] = None
+        self._transport_v6: Optional[asyncio.DatagramTransport] = None
+        self._is_running: bool = False
+
+        # Update timer
+        self._update_handle: Optional[asyncio.TimerHandle] = None
+        self._last_update_time: float = 0.0
+
+        # Manager's manual mode before start(), restored by stop()
+        self._previous_manual_mode: Optional[bool] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if socket is running"""
+        return self._is_running
+
+    @property
+    def local_port(self) -> int:
+        """Get bound local port (0 if not running)"""
+        transport = self._transport_v4 or self._transport_v6
+        if transport is None:
+            return 0
+        return transport.get_extra_info("sockname")[1]
+
+    @staticmethod
+    def _create_socket(family: int, port: int) -> socket.socket:
+        """Create and bind a UDP socket configured like NetSocket"""
+        sock = socket.socket(family, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, NetConstants.SocketBufferSize)
+        if family == socket.AF_INET6:
+            sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+        sock.bind(("", port))
+        return sock
+
+    async def start(self, port: int, listen_ipv4: bool, listen_ipv6: bool) -> bool:
+        """
+        Start socket on the event loop
+
+        Mirrors NetSocket.start(port, listen_ipv4, listen_ipv6), including
+        becoming the manager's net_socket until stop()
+        """
+        from .net_socket import NetSocket
+
+        if self._is_running:
+            return False
+
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+
+        try:
+            if listen_ipv4:
+                self._transport_v4, _ = await self._loop.create_datagram_endpoint(
+                    lambda: _NetDatagramProtocol(self),
+                    sock=self._create_socket(socket.AF_INET, port)
+                )
+
+            if listen_ipv6 and NetSocket.ipv6_support():
+                self._transport_v6, _ = await self._loop.create_datagram_endpoint(
+                    lambda: _NetDatagramProtocol(self),
+                    sock=self._create_socket(socket.AF_INET6, port)
+                )
+        except OSError:
+            self.stop()
+            return False
+
+        self._is_running = True
+
+        # Callbacks run on the loop thread, no need to queue events
+        self._previous_manual_mode = self._net_manager._manual_mode
+        self._net_manager._manual_mode = True
+        self._last_update_time = self._loop.time()
+        self._schedule_update()
+
+        # The manager sends everything (channels, pings, ACKs) through its socket
+        self._net_manager.net_socket = self
+        return True
+
+    def _schedule_update(self) -> None:
+        """Arm the update timer"""
+        self._update_handle = self._loop.call_later(
+            self._net_manager.update_time / 1000.0, self._on_update_timer
+        )
+
+    def _on_update_timer(self) -> None:
+        """Drive manager update (resends, pings, timeouts) from the loop"""
+        if not self._is_running:
+            return
+        now = self._loop.time()
+        elapsed_ms = (now - self._last_update_time) * 1000.0
+        self._last_update_time = now
+        try:
+            self._net_manager.manual_update(elapsed_ms)
+        finally:
+            if self._is_running:
+                self._schedule_update()
+
+    def send_packet(self, data: bytes, address: Tuple[str, int], ipv6: bool = False) -> int:
+        """
+        Send packet to address
+
+        C# method: internal int SendPacket(byte[] data, int offset, int size, Socket target, EndPoint remoteEndPoint)
+        """
+        transport = self._transport_v6 if ipv6 and self._transport_v6 is not None else self._transport_v4
+        if transport is None or transport.is_closing():
+            return 0
+        transport.sendto(data, address)
+        return len(data)
+
+    def send_packet_buffers(self, buffers: Sequence, address: Tuple[str, int], ipv6: bool = False) -> int:
+        """
+        Send one datagram gathered from several buffers
+
+        Datagram transports have no scatter-gather send, so the buffers are
+        joined (see NetSocket.send_packet_buffers).
+        """
+        return self.send_packet(b"".join(buffers), address, ipv6)
+
+    def send_batch(self, datagrams: Sequence[Tuple[Sequence, Tuple[str, int]]]) -> Tuple[int, int]:
+        """
+        Send many datagrams (see NetSocket.send_batch)
+
+        The transport has no batched send, so every datagram is one sendto.
+
+        Returns:
+            (datagrams sent, system calls made)
+        """
+        sent = 0
+        for buffers, address in datagrams:
+            if self.send_packet_buffers(buffers, address, ":" in address[0]):
+                sent += 1
+        return sent, len(datagrams)
+
+    def stop(self) -> None:
+        """
+        Stop socket
+
+        C# method: internal void Stop()
+        """
+        self._is_running = False
+        if getattr(self._net_manager, "net_socket", None) is self:
+            self._net_manager.net_socket = None
+
+        if self._update_handle is not None:
+            self._update_handle.cancel()
+            self._update_handle = None
+
+        if self._transport_v4 is not None:
+            self._transport_v4.close()
+            self._transport_v4 = None
+
+        if self._transport_v6 is not None:
+            self._transport_v6.close()
+            self._transport_v6 = None
+
+        if self._previous_manual_mode is not None:
+            self._net_manager._manual_mode = self._previous_manual_mode
+            self._previous_manual_mode = None
+
+
+__all__ = ["AsyncNetSocket"]
@@ -10,9 +10,12 @@ C#行数: ~46行
 说明: 完整实现了C#版本的所有功能
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import List, TYPE_CHECKING
-from queue import Queue
+from collections import deque
+from typing import Deque, Iterable, Optional, TYPE_CHECKING
+
+from ..constants import NetConstants
 
 if TYPE_CHECKING:
     from ..packets.net_packet import NetPacket
@@ -30,6 +33,8 @@ class BaseChannel(ABC):
     - 出队队列管理
     - 包发送接口
     - 包处理接口
+    - 调度参数（priority、quota、send_budget，由NetPeer.update_channels使用）
+    - 排队延迟（包从入队到首次发送的时间）
     """
 
     def __init__(self, peer: 'LiteNetPeer'):
@@ -43,7 +48,26 @@ class BaseChannel(ABC):
             peer: LiteNetPeer - 所属的peer
         """
         self._peer = peer
-        self.outgoing_queue: List['NetPacket'] = []
+        # deque：两端O(1)入队/出队，append/extend/popleft线程安全
+        self.outgoing_queue: Deque['NetPacket'] = deque()
+        # 出队队列高水位（0表示不限制），见is_over_high_water_mark
+        self.high_water_mark: int = peer.net_manager.outgoing_queue_high_water_mark
+        # 是否已在peer的通道发送队列中
+        self._is_added_to_peer_channel_send_queue = False
+        self._send_queue_flag_lock = threading.Lock()
+
+        # 调度：优先级（越小越先发送）、同一优先级内每轮的字节配额、
+        # 本次调用还可首次发送的字节数（None表示不限制）
+        self.priority: int = 0
+        self.quota: int = NetConstants.MaxPacketSize
+        self.send_budget: Optional[int] = None
+        self._deficit = 0
+
+        # 排队延迟：入队时间（定时轮毫秒）与出队队列中的包一一对应
+        self._clock = peer.net_manager.timer_wheel
+        self._enqueue_times: Deque[float] = deque()
+        self._queue_delay = 0.0
+        self._max_queue_delay = 0.0
 
     @property
     def peer(self) -> 'LiteNetPeer':
@@ -79,6 +103,30 @@ class BaseChannel(ABC):
         """
         pass
 
+    @property
+    def outgoing_queue_size(self) -> int:
+        """获取出队队列中的包数量"""
+        return len(self.outgoing_queue)
+
+    @property
+    def queue_delay(self) -> float:
+        """获取平滑（1/8）的排队延迟（毫秒），按更新周期计时"""
+        return self._queue_delay
+
+    @property
+    def max_queue_delay(self) -> float:
+        """获取最大排队延迟（毫秒）"""
+        return self._max_queue_delay
+
+    @property
+    def is_over_high_water_mark(self) -> bool:
+        """
+        出队队列是否达到高水位
+
+        说明: 应用可在发送前查询，以便在队列积压时暂停发送
+        """
+        return 0 < self.high_water_mark <= len(self.outgoing_queue)
+
     def add_to_queue(self, packet: 'NetPacket') -> None:
         """
         添加包到队列
@@ -89,7 +137,38 @@ class BaseChannel(ABC):
         参数:
             packet: NetPacket - 要添加的包
         """
+        # 先记录时间，出队时总能取到对应的入队时间
+        self._enqueue_times.append(self._clock.now_ms)
         self.outgoing_queue.append(packet)
+        self.add_to_peer_channel_send_queue()
+
+    def add_range_to_queue(self, packets: Iterable['NetPacket']) -> None:
+        """
+        批量添加包到队列
+
+        说明: 用于分片发送，一次性入队所有分片
+
+        参数:
+            packets: Iterable[NetPacket] - 要添加的包
+        """
+        packets = list(packets)
+        self._enqueue_times.extend([self._clock.now_ms] * len(packets))
+        self.outgoing_queue.extend(packets)
+        self.add_to_peer_channel_send_queue()
+
+    def _pop_outgoing(self) -> 'NetPacket':
+        """
+        取出队首的包并记录排队延迟
+
+        返回:
+            NetPacket: 出队的包
+        """
+        packet = self.outgoing_queue.popleft()
+        delay = self._clock.now_ms - self._enqueue_times.popleft()
+        self._queue_delay += (delay - self._queue_delay) / 8
+        if delay > self._max_queue_delay:
+            self._max_queue_delay = delay
+        return packet
 
     def add_to_peer_channel_send_queue(self) -> None:
         """
@@ -99,10 +178,32 @@ class BaseChannel(ABC):
         说明: 将此通道添加到peer的待发送队列
 
         实现:
-            告诉peer这个通道有数据需要发送
+            告诉peer这个通道有数据需要发送，已在队列中时不重复添加
         """
+        with self._send_queue_flag_lock:
+            if self._is_added_to_peer_channel_send_queue:
+                return
+            self._is_added_to_peer_channel_send_queue = True
         if hasattr(self._peer, 'add_to_reliable_channel_send_queue'):
             self._peer.add_to_reliable_channel_send_queue(self)
 
+    def send_and_check_queue(self) -> bool:
+        """
+        发送并检查是否仍需留在peer的发送队列
+
+        C#方法: public bool SendAndCheckQueue()
+
+        返回:
+            bool: 如果仍有待发送的数据返回true
+        """
+        has_packets_to_send = self.send_next_packets()
+        if not has_packets_to_send:
+            with self._send_queue_flag_lock:
+                self._is_added_to_peer_channel_send_queue = False
+            # 清除标志前入队的包不会重新添加通道，这里补上
+            if self.outgoing_queue:
+                self.add_to_peer_channel_send_queue()
+        return has_packets_to_send
+
 
 __all__ = ["BaseChannel"]
@@ -10,15 +10,26 @@ C#行数: ~335行
 说明: 完整实现了C#版本的所有功能，包括滑动窗口、ACK处理、包重传
 """
 
-from typing import List, Optional, TYPE_CHECKING
+from collections import deque
+from typing import Deque, List, Optional, Tuple, TYPE_CHECKING
 import threading
+import time
 
 from .base_channel import BaseChannel
+from ..constants import DeliveryMethod, NetConstants
 
 if TYPE_CHECKING:
     from ..lite_net_peer import LiteNetPeer
     from ..packets.net_packet import NetPacket
-    from ..constants import DeliveryMethod, NetConstants
+    from ..utils.timer_wheel import TimerHandle
+
+
+if hasattr(int, "bit_count"):
+    _bit_count = int.bit_count
+else:
+    def _bit_count(value: int) -> int:
+        """置位的位数（Python 3.10之前没有int.bit_count）"""
+        return bin(value).count("1")
 
 
 class PendingPacket:
@@ -29,12 +40,18 @@ class PendingPacket:
     C#源位置: ReliableChannel.cs:7-51
 
     用于存储待确认的包，支持重传机制
+    重发时机由所属通道在manager定时轮上调度的定时器决定（timer），
+    延迟随重发次数（_retries）加倍
     """
 
+    __slots__ = ("_packet", "_time_stamp", "_is_sent", "_retries", "timer")
+
     def __init__(self):
         self._packet: Optional['NetPacket'] = None
         self._time_stamp: int = 0
         self._is_sent: bool = False
+        self._retries: int = 0
+        self.timer: Optional['TimerHandle'] = None
 
     def init(self, packet: 'NetPacket') -> None:
         """
@@ -48,10 +65,11 @@ class PendingPacket:
         """
         self._packet = packet
         self._is_sent = False
+        self._retries = 0
 
     def try_send(self, current_time: int, peer: 'LiteNetPeer') -> bool:
         """
-        尝试发送包（带重传检查）
+        发送或重发包
 
         C#方法: public bool TrySend(long currentTime, LiteNetPeer peer)
         C#源位置: ReliableChannel.cs:22-39
@@ -62,21 +80,19 @@ class PendingPacket:
 
         返回:
             bool: 如果有包待发送返回true，否则返回false
+
+        说明:
+            只在首次发送和重发时调用，不再逐包比较重发延迟。
+            重发时增加_retries：确认时不再采样RTT（Karn算法），
+            下次重发延迟加倍
         """
         if self._packet is None:
             return False
 
-        if self._is_sent:  # 检查发送时间
-            # 转换：peer.ResendDelay (double ms) → ticks
-            resend_delay_ticks = int(peer.resend_delay * 10000)  # ms to ticks
-            packet_hold_time = current_time - self._time_stamp
-
-            if packet_hold_time < resend_delay_ticks:
-                return True  # 还没到重发时间
-
-            # 需要重发
+        if self._is_sent:
             from ..debug import NetDebug
-            NetDebug.write(f"[RC]Resend: {packet_hold_time} > {resend_delay_ticks}")
+            NetDebug.write(f"[RC]Resend: {current_time - self._time_stamp}")
+            self._retries += 1
 
         self._time_stamp = current_time
         self._is_sent = True
@@ -98,6 +114,9 @@ class PendingPacket:
         返回:
             bool: 如果清理了包返回true，否则返回false
         """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
         if self._packet is not None:
             peer.recycle_and_deliver(self._packet)
             self._packet = None
@@ -121,12 +140,26 @@ class ReliableChannel(BaseChannel):
     实现可靠有序/无序的包交付：
     - ACK/NACK协议
     - 滑动窗口协议
-    - 包重传
+    - 包重传（超时重传和快速重传）
     - 丢包检测
     - 有序/无序模式
+
+    窗口状态以整数位图保存（第i位对应窗口索引i，与ACK包位图布局相同），
+    处理ACK时整块做位运算，只逐个处理新确认和需要快速重传的包
+
+    窗口大小由manager的reliable_window_size决定（协议参数，双方必须相同）。
+    开启adaptive_reliable_window时实际发送窗口在MIN_ADAPTIVE_WINDOW和窗口
+    大小之间调整：受窗口限制时按确认数增长（慢启动，之后每窗口加1），
+    RTT超过最小RTT两倍时停止增长，丢包（快速重传或重发定时器到期）时减半
+
+    peer启用拥塞控制时，首次发送还需要peer的拥塞窗口和限速额度，
+    确认的字节数和丢包通知peer的拥塞控制器
     """
 
     BITS_IN_BYTE = 8
+    MIN_ADAPTIVE_WINDOW = 8
+    # 最大窗口：ACK包（通道包头 + 窗口位图）必须能用最小MTU发出
+    MAX_WINDOW = 2048
 
     def __init__(self, peer: 'LiteNetPeer', ordered: bool, id: int):
         """
@@ -145,26 +178,44 @@ class ReliableChannel(BaseChannel):
         self._peer = peer
         self._id = id
 
-        # 窗口大小
-        self._window_size = NetConstants.default_window_size
+        # 窗口大小（双方相同，决定序号到槽位的映射和ACK位图大小）
+        net_manager = peer.net_manager
+        window_size = net_manager.reliable_window_size
+        # 槽位按序号对窗口大小取模，窗口大小必须整除MaxSequence，
+        # 否则序号回绕时ACK位图和槽位错位；ACK位图随窗口增大，
+        # 超过MAX_WINDOW时ACK包大于最小MTU，通道会停住
+        if (window_size < self.MIN_ADAPTIVE_WINDOW or window_size > self.MAX_WINDOW
+                or window_size & (window_size - 1)):
+            raise ValueError(
+                f"reliable_window_size must be a power of two between "
+                f"{self.MIN_ADAPTIVE_WINDOW} and {self.MAX_WINDOW}, got {window_size}"
+            )
+        self._window_size = window_size
         self._ordered = ordered
 
-        # 待发送包数组（滑动窗口）
-        self._pending_packets: List[PendingPacket] = [
-            PendingPacket() for _ in range(self._window_size)
-        ]
+        # 发送窗口（自适应模式下不超过窗口大小）
+        self._adaptive_window = net_manager.adaptive_reliable_window
+        if self._adaptive_window:
+            self._send_window = max(min(NetConstants.DefaultWindowSize, self._window_size),
+                                    min(self.MIN_ADAPTIVE_WINDOW, self._window_size))
+        else:
+            self._send_window = self._window_size
+        self._slow_start_threshold = self._window_size
+        self._window_credit = 0
+        self._recovery_sequence: Optional[int] = None
+        self._min_rtt = 0
+
+        # 待发送包数组（滑动窗口），槽位在首次使用时创建，
+        # 窗口很大时不需要预先分配
+        self._pending_packets: List[Optional[PendingPacket]] = [None] * self._window_size
         self._pending_packets_lock = threading.Lock()
 
         # 接收包数组
         if self._ordered:
-            self._received_packets: List[Optional['NetPacket']] = [
-                None for _ in range(self._window_size)
-            ]
+            self._received_packets: List[Optional['NetPacket']] = [None] * self._window_size
             self._delivery_method = DeliveryMethod.ReliableOrdered
         else:
-            self._early_received: List[bool] = [
-                False for _ in range(self._window_size)
-            ]
+            self._early_received: List[bool] = [False] * self._window_size
             self._delivery_method = DeliveryMethod.ReliableUnordered
 
         # 序列号
@@ -176,15 +227,22 @@ class ReliableChannel(BaseChannel):
         # ACK包
         from ..packets.net_packet import NetPacket, PacketProperty
         ack_size = (self._window_size - 1) // self.BITS_IN_BYTE + 2
-        self._outgoing_acks = NetPacket(PacketProperty.Ack, ack_size)
+        self._outgoing_acks = NetPacket(ack_size, PacketProperty.Ack)
         self._outgoing_acks.channel_id = id
         self._outgoing_acks_lock = threading.Lock()
 
         # 标志
         self._must_send_acks = False
 
-        # 出队队列（由peer管理）
-        self.outgoing_queue = []
+        # 窗口位图：在途（已入窗口未确认）的槽位和已快速重传过的槽位
+        self._ack_bytes = (self._window_size - 1) // self.BITS_IN_BYTE + 1
+        self._window_bits = (1 << self._window_size) - 1
+        self._pending_mask = 0
+        self._fast_resent_mask = 0
+
+        # 重发定时器（manager定时轮）和到期待重发的窗口索引
+        self._timers = peer.net_manager.timer_wheel
+        self._resend_due: Deque[Tuple[int, 'TimerHandle']] = deque()
 
     @property
     def peer(self) -> 'LiteNetPeer':
@@ -196,6 +254,16 @@ class ReliableChannel(BaseChannel):
         """获取交付方式"""
         return self._delivery_method
 
+    @property
+    def window_size(self) -> int:
+        """获取窗口大小（协议参数）"""
+        return self._window_size
+
+    @property
+    def send_window(self) -> int:
+        """获取当前发送窗口（同时在途的最大包数）"""
+        return self._send_window
+
     def send_next_packets(self) -> bool:
         """
         发送下一个包
@@ -217,38 +285,85 @@ class ReliableChannel(BaseChannel):
                 self._peer.send_user_data(self._outgoing_acks)
 
         # 当前时间（ticks）
-        import time
         current_time = int(time.time() * 10000000)  # 转换为ticks
-        has_pending_packets = False
+        congestion = self._peer.congestion_controller
 
         with self._pending_packets_lock:
-            # 从队列获取包
+            # 从队列获取包并首次发送
             while self.outgoing_queue:
                 relate = self._relative_sequence_number(
                     self._local_sequence,
                     self._local_window_start
                 )
-                if relate >= self._window_size:
+                if relate >= self._send_window:
+                    break
+                # 调度分配的字节数用完、拥塞窗口已满或超出限速时留在队列中，下次再发送
+                if self.send_budget is not None and self.send_budget <= 0:
                     break
+                if congestion is not None and \
+                        not self._peer.acquire_send_budget(self.outgoing_queue[0].total_size):
+                    break
+
+                packet = self._pop_outgoing()
+                if self.send_budget is not None:
+                    self.send_budget -= packet.total_size
+                packet.write_channeled_header(self._local_sequence, self._id)
+                idx = self._local_sequence % self._window_size
+                pending = self._pending_packets[idx]
+                if pending is None:
+                    pending = self._pending_packets[idx] = PendingPacket()
+                pending.init(packet)
+                self._pending_mask |= 1 << idx
+                self._send_pending(idx, current_time)
+                self._local_sequence = (self._local_sequence + 1) % NetConstants.MaxSequence
+
+            # 只重发定时器已到期的包，不扫描整个窗口
+            while self._resend_due:
+                idx, timer = self._resend_due.popleft()
+                # 包已确认或槽位已被新包占用时定时器不再对应
+                if self._pending_packets[idx].timer is timer:
+                    size = self._pending_packets[idx]._packet.total_size
+                    if congestion is not None:
+                        self._peer.on_reliable_resend(size)
+                    if self.send_budget is not None:
+                        self.send_budget -= size
+                    self._send_pending(idx, current_time)
+
+        # 在途的包由重发定时器重新加入peer发送队列
+        return self._must_send_acks or len(self.outgoing_queue) > 0
+
+    def _send_pending(self, idx: int, current_time: int) -> None:
+        """
+        发送窗口中的包并调度重发定时器
 
-                packet = self.outgoing_queue.pop(0)
-                packet.sequence = self._local_sequence
-                packet.channel_id = self._id
-                self._pending_packets[
-                    self._local_sequence % self._window_size
-                ].init(packet)
-                self._local_sequence = (self._local_sequence + 1) % NetConstants.max_sequence
-
-            # 发送待发送的包
-            pending_seq = self._local_window_start
-            while pending_seq != self._local_sequence:
-                idx = pending_seq % self._window_size
-                # 注意：TrySend修改了struct的字段，必须直接调用
-                if self._pending_packets[idx].try_send(current_time, self._peer):
-                    has_pending_packets = True
-                pending_seq = (pending_seq + 1) % NetConstants.max_sequence
-
-        return has_pending_packets or self._must_send_acks or len(self.outgoing_queue) > 0
+        参数:
+            idx: int - 窗口索引
+            current_time: int - 当前时间（ticks）
+        """
+        pending = self._pending_packets[idx]
+        if pending.try_send(current_time, self._peer):
+            pending.timer = self._timers.schedule(
+                self._peer.get_resend_delay(pending._retries), self._on_resend_timer, idx
+            )
+
+    def _on_resend_timer(self, idx: int) -> None:
+        """
+        重发定时器到期
+
+        说明: 在驱动定时轮的线程上调用，记录待重发的索引并让peer在本次更新中处理此通道
+        """
+        pending = self._pending_packets[idx]
+        timer = pending.timer
+        # 仍在调度中的定时器属于已替换此槽位的新包
+        if timer is None or timer.active:
+            return
+        self._resend_due.append((idx, timer))
+        if self._adaptive_window and pending._packet is not None:
+            with self._pending_packets_lock:
+                self._shrink_window(pending._packet.sequence)
+        if self._peer.congestion_controller is not None:
+            self._peer.on_reliable_lost(1)
+        self.add_to_peer_channel_send_queue()
 
     def process_packet(self, packet: 'NetPacket') -> bool:
         """
@@ -266,15 +381,20 @@ class ReliableChannel(BaseChannel):
         from ..packets.net_packet import PacketProperty
         from ..debug import NetDebug
 
+        # 一次解码整个包头
+        header = packet.read_header()
+        if header is None:
+            return False
+
         # 处理ACK包
-        if packet.packet_property == PacketProperty.Ack:
+        if header.property == PacketProperty.Ack:
             self._process_ack(packet)
             return False
 
-        seq = packet.sequence
+        seq = header.sequence
 
         # 验证序列号
-        if seq >= NetConstants.max_sequence:
+        if seq >= NetConstants.MaxSequence:
             NetDebug.write("[RR]Bad sequence")
             return False
 
@@ -295,7 +415,7 @@ class ReliableChannel(BaseChannel):
 
         # 处理新窗口位置
         ack_idx = seq % self._window_size
-        ack_byte = NetConstants.channeled_header_size + ack_idx // self.BITS_IN_BYTE
+        ack_byte = NetConstants.ChanneledHeaderSize + ack_idx // self.BITS_IN_BYTE
         ack_bit = ack_idx % self.BITS_IN_BYTE
 
         with self._outgoing_acks_lock:
@@ -303,18 +423,18 @@ class ReliableChannel(BaseChannel):
                 # 新窗口位置
                 new_window_start = (
                     self._remote_window_start + relate - self._window_size + 1
-                ) % NetConstants.max_sequence
+                ) % NetConstants.MaxSequence
                 self._outgoing_acks.sequence = new_window_start
 
                 # 清理旧数据
                 while self._remote_window_start != new_window_start:
                     old_idx = self._remote_window_start % self._window_size
-                    old_byte = NetConstants.channeled_header_size + old_idx // self.BITS_IN_BYTE
+                    old_byte = NetConstants.ChanneledHeaderSize + old_idx // self.BITS_IN_BYTE
                     old_bit = old_idx % self.BITS_IN_BYTE
                     self._outgoing_acks.raw_data[old_byte] &= ~(1 << old_bit)
                     self._remote_window_start = (
                         self._remote_window_start + 1
-                    ) % NetConstants.max_sequence
+                    ) % NetConstants.MaxSequence
 
             # 触发ACK发送
             self._must_send_acks = True
@@ -336,7 +456,7 @@ class ReliableChannel(BaseChannel):
         if seq == self._remote_sequence:
             NetDebug.write("[RR]ReliableInOrder packet success")
             self._peer.add_reliable_packet(self._delivery_method, packet)
-            self._remote_sequence = (self._remote_sequence + 1) % NetConstants.max_sequence
+            self._remote_sequence = (self._remote_sequence + 1) % NetConstants.MaxSequence
 
             # 处理缓存的包
             if self._ordered:
@@ -345,13 +465,13 @@ class ReliableChannel(BaseChannel):
                     p = self._received_packets[self._remote_sequence % self._window_size]
                     self._received_packets[self._remote_sequence % self._window_size] = None
                     self._peer.add_reliable_packet(self._delivery_method, p)
-                    self._remote_sequence = (self._remote_sequence + 1) % NetConstants.max_sequence
+                    self._remote_sequence = (self._remote_sequence + 1) % NetConstants.MaxSequence
             else:
                 while self._early_received[self._remote_sequence % self._window_size]:
                     # 处理早期接收的包
                     self._early_received[self._remote_sequence % self._window_size] = False
                     self._peer.add_reliable_packet(self._delivery_method, packet)
-                    self._remote_sequence = (self._remote_sequence + 1) % NetConstants.max_sequence
+                    self._remote_sequence = (self._remote_sequence + 1) % NetConstants.MaxSequence
 
             return True
 
@@ -385,7 +505,7 @@ class ReliableChannel(BaseChannel):
         ack_window_start = packet.sequence
         window_rel = self._relative_sequence_number(self._local_window_start, ack_window_start)
 
-        if ack_window_start >= NetConstants.max_sequence or window_rel < 0:
+        if ack_window_start >= NetConstants.MaxSequence or window_rel < 0:
             NetDebug.write("[PA]Bad window start")
             return
 
@@ -394,41 +514,169 @@ class ReliableChannel(BaseChannel):
             NetDebug.write("[PA]Old acks")
             return
 
-        acks_data = packet.raw_data
+        # 整个位图作为一个整数读出（小端，第i位即窗口索引i）
+        offset = NetConstants.ChanneledHeaderSize
+        ack_bits = int.from_bytes(packet.raw_data[offset:offset + self._ack_bytes], "little")
+        net_manager = self._peer.net_manager
 
         with self._pending_packets_lock:
-            # 处理窗口中的包
-            pending_seq = self._local_window_start
-            while pending_seq != self._local_sequence:
-                rel = self._relative_sequence_number(pending_seq, ack_window_start)
-                if rel >= self._window_size:
-                    NetDebug.write(f"[PA]REL: {rel}")
-                    break
+            # 只有落在ACK窗口内的在途序号能判断
+            in_flight = self._relative_sequence_number(self._local_sequence, self._local_window_start)
+            count = min(in_flight, self._window_size - window_rel)
+            if count <= 0:
+                return
+            start_idx = self._local_window_start % self._window_size
+            judged = self._rotate_left((1 << count) - 1, start_idx)
+            acked = judged & ack_bits & self._pending_mask
+            lost = judged & self._pending_mask & ~ack_bits
+
+            if lost and net_manager.enable_statistics:
+                lost_count = _bit_count(lost)
+                self._peer.statistics.add_packet_loss(lost_count)
+                net_manager.statistics.add_packet_loss(lost_count)
+
+            # 清理新确认的包，用最近发出的只发送过一次的包采样RTT
+            congestion = self._peer.congestion_controller
+            acked_bytes = 0
+            sample_time = 0
+            bits = acked
+            while bits:
+                low = bits & -bits
+                idx = low.bit_length() - 1
+                pending = self._pending_packets[idx]
+                if pending._retries == 0 and pending._time_stamp > sample_time:
+                    sample_time = pending._time_stamp
+                if congestion is not None:
+                    acked_bytes += pending._packet.total_size
+                if pending.clear(self._peer):
+                    NetDebug.write(f"[PA]Removing reliableInOrder ack, window index: {idx}")
+                bits ^= low
+            self._pending_mask &= ~acked
+            self._fast_resent_mask &= ~acked
+            if acked and self._adaptive_window:
+                self._grow_window(_bit_count(acked))
+            if sample_time:
+                self._peer.add_rtt_sample((int(time.time() * 10000000) - sample_time) / 10000.0)
+            if acked_bytes:
+                self._peer.on_reliable_acked(acked_bytes)
+
+            # 窗口起点移到第一个仍在途的包
+            pending = self._rotate_right(self._pending_mask, start_idx)
+            advance = (pending & -pending).bit_length() - 1 if pending else in_flight
+            self._local_window_start = (self._local_window_start + advance) % NetConstants.MaxSequence
+
+            threshold = net_manager.fast_retransmit_threshold
+            if lost and threshold > 0:
+                self._fast_retransmit(
+                    self._rotate_right(lost & ~self._fast_resent_mask, start_idx),
+                    self._rotate_right(judged & ack_bits, start_idx),
+                    start_idx,
+                    threshold
+                )
+
+    def _fast_retransmit(self, lost: int, acked: int, start_idx: int, threshold: int) -> None:
+        """
+        快速重传：之后已有threshold个包被确认的未确认包不等重发定时器，立即重发
+
+        参数:
+            lost: int - 未确认且未快速重传过的包（以窗口起点为第0位）
+            acked: int - ACK中已确认的包（以窗口起点为第0位）
+            start_idx: int - 窗口起点的窗口索引
+            threshold: int - 之后需要被确认的包数
+
+        说明: 调用方持有_pending_packets_lock。每个包只快速重传一次，
+        再次丢失时由重发定时器处理
+        """
+        from ..debug import NetDebug
+
+        resent = 0
+        while lost:
+            low = lost & -lost
+            position = low.bit_length() - 1
+            # 越靠后的包之后被确认的包越少，不满足即可停止
+            if _bit_count(acked >> (position + 1)) < threshold:
+                break
+            lost ^= low
+            idx = (start_idx + position) % self._window_size
+            timer = self._pending_packets[idx].timer
+            if timer is None or not timer.active:
+                continue  # 未发送或重发定时器已到期
+            timer.cancel()
+            self._resend_due.append((idx, timer))
+            self._fast_resent_mask |= 1 << idx
+            resent += 1
+            if self._adaptive_window:
+                self._shrink_window(self._pending_packets[idx]._packet.sequence)
+
+        if resent:
+            NetDebug.write(f"[PA]Fast retransmit: {resent}")
+            if self._peer.congestion_controller is not None:
+                self._peer.on_reliable_lost(resent)
+            if self._peer.net_manager.enable_statistics:
+                self._peer.statistics.add_fast_retransmits(resent)
+                self._peer.net_manager.statistics.add_fast_retransmits(resent)
+            self.add_to_peer_channel_send_queue()
 
-                pending_idx = pending_seq % self._window_size
-                current_byte = NetConstants.channeled_header_size + pending_idx // self.BITS_IN_BYTE
-                current_bit = pending_idx % self.BITS_IN_BYTE
+    def _grow_window(self, acked_count: int) -> None:
+        """
+        确认后增大发送窗口
+
+        参数:
+            acked_count: int - 新确认的包数
 
-                if (acks_data[current_byte] & (1 << current_bit)) == 0:
-                    # 未收到ACK，丢包统计
-                    if self._peer.net_manager.enable_statistics:
-                        self._peer.statistics.increment_packet_loss()
-                        self._peer.net_manager.statistics.increment_packet_loss()
+        说明: 调用方持有_pending_packets_lock。只在发送受窗口限制
+        （还有排队的包）时增长
+        """
+        if not self.outgoing_queue or self._send_window >= self._window_size:
+            return
 
-                    NetDebug.write(f"[PA]False ack: {pending_seq}")
-                    pending_seq = (pending_seq + 1) % NetConstants.max_sequence
-                    continue
+        rtt = self._peer.round_trip_time
+        if rtt > 0:
+            if self._min_rtt == 0 or rtt < self._min_rtt:
+                self._min_rtt = rtt
+            elif rtt > 2 * self._min_rtt:
+                return  # 延迟在增长，说明路径已排队
 
-                # 收到ACK，清理包
-                if pending_seq == self._local_window_start:
-                    # 移动窗口
-                    self._local_window_start = (self._local_window_start + 1) % NetConstants.max_sequence
+        if self._send_window < self._slow_start_threshold:
+            self._send_window += acked_count
+        else:
+            self._window_credit += acked_count
+            if self._window_credit >= self._send_window:
+                self._window_credit -= self._send_window
+                self._send_window += 1
+        if self._send_window > self._window_size:
+            self._send_window = self._window_size
+
+    def _shrink_window(self, sequence: int) -> None:
+        """
+        丢包后减半发送窗口
 
-                # 清理包
-                if self._pending_packets[pending_idx].clear(self._peer):
-                    NetDebug.write(f"[PA]Removing reliableInOrder ack: {pending_seq} - true")
+        参数:
+            sequence: int - 丢失包的序号
 
-                pending_seq = (pending_seq + 1) % NetConstants.max_sequence
+        说明: 调用方持有_pending_packets_lock。上次减半之前发出的包
+        再丢失不重复减半
+        """
+        if self._recovery_sequence is not None:
+            behind = self._relative_sequence_number(self._recovery_sequence, sequence)
+            if 0 < behind <= self._window_size:
+                return
+        self._slow_start_threshold = max(self.MIN_ADAPTIVE_WINDOW, self._send_window // 2)
+        self._send_window = min(self._slow_start_threshold, self._window_size)
+        self._window_credit = 0
+        self._recovery_sequence = self._local_sequence
+
+    def _rotate_left(self, bits: int, shift: int) -> int:
+        """在窗口大小的位图内循环左移（相对位置 -> 窗口索引）"""
+        if not shift:
+            return bits
+        return ((bits << shift) | (bits >> (self._window_size - shift))) & self._window_bits
+
+    def _rotate_right(self, bits: int, shift: int) -> int:
+        """在窗口大小的位图内循环右移（窗口索引 -> 相对位置）"""
+        if not shift:
+            return bits
+        return ((bits >> shift) | (bits << (self._window_size - shift))) & self._window_bits
 
     def _relative_sequence_number(self, sequence: int, start_sequence: int) -> int:
         """
@@ -445,7 +693,7 @@ class ReliableChannel(BaseChannel):
         """
         diff = sequence - start_sequence
         if diff < 0:
-            diff += NetConstants.max_sequence
+            diff += NetConstants.MaxSequence
         return diff
 
 
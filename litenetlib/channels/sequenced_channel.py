@@ -14,11 +14,12 @@ from typing import Optional, TYPE_CHECKING
 import time
 
 from .base_channel import BaseChannel
+from ..constants import DeliveryMethod, NetConstants
+from ..packets.net_packet import NetPacket, PacketProperty
 
 if TYPE_CHECKING:
     from ..lite_net_peer import LiteNetPeer
-    from ..packets.net_packet import NetPacket, PacketProperty
-    from ..constants import DeliveryMethod, NetConstants
+    from ..utils.timer_wheel import TimerHandle
 
 
 class SequencedChannel(BaseChannel):
@@ -63,14 +64,20 @@ class SequencedChannel(BaseChannel):
         # ACK包（仅reliable模式）
         self._ack_packet: Optional[NetPacket] = None
         if self._reliable:
-            self._ack_packet = NetPacket(PacketProperty.Ack, 0)
+            self._ack_packet = NetPacket(0, PacketProperty.Ack)
             self._ack_packet.channel_id = id
 
         # 标志
         self._must_send_ack = False
 
-        # 发送时间
+        # 发送时间和last packet已重发的次数
         self._last_packet_send_time = 0
+        self._last_packet_retries = 0
+
+        # Last packet重发定时器（manager定时轮）
+        self._timers = peer.net_manager.timer_wheel
+        self._resend_timer: Optional['TimerHandle'] = None
+        self._resend_due = False
 
     @property
     def peer(self) -> 'LiteNetPeer':
@@ -85,36 +92,45 @@ class SequencedChannel(BaseChannel):
         C#源位置: SequencedChannel.cs:24-73
 
         返回:
-            bool: 如果有last packet返回true
+            bool: 如果仍有待发送的数据返回true
+
+        说明:
+            last packet的重发由定时轮定时器触发，不再每次更新比较时间
         """
-        # Reliable模式且队列为空时重发last packet
         if self._reliable and len(self.outgoing_queue) == 0:
-            current_time = int(time.time() * 10000000)  # 转换为ticks
-            packet_hold_time = current_time - self._last_packet_send_time
-
-            if packet_hold_time >= self._peer.resend_delay * 10000:  # ms to ticks
+            # 重发定时器到期时重发last packet
+            if self._resend_due:
+                self._resend_due = False
                 packet = self._last_packet
                 if packet is not None:
-                    self._last_packet_send_time = current_time
+                    if self.send_budget is not None:
+                        self.send_budget -= packet.total_size
+                    self._last_packet_send_time = int(time.time() * 10000000)
+                    self._last_packet_retries += 1
                     self._peer.send_user_data(packet)
-            return self._last_packet is not None
-
-        # 处理队列中的包
-        while self.outgoing_queue:
-            packet = self.outgoing_queue.pop(0)
-            self._local_sequence = (self._local_sequence + 1) % NetConstants.max_sequence
-            packet.sequence = self._local_sequence
-            packet.channel_id = self._id
-            self._peer.send_user_data(packet)
-
-            # Reliable模式：缓存last packet
-            if self._reliable and len(self.outgoing_queue) == 0:
-                self._last_packet_send_time = int(time.time() * 10000000)
-                self._last_packet = packet
-            else:
-                # Non-reliable模式：回收包
-                if packet is not None:
-                    self._peer.net_manager.pool_recycle(packet)
+                    self._schedule_resend()
+        else:
+            # 处理队列中的包，调度分配的字节数用完时留到下次
+            while self.outgoing_queue:
+                if self.send_budget is not None:
+                    if self.send_budget <= 0:
+                        break
+                    self.send_budget -= self.outgoing_queue[0].total_size
+                packet = self._pop_outgoing()
+                self._local_sequence = (self._local_sequence + 1) % NetConstants.MaxSequence
+                packet.write_channeled_header(self._local_sequence, self._id)
+                self._peer.send_user_data(packet)
+
+                # Reliable模式：缓存last packet
+                if self._reliable and len(self.outgoing_queue) == 0:
+                    self._last_packet_send_time = int(time.time() * 10000000)
+                    self._last_packet = packet
+                    self._last_packet_retries = 0
+                    self._schedule_resend()
+                else:
+                    # Non-reliable模式：回收包
+                    if packet is not None:
+                        self._peer.net_manager.pool_recycle(packet)
 
         # 发送ACK（仅reliable模式）
         if self._reliable and self._must_send_ack:
@@ -122,7 +138,30 @@ class SequencedChannel(BaseChannel):
             self._ack_packet.sequence = self._remote_sequence
             self._peer.send_user_data(self._ack_packet)
 
-        return self._last_packet is not None
+        return self._must_send_ack or len(self.outgoing_queue) > 0
+
+    def _schedule_resend(self) -> None:
+        """为last packet调度重发定时器（延迟随重发次数加倍）"""
+        if self._resend_timer is not None:
+            self._resend_timer.cancel()
+        self._resend_due = False
+        self._resend_timer = self._timers.schedule(
+            self._peer.get_resend_delay(self._last_packet_retries), self._on_resend_timer
+        )
+
+    def _cancel_resend(self) -> None:
+        """last packet已确认，取消重发定时器"""
+        if self._resend_timer is not None:
+            self._resend_timer.cancel()
+            self._resend_timer = None
+        self._resend_due = False
+
+    def _on_resend_timer(self) -> None:
+        """重发定时器到期：标记重发并让peer在本次更新中处理此通道"""
+        if self._last_packet is None:
+            return
+        self._resend_due = True
+        self.add_to_peer_channel_send_queue()
 
     def process_packet(self, packet: 'NetPacket') -> bool:
         """
@@ -139,35 +178,47 @@ class SequencedChannel(BaseChannel):
         """
         from ..debug import NetDebug
 
+        # 一次解码整个包头
+        header = packet.read_header()
+        if header is None:
+            return False
+        sequence = header.sequence
+
         # 分片包由其他地方处理
-        if packet.is_fragmented:
+        if header.is_fragmented:
             return False
 
         # 处理ACK包
-        if packet.packet_property == PacketProperty.Ack:
-            if self._reliable and self._last_packet is not None and packet.sequence == self._last_packet.sequence:
+        if header.property == PacketProperty.Ack:
+            if self._reliable and self._last_packet is not None and sequence == self._last_packet.sequence:
                 self._last_packet = None
+                self._cancel_resend()
+                # Karn算法：重发过的包不采样RTT
+                if self._last_packet_retries == 0:
+                    self._peer.add_rtt_sample(
+                        (int(time.time() * 10000000) - self._last_packet_send_time) / 10000.0
+                    )
             return False
 
         # 计算相对序列号
-        relative = self._relative_sequence_number(packet.sequence, self._remote_sequence)
+        relative = self._relative_sequence_number(sequence, self._remote_sequence)
         packet_processed = False
 
-        if packet.sequence < NetConstants.max_sequence and relative > 0:
+        if sequence < NetConstants.MaxSequence and relative > 0:
             # 统计丢包
             if self._peer.net_manager.enable_statistics:
                 self._peer.statistics.add_packet_loss(relative - 1)
                 self._peer.net_manager.statistics.add_packet_loss(relative - 1)
 
             # 更新远程序列号
-            self._remote_sequence = packet.sequence
+            self._remote_sequence = sequence
 
             # 创建接收事件
             self._peer.net_manager.create_receive_event(
                 packet,
                 self._reliable and DeliveryMethod.ReliableSequenced or DeliveryMethod.Sequenced,
-                (packet.channel_id // NetConstants.channel_type_count),
-                NetConstants.channeled_header_size,
+                (header.channel_id // NetConstants.ChannelTypeCount),
+                NetConstants.ChanneledHeaderSize,
                 self._peer
             )
             packet_processed = True
@@ -195,7 +246,7 @@ class SequencedChannel(BaseChannel):
         """
         diff = sequence - start_sequence
         if diff < 0:
-            diff += NetConstants.max_sequence
+            diff += NetConstants.MaxSequence
         return diff
 
 
@@ -0,0 +1,12 @@
+"""
+Congestion package - Per-peer congestion control, RTT estimation and send pacing
+"""
+
+from .congestion_controller import *
+from .aimd_controller import *
+from .bbr_lite_controller import *
+from .token_bucket_pacer import *
+from .rtt_estimator import *
+
+__all__ = ["CongestionController", "AimdController", "BbrMode", "BbrLiteController", "TokenBucketPacer",
+           "RttEstimator"]
@@ -0,0 +1,84 @@
+"""
+AIMD congestion controller
+
+Loss-based additive increase, multiplicative decrease
+"""
+
+from .congestion_controller import CongestionController
+
+
+class AimdController(CongestionController):
+    """
+    Additive increase, multiplicative decrease controller
+
+    The window doubles every round trip while below the slow start threshold
+    (one byte per byte acknowledged) and then grows by one datagram per
+    window acknowledged. A loss halves the window; losses within one smoothed
+    RTT of the last decrease belong to the same event and are ignored. The
+    window only grows while the sender is using it (not app-limited).
+
+    Sends are paced at gain * window / SRTT, with a higher gain in slow start
+    so the pacer does not hold back window growth. Until the first RTT sample
+    sends are not paced.
+    """
+
+    PACING_GAIN = 1.25
+    SLOW_START_PACING_GAIN = 2.0
+    DEFAULT_RTT_MS = 100.0
+
+    def __init__(self, max_datagram_size: int):
+        super().__init__(max_datagram_size)
+        self._cwnd = float(self.initial_window)
+        self._ssthresh = float("inf")
+        self._srtt = 0.0
+        self._recovery_end_ms = float("-inf")
+
+    @property
+    def congestion_window(self) -> int:
+        """Get bytes allowed in flight"""
+        return int(self._cwnd)
+
+    @property
+    def slow_start_threshold(self) -> float:
+        """Get slow start threshold in bytes (inf before the first loss)"""
+        return self._ssthresh
+
+    @property
+    def in_slow_start(self) -> bool:
+        """Get whether the window is below the slow start threshold"""
+        return self._cwnd < self._ssthresh
+
+    @property
+    def pacing_rate(self) -> float:
+        """Get send rate in bytes per second (0 until the first RTT sample)"""
+        if self._srtt <= 0:
+            return 0.0
+        gain = self.SLOW_START_PACING_GAIN if self.in_slow_start else self.PACING_GAIN
+        return gain * self._cwnd * 1000.0 / self._srtt
+
+    def on_packets_acked(self, acked_bytes: int, now_ms: float, app_limited: bool) -> None:
+        """Grow the window (slow start or congestion avoidance)"""
+        if app_limited or now_ms < self._recovery_end_ms:
+            return
+        if self._cwnd < self._ssthresh:
+            self._cwnd = min(self._cwnd + acked_bytes, self._ssthresh)
+        else:
+            self._cwnd += self.max_datagram_size * acked_bytes / self._cwnd
+
+    def on_packets_lost(self, count: int, now_ms: float) -> None:
+        """Halve the window once per loss event"""
+        if now_ms < self._recovery_end_ms:
+            return
+        self._ssthresh = max(self._cwnd / 2, float(self.min_window))
+        self._cwnd = self._ssthresh
+        self._recovery_end_ms = now_ms + (self._srtt or self.DEFAULT_RTT_MS)
+
+    def on_rtt_sample(self, rtt_ms: float, now_ms: float) -> None:
+        """Update smoothed RTT (gain 1/8)"""
+        if self._srtt <= 0:
+            self._srtt = float(rtt_ms)
+        else:
+            self._srtt += (rtt_ms - self._srtt) / 8
+
+
+__all__ = ["AimdController"]
@@ -0,0 +1,175 @@
+"""
+BBR-lite congestion controller
+
+Rate-based control from bottleneck bandwidth and minimum RTT estimates
+"""
+
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Tuple
+
+from .congestion_controller import CongestionController
+
+
+class BbrMode(IntEnum):
+    """BBR-lite state"""
+    Startup = 0
+    Drain = 1
+    ProbeBandwidth = 2
+
+
+class BbrLiteController(CongestionController):
+    """
+    Simplified BBR controller
+
+    Bottleneck bandwidth is the maximum delivery rate seen over the last
+    BANDWIDTH_WINDOW_ROUNDS rounds; a delivery rate sample is the bytes
+    acknowledged over one round (one minimum RTT). Minimum RTT is the lowest
+    RTT sample, refreshed when older than MIN_RTT_WINDOW_MS.
+
+    Sends are paced at gain * bandwidth and the window is CWND_GAIN times the
+    bandwidth-delay product. Startup uses a gain of 2/ln2 until bandwidth
+    stops growing by 25% for three rounds or a loss is seen, drains the queue
+    it built for one round, then cycles PROBE_GAINS one round each.
+
+    Compared to full BBR there is no per-packet delivery tracking and no
+    ProbeRTT state; losses outside startup do not change the model. Samples
+    from app-limited rounds only count when they raise the estimate.
+    """
+
+    STARTUP_GAIN = 2.885  # 2 / ln 2
+    DRAIN_GAIN = 1 / 2.885
+    PROBE_GAINS = (1.25, 0.75, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0)
+    CWND_GAIN = 2.0
+    BANDWIDTH_WINDOW_ROUNDS = 10
+    MIN_RTT_WINDOW_MS = 10000.0
+    FULL_BANDWIDTH_GROWTH = 1.25
+    FULL_BANDWIDTH_ROUNDS = 3
+    DEFAULT_RTT_MS = 100.0
+
+    def __init__(self, max_datagram_size: int):
+        super().__init__(max_datagram_size)
+        self._mode = BbrMode.Startup
+        self._cycle_index = 0
+        self._round = 0
+
+        # Delivery rate estimate
+        self._bandwidth_samples: Deque[Tuple[int, float]] = deque()
+        self._max_bandwidth = 0.0
+        self._interval_start_ms = None
+        self._interval_bytes = 0
+        self._interval_app_limited = True
+
+        # Minimum RTT estimate
+        self._min_rtt = 0.0
+        self._min_rtt_stamp_ms = 0.0
+
+        # Startup exit
+        self._full_bandwidth = 0.0
+        self._full_bandwidth_rounds = 0
+
+    @property
+    def mode(self) -> BbrMode:
+        """Get current state"""
+        return self._mode
+
+    @property
+    def bottleneck_bandwidth(self) -> float:
+        """Get bandwidth estimate in bytes per second"""
+        return self._max_bandwidth
+
+    @property
+    def min_rtt(self) -> float:
+        """Get minimum RTT estimate in milliseconds"""
+        return self._min_rtt
+
+    @property
+    def pacing_gain(self) -> float:
+        """Get pacing gain for the current state"""
+        if self._mode == BbrMode.Startup:
+            return self.STARTUP_GAIN
+        if self._mode == BbrMode.Drain:
+            return self.DRAIN_GAIN
+        return self.PROBE_GAINS[self._cycle_index]
+
+    @property
+    def congestion_window(self) -> int:
+        """Get bytes allowed in flight (gain times the bandwidth-delay product)"""
+        if self._max_bandwidth <= 0 or self._min_rtt <= 0:
+            return self.initial_window
+        gain = self.STARTUP_GAIN if self._mode == BbrMode.Startup else self.CWND_GAIN
+        bdp = self._max_bandwidth * self._min_rtt / 1000.0
+        return max(self.min_window, int(gain * bdp))
+
+    @property
+    def pacing_rate(self) -> float:
+        """Get send rate in bytes per second (0 until the first RTT sample)"""
+        if self._max_bandwidth > 0:
+            return self.pacing_gain * self._max_bandwidth
+        if self._min_rtt > 0:
+            return self.STARTUP_GAIN * self.initial_window * 1000.0 / self._min_rtt
+        return 0.0
+
+    def on_packets_acked(self, acked_bytes: int, now_ms: float, app_limited: bool) -> None:
+        """Accumulate delivered bytes and take a bandwidth sample each round"""
+        if self._interval_start_ms is None:
+            self._interval_start_ms = now_ms
+            return
+        self._interval_bytes += acked_bytes
+        self._interval_app_limited = self._interval_app_limited and app_limited
+
+        elapsed = now_ms - self._interval_start_ms
+        if elapsed < (self._min_rtt or self.DEFAULT_RTT_MS):
+            return
+
+        sample = self._interval_bytes * 1000.0 / elapsed
+        interval_app_limited = self._interval_app_limited
+        self._interval_start_ms = now_ms
+        self._interval_bytes = 0
+        self._interval_app_limited = True
+        self._round += 1
+
+        if not interval_app_limited or sample > self._max_bandwidth:
+            self._add_bandwidth_sample(sample)
+        self._advance_mode(interval_app_limited)
+
+    def on_packets_lost(self, count: int, now_ms: float) -> None:
+        """Leave startup: loss means the pipe is already full"""
+        if self._mode == BbrMode.Startup:
+            self._mode = BbrMode.Drain
+
+    def on_rtt_sample(self, rtt_ms: float, now_ms: float) -> None:
+        """Keep the lowest RTT, replacing it once it is too old"""
+        if (self._min_rtt <= 0 or rtt_ms <= self._min_rtt
+                or now_ms - self._min_rtt_stamp_ms > self.MIN_RTT_WINDOW_MS):
+            self._min_rtt = float(rtt_ms)
+            self._min_rtt_stamp_ms = now_ms
+
+    def _add_bandwidth_sample(self, sample: float) -> None:
+        """Add a delivery rate sample to the windowed maximum"""
+        samples = self._bandwidth_samples
+        samples.append((self._round, sample))
+        while samples[0][0] <= self._round - self.BANDWIDTH_WINDOW_ROUNDS:
+            samples.popleft()
+        self._max_bandwidth = max(bandwidth for _, bandwidth in samples)
+
+    def _advance_mode(self, app_limited: bool) -> None:
+        """Move between states at the end of a round"""
+        if self._mode == BbrMode.Startup:
+            if app_limited:
+                return
+            if self._max_bandwidth >= self._full_bandwidth * self.FULL_BANDWIDTH_GROWTH:
+                self._full_bandwidth = self._max_bandwidth
+                self._full_bandwidth_rounds = 0
+                return
+            self._full_bandwidth_rounds += 1
+            if self._full_bandwidth_rounds >= self.FULL_BANDWIDTH_ROUNDS:
+                self._mode = BbrMode.Drain
+        elif self._mode == BbrMode.Drain:
+            self._mode = BbrMode.ProbeBandwidth
+            self._cycle_index = 0
+        else:
+            self._cycle_index = (self._cycle_index + 1) % len(self.PROBE_GAINS)
+
+
+__all__ = ["BbrMode", "BbrLiteController"]
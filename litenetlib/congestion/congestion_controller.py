@@ -0,0 +1,87 @@
+"""
+Congestion controller base class
+
+Per-peer congestion control for reliable channels
+"""
+
+from abc import ABC, abstractmethod
+
+
+class CongestionController(ABC):
+    """
+    Base class for per-peer congestion controllers
+
+    A controller decides how many bytes of reliable data may be in flight
+    (congestion_window) and how fast they may be sent (pacing_rate). The peer
+    feeds it acknowledged bytes, loss signals (fast retransmits and resend
+    timeouts) and RTT samples. All times are manager timer wheel milliseconds.
+
+    Args:
+        max_datagram_size: Peer MTU in bytes
+    """
+
+    INITIAL_WINDOW_PACKETS = 10
+    MIN_WINDOW_PACKETS = 2
+
+    def __init__(self, max_datagram_size: int):
+        self.max_datagram_size = max_datagram_size
+
+    @property
+    def initial_window(self) -> int:
+        """Get window used before the controller has any samples"""
+        return self.INITIAL_WINDOW_PACKETS * self.max_datagram_size
+
+    @property
+    def min_window(self) -> int:
+        """Get smallest window the controller will shrink to"""
+        return self.MIN_WINDOW_PACKETS * self.max_datagram_size
+
+    @property
+    @abstractmethod
+    def congestion_window(self) -> int:
+        """Get bytes allowed in flight"""
+        pass
+
+    @property
+    @abstractmethod
+    def pacing_rate(self) -> float:
+        """Get send rate in bytes per second (0 means not paced)"""
+        pass
+
+    @abstractmethod
+    def on_packets_acked(self, acked_bytes: int, now_ms: float, app_limited: bool) -> None:
+        """
+        Handle newly acknowledged packets
+
+        Args:
+            acked_bytes: Bytes acknowledged by one ACK
+            now_ms: Current time
+            app_limited: Nothing was held back by the window or pacer since
+                the previous ACK, so the sender did not use its full allowance
+        """
+        pass
+
+    @abstractmethod
+    def on_packets_lost(self, count: int, now_ms: float) -> None:
+        """
+        Handle packets detected as lost
+
+        Args:
+            count: Packets resent by fast retransmit or the resend timer
+            now_ms: Current time
+        """
+        pass
+
+    @abstractmethod
+    def on_rtt_sample(self, rtt_ms: float, now_ms: float) -> None:
+        """
+        Handle a round trip time sample
+
+        Args:
+            rtt_ms: Measured round trip time
+            now_ms: Current time
+        """
+        pass
+
+
+__all__ = ["CongestionController"]
@@ -0,0 +1,92 @@
+"""
+RTT estimator
+
+Smoothed RTT and retransmission timeout (RFC 6298)
+"""
+
+
+class RttEstimator:
+    """
+    Smoothed round trip time and retransmission timeout
+
+    RFC 6298: the first sample R sets SRTT = R and RTTVAR = R / 2, later
+    samples update RTTVAR = 3/4 RTTVAR + 1/4 |SRTT - R| and then
+    SRTT = 7/8 SRTT + 1/8 R. RTO = SRTT + max(G, 4 * RTTVAR), clamped to
+    [min_rto, max_rto]. Callers apply Karn's algorithm by not sampling
+    retransmitted packets. The n-th retransmission of a packet waits
+    RTO * 2**n (capped at max_rto).
+
+    Args:
+        min_rto: Lower RTO bound in milliseconds
+        max_rto: Upper RTO bound in milliseconds
+        initial_rto: RTO before the first sample
+        granularity: G in milliseconds (the peer passes the update tick,
+            since ACKs only go out once per tick)
+    """
+
+    ALPHA = 0.125
+    BETA = 0.25
+    K = 4
+
+    def __init__(self, min_rto: float, max_rto: float, initial_rto: float, granularity: float = 1.0):
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+        self.granularity = granularity
+        self._srtt = 0.0
+        self._rttvar = 0.0
+        self._samples = 0
+        self._rto = min(max(initial_rto, min_rto), max_rto)
+
+    @property
+    def srtt(self) -> float:
+        """Get smoothed RTT in milliseconds (0 before the first sample)"""
+        return self._srtt
+
+    @property
+    def rttvar(self) -> float:
+        """Get RTT variation in milliseconds"""
+        return self._rttvar
+
+    @property
+    def rto(self) -> float:
+        """Get retransmission timeout in milliseconds"""
+        return self._rto
+
+    @property
+    def samples(self) -> int:
+        """Get number of samples taken"""
+        return self._samples
+
+    def add_sample(self, rtt_ms: float) -> None:
+        """
+        Update the estimate with a measured RTT
+
+        Args:
+            rtt_ms: RTT of a packet that was sent only once
+        """
+        if self._samples == 0:
+            self._srtt = float(rtt_ms)
+            self._rttvar = rtt_ms / 2.0
+        else:
+            self._rttvar += self.BETA * (abs(self._srtt - rtt_ms) - self._rttvar)
+            self._srtt += self.ALPHA * (rtt_ms - self._srtt)
+        self._samples += 1
+        rto = self._srtt + max(self.granularity, self.K * self._rttvar)
+        self._rto = min(max(rto, self.min_rto), self.max_rto)
+
+    def backoff(self, retries: int) -> float:
+        """
+        Get timeout for a packet's retransmission
+
+        Args:
+            retries: Times the packet has already been resent
+
+        Returns:
+            RTO doubled per retry, capped at max_rto
+        """
+        if retries <= 0:
+            return self._rto
+        return min(self._rto * (1 << min(retries, 30)), self.max_rto)
+
+
+__all__ = ["RttEstimator"]
@@ -0,0 +1,101 @@
+"""
+Token bucket pacer
+
+Spreads sends over time at a configured byte rate
+"""
+
+from typing import Optional
+
+
+class TokenBucketPacer:
+    """
+    Token bucket send pacer
+
+    Tokens are bytes. They refill at rate bytes per second up to burst
+    bytes. A packet may go out while the bucket holds any tokens and the
+    balance may then go negative, so a packet larger than the remaining
+    tokens is not starved and the long-run rate still equals rate. A rate
+    of 0 disables pacing.
+
+    Args:
+        rate: Bytes per second
+        burst: Bucket size in bytes
+    """
+
+    def __init__(self, rate: float = 0.0, burst: int = 0):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last_ms: Optional[float] = None
+
+    @property
+    def rate(self) -> float:
+        """Get bytes per second (0 means not paced)"""
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        """Get bucket size in bytes"""
+        return self._burst
+
+    @property
+    def tokens(self) -> float:
+        """Get current token balance (negative while in debt)"""
+        return self._tokens
+
+    def set_rate(self, rate: float, burst: int) -> None:
+        """
+        Change rate and bucket size
+
+        Args:
+            rate: Bytes per second
+            burst: Bucket size in bytes
+        """
+        self._rate = rate
+        self._burst = burst
+        if self._tokens > burst:
+            self._tokens = float(burst)
+
+    def _refill(self, now_ms: float) -> None:
+        """Add tokens for the time since the last refill"""
+        last = self._last_ms
+        self._last_ms = now_ms
+        if last is None:
+            self._tokens = float(self._burst)
+        elif now_ms > last:
+            self._tokens = min(self._tokens + self._rate * (now_ms - last) / 1000.0, float(self._burst))
+
+    def try_consume(self, size: int, now_ms: float) -> bool:
+        """
+        Take tokens for a packet if the bucket is not empty
+
+        Args:
+            size: Packet size in bytes
+            now_ms: Current time in milliseconds
+
+        Returns:
+            True if the packet may be sent now
+        """
+        if self._rate <= 0:
+            return True
+        self._refill(now_ms)
+        if self._tokens <= 0:
+            return False
+        self._tokens -= size
+        return True
+
+    def consume(self, size: int, now_ms: float) -> None:
+        """
+        Take tokens for a packet that is sent regardless (retransmissions)
+
+        Args:
+            size: Packet size in bytes
+            now_ms: Current time in milliseconds
+        """
+        if self._rate <= 0:
+            return
+        self._refill(now_ms)
+        self._tokens -= size
+
+
+__all__ = ["TokenBucketPacer"]
@@ -42,6 +42,7 @@ class NetConstants:
     DefaultWindowSize = 64
     SocketBufferSize = 1024 * 1024  # 1mb
     SocketTTL = 255
+    ReceiveRingSize = 256  # preallocated buffers per socket in batched receive mode
 
     HeaderSize = 1
     ChanneledHeaderSize = 4
@@ -49,6 +50,7 @@ class NetConstants:
     FragmentedHeaderTotalSize = ChanneledHeaderSize + FragmentHeaderSize
     MaxSequence = 32768
     HalfMaxSequence = MaxSequence // 2
+    ChannelTypeCount = 4
 
     # protocol
     _protocol_id = 11
@@ -71,6 +73,13 @@ class NetConstants:
 
     PacketPoolSize = 1000
 
+    # packet pool size classes
+    PacketPoolTinySize = 64  # acks, pings and other control packets
+    PacketPoolMtuSize = MaxPacketSize + MaxUdpHeaderSize  # mtu packets plus packet layer overhead
+    PacketPoolFragmentSize = 64 * 1024  # reassembled fragmented messages
+    PacketPoolFragmentLimit = 32
+    PacketPoolThreadCacheSize = 64
+
     @classmethod
     def get_possible_mtu(cls) -> list:
         """Get list of possible MTU values"""
@@ -5,5 +5,6 @@ Layers package - Packet processing layers (encryption, CRC, etc.)
 from .packet_layer_base import *
 from .crc32c_layer import *
 from .xor_encrypt_layer import *
+from .layer_pipeline import *
 
-__all__ = ["PacketLayerBase", "Crc32cLayer", "XorEncryptLayer"]
+__all__ = ["PacketLayerBase", "Crc32cLayer", "XorEncryptLayer", "LayerPipeline"]
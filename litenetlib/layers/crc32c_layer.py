@@ -4,6 +4,8 @@ Crc32cLayer.cs translation
 CRC32C packet processing layer
 """
 
+import struct
+
 from .packet_layer_base import PacketLayerBase
 from ..utils.crc32c import CRC32C
 
@@ -16,8 +18,12 @@ class Crc32cLayer(PacketLayerBase):
     """
 
     def __init__(self):
-        """Initialize CRC32C layer"""
-        pass
+        """
+        Initialize CRC32C layer
+
+        C# constructor: public Crc32cLayer() : base(CRC32C.ChecksumSize)
+        """
+        super().__init__(CRC32C.CHECKSUM_SIZE)
 
     def process_out_bound_packet(self, data: bytearray, offset: int, length: int) -> None:
         """
@@ -30,7 +36,6 @@ class Crc32cLayer(PacketLayerBase):
         # Ensure data has space for checksum
         if offset + length + 4 > len(data):
             raise ValueError(f"Not enough space in data buffer for checksum. Need {offset + length + 4}, have {len(data)}")
-        import struct
         struct.pack_into("<I", data, offset + length, checksum)
 
     def process_in_bound_packet(self, data: bytes, offset: int, length: int) -> bool:
@@ -42,9 +47,7 @@ class Crc32cLayer(PacketLayerBase):
         if length < CRC32C.CHECKSUM_SIZE:
             return False
 
-        received_checksum = int.from_bytes(
-            data[offset + length - 4 : offset + length], "little"
-        )
+        received_checksum = struct.unpack_from("<I", data, offset + length - 4)[0]
         computed_checksum = CRC32C.compute(data, offset, length - 4)
 
         return received_checksum == computed_checksum
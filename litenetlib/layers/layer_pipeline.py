@@ -0,0 +1,78 @@
+"""
+Layer pipeline
+
+Chains any number of packet layers (compression, encryption, checksum...)
+behind the single extra_packet_layer slot of NetManager.
+"""
+
+from typing import Iterable, Tuple
+
+from .packet_layer_base import PacketLayerBase
+
+
+class LayerPipeline(PacketLayerBase):
+    """
+    Composite packet layer
+
+    Outgoing packets pass through the layers in the given order, incoming
+    packets in reverse order. extra_packet_size_for_layer and
+    head_room_for_layer are the sums over all layers, so the manager
+    allocates each outgoing datagram once with room for every layer. All
+    layers operate in place on one memoryview of the packet buffer.
+    """
+
+    def __init__(self, layers: Iterable[PacketLayerBase]):
+        """
+        Initialize pipeline
+
+        Args:
+            layers: Layers in outbound order, e.g. [compress, encrypt, crc]
+        """
+        self._layers: Tuple[PacketLayerBase, ...] = tuple(layers)
+        super().__init__(
+            sum(layer.extra_packet_size_for_layer for layer in self._layers),
+            sum(layer.head_room_for_layer for layer in self._layers)
+        )
+
+    @property
+    def layers(self) -> Tuple[PacketLayerBase, ...]:
+        """Get layers in outbound order"""
+        return self._layers
+
+    def process_out_bound_packet(self, data: bytearray, offset: int, length: int) -> int:
+        """
+        Run outbound transforms
+
+        Each layer sees the previous layers' output as its data, so later
+        layers wrap earlier ones.
+
+        Returns:
+            Packet length after all layers (length + extra_packet_size_for_layer),
+            starting at offset - head_room_for_layer
+        """
+        view = memoryview(data)
+        for layer in self._layers:
+            layer.process_out_bound_packet(view, offset, length)
+            offset -= layer.head_room_for_layer
+            length += layer.extra_packet_size_for_layer
+        return length
+
+    def process_in_bound_packet(self, data: bytearray, offset: int, length: int) -> bool:
+        """
+        Run inbound transforms
+
+        Stops at the first layer that rejects the packet. On success the
+        payload is the length - extra_packet_size_for_layer bytes starting at
+        offset + head_room_for_layer.
+        """
+        view = memoryview(data)
+        for layer in reversed(self._layers):
+            if length < layer.extra_packet_size_for_layer or \
+                    not layer.process_in_bound_packet(view, offset, length):
+                return False
+            offset += layer.head_room_for_layer
+            length -= layer.extra_packet_size_for_layer
+        return True
+
+
+__all__ = ["LayerPipeline"]
@@ -12,8 +12,30 @@ class PacketLayerBase(ABC):
     Base class for packet processing layers
 
     C# class: public abstract class PacketLayerBase
+
+    Layers transform packets in place. A layer adds up to
+    extra_packet_size_for_layer bytes on the way out and strips the same
+    amount on the way in. The first head_room_for_layer of those bytes go
+    before the data (written to data[offset - head_room_for_layer:offset]),
+    the rest after it. On the way in, offset and length cover the whole
+    datagram as this layer produced it, prefix and suffix included.
     """
 
+    def __init__(self, extra_packet_size_for_layer: int = 0, head_room_for_layer: int = 0):
+        """
+        Initialize layer
+
+        C# constructor: protected PacketLayerBase(int extraPacketSizeForLayer)
+
+        Args:
+            extra_packet_size_for_layer: Total bytes added per packet
+            head_room_for_layer: Part of them written before the data
+        """
+        if not 0 <= head_room_for_layer <= extra_packet_size_for_layer:
+            raise ValueError("head_room_for_layer must be between 0 and extra_packet_size_for_layer")
+        self.extra_packet_size_for_layer = extra_packet_size_for_layer
+        self.head_room_for_layer = head_room_for_layer
+
     @abstractmethod
     def process_out_bound_packet(self, data: bytes, offset: int, length: int) -> bytes:
         """
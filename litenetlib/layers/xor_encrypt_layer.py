@@ -4,7 +4,10 @@ XorEncryptLayer.cs translation
 XOR encryption layer
 """
 
+from typing import Dict
+
 from .packet_layer_base import PacketLayerBase
+from ..constants import NetConstants
 
 
 class XorEncryptLayer(PacketLayerBase):
@@ -12,16 +15,58 @@ class XorEncryptLayer(PacketLayerBase):
     XOR encryption layer
 
     C# class: public class XorEncryptLayer : PacketLayerBase
+
+    The key is repeated into a key stream of MTU length once, and each packet
+    is transformed as a single big-integer XOR instead of a per-byte loop.
+    The key-stream integer for each packet length is computed once and
+    cached. Byte i of the payload is still XORed with key[i % len(key)], so
+    the output is identical to the C# layer.
     """
 
+    # Cached key-stream integers; cleared when full (packet lengths are
+    # bounded by the MTU, but only a few sizes are common)
+    _KEY_CACHE_LIMIT = 256
+
     def __init__(self, key: bytes):
         """
         Initialize XOR encryption layer
 
         C# constructor: public XorEncryptLayer(byte[] key)
         """
+        super().__init__(0)
         self._key = key
         self._key_length = len(key)
+        self._key_stream = b""
+        self._key_ints: Dict[int, int] = {}
+        self._build_key_stream(NetConstants.MaxPacketSize)
+
+    def _build_key_stream(self, length: int) -> None:
+        """Repeat the key to cover at least length bytes"""
+        if self._key_length == 0:
+            return
+        repeats = -(-length // self._key_length)
+        self._key_stream = bytes(self._key) * repeats
+        self._key_ints = {}
+
+    def _key_int(self, length: int) -> int:
+        """Get the first length bytes of the key stream as an integer"""
+        key_int = self._key_ints.get(length)
+        if key_int is None:
+            if length > len(self._key_stream):
+                self._build_key_stream(length)
+            if len(self._key_ints) >= self._KEY_CACHE_LIMIT:
+                self._key_ints = {}
+            key_int = int.from_bytes(self._key_stream[:length], "little")
+            self._key_ints[length] = key_int
+        return key_int
+
+    def _apply(self, data: bytearray, offset: int, length: int) -> None:
+        """XOR data[offset:offset + length] with the key stream in place"""
+        if self._key_length == 0 or length <= 0:
+            return
+        end = offset + length
+        value = int.from_bytes(data[offset:end], "little") ^ self._key_int(length)
+        data[offset:end] = value.to_bytes(length, "little")
 
     def process_out_bound_packet(self, data: bytearray, offset: int, length: int) -> None:
         """
@@ -29,8 +74,7 @@ class XorEncryptLayer(PacketLayerBase):
 
         C# method: public override void ProcessOutBoundPacket(byte[] data, int offset, int length)
         """
-        for i in range(length):
-            data[offset + i] ^= self._key[i % self._key_length]
+        self._apply(data, offset, length)
 
     def process_in_bound_packet(self, data: bytearray, offset: int, length: int) -> bool:
         """
@@ -38,8 +82,7 @@ class XorEncryptLayer(PacketLayerBase):
 
         C# method: public override bool ProcessInBoundPacket(byte[] data, int offset, int length)
         """
-        for i in range(length):
-            data[offset + i] ^= self._key[i % self._key_length]
+        self._apply(data, offset, length)
         return True
 
 
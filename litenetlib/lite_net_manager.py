@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from .net_event import NetEvent, NetEventType
     from .lite_net_peer import LiteNetPeer
     from .connection_request import ConnectionRequest
+    from .utils.timer_wheel import TimerHandle
     from .packets.net_packet import NetPacket
     from .constants import DeliveryMethod, NetConstants
     from .layers.packet_layer_base import PacketLayerBase
@@ -74,6 +75,20 @@ class LiteNetManager(ABC):
         enable_statistics: bool - 启用统计
         mtu_discovery: bool - MTU发现
         mtu_override: int - MTU覆盖值
+        fragment_memory_budget: int - 每个peer分片重组内存上限（字节）
+        fragment_timeout: int - 分片重组超时（毫秒）
+        max_incoming_fragment_ids: int - 每个peer同时重组的分片ID数上限
+        fast_retransmit_threshold: int - 快速重传阈值（之后被确认的包数，0关闭）
+        reliable_window_size: int - 可靠通道窗口大小（双方必须相同，8到2048之间的2的幂，ACK包需能用最小MTU发出）
+        adaptive_reliable_window: bool - 按RTT和丢包调整可靠通道发送窗口
+        congestion_control: Callable[[int], CongestionController] - 每个peer的拥塞控制器工厂（参数为MTU）
+        min_resend_delay: float - 可靠包重发延迟下限（毫秒）
+        max_resend_delay: float - 可靠包重发延迟上限（毫秒，包括多次重发的加倍）
+        channel_priorities: Dict[int, int] - 通道编号到优先级（越小越先发送，默认0）
+        channel_quotas: Dict[int, int] - 通道编号到同一优先级内每轮的字节配额
+        channel_send_budget: int - 每个peer每次更新通道可首次发送的字节数（0不限制）
+        net_socket: NetSocket - 发送使用的socket
+        batch_send: bool - 每次更新批量发送（sendmmsg）
 
     抽象方法（子类实现）:
         create_outgoing_peer - 创建出站peer
@@ -84,7 +99,7 @@ class LiteNetManager(ABC):
         process_ntp_requests - 处理NTP请求
     """
 
-    def __init__(self, listener):
+    def __init__(self, listener, extra_packet_layer: Optional['PacketLayerBase'] = None):
         """
         构造函数
 
@@ -93,6 +108,7 @@ class LiteNetManager(ABC):
 
         参数:
             listener: ILiteNetEventListener - 网络事件监听器
+            extra_packet_layer: PacketLayerBase - 额外的包处理层（可选）
         """
         # 监听器
         self._net_event_listener = listener
@@ -102,6 +118,9 @@ class LiteNetManager(ABC):
         self._connected_peers_count = 0
         self._last_peer_id = 0
         self._peer_lock = threading.Lock()
+        # 端点和ID索引（写入在_peer_lock下进行，读取依赖dict操作的原子性）
+        self._peers_dict: Dict[tuple, 'LiteNetPeer'] = {}
+        self._peers_by_id: Dict[int, 'LiteNetPeer'] = {}
 
         # 连接请求
         self._requests_dict: Dict[tuple, 'ConnectionRequest'] = {}
@@ -119,17 +138,38 @@ class LiteNetManager(ABC):
         self._local_port = 0
 
         # 包池
-        self._packet_pool: List['NetPacket'] = []
-        self._packet_pool_lock = threading.Lock()
+        from .packets.net_packet_pool import NetPacketPool
+        self._packet_pool = NetPacketPool()
+
+        # 定时轮：重发、超时、ping、MTU探测等截止时间，更新时只处理到期的定时器
+        from .utils.timer_wheel import TimerWheel
+        self.timer_wheel = TimerWheel()
+        # 每个peer的定时器（"timeout"、"ping"、"mtu"）
+        self._peer_timers: Dict[int, Dict[str, 'TimerHandle']] = {}
+
+        # 有通道待发送的peer（更新时只处理这些peer）
+        self._peers_to_update: Dict[int, 'LiteNetPeer'] = {}
+        self._peers_to_update_lock = threading.Lock()
 
         # 统计
-        from .net_statistics import NetStatistics
+        from .net_statistics import NetStatistics, TickStatistics
         self.statistics = NetStatistics()
+        self.tick_statistics = TickStatistics()
+
+        # 发送：由NetSocket.start设置、stop清除，为None时不发送；batch_send时每次更新批量发送一次
+        self.net_socket = None
+        self._send_queue: List[tuple] = []
+        self._send_queue_lock = threading.Lock()
+
+        # 更新线程
+        self._update_thread: Optional[threading.Thread] = None
+        self._update_stop_event = threading.Event()
 
         # 额外的包层
-        self._extra_packet_layer: Optional['PacketLayerBase'] = None
+        self._extra_packet_layer: Optional['PacketLayerBase'] = extra_packet_layer
 
         # 配置（对应C#公共字段）
+        from .constants import NetConstants
         self.unconnected_messages_enabled = False
         self.nat_punch_enabled = False
         self.update_time = 15
@@ -149,9 +189,23 @@ class LiteNetManager(ABC):
         self.mtu_discovery = False
         self.enable_statistics = False
         self.max_fragments_count = 65535
+        self.fragment_memory_budget = 16 * 1024 * 1024  # 每个peer重组中的分片内存上限（字节）
+        self.fragment_timeout = 10000  # 重组超过该时间（毫秒）没有新分片则丢弃
+        self.max_incoming_fragment_ids = 256  # 每个peer同时重组的分片ID数上限
+        self.fast_retransmit_threshold = 3  # 之后有这么多包被确认仍未确认的包立即重发，0表示关闭
+        self.reliable_window_size = NetConstants.DefaultWindowSize  # 协议参数，双方必须相同
+        self.adaptive_reliable_window = False  # 发送窗口随RTT和丢包在窗口大小内调整
+        self.congestion_control = None  # 如AimdController，None表示可靠包不做拥塞控制和限速
+        self.min_resend_delay = 25.0  # 重发延迟（RTO）下限（毫秒）
+        self.max_resend_delay = 2000.0  # 重发延迟上限（毫秒），重发加倍也不超过
+        self.channel_priorities: Dict[int, int] = {}  # 通道编号 -> 优先级，越小越先发送
+        self.channel_quotas: Dict[int, int] = {}  # 通道编号 -> 同一优先级内按字节的权重（默认MaxPacketSize）
+        self.channel_send_budget = 0  # 每个peer每次更新的字节数上限，0表示不限制
         self.use_native_sockets = False
         self.disconnect_on_unreachable = False
         self.allow_peer_address_change = False
+        self.outgoing_queue_high_water_mark = 0  # 通道出队队列高水位，0表示不限制
+        self.batch_send = True  # 数据报暂存到更新结束时批量发送
 
     # ==================== 属性 ====================
 
@@ -207,6 +261,17 @@ class LiteNetManager(ABC):
             return 0
         return self._extra_packet_layer.extra_packet_size_for_layer
 
+    @property
+    def head_room_for_layer(self) -> int:
+        """
+        获取层在包数据之前添加的字节数
+
+        说明: 是extra_packet_size_for_layer的一部分，见PacketLayerBase
+        """
+        if self._extra_packet_layer is None:
+            return 0
+        return self._extra_packet_layer.head_room_for_layer
+
     # ==================== 事件创建和回收 ====================
 
     def create_event(
@@ -221,7 +286,8 @@ class LiteNetManager(ABC):
         delivery_method: Optional['DeliveryMethod'] = None,
         channel_number: int = 0,
         reader_source: Optional['NetPacket'] = None,
-        user_data: Optional[object] = None
+        user_data: Optional[object] = None,
+        reader_header_size: Optional[int] = None
     ) -> 'NetEvent':
         """
         创建事件
@@ -241,12 +307,13 @@ class LiteNetManager(ABC):
             channel_number: int - 通道号
             reader_source: NetPacket - 数据源
             user_data: object - 用户数据
+            reader_header_size: int - 数据源的包头大小（None时按包属性计算）
 
         说明:
             创建事件并立即处理或加入待处理队列
             Connect事件会增加connected_peers_count
         """
-        from .net_event import NetEvent
+        from .net_event import NetEvent, NetEventType
 
         evt: NetEvent
         unsync_event = self.unsynced_events
@@ -280,7 +347,9 @@ class LiteNetManager(ABC):
         # 设置数据源
         if reader_source is not None:
             from .packets.net_packet import PacketProperty
-            header_size = PacketProperty.get_header_size(reader_source.packet_property)
+            header_size = reader_header_size
+            if header_size is None:
+                header_size = PacketProperty.get_header_size(reader_source.packet_property)
             # evt.data_reader.set_source(reader_source, header_size)
 
         # 处理事件
@@ -296,6 +365,38 @@ class LiteNetManager(ABC):
 
         return evt
 
+    def create_receive_event(
+        self,
+        packet: 'NetPacket',
+        method: 'DeliveryMethod',
+        channel_number: int,
+        header_size: int,
+        from_peer: 'LiteNetPeer'
+    ) -> 'NetEvent':
+        """
+        创建接收事件
+
+        C#方法: internal void CreateReceiveEvent(NetPacket packet, DeliveryMethod method, byte channelNumber, int headerSize, LiteNetPeer fromPeer)
+        C#源位置: LiteNetManager.cs:400-428
+
+        参数:
+            packet: NetPacket - 数据包
+            method: DeliveryMethod - 交付方式
+            channel_number: int - 通道号
+            header_size: int - 数据前的包头大小
+            from_peer: LiteNetPeer - 来源peer
+        """
+        from .net_event import NetEventType
+
+        return self.create_event(
+            NetEventType.Receive,
+            peer=from_peer,
+            delivery_method=method,
+            channel_number=channel_number,
+            reader_source=packet,
+            reader_header_size=header_size
+        )
+
     def recycle_event(self, evt: 'NetEvent') -> None:
         """
         回收事件到对象池
@@ -439,12 +540,23 @@ class LiteNetManager(ABC):
 
     # ==================== 包池管理 ====================
 
+    @property
+    def packet_pool(self) -> 'NetPacketPool':
+        """
+        获取包池
+
+        说明: 可通过size_classes调整各大小级别的limit，
+        通过get_statistics()查看命中/未命中/溢出计数
+        """
+        return self._packet_pool
+
     def pool_get_packet(self, size: int) -> 'NetPacket':
         """
         从对象池获取包
 
         C#方法: internal NetPacket PoolGetPacket(int size)
-        说明: 从包池获取或创建新包
+        说明: 按大小级别从包池获取或创建新包。缓冲区额外预留extra_packet_size_for_layer
+        字节的尾部空间，包处理层可以原地追加数据而无需重新分配
 
         参数:
             size: int - 请求的包大小
@@ -452,30 +564,59 @@ class LiteNetManager(ABC):
         返回:
             NetPacket: 包实例
         """
-        from .packets.net_packet import NetPacket
-
-        with self._packet_pool_lock:
-            if self._packet_pool:
-                packet = self._packet_pool.pop()
-                if packet.raw_data is None or len(packet.raw_data) < size:
-                    packet.raw_data = bytearray(size)
-                packet.size = size
-                return packet
-        return NetPacket(size)
+        return self._packet_pool.get_packet(size, reserve=self.extra_packet_size_for_layer)
 
     def pool_recycle(self, packet: 'NetPacket') -> None:
         """
         回收包到对象池
 
         C#方法: internal void PoolRecycle(NetPacket packet)
-        说明: 将包回收到对象池以重用
+        说明: 将包回收到对象池以重用。批量接收的缓冲区会归还给NetSocket
 
         参数:
             packet: NetPacket - 要回收的包
         """
-        with self._packet_pool_lock:
-            if len(self._packet_pool) < 1000:  # 限制池大小
-                self._packet_pool.append(packet)
+        self._packet_pool.recycle(packet)
+
+    def pool_get_packet_from_buffer(
+        self,
+        data: memoryview,
+        release: Callable
+    ) -> 'NetPacket':
+        """
+        用接收缓冲区包装包（零拷贝）
+
+        说明: NetSocket批量接收模式下使用。包通过pool_recycle回收时
+        调用release归还缓冲区，之后该缓冲区才会被重用
+
+        参数:
+            data: memoryview - 接收到的数据
+            release: Callable - 缓冲区释放回调
+
+        返回:
+            NetPacket: 包实例
+        """
+        return self._packet_pool.get_buffer_packet(data, len(data), release)
+
+    def pool_get_packet_from_view(
+        self,
+        view: memoryview,
+        release: Callable
+    ) -> 'NetPacket':
+        """
+        用另一个包缓冲区的切片包装包（零拷贝）
+
+        说明: 拆分Merged包时使用，子包数据从view[0]开始。子包通过
+        pool_recycle回收时调用release
+
+        参数:
+            view: memoryview - 子包数据
+            release: Callable - 释放回调
+
+        返回:
+            NetPacket: 包实例
+        """
+        return self._packet_pool.get_view_packet(view, release)
 
     def pool_get_with_property(
         self,
@@ -486,7 +627,7 @@ class LiteNetManager(ABC):
         获取具有特定属性的包
 
         C#方法: internal NetPacket PoolGetWithProperty(PacketProperty property, int size)
-        说明: 创建具有指定属性的包
+        说明: 从包池获取具有指定属性的包，包大小包含该属性的包头
 
         参数:
             property_type: int - PacketProperty值
@@ -495,11 +636,9 @@ class LiteNetManager(ABC):
         返回:
             NetPacket: 包实例
         """
-        from .packets.net_packet import NetPacket
-
-        packet = NetPacket(size)
-        packet.packet_property = property_type
-        return packet
+        return self._packet_pool.get_packet(
+            size, property_type, reserve=self.extra_packet_size_for_layer
+        )
 
     # ==================== Peer管理 ====================
 
@@ -520,6 +659,15 @@ class LiteNetManager(ABC):
             if self._head_peer is not None:
                 self._head_peer.prev_peer = peer
             self._head_peer = peer
+            self.add_peer_to_set(peer)
+            self._peers_by_id[peer.id] = peer
+
+            self._cancel_peer_timers(peer.id)
+            self._peer_timers[peer.id] = {}
+            self._schedule_peer_timer(peer, "timeout", self.disconnect_timeout, self._check_peer_timeout)
+            self._schedule_peer_timer(peer, "ping", self.ping_interval, self._on_peer_ping_timer)
+            if self.mtu_discovery:
+                self._schedule_peer_timer(peer, "mtu", peer.MTU_CHECK_DELAY, self._on_peer_mtu_timer)
 
     def remove_peer(
         self,
@@ -549,6 +697,78 @@ class LiteNetManager(ABC):
             peer.next_peer = None
             peer.prev_peer = None
 
+            self.remove_peer_from_set(peer)
+            if self._peers_by_id.get(peer.id) is peer:
+                del self._peers_by_id[peer.id]
+                self._cancel_peer_timers(peer.id)
+
+    def add_peer_to_set(self, peer: 'LiteNetPeer') -> None:
+        """
+        添加peer到端点索引
+
+        C#方法: private void AddPeerToSet(LiteNetPeer peer)
+        说明: 调用方需持有_peer_lock
+
+        参数:
+            peer: LiteNetPeer - 要索引的peer
+        """
+        self._peers_dict[peer.remote_end_point] = peer
+
+    def remove_peer_from_set(self, peer: 'LiteNetPeer') -> None:
+        """
+        从端点索引移除peer
+
+        C#方法: private void RemovePeerFromSet(LiteNetPeer peer)
+        说明: 调用方需持有_peer_lock
+
+        参数:
+            peer: LiteNetPeer - 要移除的peer
+        """
+        if self._peers_dict.get(peer.remote_end_point) is peer:
+            del self._peers_dict[peer.remote_end_point]
+
+    def _contains_peer(self, peer: 'LiteNetPeer') -> bool:
+        """
+        检查peer是否在索引中
+
+        C#方法: private bool ContainsPeer(LiteNetPeer item)
+
+        参数:
+            peer: LiteNetPeer - 要检查的peer
+
+        返回:
+            bool: peer是否由本管理器持有
+        """
+        return self._peers_dict.get(peer.remote_end_point) is peer
+
+    def finish_end_point_change(self, peer: 'LiteNetPeer', new_end_point: tuple) -> bool:
+        """
+        完成peer端点变更并重建索引
+
+        C#对应: NetManager.ProcessEvent中的PeerAddressChanged处理
+
+        参数:
+            peer: LiteNetPeer - 地址变化的peer
+            new_end_point: tuple - 新的远程端点
+
+        返回:
+            bool: 是否完成了变更（peer已被移除或不在端点变更状态时为False）
+
+        说明: 先登记新端点再移除旧端点，不加锁的_contains_peer和try_get_peer
+        在变更期间始终能找到peer
+        """
+        from .lite_net_peer import ConnectionState
+
+        with self._peer_lock:
+            if not self._contains_peer(peer) or peer.connection_state != ConnectionState.EndPointChange:
+                return False
+            old_end_point = peer.remote_end_point
+            self._peers_dict[new_end_point] = peer
+            peer.finish_end_point_change(new_end_point)
+            if old_end_point != new_end_point and self._peers_dict.get(old_end_point) is peer:
+                del self._peers_dict[old_end_point]
+            return True
+
     def try_get_peer(
         self,
         end_point: tuple,
@@ -566,10 +786,23 @@ class LiteNetManager(ABC):
         返回:
             tuple: (found: bool, peer: LiteNetPeer)
         """
-        for p in self.get_peers():
-            if p.remote_end_point == end_point:
-                return True, p
-        return False, None
+        p = self._peers_dict.get(end_point)
+        return p is not None, p
+
+    def try_get_peer_by_id(self, id: int) -> tuple:
+        """
+        根据ID查找peer
+
+        C#方法: public bool TryGetPeerById(int id, out LiteNetPeer peer)
+
+        参数:
+            id: int - Peer ID
+
+        返回:
+            tuple: (found: bool, peer: LiteNetPeer)
+        """
+        p = self._peers_by_id.get(id)
+        return p is not None, p
 
     def get_peers(self) -> List['LiteNetPeer']:
         """
@@ -605,25 +838,228 @@ class LiteNetManager(ABC):
     def send_raw(
         self,
         packet: 'NetPacket',
-        peer: 'LiteNetPeer'
+        peer: 'LiteNetPeer',
+        immediate: bool = False
     ) -> None:
         """
         发送原始包
 
         C#方法: internal void SendRaw(NetPacket packet, LiteNetPeer peer)
-        说明: 直接发送包（不经过通道）
+        说明: 直接发送包（不经过通道），见send_raw_to
 
         参数:
             packet: NetPacket - 要发送的包
             peer: LiteNetPeer - 目标peer
+            immediate: bool - 不暂存，立即发送
         """
-        # 子类需要实现实际的网络发送
-        pass
+        self.send_raw_to(packet, peer.remote_end_point, immediate)
+
+    def send_raw_to(self, packet: 'NetPacket', remote_end_point: tuple, immediate: bool = False) -> None:
+        """
+        发送包到端点
+
+        C#方法: internal int SendRaw(byte[] message, int start, int length, IPEndPoint remoteEndPoint)
+
+        参数:
+            packet: NetPacket - 要发送的包
+            remote_end_point: tuple - 目标端点
+            immediate: bool - 不暂存，立即发送（用于pong、MTU回复等
+                计时敏感的控制包，暂存会让对端测得的RTT多出最多一次更新间隔）
+
+        说明:
+            batch_send为True时数据报先暂存，在本次更新结束时由flush_send_queue
+            一起发送；暂存时复制包头（包可能在发送前被重用或回收），
+            零拷贝负载只保留引用，由sendmmsg直接以iovec发出而不复制。
+            batch_send为False或immediate时通过send_packet_buffers
+            以scatter-gather方式立即发送。没有net_socket时丢弃
+        """
+        if self.batch_send and not immediate:
+            header = bytes(packet.raw_data[:packet.size])
+            buffers = (header,) if packet.payload is None else (header, packet.payload)
+        else:
+            buffers = packet.get_send_buffers()
+        self._send_datagram(buffers, packet.total_size, remote_end_point, immediate)
+
+    def send_raw_data(self, data, remote_end_point: tuple) -> None:
+        """
+        发送已编码的数据报到端点
+
+        C#方法: internal int SendRaw(byte[] message, int start, int length, IPEndPoint remoteEndPoint)
+
+        参数:
+            data: 缓冲区对象 - 数据报内容，暂存时复制
+            remote_end_point: tuple - 目标端点
+        """
+        buffers = (bytes(data),) if self.batch_send else (data,)
+        self._send_datagram(buffers, len(buffers[0]), remote_end_point)
+
+    def _send_datagram(
+        self,
+        buffers: tuple,
+        size: int,
+        remote_end_point: tuple,
+        immediate: bool = False
+    ) -> None:
+        """立即发送或暂存一个数据报，buffers在暂存时必须已是快照"""
+        net_socket = self.net_socket
+        if net_socket is None:
+            return
+
+        if self._extra_packet_layer is not None:
+            buffers, size = self._process_outbound_layer(buffers, size)
+
+        if self.enable_statistics:
+            self.statistics.increment_packets_sent()
+            self.statistics.add_bytes_sent(size)
+
+        if immediate or not self.batch_send:
+            result = net_socket.send_packet_buffers(buffers, remote_end_point, ":" in remote_end_point[0])
+            if self.enable_statistics:
+                self.statistics.add_send_batch(1, 1, 0 if result else 1)
+            return
+
+        with self._send_queue_lock:
+            self._send_queue.append((buffers, remote_end_point))
+
+    def _process_outbound_layer(self, buffers: tuple, size: int) -> tuple:
+        """
+        让数据报经过额外的包层
+
+        说明: 层会原地修改数据，而可靠通道的包在重发前必须保持原样，
+        所以把包头和负载复制到一个新缓冲区中处理。缓冲区一次分配，
+        前后留出层需要的head_room_for_layer和其余的额外空间。
+        结果是新对象，可以直接暂存
+
+        参数:
+            buffers: tuple - 组成数据报的缓冲区
+            size: int - 数据报大小
+
+        返回:
+            tuple: (buffers: tuple, size: int) 层处理后的数据报
+        """
+        layer = self._extra_packet_layer
+        data = bytearray(size + layer.extra_packet_size_for_layer)
+        pos = layer.head_room_for_layer
+        for buffer in buffers:
+            length = memoryview(buffer).nbytes
+            data[pos:pos + length] = buffer
+            pos += length
+        layer.process_out_bound_packet(data, layer.head_room_for_layer, size)
+        return (data,), len(data)
+
+    def process_inbound_layer(self, packet: 'NetPacket') -> Optional['NetPacket']:
+        """
+        让收到的包经过额外的包层
+
+        说明: 原地解码（解密、校验）包数据。层没有头部空间时直接截掉尾部字节，
+        返回原包；有头部空间时不移动数据，返回从层头部之后开始的视图包
+        （同Merged子包），视图包回收时才回收原包。层拒绝或包短于层的额外大小时
+        回收原包并返回None
+
+        参数:
+            packet: NetPacket - 收到的包
+
+        返回:
+            NetPacket: 去掉层字节后的包，无效时为None
+        """
+        layer = self._extra_packet_layer
+        if layer is None:
+            return packet
+        size = packet.size
+        extra = layer.extra_packet_size_for_layer
+        if size < extra or not layer.process_in_bound_packet(packet.raw_data, 0, size):
+            self.pool_recycle(packet)
+            return None
+        size -= extra
+        head = layer.head_room_for_layer
+        if not head:
+            packet.size = size
+            return packet
+        return self.pool_get_packet_from_view(
+            packet.get_view()[head:head + size],
+            lambda view: self.pool_recycle(packet)
+        )
+
+    def on_message_received(self, data, remote_end_point: tuple, release: Optional[Callable] = None) -> None:
+        """
+        Socket收到数据报的入口
+
+        C#方法: private void OnMessageReceived(NetPacket packet, IPEndPoint remoteEndPoint)
+        说明: NetSocket/AsyncNetSocket收到数据报时调用。带release的数据（批量接收的
+        缓冲区切片）直接包装成包，否则复制到池中的包。已连接peer的包交给
+        peer.process_packet处理；本移植版没有连接握手和未连接消息，
+        其他端点的包直接回收
+
+        参数:
+            data: bytes | memoryview - 数据报内容
+            remote_end_point: tuple - 发送方端点
+            release: Callable - 缓冲区释放回调（可选）
+        """
+        size = len(data)
+        if release is not None:
+            packet = self.pool_get_packet_from_buffer(data, release)
+        else:
+            packet = self.pool_get_packet(size)
+            packet.raw_data[:size] = data
+
+        if self.enable_statistics:
+            self.statistics.increment_packets_received()
+            self.statistics.add_bytes_received(size)
+
+        found, peer = self.try_get_peer(remote_end_point)
+        if size == 0 or not found:
+            self.pool_recycle(packet)
+            return
+        peer.process_packet(packet)
+
+    def on_network_error(self, remote_end_point: Optional[tuple], error: Exception) -> None:
+        """
+        Socket错误的入口
+
+        C#方法: private void OnNetworkError(IPEndPoint endPoint, SocketError socketError)
+        说明: 创建Error事件，监听器收到错误的errno（无errno时为0）
+
+        参数:
+            remote_end_point: tuple - 相关端点（未知时为None）
+            error: Exception - Socket异常
+        """
+        from .net_event import NetEventType
+
+        self.create_event(
+            NetEventType.Error,
+            remote_end_point=remote_end_point,
+            error_code=getattr(error, "errno", None) or 0
+        )
+
+    def flush_send_queue(self) -> int:
+        """
+        发送本次更新暂存的所有数据报
+
+        说明: 由update_logic在每次更新结束时调用，通过NetSocket.send_batch
+        以尽量少的系统调用（sendmmsg）发出
+
+        返回:
+            int: 发送的数据报数量
+        """
+        with self._send_queue_lock:
+            datagrams = self._send_queue
+            if not datagrams:
+                return 0
+            self._send_queue = []
+
+        net_socket = self.net_socket
+        if net_socket is None:
+            return 0
+        sent, syscalls = net_socket.send_batch(datagrams)
+        if self.enable_statistics:
+            self.statistics.add_send_batch(len(datagrams), syscalls, len(datagrams) - sent)
+        return len(datagrams)
 
     def send_raw_and_recycle(
         self,
         packet: 'NetPacket',
-        remote_end_point: tuple
+        remote_end_point: tuple,
+        immediate: bool = False
     ) -> None:
         """
         发送包并回收
@@ -634,8 +1070,9 @@ class LiteNetManager(ABC):
         参数:
             packet: NetPacket - 要发送的包
             remote_end_point: tuple - 目标端点
+            immediate: bool - 不暂存，立即发送
         """
-        self.send_raw(packet, None)
+        self.send_raw_to(packet, remote_end_point, immediate)
         self.pool_recycle(packet)
 
     def disconnect_peer(
@@ -657,6 +1094,116 @@ class LiteNetManager(ABC):
             data = b''
         peer.shutdown(data, 0, len(data), False)
 
+    def _check_peer_timeout(self, peer: 'LiteNetPeer') -> None:
+        """
+        peer超时定时器回调
+
+        说明: 已断开且超过disconnect_timeout未收到包的peer被移除，
+        否则按剩余时间重新调度，每个peer每个超时周期只检查一次
+        """
+        from .lite_net_peer import ConnectionState
+
+        if not self._contains_peer(peer):
+            return
+
+        remaining = self.disconnect_timeout - peer.time_since_last_packet
+        if peer.connection_state == ConnectionState.Disconnected and remaining < 0:
+            self.remove_peer(peer, False)
+            return
+
+        self._schedule_peer_timer(
+            peer,
+            "timeout",
+            max(remaining, 1) if remaining >= 0 else self.disconnect_timeout,
+            self._check_peer_timeout
+        )
+
+    def _on_peer_ping_timer(self, peer: 'LiteNetPeer') -> None:
+        """
+        peer ping定时器回调
+
+        说明: 每ping_interval触发一次，连接中的peer发送ping并重置RTT统计
+        """
+        from .lite_net_peer import ConnectionState
+
+        if not self._contains_peer(peer):
+            return
+        if peer.connection_state == ConnectionState.Connected:
+            peer.update_ping(self.ping_interval)
+        self._schedule_peer_timer(peer, "ping", self.ping_interval, self._on_peer_ping_timer)
+
+    def _on_peer_mtu_timer(self, peer: 'LiteNetPeer') -> None:
+        """
+        peer MTU探测定时器回调
+
+        说明: 每MTU_CHECK_DELAY发送一个探测包，探测结束后不再调度
+        """
+        from .lite_net_peer import ConnectionState
+
+        if not self._contains_peer(peer):
+            return
+        delay = peer.MTU_CHECK_DELAY
+        if peer.connection_state == ConnectionState.Connected and not peer.update_mtu_logic(delay):
+            self._peer_timers[peer.id].pop("mtu", None)
+            return
+        self._schedule_peer_timer(peer, "mtu", delay, self._on_peer_mtu_timer)
+
+    def _schedule_peer_timer(
+        self,
+        peer: 'LiteNetPeer',
+        name: str,
+        delay: float,
+        callback: Callable
+    ) -> None:
+        """
+        调度peer定时器
+
+        说明: 替换同名的旧定时器；peer已移除时不调度
+        """
+        timers = self._peer_timers.get(peer.id)
+        if timers is None:
+            return
+        old_timer = timers.get(name)
+        if old_timer is not None:
+            old_timer.cancel()
+        timers[name] = self.timer_wheel.schedule(delay, callback, peer)
+
+    def _cancel_peer_timers(self, peer_id: int) -> None:
+        """取消peer的所有定时器"""
+        timers = self._peer_timers.pop(peer_id, None)
+        if timers:
+            for timer in timers.values():
+                timer.cancel()
+
+    def add_peer_to_update_queue(self, peer: 'LiteNetPeer') -> None:
+        """
+        标记peer有数据待发送
+
+        说明: 由peer在通道加入其发送队列、不可靠包入队或合并缓冲区开始
+        积累数据时调用，下次更新时处理
+        """
+        with self._peers_to_update_lock:
+            self._peers_to_update[peer.id] = peer
+
+    def update_peers(self) -> int:
+        """
+        发送所有已标记peer的待发送数据
+
+        说明: 只处理有数据待发送的peer，空闲peer不产生开销（见LiteNetPeer.update_send）
+
+        返回:
+            int: 处理的peer数量
+        """
+        with self._peers_to_update_lock:
+            peers = self._peers_to_update
+            if not peers:
+                return 0
+            self._peers_to_update = {}
+
+        for peer in peers.values():
+            peer.update_send()
+        return len(peers)
+
     def manual_update(self, elapsed_milliseconds: float) -> None:
         """
         手动更新（用于手动模式）
@@ -669,28 +1216,117 @@ class LiteNetManager(ABC):
 
         说明:
             仅在manual_mode为true时使用
-            更新所有peer和NTP请求
+            推进定时轮（重发、超时），发送有待发送数据的peer，处理NTP请求
         """
         if not self._manual_mode:
             return
+        self.update_logic(elapsed_milliseconds)
 
-        peers_to_remove = []
-        for peer in self.get_peers():
-            from .lite_net_peer import ConnectionState
-            if peer.connection_state == ConnectionState.Disconnected and \
-               peer.time_since_last_packet > self.disconnect_timeout:
-                peers_to_remove.append(peer)
-            else:
-                # peer.update(elapsed_milliseconds)
-                pass
+    def update_logic(self, elapsed_milliseconds: float) -> None:
+        """
+        执行一次更新
 
-        # 移除断开的peer
-        for peer in peers_to_remove:
-            self.remove_peer(peer, False)
+        C#方法: private void UpdateLogic()（循环体）
+
+        参数:
+            elapsed_milliseconds: float - 距上次更新经过的时间（毫秒）
+
+        说明:
+            推进定时轮（重发、ping、MTU探测、超时），
+            发送有待发送数据的peer，处理NTP请求，批量发出暂存的数据报
+        """
+        # 到期的定时器会把通道加入peer发送队列、发送ping和MTU探测包、移除超时的peer
+        self.timer_wheel.advance(elapsed_milliseconds)
+        self.update_peers()
 
         # 处理NTP请求
         self.process_ntp_requests(elapsed_milliseconds)
 
+        # 本次更新暂存的数据报一次发出
+        self.flush_send_queue()
+
+    # ==================== 更新线程 ====================
+
+    @property
+    def is_update_thread_running(self) -> bool:
+        """检查更新线程是否在运行"""
+        thread = self._update_thread
+        return thread is not None and thread.is_alive()
+
+    def start_update_thread(self) -> bool:
+        """
+        启动更新线程
+
+        C#对应: Start()中创建的LogicThread
+
+        返回:
+            bool: 已启动返回True，手动模式或已在运行返回False
+
+        说明:
+            线程每update_time毫秒调用一次update_logic，tick时间按单调时钟
+            的截止时间计算，不会因单次延迟而累积漂移；落后超过一个tick时跳过
+            错过的tick。tick耗时、超时次数和抖动记录在tick_statistics中
+        """
+        if self._manual_mode or self.is_update_thread_running:
+            return False
+        self._update_stop_event.clear()
+        self._update_thread = threading.Thread(
+            target=self._update_thread_loop,
+            name=f"LogicThread({self._local_port})",
+            daemon=True
+        )
+        self._update_thread.start()
+        return True
+
+    def stop_update_thread(self, timeout: Optional[float] = None) -> None:
+        """
+        停止更新线程
+
+        参数:
+            timeout: float - 等待线程退出的秒数（None表示一直等待）
+        """
+        thread = self._update_thread
+        if thread is None:
+            return
+        self._update_stop_event.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+        self._update_thread = None
+
+    def _update_thread_loop(self) -> None:
+        """更新线程主循环"""
+        from .debug import NetDebug
+
+        clock = time.monotonic
+        stop_event = self._update_stop_event
+        stats = self.tick_statistics
+
+        tick = self.update_time / 1000.0
+        last_tick = clock() - tick
+        next_tick = last_tick + tick
+
+        while not stop_event.is_set():
+            tick_start = clock()
+            elapsed = (tick_start - last_tick) * 1000.0
+            last_tick = tick_start
+
+            try:
+                self.update_logic(elapsed)
+            except Exception as ex:
+                NetDebug.write_error(f"[NM] LogicThread error: {ex}")
+
+            # update_time可在运行中修改，下一个截止时间按当前值计算
+            tick = self.update_time / 1000.0
+            next_tick += tick
+            now = clock()
+            overrun = now > next_tick
+            if overrun:
+                # 跳过错过的tick，保持原有相位
+                next_tick += ((now - next_tick) // tick + 1) * tick
+            stats.add_tick(self.update_time, elapsed, (now - tick_start) * 1000.0, overrun)
+
+            stop_event.wait(next_tick - now)
+
 
 __all__ = [
     "UnconnectedMessageType",
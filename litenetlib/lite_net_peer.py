@@ -13,15 +13,32 @@ C#行数: ~1,288行
 from enum import IntFlag, IntEnum
 from typing import Optional, Dict, List, TYPE_CHECKING
 from abc import ABC, abstractmethod
+import struct
 import threading
 import time
 
 if TYPE_CHECKING:
     from .lite_net_manager import LiteNetManager
     from .net_statistics import NetStatistics
-    from .packets.net_packet import NetPacket
+    from .packets.net_packet import NetPacket, PacketHeader
     from .constants import DeliveryMethod
     from .channels.base_channel import BaseChannel
+    from .utils.timer_wheel import TimerHandle
+    from .congestion.congestion_controller import CongestionController
+    from .congestion.token_bucket_pacer import TokenBucketPacer
+
+
+# DateTime.UtcNow.Ticks：0001-01-01起的100纳秒数
+_TICKS_PER_MILLISECOND = 10000
+_UNIX_EPOCH_TICKS = 621355968000000000
+
+# 合并包内每个子包前的长度字段
+_MERGED_SIZE = struct.Struct("<H")
+
+
+def _utc_ticks() -> int:
+    """获取当前UTC时间的.NET ticks"""
+    return time.time_ns() // 100 + _UNIX_EPOCH_TICKS
 
 
 class ConnectionState(IntFlag):
@@ -101,12 +118,19 @@ class LiteNetPeer(ABC):
         mtu: int - 最大传输单元
         tag: object - 用户定义的对象
         statistics: NetStatistics - 连接统计信息
+        congestion_controller: CongestionController - 拥塞控制器（未启用时为None）
+        rtt_estimator: RttEstimator - 平滑RTT和重发超时估计
 
     抽象方法（子类实现）:
         channels_count: int - 通道数量
         create_channel(channel_number: byte) -> BaseChannel - 创建通道
     """
 
+    MTU_CHECK_DELAY = 1000         # C#: private const int MtuCheckDelay = 1000
+    MAX_MTU_CHECK_ATTEMPTS = 4     # C#: private const int MaxMtuCheckAttempts = 4
+    MERGE_SIZE_THRESHOLD = 20      # C#: const int sizeTreshold = 20（SendUserData）
+    INITIAL_RESEND_DELAY = 27.0    # C#: private double _resendDelay = 27.0
+
     def __init__(self, net_manager: 'LiteNetManager', remote_end_point: tuple, id: int):
         """
         创建Peer（入站连接构造函数）
@@ -129,11 +153,20 @@ class LiteNetPeer(ABC):
         self._rtt = 0
         self._avg_rtt = 0
         self._rtt_count = 0
-        self._resend_delay = 27.0
+        from .congestion.rtt_estimator import RttEstimator
+        self.rtt_estimator = RttEstimator(
+            net_manager.min_resend_delay, net_manager.max_resend_delay,
+            self.INITIAL_RESEND_DELAY, net_manager.update_time
+        )
         self._ping_send_timer = 0.0
         self._rtt_reset_timer = 0.0
-        self._time_since_last_packet = 0.0
+        self._last_packet_time = net_manager.timer_wheel.now_ms  # 定时轮时间（毫秒）
         self._remote_delta = 0
+        self._ping_sent_at: Optional[float] = None  # 上次发送ping的单调时钟时间（秒），None表示已收到pong
+        from .packets.net_packet import NetPacket, PacketProperty
+        self._ping_packet = NetPacket(0, PacketProperty.Ping)
+        self._ping_packet.sequence = 1
+        self._pong_packet = NetPacket(0, PacketProperty.Pong)
 
         # 连接
         self._connect_attempts = 0
@@ -155,6 +188,9 @@ class LiteNetPeer(ABC):
         # 分片
         self._fragment_id = 0
         self._holded_fragments: Dict[int, 'IncomingFragments'] = {}
+        self._fragments_memory = 0
+        # 接收线程和更新线程（重组超时）都会修改重组状态
+        self._fragments_lock = threading.Lock()
         self._delivered_fragments: Dict[int, int] = {}
 
         # 不可靠通道
@@ -163,6 +199,13 @@ class LiteNetPeer(ABC):
         self._unreliable_pending_count = 0
         self._unreliable_channel_lock = threading.Lock()
 
+        # 合并发送（C#: _mergeData, _mergePos, _mergeCount）
+        from .constants import NetConstants
+        self._merge_data = NetPacket(NetConstants.MaxPacketSize, PacketProperty.Merged)
+        self._merge_pos = 0    # 已写入的字节数（不含Merged包头）
+        self._merge_count = 0
+        self._merge_lock = threading.Lock()
+
         # 统计
         from .net_statistics import NetStatistics
         self.statistics: NetStatistics = NetStatistics()
@@ -174,9 +217,23 @@ class LiteNetPeer(ABC):
         self.next_peer: Optional['LiteNetPeer'] = None
         self.prev_peer: Optional['LiteNetPeer'] = None
 
+        # 拥塞控制（可靠包在途字节数和发送限速）
+        self.congestion_controller: Optional['CongestionController'] = None
+        self._pacer: Optional['TokenBucketPacer'] = None
+        self._bytes_in_flight = 0
+        self._send_limited = False  # 上次ACK之后有包因窗口或限速被推迟
+        self._congestion_lock = threading.Lock()
+
         # 初始化
         self._reset_mtu()
 
+        congestion_control = net_manager.congestion_control
+        if congestion_control is not None:
+            from .congestion.token_bucket_pacer import TokenBucketPacer
+            self.congestion_controller = congestion_control(self._mtu)
+            self._pacer = TokenBucketPacer()
+            self._update_congestion_state()
+
     # ==================== 属性 ====================
 
     @property
@@ -221,8 +278,15 @@ class LiteNetPeer(ABC):
 
         C#属性: public float TimeSinceLastPacket => _timeSinceLastPacket
         C#源位置: LiteNetPeer.cs:185
+
+        说明: 按manager定时轮时间计算，不需要每次更新累加
         """
-        return self._time_since_last_packet
+        return self.net_manager.timer_wheel.now_ms - self._last_packet_time
+
+    @property
+    def bytes_in_flight(self) -> int:
+        """获取已发送未确认的可靠包字节数（只在启用拥塞控制时统计）"""
+        return self._bytes_in_flight
 
     @property
     def resend_delay(self) -> float:
@@ -231,8 +295,23 @@ class LiteNetPeer(ABC):
 
         C#属性: internal double ResendDelay => _resendDelay
         C#源位置: LiteNetPeer.cs:187
+
+        说明: 即rtt_estimator的RTO（平滑RTT加4倍RTT偏差），
+        在manager的min_resend_delay和max_resend_delay之间
+        """
+        return self.rtt_estimator.rto
+
+    def get_resend_delay(self, retries: int) -> float:
         """
-        return self._resend_delay
+        获取包的重发延迟
+
+        参数:
+            retries: int - 包已重发的次数
+
+        返回:
+            float: 重发延迟（毫秒），每重发一次加倍，不超过max_resend_delay
+        """
+        return self.rtt_estimator.backoff(retries)
 
     @property
     @abstractmethod
@@ -263,6 +342,27 @@ class LiteNetPeer(ABC):
         """
         pass
 
+    @abstractmethod
+    def update_channels(self) -> None:
+        """
+        发送各通道待发送的包（子类实现）
+
+        C#方法: protected virtual void UpdateChannels()
+        """
+        pass
+
+    @abstractmethod
+    def process_channeled(self, packet: 'NetPacket') -> None:
+        """
+        处理通道包和ACK（子类实现）
+
+        C#方法: internal virtual void ProcessChanneled(NetPacket packet)
+
+        参数:
+            packet: NetPacket - 收到的包
+        """
+        pass
+
     # ==================== 连接管理 ====================
 
     def initiate_end_point_change(self) -> None:
@@ -319,7 +419,9 @@ class LiteNetPeer(ABC):
         from .constants import NetConstants
 
         self._mtu_idx = mtu_idx
-        self._mtu = NetConstants.possible_mtu[mtu_idx] - self.net_manager.extra_packet_size_for_layer
+        self._mtu = NetConstants._possible_mtu[mtu_idx] - self.net_manager.extra_packet_size_for_layer
+        if self.congestion_controller is not None:
+            self.congestion_controller.max_datagram_size = self._mtu
 
     def _override_mtu(self, mtu_value: int) -> None:
         """
@@ -387,12 +489,64 @@ class LiteNetPeer(ABC):
         """
         self._send_internal(data, channel_number, delivery_method, None)
 
+    def send_zero_copy(
+        self,
+        data,
+        channel_number: int,
+        delivery_method: 'DeliveryMethod'
+    ) -> None:
+        """
+        零拷贝发送
+
+        参数:
+            data: 支持缓冲区协议的对象（bytes、bytearray、memoryview、mmap等）
+            channel_number: int - 通道号
+            delivery_method: DeliveryMethod - 交付方式
+
+        说明:
+            包（包括每个分片）只包含包头，负载是data的memoryview切片，
+            发送时由NetSocket.send_packet_buffers以scatter-gather方式发出，
+            1MB的消息也不会被复制到中间包中。
+            data在包发送（可靠通道为被确认）之前不能被修改。
+            包负载的memoryview会锁定data的缓冲区：bytearray等可变大小的对象
+            在所有包发送并回收到对象池之前调整大小（extend、del切片等）
+            会抛出BufferError
+        """
+        self._send_internal(data, channel_number, delivery_method, None, zero_copy=True)
+
+    def send_shared(
+        self,
+        data: memoryview,
+        channel_number: int,
+        delivery_method: 'DeliveryMethod',
+        fragment_cache: Optional[Dict[int, List[memoryview]]] = None
+    ) -> None:
+        """
+        发送多个peer共享的负载（广播用）
+
+        参数:
+            data: memoryview - 不可变的负载（通常是bytes的memoryview）
+            channel_number: int - 通道号
+            delivery_method: DeliveryMethod - 交付方式
+            fragment_cache: dict - 分片负载大小到分片切片列表的缓存，
+                同一次广播的所有peer共用
+
+        说明:
+            与send_zero_copy相同，每个peer只分配自己的包头（序号、通道、
+            分片ID），负载引用data。分片切片按分片大小缓存，MTU相同的peer
+            复用同一组切片。data在所有peer发送（或被确认）之前不能被修改
+        """
+        self._send_internal(data, channel_number, delivery_method, None,
+                            zero_copy=True, fragment_cache=fragment_cache)
+
     def _send_internal(
         self,
         data: bytes,
         channel_number: int,
         delivery_method: 'DeliveryMethod',
-        user_data: Optional[object]
+        user_data: Optional[object],
+        zero_copy: bool = False,
+        fragment_cache: Optional[Dict[int, List[memoryview]]] = None
     ) -> None:
         """
         内部发送方法
@@ -401,10 +555,12 @@ class LiteNetPeer(ABC):
         C#源位置: LiteNetPeer.cs:589-674
 
         参数:
-            data: bytes - 要发送的数据
+            data: bytes - 要发送的数据（zero_copy时为任意缓冲区对象）
             channel_number: int - 通道号
             delivery_method: DeliveryMethod - 交付方式
             user_data: object - 用户数据（用于交付事件）
+            zero_copy: bool - 不复制数据，包负载引用data的切片（见send_zero_copy）
+            fragment_cache: dict - zero_copy时共享的分片切片缓存（见send_shared）
 
         说明:
             这是所有发送方法的底层实现
@@ -424,13 +580,19 @@ class LiteNetPeer(ABC):
         else:
             property_type = PacketProperty.Channeled
             channel = self.create_channel(
-                channel_number * NetConstants.channel_type_count + int(delivery_method)
+                channel_number * NetConstants.ChannelTypeCount + int(delivery_method)
             )
 
         # 计算包头大小
         header_size = PacketProperty.get_header_size(property_type)
         mtu = self._mtu
-        length = len(data)
+        if zero_copy:
+            data = memoryview(data)
+            if data.format != "B" or data.ndim != 1:
+                data = data.cast("B")
+            length = data.nbytes
+        else:
+            length = len(data)
 
         # 检查是否需要分片
         if length + header_size > mtu:
@@ -443,7 +605,7 @@ class LiteNetPeer(ABC):
 
             # 分片发送
             packet_full_size = mtu - header_size
-            packet_data_size = packet_full_size - NetConstants.fragment_header_size
+            packet_data_size = packet_full_size - NetConstants.FragmentHeaderSize
             total_packets = length // packet_data_size + (1 if length % packet_data_size else 0)
 
             if total_packets > self.net_manager.max_fragments_count:
@@ -456,43 +618,215 @@ class LiteNetPeer(ABC):
             self._fragment_id += 1
             current_fragment_id = self._fragment_id
 
-            for part_idx in range(total_packets):
-                send_length = min(packet_data_size, length)
-                offset = part_idx * packet_data_size
+            data_start = NetConstants.FragmentedHeaderTotalSize
+            fragments = []
+            if zero_copy:
+                parts = fragment_cache.get(packet_data_size) if fragment_cache is not None else None
+                if parts is None:
+                    parts = [data[offset:offset + packet_data_size]
+                             for offset in range(0, length, packet_data_size)]
+                    if fragment_cache is not None:
+                        fragment_cache[packet_data_size] = parts
+                for part_idx, part in enumerate(parts):
+                    # 只分配包头，负载引用data切片
+                    packet = self.net_manager.pool_get_packet(data_start)
+                    packet.payload = part
+                    packet.packet_property = property_type
+                    packet.user_data = user_data
+                    packet.write_fragment_header(current_fragment_id, part_idx, total_packets)
+                    fragments.append(packet)
+            else:
+                for part_idx in range(total_packets):
+                    send_length = min(packet_data_size, length)
+                    offset = part_idx * packet_data_size
 
-                # 创建分片包
-                packet = self.net_manager.pool_get_packet(header_size + send_length + NetConstants.fragment_header_size)
-                packet.property = property_type
-                packet.user_data = user_data
-                packet.fragment_id = current_fragment_id
-                packet.fragment_part = part_idx
-                packet.fragments_total = total_packets
-                packet.mark_fragmented()
+                    # 创建分片包
+                    packet = self.net_manager.pool_get_packet(data_start + send_length)
+                    packet.packet_property = property_type
+                    packet.user_data = user_data
+                    packet.write_fragment_header(current_fragment_id, part_idx, total_packets)
 
-                # 复制数据
-                packet.raw_data[NetConstants.fragmented_header_total_size:send_length] = \
-                    data[offset:offset + send_length]
+                    # 复制数据
+                    packet.raw_data[data_start:data_start + send_length] = \
+                        data[offset:offset + send_length]
 
-                # 添加到通道队列
-                channel.add_to_queue(packet)
-                length -= send_length
+                    fragments.append(packet)
+                    length -= send_length
+
+            # 所有分片一次性入队
+            channel.add_range_to_queue(fragments)
         else:
             # 不分片，直接发送
-            packet = self.net_manager.pool_get_packet(header_size + length)
-            packet.property = property_type
-            packet.raw_data[header_size:header_size + length] = data
+            if zero_copy:
+                packet = self.net_manager.pool_get_packet(header_size)
+                packet.payload = data
+            else:
+                packet = self.net_manager.pool_get_packet(header_size + length)
+                packet.raw_data[header_size:header_size + length] = data
+            packet.packet_property = property_type
             packet.user_data = user_data
 
             if channel is None:  # Unreliable
                 with self._unreliable_channel_lock:
                     if self._unreliable_pending_count == len(self._unreliable_channel):
                         # 扩容
-                        self._unreliable_channel.extend([None] * self._unreliable_pending_count)
+                        self._unreliable_channel.extend([None] * max(self._unreliable_pending_count, 8))
                     self._unreliable_channel[self._unreliable_pending_count] = packet
                     self._unreliable_pending_count += 1
+                self.net_manager.add_peer_to_update_queue(self)
             else:
                 channel.add_to_queue(packet)
 
+    def send_user_data(self, packet: 'NetPacket') -> None:
+        """
+        发送通道包
+
+        C#方法: internal void SendUserData(NetPacket packet)
+
+        参数:
+            packet: NetPacket - 要发送的包
+
+        说明:
+            小包复制到合并缓冲区（每个前面加2字节长度），在update_send结束时
+            由send_merged作为一个Merged数据报发出；放不下时先发出已合并的数据。
+            加上合并开销接近MTU的包直接发送
+        """
+        from .constants import NetConstants
+
+        packet.connection_number = self._connect_num
+        packet_size = packet.total_size
+        merged_packet_size = NetConstants.HeaderSize + packet_size + 2
+        if merged_packet_size + self.MERGE_SIZE_THRESHOLD >= self._mtu:
+            if self.net_manager.enable_statistics:
+                self.statistics.increment_packets_sent()
+                self.statistics.add_bytes_sent(packet_size)
+            self.net_manager.send_raw(packet, self)
+            return
+
+        with self._merge_lock:
+            if NetConstants.HeaderSize + self._merge_pos + merged_packet_size > self._mtu:
+                self._send_merged_locked()
+            raw = self._merge_data.raw_data
+            pos = NetConstants.HeaderSize + self._merge_pos
+            _MERGED_SIZE.pack_into(raw, pos, packet_size)
+            pos += 2
+            raw[pos:pos + packet.size] = packet.raw_data[:packet.size]
+            if packet.payload is not None:
+                raw[pos + packet.size:pos + packet_size] = packet.payload
+            self._merge_pos += packet_size + 2
+            self._merge_count += 1
+            first = self._merge_count == 1
+
+        if first:
+            # 保证即使在更新之外发送（如接收线程回复ACK）也会在下次更新时发出
+            self.net_manager.add_peer_to_update_queue(self)
+
+    def send_merged(self) -> None:
+        """
+        发出合并缓冲区中的数据
+
+        C#方法: private void SendMerged()
+
+        说明: 只有一个包时去掉长度字段按原包发送
+        """
+        with self._merge_lock:
+            self._send_merged_locked()
+
+    def _send_merged_locked(self) -> None:
+        """send_merged的实现，调用方持有_merge_lock"""
+        from .constants import NetConstants
+
+        count = self._merge_count
+        if count == 0:
+            return
+
+        merge_data = self._merge_data
+        if count > 1:
+            merge_data.size = NetConstants.HeaderSize + self._merge_pos
+            merge_data.connection_number = self._connect_num
+            self.net_manager.send_raw(merge_data, self)
+            bytes_sent = merge_data.size
+        else:
+            start = NetConstants.HeaderSize + 2
+            bytes_sent = self._merge_pos - 2
+            self.net_manager.send_raw_data(
+                memoryview(merge_data.raw_data)[start:start + bytes_sent], self.remote_end_point
+            )
+
+        if self.net_manager.enable_statistics:
+            self.statistics.increment_packets_sent()
+            self.statistics.add_bytes_sent(bytes_sent)
+
+        self._merge_pos = 0
+        self._merge_count = 0
+
+    def _send_unreliable_queue(self) -> None:
+        """
+        发出排队的不可靠包
+
+        C#方法: internal void Update(float deltaTime) 中的不可靠队列部分
+
+        说明: 在锁内交换双缓冲队列，锁外发送并回收
+        """
+        with self._unreliable_channel_lock:
+            count = self._unreliable_pending_count
+            if count == 0:
+                return
+            self._unreliable_channel, self._unreliable_second_queue = \
+                self._unreliable_second_queue, self._unreliable_channel
+            self._unreliable_pending_count = 0
+
+        queue = self._unreliable_second_queue
+        for i in range(count):
+            packet = queue[i]
+            queue[i] = None
+            self.send_user_data(packet)
+            self.net_manager.pool_recycle(packet)
+
+    def update_send(self) -> None:
+        """
+        发送所有待发送的数据
+
+        C#方法: internal void Update(float deltaTime) 中的发送部分
+
+        说明: 依次发送通道包、不可靠包，最后把合并缓冲区作为Merged数据报发出。
+        由manager的update_peers对有数据待发送的peer调用
+        """
+        self.update_channels()
+        self._send_unreliable_queue()
+        self.send_merged()
+
+    def recycle_and_deliver(self, packet: 'NetPacket') -> None:
+        """
+        回收已确认的包，需要时触发交付事件
+
+        C#方法: internal void RecycleAndDeliver(NetPacket packet)
+
+        参数:
+            packet: NetPacket - 已被对方确认的包
+
+        说明: 带user_data的包触发MessageDelivered事件，分片消息在所有分片都确认后触发一次
+        """
+        if packet.user_data is not None:
+            from .net_event import NetEventType
+
+            if packet.is_fragmented:
+                fragment_id = packet.fragment_id
+                delivered = self._delivered_fragments.get(fragment_id, 0) + 1
+                if delivered == packet.fragments_total:
+                    self.net_manager.create_event(
+                        NetEventType.MessageDelivered, self, user_data=packet.user_data
+                    )
+                    self._delivered_fragments.pop(fragment_id, None)
+                else:
+                    self._delivered_fragments[fragment_id] = delivered
+            else:
+                self.net_manager.create_event(
+                    NetEventType.MessageDelivered, self, user_data=packet.user_data
+                )
+            packet.user_data = None
+        self.net_manager.pool_recycle(packet)
+
     # ==================== 断开连接 ====================
 
     def disconnect(self, data: Optional[bytes] = None) -> None:
@@ -546,7 +880,7 @@ class LiteNetPeer(ABC):
                 return result
 
             # 重置时间以防止重连保护
-            self._time_since_last_packet = 0
+            self._last_packet_time = self.net_manager.timer_wheel.now_ms
 
             # 发送关闭包
             from .packets.net_packet import NetPacket, PacketProperty
@@ -564,6 +898,475 @@ class LiteNetPeer(ABC):
 
             return result
 
+    # ==================== 接收 ====================
+
+    def process_packet(self, packet: 'NetPacket') -> None:
+        """
+        处理发给此peer的包
+
+        C#方法: internal void ProcessPacket(NetPacket packet)
+
+        参数:
+            packet: NetPacket - 收到的包
+
+        说明: 连接请求和断开由manager处理，这里只分发已连接peer的数据包。
+        包先经过manager的额外包层（见process_inbound_layer），被层拒绝的包丢弃
+        """
+        packet = self.net_manager.process_inbound_layer(packet)
+        if packet is not None:
+            self._dispatch_packet(packet)
+
+    def _dispatch_packet(self, packet: 'NetPacket') -> None:
+        """按包属性分发已经过包层的包，Merged包的子包直接从这里进入"""
+        from .constants import NetConstants, DeliveryMethod
+        from .packets.net_packet import PacketProperty
+
+        self._last_packet_time = self.net_manager.timer_wheel.now_ms
+        prop = packet.packet_property
+        if prop == PacketProperty.Merged:
+            self._process_merged(packet)
+        elif prop == PacketProperty.Ping:
+            self.process_ping(packet)
+        elif prop == PacketProperty.Pong:
+            self.process_pong(packet)
+        elif prop == PacketProperty.Channeled or prop == PacketProperty.Ack:
+            self.process_channeled(packet)
+        elif prop == PacketProperty.Unreliable:
+            self.net_manager.create_receive_event(
+                packet, DeliveryMethod.Unreliable, 0, NetConstants.HeaderSize, self
+            )
+        elif prop == PacketProperty.MtuCheck or prop == PacketProperty.MtuOk:
+            self.process_mtu_packet(packet)
+        else:
+            self.net_manager.pool_recycle(packet)
+
+    def _process_merged(self, packet: 'NetPacket') -> None:
+        """
+        拆分Merged包
+
+        C#方法: internal void ProcessPacket(NetPacket packet) 中的case PacketProperty.Merged
+
+        说明: 子包是原包缓冲区的切片，不复制数据。原包在所有子包
+        回收后才回收（见MergedPacketRef）
+        """
+        from .constants import NetConstants
+
+        view = packet.get_view()
+        size = packet.size
+        pos = NetConstants.HeaderSize
+        ref = MergedPacketRef(self.net_manager, packet)
+        try:
+            while pos + 2 <= size:
+                length = _MERGED_SIZE.unpack_from(view, pos)[0]
+                pos += 2
+                if size - pos < length:
+                    break
+                ref.acquire()
+                merged_packet = self.net_manager.pool_get_packet_from_view(view[pos:pos + length], ref.release)
+                if not merged_packet.verify():
+                    self.net_manager.pool_recycle(merged_packet)
+                    break
+                pos += length
+                self._dispatch_packet(merged_packet)
+        finally:
+            ref.release(None)
+
+    def add_reliable_packet(self, method: 'DeliveryMethod', p: 'NetPacket') -> None:
+        """
+        将可靠通道收到的包交付给应用，分片包在此重组
+
+        C#方法: internal void AddReliablePacket(DeliveryMethod method, NetPacket p)
+        C#源位置: LiteNetPeer.cs:797-862
+
+        参数:
+            method: DeliveryMethod - 交付方式
+            p: NetPacket - 收到的包
+
+        说明:
+            包头通过read_header()一次解码。分片按fragment_part * 分片大小
+            直接写入一块连续缓冲区，分片包写入后立即回收，到齐后缓冲区
+            作为一个包交付（见NetPacket.get_view）。重组中的内存受
+            fragment_memory_budget限制（包括每个重组的接收位图和先到的最后
+            分片），同时重组的分片ID数受max_incoming_fragment_ids限制，
+            超过fragment_timeout没有新分片的重组被丢弃
+        """
+        from .constants import NetConstants
+
+        header = p.read_header()
+        if header is None:
+            self.net_manager.pool_recycle(p)
+            return
+        if not header.is_fragmented:
+            self.net_manager.create_receive_event(
+                p,
+                method,
+                header.channel_id // NetConstants.ChannelTypeCount,
+                NetConstants.ChanneledHeaderSize,
+                self
+            )
+            return
+
+        with self._fragments_lock:
+            incoming_fragments = self._add_fragment(header, p)
+        if incoming_fragments is None:
+            return
+
+        resulting_packet = incoming_fragments.packet
+        resulting_packet.size = incoming_fragments.total_size
+        self.net_manager.create_receive_event(
+            resulting_packet,
+            method,
+            incoming_fragments.channel_id // NetConstants.ChannelTypeCount,
+            0,
+            self
+        )
+
+    def _add_fragment(self, header: 'PacketHeader', p: 'NetPacket') -> Optional['IncomingFragments']:
+        """
+        把分片加入重组
+
+        参数:
+            header: PacketHeader - 分片包头
+            p: NetPacket - 分片包（写入、保留或丢弃后由本方法负责回收）
+
+        返回:
+            IncomingFragments: 所有分片到齐时返回已完成的重组，否则返回None
+
+        说明: 调用方需持有_fragments_lock
+        """
+        from .constants import NetConstants
+        from .debug import NetDebug
+
+        manager = self.net_manager
+        incoming_fragments = self._holded_fragments.get(header.fragment_id)
+        if incoming_fragments is None:
+            # 分片数量不能超过上限
+            fragments_total = header.fragments_total
+            if fragments_total == 0 or fragments_total > manager.max_fragments_count:
+                manager.pool_recycle(p)
+                NetDebug.write_error("Fragments count exceeded")
+                return None
+            if len(self._holded_fragments) >= manager.max_incoming_fragment_ids:
+                manager.pool_recycle(p)
+                NetDebug.write_error("Too many fragmented packets in progress")
+                return None
+            # 接收位图在分配缓冲区之前就计入内存预算
+            if self._fragments_memory + fragments_total > manager.fragment_memory_budget:
+                manager.pool_recycle(p)
+                NetDebug.write_error("Fragment memory budget exceeded")
+                return None
+            incoming_fragments = IncomingFragments()
+            incoming_fragments.received = bytearray(fragments_total)
+            incoming_fragments.channel_id = header.channel_id
+            incoming_fragments.memory = fragments_total
+            self._fragments_memory += fragments_total
+            incoming_fragments.timer = manager.timer_wheel.schedule(
+                manager.fragment_timeout, self._on_fragments_timeout, header.fragment_id
+            )
+            self._holded_fragments[header.fragment_id] = incoming_fragments
+
+        received = incoming_fragments.received
+        part = header.fragment_part
+        payload_size = p.size - NetConstants.FragmentedHeaderTotalSize
+        is_last = part == len(received) - 1
+
+        # 校验分片：非最后分片大小必须一致，最后分片不能更大
+        fragment_size = incoming_fragments.fragment_size
+        if (part >= len(received)
+                or received[part]
+                or header.channel_id != incoming_fragments.channel_id
+                or payload_size <= 0
+                or (fragment_size and (payload_size > fragment_size
+                                       or (not is_last and payload_size != fragment_size)))):
+            manager.pool_recycle(p)
+            NetDebug.write_error("Invalid fragment packet")
+            return None
+
+        received[part] = 1
+        incoming_fragments.received_count += 1
+        incoming_fragments.total_size += payload_size
+        incoming_fragments.last_update = manager.timer_wheel.now_ms
+
+        if incoming_fragments.packet is None:
+            if is_last and len(received) > 1:
+                # 分片大小未知，先保留最后分片（计入内存预算），收到其他分片后再写入
+                held = len(p.raw_data)
+                if self._fragments_memory + held > manager.fragment_memory_budget:
+                    manager.pool_recycle(p)
+                    NetDebug.write_error("Fragment memory budget exceeded")
+                    self._drop_fragments(header.fragment_id)
+                    return None
+                incoming_fragments.last_fragment = p
+                incoming_fragments.memory += held
+                self._fragments_memory += held
+                return None
+            if not self._allocate_fragments_buffer(header.fragment_id, incoming_fragments, payload_size):
+                manager.pool_recycle(p)
+                return None
+
+        self._write_fragment(incoming_fragments, part, p)
+        last_fragment = incoming_fragments.last_fragment
+        if last_fragment is not None:
+            if last_fragment.size - NetConstants.FragmentedHeaderTotalSize > incoming_fragments.fragment_size:
+                NetDebug.write_error("Invalid fragment packet")
+                self._drop_fragments(header.fragment_id)
+                return None
+            held = len(last_fragment.raw_data)
+            incoming_fragments.last_fragment = None
+            incoming_fragments.memory -= held
+            self._fragments_memory -= held
+            self._write_fragment(incoming_fragments, len(received) - 1, last_fragment)
+
+        if incoming_fragments.received_count != len(received):
+            return None
+
+        # 所有分片到齐，缓冲区直接交付
+        del self._holded_fragments[header.fragment_id]
+        incoming_fragments.timer.cancel()
+        self._fragments_memory -= incoming_fragments.memory
+        return incoming_fragments
+
+    def _allocate_fragments_buffer(
+        self,
+        fragment_id: int,
+        incoming_fragments: 'IncomingFragments',
+        fragment_size: int
+    ) -> bool:
+        """
+        为重组分配最终大小的连续缓冲区
+
+        参数:
+            fragment_id: int - 分片ID
+            incoming_fragments: IncomingFragments - 重组状态
+            fragment_size: int - 每个分片的负载大小（最后分片除外）
+
+        返回:
+            bool: 分配成功返回True，超过内存预算时丢弃整个重组并返回False
+
+        说明: 调用方需持有_fragments_lock
+        """
+        from .debug import NetDebug
+
+        capacity = len(incoming_fragments.received) * fragment_size
+        if self._fragments_memory + capacity > self.net_manager.fragment_memory_budget:
+            NetDebug.write_error("Fragment memory budget exceeded")
+            self._drop_fragments(fragment_id)
+            return False
+
+        incoming_fragments.fragment_size = fragment_size
+        incoming_fragments.packet = self.net_manager.pool_get_packet(capacity)
+        incoming_fragments.memory += capacity
+        self._fragments_memory += capacity
+        return True
+
+    def _write_fragment(self, incoming_fragments: 'IncomingFragments', part: int, p: 'NetPacket') -> None:
+        """将分片负载写入重组缓冲区对应位置并回收分片包"""
+        from .constants import NetConstants
+
+        header_size = NetConstants.FragmentedHeaderTotalSize
+        offset = part * incoming_fragments.fragment_size
+        size = p.size - header_size
+        memoryview(incoming_fragments.packet.raw_data)[offset:offset + size] = \
+            memoryview(p.raw_data)[header_size:p.size]
+        self.net_manager.pool_recycle(p)
+
+    def _drop_fragments(self, fragment_id: int) -> None:
+        """丢弃未完成的重组并释放其内存（调用方需持有_fragments_lock）"""
+        incoming_fragments = self._holded_fragments.pop(fragment_id, None)
+        if incoming_fragments is None:
+            return
+        incoming_fragments.timer.cancel()
+        self._fragments_memory -= incoming_fragments.memory
+        if incoming_fragments.packet is not None:
+            self.net_manager.pool_recycle(incoming_fragments.packet)
+        if incoming_fragments.last_fragment is not None:
+            self.net_manager.pool_recycle(incoming_fragments.last_fragment)
+
+    def _on_fragments_timeout(self, fragment_id: int) -> None:
+        """
+        重组超时定时器回调
+
+        说明: 超过fragment_timeout没有收到新分片的重组被丢弃，否则按剩余时间重新调度
+        """
+        from .debug import NetDebug
+
+        with self._fragments_lock:
+            incoming_fragments = self._holded_fragments.get(fragment_id)
+            if incoming_fragments is None:
+                return
+            timeout = self.net_manager.fragment_timeout
+            idle = self.net_manager.timer_wheel.now_ms - incoming_fragments.last_update
+            if idle >= timeout:
+                NetDebug.write_error(f"Fragment reassembly timed out: {fragment_id}")
+                self._drop_fragments(fragment_id)
+                return
+            incoming_fragments.timer = self.net_manager.timer_wheel.schedule(
+                timeout - idle, self._on_fragments_timeout, fragment_id
+            )
+
+    @property
+    def fragments_memory(self) -> int:
+        """获取重组中的分片占用的内存（字节）"""
+        return self._fragments_memory
+
+    # ==================== Ping和MTU ====================
+
+    def update_ping(self, delta_time: float) -> None:
+        """
+        Ping发送和RTT重置
+
+        C#方法: internal void Update(float deltaTime) 中的Ping/RTT部分
+
+        参数:
+            delta_time: float - 距上次调用经过的时间（毫秒）
+
+        说明:
+            由manager的ping定时器每ping_interval调用一次。上一个ping
+            没有收到pong时，按已经过的时间计入RTT（ping超时）
+        """
+        self._ping_send_timer += delta_time
+        if self._ping_send_timer >= self.net_manager.ping_interval:
+            self._ping_send_timer = 0.0
+            self.send_ping()
+
+        self._rtt_reset_timer += delta_time
+        if self._rtt_reset_timer >= self.net_manager.ping_interval * 3:
+            self._rtt_reset_timer = 0.0
+            self._rtt = self._avg_rtt
+            self._rtt_count = 1
+
+    def send_ping(self) -> None:
+        """
+        发送ping
+
+        说明: 序号递增，用单调时钟记录发送时间供pong计算RTT
+        """
+        from .constants import NetConstants
+
+        self._ping_packet.sequence = (self._ping_packet.sequence + 1) % NetConstants.MaxSequence
+        now = time.monotonic()
+        if self._ping_sent_at is not None:
+            self._update_round_trip_time(int((now - self._ping_sent_at) * 1000))
+        self._ping_sent_at = now
+        self.net_manager.send_raw(self._ping_packet, self)
+
+    def process_ping(self, packet: 'NetPacket') -> None:
+        """
+        处理ping，回复带本地UTC时间的pong
+
+        C#方法: internal void ProcessPacket(NetPacket packet) 中的case PacketProperty.Ping
+        """
+        from .net_utils import NetUtils
+        from .utils.fast_bit_converter import FastBitConverter
+
+        if NetUtils.relative_sequence_number(packet.sequence, self._pong_packet.sequence) > 0:
+            FastBitConverter.get_bytes_int64(self._pong_packet.raw_data, 3, _utc_ticks())
+            self._pong_packet.sequence = packet.sequence
+            self.net_manager.send_raw(self._pong_packet, self, immediate=True)
+        self.net_manager.pool_recycle(packet)
+
+    def process_pong(self, packet: 'NetPacket') -> None:
+        """
+        处理pong，更新RTT和远端时间差
+
+        C#方法: internal void ProcessPacket(NetPacket packet) 中的case PacketProperty.Pong
+        """
+        from .net_event import NetEventType
+
+        if packet.sequence == self._ping_packet.sequence and self._ping_sent_at is not None:
+            elapsed_ms = int((time.monotonic() - self._ping_sent_at) * 1000)
+            self._ping_sent_at = None
+            remote_ticks = int.from_bytes(packet.raw_data[3:11], "little", signed=True)
+            self._remote_delta = remote_ticks + (elapsed_ms * _TICKS_PER_MILLISECOND) // 2 - _utc_ticks()
+            self._update_round_trip_time(elapsed_ms)
+            self.add_rtt_sample(elapsed_ms)
+            self.net_manager.create_event(
+                NetEventType.ConnectionLatencyUpdated, self, latency=elapsed_ms // 2
+            )
+        self.net_manager.pool_recycle(packet)
+
+    def update_mtu_logic(self, delta_time: float) -> bool:
+        """
+        MTU探测
+
+        C#方法: private void UpdateMtuLogic(float deltaTime)
+
+        参数:
+            delta_time: float - 距上次调用经过的时间（毫秒）
+
+        返回:
+            bool: MTU探测未结束，需要继续调用
+        """
+        from .constants import NetConstants
+        from .packets.net_packet import PacketProperty
+        from .utils.fast_bit_converter import FastBitConverter
+
+        if self._finish_mtu:
+            return False
+
+        self._mtu_check_timer += delta_time
+        if self._mtu_check_timer < self.MTU_CHECK_DELAY:
+            return True
+
+        self._mtu_check_timer = 0.0
+        self._mtu_check_attempts += 1
+        if self._mtu_check_attempts >= self.MAX_MTU_CHECK_ATTEMPTS:
+            self._finish_mtu = True
+            return False
+
+        with self._mtu_mutex:
+            if self._mtu_idx >= len(NetConstants._possible_mtu) - 1:
+                return True
+
+            # 发送增大的包，MTU值写在包首和包尾
+            new_mtu = NetConstants._possible_mtu[self._mtu_idx + 1] - self.net_manager.extra_packet_size_for_layer
+            p = self.net_manager.pool_get_packet(new_mtu)
+            p.packet_property = PacketProperty.MtuCheck
+            FastBitConverter.get_bytes_int32(p.raw_data, 1, new_mtu)
+            FastBitConverter.get_bytes_int32(p.raw_data, p.size - 4, new_mtu)
+            self.net_manager.send_raw_and_recycle(p, self.remote_end_point)
+        return True
+
+    def process_mtu_packet(self, packet: 'NetPacket') -> None:
+        """
+        处理MtuCheck/MtuOk包
+
+        C#方法: private void ProcessMtuPacket(NetPacket packet)
+        """
+        from .constants import NetConstants
+        from .debug import NetDebug
+        from .packets.net_packet import PacketProperty
+
+        # header + int
+        if packet.size < NetConstants._possible_mtu[0]:
+            self.net_manager.pool_recycle(packet)
+            return
+
+        received_mtu = int.from_bytes(packet.raw_data[1:5], "little", signed=True)
+        end_mtu_check = int.from_bytes(packet.raw_data[packet.size - 4:packet.size], "little", signed=True)
+        if (received_mtu != packet.size or received_mtu != end_mtu_check
+                or received_mtu > NetConstants.MaxPacketSize):
+            self.net_manager.pool_recycle(packet)
+            return
+
+        if packet.packet_property == PacketProperty.MtuCheck:
+            self._mtu_check_attempts = 0
+            packet.packet_property = PacketProperty.MtuOk
+            self.net_manager.send_raw_and_recycle(packet, self.remote_end_point, immediate=True)
+            return
+
+        # MtuOk: 只接受下一级MTU，重复或过小的回复直接丢弃
+        if (received_mtu > self._mtu and not self._finish_mtu and received_mtu ==
+                NetConstants._possible_mtu[self._mtu_idx + 1] - self.net_manager.extra_packet_size_for_layer):
+            with self._mtu_mutex:
+                self._set_mtu(self._mtu_idx + 1)
+            # 达到最大值则结束
+            if self._mtu_idx == len(NetConstants._possible_mtu) - 1:
+                self._finish_mtu = True
+            NetDebug.write(f"[MTU] ok. Increase to: {self._mtu}")
+        # 批量接收时包占用ReceiveRing槽位，不转发的包必须回收
+        self.net_manager.pool_recycle(packet)
+
     # ==================== RTT计算 ====================
 
     def _update_round_trip_time(self, round_trip_time: int) -> None:
@@ -575,11 +1378,109 @@ class LiteNetPeer(ABC):
 
         参数:
             round_trip_time: int - 新的RTT值（毫秒）
+
+        说明: 只维护ping/round_trip_time使用的平均值。重发延迟由
+        add_rtt_sample更新的rtt_estimator决定，不再按平均值计算
         """
         self._rtt += round_trip_time
         self._rtt_count += 1
         self._avg_rtt = self._rtt // self._rtt_count
-        self._resend_delay = 25.0 + self._avg_rtt * 2.1  # 25 ms + double rtt
+
+    def add_rtt_sample(self, rtt_ms: float) -> None:
+        """
+        加入一个测得的RTT样本
+
+        参数:
+            rtt_ms: float - RTT（毫秒）
+
+        说明: 来自pong和只发送过一次的可靠包的确认（Karn算法：
+        重发过的包无法确定确认对应哪次发送，不采样）。更新重发延迟、
+        拥塞控制器和统计
+        """
+        self.rtt_estimator.add_sample(rtt_ms)
+        if self.net_manager.enable_statistics:
+            self.statistics.update_rtt(int(rtt_ms))
+
+        if self.congestion_controller is not None:
+            with self._congestion_lock:
+                self.congestion_controller.on_rtt_sample(rtt_ms, self.net_manager.timer_wheel.now_ms)
+                self._update_congestion_state()
+
+    # ==================== 拥塞控制 ====================
+
+    def acquire_send_budget(self, size: int) -> bool:
+        """
+        为首次发送的可靠包占用拥塞窗口和限速额度
+
+        参数:
+            size: int - 包大小（字节）
+
+        返回:
+            bool: 可以发送返回True，否则包应留在队列中等下次更新
+
+        说明: 由可靠通道在拥塞控制启用时调用。没有在途数据时
+        总是允许发送一个包，避免窗口小于包大小时停止发送
+        """
+        with self._congestion_lock:
+            in_flight = self._bytes_in_flight
+            if in_flight > 0 and in_flight + size > self.congestion_controller.congestion_window:
+                self._send_limited = True
+                return False
+            if not self._pacer.try_consume(size, self.net_manager.timer_wheel.now_ms):
+                self._send_limited = True
+                return False
+            self._bytes_in_flight = in_flight + size
+        return True
+
+    def on_reliable_resend(self, size: int) -> None:
+        """
+        重发可靠包
+
+        参数:
+            size: int - 包大小（字节）
+
+        说明: 重发不受窗口和限速限制（包已计入在途字节数），只占用限速额度
+        """
+        with self._congestion_lock:
+            self._pacer.consume(size, self.net_manager.timer_wheel.now_ms)
+
+    def on_reliable_acked(self, acked_bytes: int) -> None:
+        """
+        可靠包被确认
+
+        参数:
+            acked_bytes: int - 一个ACK新确认的字节数
+        """
+        with self._congestion_lock:
+            self._bytes_in_flight = max(self._bytes_in_flight - acked_bytes, 0)
+            self.congestion_controller.on_packets_acked(
+                acked_bytes, self.net_manager.timer_wheel.now_ms, not self._send_limited
+            )
+            self._send_limited = False
+            self._update_congestion_state()
+
+    def on_reliable_lost(self, count: int) -> None:
+        """
+        检测到可靠包丢失（快速重传或重发定时器到期）
+
+        参数:
+            count: int - 丢失的包数
+        """
+        with self._congestion_lock:
+            self.congestion_controller.on_packets_lost(count, self.net_manager.timer_wheel.now_ms)
+            self._update_congestion_state()
+
+    def _update_congestion_state(self) -> None:
+        """
+        按控制器的当前值设置限速器并更新统计
+
+        说明: 调用方持有_congestion_lock（构造时除外）。令牌桶容量为一次
+        更新周期的发送量（至少两个MTU），使发送分散到各次更新中
+        """
+        rate = self.congestion_controller.pacing_rate
+        burst = max(2 * self._mtu, int(rate * self.net_manager.update_time / 1000.0))
+        self._pacer.set_rate(rate, burst)
+        self.statistics.set_congestion_state(self.congestion_controller.congestion_window, rate)
 
     # ==================== 统计信息 ====================
 
@@ -610,11 +1511,53 @@ class IncomingFragments:
     用于管理分片重组
     """
 
+    __slots__ = (
+        "received", "received_count", "total_size", "channel_id", "fragment_size",
+        "packet", "last_fragment", "memory", "last_update", "timer",
+    )
+
     def __init__(self):
-        self.fragments: List[Optional['NetPacket']] = []
+        self.received = bytearray()              # 每个分片是否已收到
         self.received_count = 0
-        self.total_size = 0
+        self.total_size = 0                      # 已收到的负载字节数
         self.channel_id = 0
+        self.fragment_size = 0                   # 非最后分片的负载大小，0表示未知
+        self.packet: Optional['NetPacket'] = None          # 最终大小的连续缓冲区
+        self.last_fragment: Optional['NetPacket'] = None   # 分片大小未知时先到的最后分片
+        self.memory = 0                          # 计入peer内存预算的字节数
+        self.last_update = 0.0                   # 最近收到分片的定时轮时间
+        self.timer: Optional['TimerHandle'] = None
+
+
+class MergedPacketRef:
+    """
+    Merged包的子包引用计数
+
+    子包直接引用Merged包的缓冲区，最后一个子包回收时才回收Merged包。
+    初始计数1由拆分过程自己持有，拆分结束时释放
+    """
+
+    __slots__ = ("_manager", "_packet", "_count", "_lock")
+
+    def __init__(self, manager: 'LiteNetManager', packet: 'NetPacket'):
+        self._manager = manager
+        self._packet = packet
+        self._count = 1
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """增加一个子包"""
+        with self._lock:
+            self._count += 1
+
+    def release(self, view) -> None:
+        """子包回收时调用（作为NetPacket的释放回调）"""
+        with self._lock:
+            self._count -= 1
+            if self._count:
+                return
+        packet, self._packet = self._packet, None
+        self._manager.pool_recycle(packet)
 
 
 __all__ = [
@@ -624,4 +1567,5 @@ __all__ = [
     "ShutdownResult",
     "LiteNetPeer",
     "IncomingFragments",
+    "MergedPacketRef",
 ]
@@ -14,7 +14,7 @@ from enum import IntEnum
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .net_data_reader import NetDataReader
+    from .utils.net_data_reader import NetDataReader
 
 
 class NetEventType(IntEnum):
@@ -78,6 +78,12 @@ class NetEvent:
         data_reader: NetDataReader - 数据读取器
     """
 
+    __slots__ = (
+        "next", "type", "peer", "remote_end_point", "user_data", "latency",
+        "error_code", "disconnect_reason", "connection_request",
+        "delivery_method", "channel_number", "_data_reader", "_manager",
+    )
+
     def __init__(self, manager=None):
         """
         创建事件
@@ -144,7 +150,7 @@ class NetEvent:
             按需创建，避免不必要的开销
         """
         if self._data_reader is None and self._manager is not None:
-            from .net_data_reader import NetDataReader
+            from .utils.net_data_reader import NetDataReader
             self._data_reader = NetDataReader()
         return self._data_reader
 
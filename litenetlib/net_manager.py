@@ -31,6 +31,7 @@ if TYPE_CHECKING:
     from .utils.ntp_packet import NtpPacket
     from .utils.net_data_reader import NetDataReader
     from .utils.net_data_writer import NetDataWriter
+    from .peer_group import PeerGroup, PeerSet
 
 
 class NetManager(LiteNetManager):
@@ -126,16 +127,151 @@ class NetManager(LiteNetManager):
             channel_number: int - 通道编号（0到channels_count-1）
             options: DeliveryMethod - 发送选项
             exclude_peer: Optional[NetPeer] - 排除的peer
+
+        说明:
+            负载只编码一次：data（非bytes时先复制一次为bytes）和各分片切片
+            被所有peer的包共享，每个peer只分配并填写自己的包头（序号、通道、
+            分片ID）。_peer_lock只在取peer列表时持有，入队时不持有
+        """
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        self._send_to_all_shared(data, channel_number, options, exclude_peer)
+
+    def create_peer_group(self, name: Optional[str] = None) -> 'PeerGroup':
+        """
+        创建peer组
+
+        参数:
+            name: Optional[str] - 组名（仅供应用使用）
+
+        返回:
+            PeerGroup: 空的peer组
+
+        说明:
+            peer组用于向房间、队伍、空间格子等子集广播。peer被移除时
+            自动退出所有组
+        """
+        from .peer_group import PeerGroup
+        return PeerGroup(self, name)
+
+    def send_to_group(
+        self,
+        group: 'PeerSet',
+        data: bytes,
+        channel_number: int,
+        options: DeliveryMethod,
+        exclude_peer: Optional['NetPeer'] = None
+    ) -> None:
+        """
+        发送数据到组内所有peer
+
+        参数:
+            group: PeerSet - peer组或组的并集/差集/交集
+            data: bytes - 要发送的数据
+            channel_number: int - 通道编号
+            options: DeliveryMethod - 发送选项
+            exclude_peer: Optional[NetPeer] - 排除的peer
+
+        说明:
+            与send_to_all相同，负载只编码一次并被所有peer共享。
+            直接遍历组的成员快照（集合运算时惰性遍历各操作数），
+            不生成peer列表，也不持有_peer_lock
+        """
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        self._send_shared(group, data, channel_number, options, exclude_peer)
+
+    def send_to_group_with_writer(
+        self,
+        group: 'PeerSet',
+        writer: 'NetDataWriter',
+        channel_number: int,
+        options: DeliveryMethod,
+        exclude_peer: Optional['NetPeer'] = None
+    ) -> None:
+        """
+        发送数据到组内所有peer（使用NetDataWriter）
+
+        参数:
+            group: PeerSet - peer组或组的并集/差集/交集
+            writer: NetDataWriter - 包含数据的写入器
+            channel_number: int - 通道编号
+            options: DeliveryMethod - 发送选项
+            exclude_peer: Optional[NetPeer] - 排除的peer
+        """
+        self._send_shared(group, writer.copy_data(), channel_number, options, exclude_peer)
+
+    def remove_peer(self, peer: LiteNetPeer, shutdown: bool = False) -> None:
+        """
+        从管理器移除peer
+
+        C#方法: private void RemovePeer(LiteNetPeer netPeer, bool shutdown)
+
+        参数:
+            peer: LiteNetPeer - 要移除的peer
+            shutdown: bool - 是否关闭连接
+
+        说明:
+            在LiteNetManager.remove_peer之后让peer退出所有PeerGroup
+        """
+        super().remove_peer(peer, shutdown)
+        groups = getattr(peer, "_peer_groups", None)
+        if groups:
+            for group in list(groups):
+                group.remove(peer)
+
+    def _send_to_all_shared(
+        self,
+        data: bytes,
+        channel_number: int,
+        options: DeliveryMethod,
+        exclude_peer: Optional['NetPeer']
+    ) -> None:
+        """
+        把不可变负载发送给所有peer
+
+        参数:
+            data: bytes - 不可变负载，由所有peer的包共享
+            channel_number: int - 通道编号
+            options: DeliveryMethod - 发送选项
+            exclude_peer: Optional[NetPeer] - 排除的peer
         """
         from .net_peer import NetPeer
 
         with self._peer_lock:
+            peers = []
             peer = self._head_peer
             while peer is not None:
-                if isinstance(peer, NetPeer) and peer is not exclude_peer:
-                    peer.send(data, channel_number, options)
+                if isinstance(peer, NetPeer):
+                    peers.append(peer)
                 peer = peer.next_peer
 
+        self._send_shared(peers, data, channel_number, options, exclude_peer)
+
+    @staticmethod
+    def _send_shared(
+        peers,
+        data: bytes,
+        channel_number: int,
+        options: DeliveryMethod,
+        exclude_peer: Optional['NetPeer']
+    ) -> None:
+        """
+        把不可变负载发送给一组peer
+
+        参数:
+            peers: 可迭代的NetPeer
+            data: bytes - 不可变负载，由所有peer的包共享
+            channel_number: int - 通道编号
+            options: DeliveryMethod - 发送选项
+            exclude_peer: Optional[NetPeer] - 排除的peer
+        """
+        payload = memoryview(data)
+        fragment_cache = {}
+        for peer in peers:
+            if peer is not exclude_peer:
+                peer.send_shared(payload, channel_number, options, fragment_cache)
+
     def send_to_all_with_writer(
         self,
         writer: 'NetDataWriter',
@@ -154,8 +290,12 @@ class NetManager(LiteNetManager):
             channel_number: int - 通道编号
             options: DeliveryMethod - 发送选项
             exclude_peer: Optional[NetPeer] - 排除的peer
+
+        说明:
+            只复制writer中已写入的length字节一次（writer之后可以重用），
+            该副本由所有peer共享
         """
-        self.send_to_all(writer.data, channel_number, options, exclude_peer)
+        self._send_to_all_shared(writer.copy_data(), channel_number, options, exclude_peer)
 
     # ========================================================================
     # LiteNetManager抽象方法实现
@@ -293,18 +433,13 @@ class NetManager(LiteNetManager):
             )
 
         elif evt.type == NetEventType.PeerAddressChanged:
-            # 更新peer地址
-            with self._peer_lock:
-                if self._contains_peer(evt.peer):
-                    self.remove_peer_from_set(evt.peer)
-                    previous_address = (evt.peer.address, evt.peer.port)
-                    evt.peer.finish_end_point_change(evt.remote_end_point)
-                    self.add_peer_to_set(evt.peer)
-
-                    self._net_event_listener.on_peer_address_changed(
-                        net_peer,
-                        previous_address
-                    )
+            # 更新peer地址，peer已被移除或变更未完成时不通知
+            previous_address = evt.peer.remote_end_point
+            if self.finish_end_point_change(evt.peer, evt.remote_end_point):
+                self._net_event_listener.on_peer_address_changed(
+                    net_peer,
+                    previous_address
+                )
 
         # 回收事件
         if empty_data:
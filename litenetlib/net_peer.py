@@ -11,8 +11,9 @@ C#行数: ~244行
 """
 
 import threading
-from typing import Optional, List, TYPE_CHECKING
-from queue import Queue
+from collections import deque
+from operator import attrgetter
+from typing import Deque, Dict, Optional, List, TYPE_CHECKING
 
 from .constants import DeliveryMethod, NetConstants
 from .lite_net_peer import LiteNetPeer
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
     from .net_manager import NetManager
     from .connection_request import ConnectionRequest
     from .utils.net_data_writer import NetDataWriter
+    from .peer_group import PeerGroup
 
 
 class NetPeer(LiteNetPeer):
@@ -40,6 +42,7 @@ class NetPeer(LiteNetPeer):
     - 分片和重组
     - MTU发现
     - ACK/NACK处理
+    - 通道调度（见update_channels）
     """
 
     def __init__(
@@ -73,12 +76,16 @@ class NetPeer(LiteNetPeer):
             super().__init__(net_manager, remote_end_point, id)
 
         self._net_manager = net_manager
-        self._channel_send_queue: Queue[BaseChannel] = Queue()
+        # 有数据待发送的通道（通道自身的标志保证只加入一次；
+        # deque的append/popleft是原子操作，不需要额外加锁）
+        self._ready_channels: Deque[BaseChannel] = deque()
+        # 所属的PeerGroup（由PeerGroup维护，peer移除时退出所有组）
+        self._peer_groups: Dict['PeerGroup', None] = {}
 
         # 创建通道数组
         channels_count = net_manager.channels_count
         self._channels: List[Optional[BaseChannel]] = [
-            None for _ in range(channels_count * NetConstants.channel_type_count)
+            None for _ in range(channels_count * NetConstants.ChannelTypeCount)
         ]
 
     @property
@@ -116,7 +123,7 @@ class NetPeer(LiteNetPeer):
             return new_channel
 
         # 根据交付方法创建通道类型
-        delivery_method = DeliveryMethod(channel_number % NetConstants.channel_type_count)
+        delivery_method = DeliveryMethod(channel_number % NetConstants.ChannelTypeCount)
 
         if delivery_method == DeliveryMethod.ReliableUnordered:
             new_channel = ReliableChannel(self, False, channel_number)
@@ -130,6 +137,11 @@ class NetPeer(LiteNetPeer):
             # Unreliable通道不需要创建
             return None
 
+        # 调度参数按通道编号配置
+        number = channel_number // NetConstants.ChannelTypeCount
+        new_channel.priority = self._net_manager.channel_priorities.get(number, 0)
+        new_channel.quota = self._net_manager.channel_quotas.get(number, new_channel.quota)
+
         # 线程安全地设置通道
         if self._channels[channel_number] is None:
             self._channels[channel_number] = new_channel
@@ -142,20 +154,89 @@ class NetPeer(LiteNetPeer):
 
         C#方法: protected override void UpdateChannels()
         C#源位置: NetPeer.cs:182-199
+
+        说明:
+            通道按priority从小到大处理（严格优先级）。manager的
+            channel_send_budget不为0时是每次更新的字节数上限：同一优先级的
+            通道按quota做差额轮询（DRR）分配，前面的优先级用完后后面的通道
+            只发送ACK和重发。仍有数据的通道留到下次更新
         """
-        if self._channel_send_queue.empty():
+        ready = self._ready_channels
+        count = len(ready)
+        if count == 0:
             return
 
-        count = self._channel_send_queue.qsize()
-        while count > 0:
-            try:
-                channel = self._channel_send_queue.get_nowait()
-                if channel.send_next_packets():
-                    # 仍然有待发送的包，重新加入队列
-                    self._channel_send_queue.put(channel)
-                count -= 1
-            except:
+        channels = [ready.popleft() for _ in range(count)]
+        if count > 1:
+            channels.sort(key=attrgetter("priority"))
+
+        budget = self._net_manager.channel_send_budget
+        if budget <= 0:
+            remaining = [channel for channel in channels if channel.send_and_check_queue()]
+        else:
+            remaining = []
+            start = 0
+            while start < count:
+                priority = channels[start].priority
+                end = start + 1
+                while end < count and channels[end].priority == priority:
+                    end += 1
+                budget = self._send_priority_level(channels[start:end], budget, remaining)
+                start = end
+
+        if remaining:
+            # 仍然有待发送的包，重新加入队列
+            ready.extend(remaining)
+            self._net_manager.add_peer_to_update_queue(self)
+
+    def _send_priority_level(self, channels: List[BaseChannel], budget: int, remaining: List[BaseChannel]) -> int:
+        """
+        按差额轮询发送同一优先级的通道
+
+        参数:
+            channels: List[BaseChannel] - 同一优先级的通道
+            budget: int - 本次更新剩余的字节数（可能为负）
+            remaining: List[BaseChannel] - 收集仍有数据的通道
+
+        返回:
+            int: 发送后剩余的字节数
+
+        说明: 每轮每个通道的额度增加quota，最多发送额度内的字节（最后一个包
+        可以超出，超出部分从额度中扣除）。通道发完或因窗口等原因
+        没有用完额度时额度清零。
+        没有剩余字节时只调用一轮，让通道发送ACK和重发
+        """
+        active = channels
+        while active:
+            has_budget = budget > 0
+            sent_any = False
+            still_active = []
+            for channel in active:
+                if budget > 0:
+                    channel._deficit += channel.quota
+                    allowance = min(channel._deficit, budget)
+                else:
+                    allowance = 0
+                channel.send_budget = allowance
+                has_more = channel.send_and_check_queue()
+                left = channel.send_budget
+                channel.send_budget = None
+                spent = allowance - left
+                budget -= spent
+                if has_more:
+                    still_active.append(channel)
+                # 因窗口等其他原因没有用完额度的通道不累积额度
+                if has_more and left <= 0:
+                    channel._deficit -= spent
+                else:
+                    channel._deficit = 0
+                if spent > 0:
+                    sent_any = True
+            active = still_active
+            if not has_budget or not sent_any or budget <= 0:
                 break
+        remaining.extend(active)
+        return budget
 
     def process_channeled(self, packet: NetPacket) -> None:
         """
@@ -167,7 +248,7 @@ class NetPeer(LiteNetPeer):
         参数:
             packet: NetPacket - 收到的包
         """
-        if packet.channel_id >= len(self._channels):
+        if packet.size < NetConstants.ChanneledHeaderSize or packet.channel_id >= len(self._channels):
             self._net_manager.pool_recycle(packet)
             return
 
@@ -187,8 +268,11 @@ class NetPeer(LiteNetPeer):
 
         参数:
             channel: BaseChannel - 要添加的通道
+
+        说明: 同时通知manager下次更新时处理此peer
         """
-        self._channel_send_queue.put(channel)
+        self._ready_channels.append(channel)
+        self._net_manager.add_peer_to_update_queue(self)
 
     # ========================================================================
     # 公共Send方法（7个重载）
@@ -296,7 +380,7 @@ class NetPeer(LiteNetPeer):
         返回:
             int: 通道队列中的包数量
         """
-        idx = channel_number * NetConstants.channel_type_count + (
+        idx = channel_number * NetConstants.ChannelTypeCount + (
             DeliveryMethod.ReliableOrdered if ordered else DeliveryMethod.ReliableUnordered
         )
         channel = self._channels[idx]
@@ -304,6 +388,57 @@ class NetPeer(LiteNetPeer):
             return len(channel.outgoing_queue)
         return 0
 
+    def get_outgoing_queue_size(self, channel_number: int, delivery_method: DeliveryMethod) -> int:
+        """
+        获取通道出队队列中的包数量
+
+        参数:
+            channel_number: int - 通道编号
+            delivery_method: DeliveryMethod - 发送方式
+
+        返回:
+            int: 等待发送的包数量（Unreliable或未创建的通道返回0）
+        """
+        if delivery_method == DeliveryMethod.Unreliable:
+            return 0
+        channel = self._channels[channel_number * NetConstants.ChannelTypeCount + delivery_method]
+        return 0 if channel is None else channel.outgoing_queue_size
+
+    def get_queue_delay(self, channel_number: int, delivery_method: DeliveryMethod) -> float:
+        """
+        获取通道的排队延迟
+
+        参数:
+            channel_number: int - 通道编号
+            delivery_method: DeliveryMethod - 发送方式
+
+        返回:
+            float: 包从入队到首次发送的平滑延迟（毫秒，Unreliable或未创建的通道返回0）
+        """
+        if delivery_method == DeliveryMethod.Unreliable:
+            return 0.0
+        channel = self._channels[channel_number * NetConstants.ChannelTypeCount + delivery_method]
+        return 0.0 if channel is None else channel.queue_delay
+
+    def can_send(self, channel_number: int, delivery_method: DeliveryMethod) -> bool:
+        """
+        检查通道是否低于出队队列高水位
+
+        说明: 配合NetManager.outgoing_queue_high_water_mark实现发送端背压，
+        返回False时应用应暂缓发送
+
+        参数:
+            channel_number: int - 通道编号
+            delivery_method: DeliveryMethod - 发送方式
+
+        返回:
+            bool: 可以继续发送返回True
+        """
+        if delivery_method == DeliveryMethod.Unreliable:
+            return True
+        channel = self._channels[channel_number * NetConstants.ChannelTypeCount + delivery_method]
+        return channel is None or not channel.is_over_high_water_mark
+
     def create_packet_from_pool(self, delivery_method: DeliveryMethod, channel_number: int):
         """
         从对象池创建临时包（最大大小MTU - headerSize）
@@ -328,7 +463,7 @@ class NetPeer(LiteNetPeer):
         else:
             from .packets.net_packet import PacketProperty
             packet.packet_property = PacketProperty.Channeled
-            channel_id = channel_number * NetConstants.channel_type_count + delivery_method
+            channel_id = channel_number * NetConstants.ChannelTypeCount + delivery_method
             return PooledPacket(packet, mtu, channel_id)
 
     def send_internal(
@@ -349,8 +484,8 @@ class NetPeer(LiteNetPeer):
             delivery_method: DeliveryMethod - 发送方式
             user_data: Optional[object] - 用户数据
         """
-        # 这里调用父类LiteNetPeer的send_with_channel方法
-        self.send_with_channel(data, channel_number, delivery_method, user_data)
+        # 这里调用父类LiteNetPeer的_send_internal方法
+        self._send_internal(data, channel_number, delivery_method, user_data)
 
 
 class PooledPacket:
@@ -4,10 +4,75 @@ NetSocket.cs translation
 UDP socket wrapper for IPv4 and IPv6
 """
 
+import errno
+import selectors
 import socket
+import struct
+import sys
 import threading
-from typing import Optional, Callable, Tuple
+from collections import deque
+from typing import Optional, Callable, Tuple, List, Sequence
 from .constants import NetConstants
+from .utils.sendmmsg import SENDMMSG_AVAILABLE, sendmmsg
+
+# Non-blocking flag used to drain the socket after a wakeup (absent on Windows)
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+
+# Scatter-gather send (absent on Windows)
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+# recvmsg reports truncated datagrams through MSG_TRUNC (absent on Windows,
+# where a truncated receive raises instead)
+_HAS_RECVMSG = hasattr(socket.socket, "recvmsg_into")
+_MSG_TRUNC = getattr(socket, "MSG_TRUNC", 0)
+
+# Linux UDP segmentation offload options (linux/udp.h), not exposed by
+# the socket module on every Python version
+_SOL_UDP = getattr(socket, "SOL_UDP", 17)
+_UDP_SEGMENT = getattr(socket, "UDP_SEGMENT", 103)
+_UDP_GRO = getattr(socket, "UDP_GRO", 104)
+_GSO_SIZE = struct.Struct("=H")
+_GRO_SIZE = struct.Struct("=i")
+
+# Kernel limits for one GSO send (UDP_MAX_SEGMENTS, IP payload size)
+GSO_MAX_SEGMENTS = 64
+GSO_MAX_BYTES = 65000
+
+
+class ReceiveRing:
+    """
+    Ring of preallocated receive buffers
+
+    Buffers are handed out by acquire() and only become reusable after
+    release() is called, which normally happens when the packet wrapping the
+    buffer is recycled through the manager's packet pool.
+    """
+
+    def __init__(self, count: int, buffer_size: int):
+        self.buffers: List[bytearray] = [bytearray(buffer_size) for _ in range(count)]
+        self.views: List[memoryview] = [memoryview(b) for b in self.buffers]
+        self._index = {id(b): i for i, b in enumerate(self.buffers)}
+        # deque append/popleft are atomic, so no lock is needed between
+        # the receive thread and the thread recycling packets
+        self._free = deque(range(count))
+
+    @property
+    def free_count(self) -> int:
+        """Number of buffers available for receiving"""
+        return len(self._free)
+
+    def acquire(self) -> int:
+        """Take a free buffer index, or -1 if every buffer is in flight"""
+        try:
+            return self._free.popleft()
+        except IndexError:
+            return -1
+
+    def release(self, buffer) -> None:
+        """Return a buffer (bytearray or memoryview over it) to the ring"""
+        if isinstance(buffer, memoryview):
+            buffer = buffer.obj
+        self._free.append(self._index[id(buffer)])
 
 
 class NetSocket:
@@ -20,21 +85,61 @@ class NetSocket:
     # Class-level IPv6 support detection
     _ipv6_support: Optional[bool] = None
 
-    def __init__(self, net_manager):
+    def __init__(self, net_manager, batch_receive: bool = False,
+                 receive_ring_size: int = NetConstants.ReceiveRingSize,
+                 reuse_port: bool = False, udp_offload: bool = False):
         """
         Initialize socket
 
         C# constructor: internal NetSocket(NetManager netManager)
+
+        With batch_receive enabled every ready datagram is drained in a single
+        wakeup into a ring of preallocated buffers and passed to
+        on_message_received(data, address, release) as a memoryview without
+        copying. The receiver must call release(data) (usually through
+        LiteNetManager.pool_recycle) before the buffer is reused. If
+        on_message_received raises, the socket releases the buffer itself,
+        so the receiver must not keep it in that case. Ring buffers hold
+        NetConstants.PacketPoolMtuSize bytes (MTU plus packet layer
+        overhead); larger datagrams are dropped and counted in
+        truncated_datagrams.
+
+        With reuse_port enabled sockets are bound with SO_REUSEPORT so several
+        processes can share one port (see ShardedNetServer).
+
+        With udp_offload enabled on Linux, start() turns on UDP_SEGMENT (GSO)
+        and UDP_GRO where the kernel supports them. send_batch then sends runs
+        of equal-sized datagrams to one address as a single GSO send, and the
+        receive loop splits GRO-coalesced datagrams back into segments. Either
+        feature stays off when the kernel rejects it (see gso_enabled and
+        gro_enabled).
         """
         self._net_manager = net_manager
         self._udp_socket_v4: Optional[socket.socket] = None
         self._udp_socket_v6: Optional[socket.socket] = None
         self._is_running: bool = False
+        self.reuse_port = reuse_port
 
         # Receive threads
         self._receive_thread_v4: Optional[threading.Thread] = None
         self._receive_thread_v6: Optional[threading.Thread] = None
 
+        # Batched receive
+        self.batch_receive = batch_receive
+        self._receive_ring_size = receive_ring_size
+        self._receive_ring_v4: Optional[ReceiveRing] = None
+        self._receive_ring_v6: Optional[ReceiveRing] = None
+        self.receive_poll_timeout = 0.1
+        self.truncated_datagrams = 0
+
+        # Batched send (see send_batch)
+        self.use_sendmmsg = SENDMMSG_AVAILABLE
+
+        # UDP GSO/GRO offload, detected in start()
+        self.udp_offload = udp_offload
+        self._gso_enabled = False
+        self._gro_enabled = False
+
     @classmethod
     def ipv6_support(cls) -> bool:
         """
@@ -51,16 +156,65 @@ class NetSocket:
                 cls._ipv6_support = False
         return cls._ipv6_support
 
+    @staticmethod
+    def reuse_port_support() -> bool:
+        """Check if SO_REUSEPORT is available on this platform"""
+        return hasattr(socket, "SO_REUSEPORT")
+
+    @property
+    def gso_enabled(self) -> bool:
+        """Check if runs of equal-sized datagrams are sent with UDP_SEGMENT"""
+        return self._gso_enabled
+
+    @property
+    def gro_enabled(self) -> bool:
+        """Check if coalesced UDP_GRO datagrams are received and split"""
+        return self._gro_enabled
+
+    @staticmethod
+    def _enable_udp_offload(sock: socket.socket) -> Tuple[bool, bool]:
+        """
+        Turn on GSO and GRO for sock where the kernel supports them
+
+        Returns:
+            (GSO supported, GRO enabled)
+        """
+        if not sys.platform.startswith("linux") or not _HAS_SENDMSG:
+            return False, False
+        try:
+            # Segment size 0 leaves sends unsegmented unless a send asks for it
+            sock.setsockopt(_SOL_UDP, _UDP_SEGMENT, 0)
+            gso = True
+        except OSError:
+            gso = False
+        try:
+            sock.setsockopt(_SOL_UDP, _UDP_GRO, 1)
+            gro = True
+        except OSError:
+            gro = False
+        return gso, gro
+
     @property
     def is_running(self) -> bool:
         """Check if socket is running"""
         return self._is_running
 
+    @property
+    def local_port(self) -> int:
+        """Get bound local port (0 if not running)"""
+        sock = self._udp_socket_v4 or self._udp_socket_v6
+        if sock is None:
+            return 0
+        return sock.getsockname()[1]
+
     def start(self, port: int, listen_ipv4: bool, listen_ipv6: bool) -> bool:
         """
         Start socket
 
         C# method: internal bool Start(int port, bool listenIPv4, bool listenIPv6)
+
+        On success the socket becomes net_manager.net_socket, so the
+        manager's sends go out through it; stop() clears it again.
         """
         if self._is_running:
             return False
@@ -69,6 +223,8 @@ class NetSocket:
             if listen_ipv4:
                 self._udp_socket_v4 = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 self._udp_socket_v4.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if self.reuse_port:
+                    self._udp_socket_v4.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
                 self._udp_socket_v4.setsockopt(
                     socket.SOL_SOCKET, socket.SO_RCVBUF, NetConstants.SocketBufferSize
                 )
@@ -77,6 +233,8 @@ class NetSocket:
             if listen_ipv6 and NetSocket.ipv6_support():
                 self._udp_socket_v6 = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
                 self._udp_socket_v6.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if self.reuse_port:
+                    self._udp_socket_v6.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
                 self._udp_socket_v6.setsockopt(
                     socket.SOL_SOCKET, socket.SO_RCVBUF, NetConstants.SocketBufferSize
                 )
@@ -84,24 +242,65 @@ class NetSocket:
                 self._udp_socket_v6.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
                 self._udp_socket_v6.bind(("", port))
 
+            if self.udp_offload:
+                sockets = [sock for sock in (self._udp_socket_v4, self._udp_socket_v6) if sock is not None]
+                support = [self._enable_udp_offload(sock) for sock in sockets]
+                self._gso_enabled = bool(support) and all(gso for gso, _ in support)
+                self._gro_enabled = bool(support) and all(gro for _, gro in support)
+                if not self._gro_enabled:
+                    # Only the GRO loop can read coalesced datagrams
+                    for sock, (_, gro) in zip(sockets, support):
+                        if gro:
+                            sock.setsockopt(_SOL_UDP, _UDP_GRO, 0)
+
             self._is_running = True
 
             # Start receive threads
             if self._udp_socket_v4 is not None:
-                self._receive_thread_v4 = threading.Thread(
-                    target=self._receive_loop_v4, daemon=True
-                )
+                if self._gro_enabled:
+                    self._receive_thread_v4 = threading.Thread(
+                        target=self._receive_loop_gro, args=(self._udp_socket_v4,), daemon=True
+                    )
+                elif self.batch_receive:
+                    self._receive_ring_v4 = ReceiveRing(
+                        self._receive_ring_size, NetConstants.PacketPoolMtuSize
+                    )
+                    self._receive_thread_v4 = threading.Thread(
+                        target=self._receive_loop_batched,
+                        args=(self._udp_socket_v4, self._receive_ring_v4),
+                        daemon=True
+                    )
+                else:
+                    self._receive_thread_v4 = threading.Thread(
+                        target=self._receive_loop_v4, daemon=True
+                    )
                 self._receive_thread_v4.start()
 
             if self._udp_socket_v6 is not None:
-                self._receive_thread_v6 = threading.Thread(
-                    target=self._receive_loop_v6, daemon=True
-                )
+                if self._gro_enabled:
+                    self._receive_thread_v6 = threading.Thread(
+                        target=self._receive_loop_gro, args=(self._udp_socket_v6,), daemon=True
+                    )
+                elif self.batch_receive:
+                    self._receive_ring_v6 = ReceiveRing(
+                        self._receive_ring_size, NetConstants.PacketPoolMtuSize
+                    )
+                    self._receive_thread_v6 = threading.Thread(
+                        target=self._receive_loop_batched,
+                        args=(self._udp_socket_v6, self._receive_ring_v6),
+                        daemon=True
+                    )
+                else:
+                    self._receive_thread_v6 = threading.Thread(
+                        target=self._receive_loop_v6, daemon=True
+                    )
                 self._receive_thread_v6.start()
 
+            # The manager sends everything (channels, pings, ACKs) through its socket
+            self._net_manager.net_socket = self
             return True
 
-        except socket.error as e:
+        except (socket.error, AttributeError) as e:
             self.stop()
             return False
 
@@ -131,6 +330,107 @@ class NetSocket:
                 if self._is_running:
                     self._net_manager.on_network_error(None, e)
 
+    def _receive_loop_batched(self, sock: socket.socket, ring: ReceiveRing):
+        """
+        Batched zero-copy receive loop
+
+        Waits for readability once, then drains every queued datagram into
+        ring buffers. Falls back to a copying receive when all ring buffers
+        are still held by unrecycled packets. Datagrams larger than a ring
+        buffer are dropped rather than delivered truncated.
+        """
+        overflow = bytearray(len(ring.buffers[0]) if ring.buffers else NetConstants.PacketPoolMtuSize)
+        buffers = ring.buffers
+        views = ring.views
+        release = ring.release
+        on_message_received = self._net_manager.on_message_received
+
+        if _HAS_RECVMSG:
+            def receive(buffer):
+                size, _, flags, addr = sock.recvmsg_into((buffer,), 0, _MSG_DONTWAIT)
+                return (-1 if flags & _MSG_TRUNC else size), addr
+        else:
+            def receive(buffer):
+                return sock.recvfrom_into(buffer, 0, _MSG_DONTWAIT)
+
+        selector = selectors.DefaultSelector()
+        try:
+            try:
+                selector.register(sock, selectors.EVENT_READ)
+            except (OSError, ValueError) as e:
+                # stop() closed the socket before this thread got to run
+                if self._is_running:
+                    self._net_manager.on_network_error(None, e)
+                return
+
+            while self._is_running:
+                try:
+                    if not selector.select(self.receive_poll_timeout):
+                        continue
+                    while True:
+                        idx = ring.acquire()
+                        if idx < 0:
+                            size, addr = receive(overflow)
+                            if size < 0:
+                                self.truncated_datagrams += 1
+                            else:
+                                on_message_received(bytes(overflow[:size]), (addr[0], addr[1]))
+                        else:
+                            delivered = False
+                            try:
+                                size, addr = receive(buffers[idx])
+                                if size < 0:
+                                    self.truncated_datagrams += 1
+                                else:
+                                    on_message_received(views[idx][:size], (addr[0], addr[1]), release)
+                                    delivered = True
+                            finally:
+                                if not delivered:
+                                    release(buffers[idx])
+                        if not _MSG_DONTWAIT:
+                            # Cannot drain without blocking, wait for next wakeup
+                            break
+                except BlockingIOError:
+                    continue
+                except (socket.error, ValueError) as e:
+                    if not self._is_running:
+                        break
+                    self._net_manager.on_network_error(None, e)
+        finally:
+            selector.close()
+
+    def _receive_loop_gro(self, sock: socket.socket):
+        """
+        Receive loop for sockets with UDP_GRO enabled
+
+        The kernel may coalesce consecutive datagrams from one sender into a
+        single read of up to 64KB and reports the segment size in ancillary
+        data. Each segment (the last one may be shorter) is passed to
+        on_message_received as a separate datagram. This loop replaces the
+        batched ring receive, whose buffers only hold one datagram.
+        """
+        buffer = bytearray(65536)
+        view = memoryview(buffer)
+        ancillary_size = socket.CMSG_SPACE(_GRO_SIZE.size)
+        on_message_received = self._net_manager.on_message_received
+        while self._is_running:
+            try:
+                size, ancdata, _, addr = sock.recvmsg_into([buffer], ancillary_size)
+                address = (addr[0], addr[1])
+                segment_size = size
+                for level, kind, data in ancdata:
+                    if level == _SOL_UDP and kind == _UDP_GRO and len(data) >= _GRO_SIZE.size:
+                        segment_size = _GRO_SIZE.unpack_from(data)[0]
+                if 0 < segment_size < size:
+                    for offset in range(0, size, segment_size):
+                        end = min(offset + segment_size, size)
+                        on_message_received(bytes(view[offset:end]), address)
+                else:
+                    on_message_received(bytes(view[:size]), address)
+            except socket.error as e:
+                if self._is_running:
+                    self._net_manager.on_network_error(None, e)
+
     def send_packet(self, data: bytes, address: Tuple[str, int], ipv6: bool = False) -> int:
         """
         Send packet to address
@@ -146,6 +446,156 @@ class NetSocket:
         except socket.error:
             return 0
 
+    def send_packet_buffers(self, buffers: Sequence, address: Tuple[str, int], ipv6: bool = False) -> int:
+        """
+        Send one datagram gathered from several buffers without joining them
+
+        Uses socket.sendmsg scatter-gather I/O where available (see
+        NetPacket.get_send_buffers), otherwise joins the buffers and falls
+        back to sendto.
+
+        Args:
+            buffers: Buffer-protocol objects sent back to back as one datagram
+            address: Destination address
+            ipv6: Send through the IPv6 socket
+
+        Returns:
+            Number of bytes sent (0 on error)
+        """
+        if ipv6 and self._udp_socket_v6 is not None:
+            sock = self._udp_socket_v6
+        else:
+            sock = self._udp_socket_v4
+        if sock is None:
+            return 0
+        return self._send_buffers(sock, buffers, address)
+
+    def send_batch(self, datagrams: Sequence[Tuple[Sequence, Tuple[str, int]]]) -> Tuple[int, int]:
+        """
+        Send many datagrams with as few system calls as possible
+
+        Uses sendmmsg (one call per up to 1024 datagrams per socket) when
+        use_sendmmsg is set, otherwise one send_packet_buffers call per
+        datagram. With GSO enabled, runs of equal-sized datagrams to one
+        address are sent as one UDP_SEGMENT send each. IPv6 addresses go
+        through the IPv6 socket.
+
+        Args:
+            datagrams: (buffers, address) pairs
+
+        Returns:
+            (datagrams sent, system calls made)
+        """
+        v4: list = []
+        v6: list = []
+        for datagram in datagrams:
+            if ":" in datagram[1][0] and self._udp_socket_v6 is not None:
+                v6.append(datagram)
+            else:
+                v4.append(datagram)
+
+        sent = 0
+        syscalls = 0
+        for sock, group in ((self._udp_socket_v4 or self._udp_socket_v6, v4), (self._udp_socket_v6, v6)):
+            if not group or sock is None:
+                continue
+            if self._gso_enabled:
+                group_sent, group_syscalls = self._send_group_offload(sock, group)
+            else:
+                group_sent, group_syscalls = self._send_group(sock, group)
+            sent += group_sent
+            syscalls += group_syscalls
+        return sent, syscalls
+
+    def _send_group(self, sock: socket.socket, group: Sequence) -> Tuple[int, int]:
+        """Send datagrams on one socket with sendmmsg or one call each"""
+        if self.use_sendmmsg:
+            try:
+                return sendmmsg(sock, group)
+            except (OSError, BufferError, ValueError):
+                pass
+        sent = 0
+        for buffers, address in group:
+            if self._send_buffers(sock, buffers, address):
+                sent += 1
+        return sent, len(group)
+
+    def _send_group_offload(self, sock: socket.socket, group: Sequence) -> Tuple[int, int]:
+        """
+        Send datagrams on one socket, using one GSO send per run
+
+        A run is two or more consecutive datagrams to the same address with
+        the same size, optionally ended by one shorter datagram (the last
+        fragment of a message). Everything else goes through _send_group,
+        keeping the original order.
+        """
+        sizes = [sum(memoryview(buffer).nbytes for buffer in buffers) for buffers, _ in group]
+        count = len(group)
+        sent = 0
+        syscalls = 0
+        start = 0  # First datagram not sent yet
+        i = 0
+        while i < count:
+            address = group[i][1]
+            size = sizes[i]
+            limit = min(GSO_MAX_SEGMENTS, GSO_MAX_BYTES // size) if size else 1
+            end = i + 1
+            while end < count and end - i < limit and sizes[end] == size and group[end][1] == address:
+                end += 1
+            if end < count and end - i < limit and 0 < sizes[end] < size and group[end][1] == address:
+                end += 1
+            if end - i < 2:
+                i = end
+                continue
+
+            if start < i:
+                group_sent, group_syscalls = self._send_group(sock, group[start:i])
+                sent += group_sent
+                syscalls += group_syscalls
+            if self._send_segments(sock, group[i:end], size):
+                sent += end - i
+                syscalls += 1
+            else:
+                group_sent, group_syscalls = self._send_group(sock, group[i:end])
+                sent += group_sent
+                syscalls += group_syscalls + 1
+            start = i = end
+
+        if start < count:
+            group_sent, group_syscalls = self._send_group(sock, group[start:])
+            sent += group_sent
+            syscalls += group_syscalls
+        return sent, syscalls
+
+    def _send_segments(self, sock: socket.socket, run: Sequence, segment_size: int) -> bool:
+        """
+        Send a run of datagrams to one address as a single UDP_SEGMENT send
+
+        Returns:
+            True if sent; on failure the caller resends the run normally. GSO
+            is switched off when the kernel or device rejects it outright.
+        """
+        buffers = [buffer for datagram, _ in run for buffer in datagram]
+        try:
+            sock.sendmsg(buffers, [(_SOL_UDP, _UDP_SEGMENT, _GSO_SIZE.pack(segment_size))], 0, run[0][1])
+            return True
+        except OSError as e:
+            if e.errno in (errno.EIO, errno.EINVAL, errno.ENOPROTOOPT):
+                self._gso_enabled = False
+            return False
+
+    @staticmethod
+    def _send_buffers(sock: socket.socket, buffers: Sequence, address: Tuple[str, int]) -> int:
+        """Send one datagram from buffers on sock, 0 on error"""
+        try:
+            if len(buffers) == 1:
+                return sock.sendto(buffers[0], address)
+            if _HAS_SENDMSG:
+                return sock.sendmsg(buffers, (), 0, address)
+            return sock.sendto(b"".join(buffers), address)
+        except socket.error:
+            return 0
+
     def stop(self) -> None:
         """
         Stop socket
@@ -153,6 +603,8 @@ class NetSocket:
         C# method: internal void Stop()
         """
         self._is_running = False
+        if getattr(self._net_manager, "net_socket", None) is self:
+            self._net_manager.net_socket = None
 
         # Close sockets
         if self._udp_socket_v4 is not None:
@@ -178,5 +630,10 @@ class NetSocket:
             self._receive_thread_v6.join(timeout=1.0)
             self._receive_thread_v6 = None
 
+        self._receive_ring_v4 = None
+        self._receive_ring_v6 = None
+        self._gso_enabled = False
+        self._gro_enabled = False
+
 
-__all__ = ["NetSocket"]
+__all__ = ["NetSocket", "ReceiveRing"]
@@ -23,9 +23,20 @@ class NetStatistics:
         self._bytes_received: int = 0
         self._packet_loss: int = 0
         self._duplicate_packets: int = 0
+        self._fast_retransmits: int = 0
         self._rtt: int = 0
         self._rtt_min: int = 0
         self._rtt_max: int = 0
+        # Batched send (datagrams flushed per update tick)
+        self._send_batches: int = 0
+        self._batched_datagrams: int = 0
+        self._send_syscalls: int = 0
+        self._last_batch_size: int = 0
+        self._max_batch_size: int = 0
+        self._send_drops: int = 0
+        # Congestion control (current values, 0 when disabled)
+        self._congestion_window: int = 0
+        self._pacing_rate: float = 0.0
         _lock = threading.Lock()
 
     @property
@@ -58,6 +69,11 @@ class NetStatistics:
         """Get duplicate packets count"""
         return self._duplicate_packets
 
+    @property
+    def fast_retransmits(self) -> int:
+        """Get packets resent early because later packets were acked"""
+        return self._fast_retransmits
+
     @property
     def rtt(self) -> int:
         """Get current round trip time"""
@@ -82,6 +98,46 @@ class NetStatistics:
         """Get maximum RTT"""
         return self._rtt_max
 
+    @property
+    def send_batches(self) -> int:
+        """Get number of send batches flushed"""
+        return self._send_batches
+
+    @property
+    def send_syscalls(self) -> int:
+        """Get number of send system calls"""
+        return self._send_syscalls
+
+    @property
+    def last_batch_size(self) -> int:
+        """Get datagrams in the last send batch"""
+        return self._last_batch_size
+
+    @property
+    def max_batch_size(self) -> int:
+        """Get largest send batch"""
+        return self._max_batch_size
+
+    @property
+    def send_drops(self) -> int:
+        """Get datagrams the socket failed to send"""
+        return self._send_drops
+
+    @property
+    def congestion_window(self) -> int:
+        """Get reliable bytes allowed in flight"""
+        return self._congestion_window
+
+    @property
+    def pacing_rate(self) -> float:
+        """Get reliable send rate limit in bytes per second (0 means not paced)"""
+        return self._pacing_rate
+
+    @property
+    def datagrams_per_syscall(self) -> float:
+        """Get average datagrams sent per send system call"""
+        return self._batched_datagrams / self._send_syscalls if self._send_syscalls else 0.0
+
     def increment_packets_sent(self) -> None:
         """Increment packets sent counter"""
         self._packets_sent += 1
@@ -102,10 +158,46 @@ class NetStatistics:
         """Increment packet loss counter"""
         self._packet_loss += 1
 
+    def add_packet_loss(self, count: int) -> None:
+        """Add to packet loss counter"""
+        self._packet_loss += count
+
+    def add_fast_retransmits(self, count: int) -> None:
+        """Add to fast retransmit counter"""
+        self._fast_retransmits += count
+
     def increment_duplicate_packets(self) -> None:
         """Increment duplicate packets counter"""
         self._duplicate_packets += 1
 
+    def add_send_batch(self, datagrams: int, syscalls: int, dropped: int = 0) -> None:
+        """
+        Record a flushed send batch
+
+        Args:
+            datagrams: Datagrams in the batch
+            syscalls: System calls used to send them
+            dropped: Datagrams of the batch that could not be sent
+        """
+        self._send_batches += 1
+        self._send_drops += dropped
+        self._batched_datagrams += datagrams
+        self._send_syscalls += syscalls
+        self._last_batch_size = datagrams
+        if datagrams > self._max_batch_size:
+            self._max_batch_size = datagrams
+
+    def set_congestion_state(self, congestion_window: int, pacing_rate: float) -> None:
+        """
+        Record current congestion controller output
+
+        Args:
+            congestion_window: Bytes allowed in flight
+            pacing_rate: Bytes per second
+        """
+        self._congestion_window = congestion_window
+        self._pacing_rate = pacing_rate
+
     def update_rtt(self, rtt: int) -> None:
         """
         Update RTT
@@ -118,6 +210,33 @@ class NetStatistics:
         if rtt > self._rtt_max:
             self._rtt_max = rtt
 
+    def add(self, other: 'NetStatistics') -> None:
+        """
+        Accumulate counters from another statistics object
+
+        Counters are summed, rtt_min/rtt_max are combined and rtt keeps the
+        worst current value. Congestion windows and pacing rates are summed
+        into totals across peers.
+        """
+        self._packets_sent += other._packets_sent
+        self._packets_received += other._packets_received
+        self._bytes_sent += other._bytes_sent
+        self._bytes_received += other._bytes_received
+        self._packet_loss += other._packet_loss
+        self._duplicate_packets += other._duplicate_packets
+        self._fast_retransmits += other._fast_retransmits
+        self._rtt = max(self._rtt, other._rtt)
+        if other._rtt_min and (self._rtt_min == 0 or other._rtt_min < self._rtt_min):
+            self._rtt_min = other._rtt_min
+        self._rtt_max = max(self._rtt_max, other._rtt_max)
+        self._send_batches += other._send_batches
+        self._batched_datagrams += other._batched_datagrams
+        self._send_syscalls += other._send_syscalls
+        self._max_batch_size = max(self._max_batch_size, other._max_batch_size)
+        self._send_drops += other._send_drops
+        self._congestion_window += other._congestion_window
+        self._pacing_rate += other._pacing_rate
+
     def reset(self) -> None:
         """Reset all statistics"""
         self._packets_sent = 0
@@ -126,9 +245,112 @@ class NetStatistics:
         self._bytes_received = 0
         self._packet_loss = 0
         self._duplicate_packets = 0
+        self._fast_retransmits = 0
         self._rtt = 0
         self._rtt_min = 0
         self._rtt_max = 0
+        self._send_batches = 0
+        self._batched_datagrams = 0
+        self._send_syscalls = 0
+        self._last_batch_size = 0
+        self._max_batch_size = 0
+        self._send_drops = 0
+        self._congestion_window = 0
+        self._pacing_rate = 0.0
+
+
+class TickStatistics:
+    """
+    Update loop timing metrics
+
+    All values are in milliseconds. Jitter is the smoothed deviation of the
+    interval between tick starts from the target tick (RFC 3550 style,
+    J += (|D| - J) / 16). An overrun is a tick whose work did not finish
+    before the next tick was due.
+    """
+
+    def __init__(self):
+        """Initialize statistics"""
+        self._ticks: int = 0
+        self._overruns: int = 0
+        self._last_duration: float = 0.0
+        self._max_duration: float = 0.0
+        self._total_duration: float = 0.0
+        self._last_interval: float = 0.0
+        self._jitter: float = 0.0
+        self._max_jitter: float = 0.0
+
+    @property
+    def ticks(self) -> int:
+        """Get number of ticks run"""
+        return self._ticks
+
+    @property
+    def overruns(self) -> int:
+        """Get number of ticks that ran past the next tick deadline"""
+        return self._overruns
+
+    @property
+    def last_duration(self) -> float:
+        """Get work time of the last tick"""
+        return self._last_duration
+
+    @property
+    def max_duration(self) -> float:
+        """Get longest tick work time"""
+        return self._max_duration
+
+    @property
+    def average_duration(self) -> float:
+        """Get average tick work time"""
+        return self._total_duration / self._ticks if self._ticks else 0.0
+
+    @property
+    def last_interval(self) -> float:
+        """Get time between the last two tick starts"""
+        return self._last_interval
+
+    @property
+    def jitter(self) -> float:
+        """Get smoothed tick start jitter"""
+        return self._jitter
+
+    @property
+    def max_jitter(self) -> float:
+        """Get largest single tick start deviation"""
+        return self._max_jitter
+
+    def add_tick(self, target: float, interval: float, duration: float, overrun: bool) -> None:
+        """
+        Record one tick
+
+        Args:
+            target: Target tick interval
+            interval: Actual time since the previous tick start
+            duration: Time spent in the tick
+            overrun: Tick finished after the next tick was due
+        """
+        self._ticks += 1
+        self._last_duration = duration
+        self._total_duration += duration
+        if duration > self._max_duration:
+            self._max_duration = duration
+        self._last_interval = interval
+        deviation = abs(interval - target)
+        self._jitter += (deviation - self._jitter) / 16.0
+        if deviation > self._max_jitter:
+            self._max_jitter = deviation
+        if overrun:
+            self._overruns += 1
+
+    def reset(self) -> None:
+        """Reset all statistics"""
+        self.__init__()
+
+    def __str__(self) -> str:
+        return (f"TickStatistics(ticks={self._ticks}, overruns={self._overruns}, "
+                f"avg={self.average_duration:.3f}ms, max={self._max_duration:.3f}ms, "
+                f"jitter={self._jitter:.3f}ms, max_jitter={self._max_jitter:.3f}ms)")
 
 
-__all__ = ["NetStatistics"]
+__all__ = ["NetStatistics", "TickStatistics"]
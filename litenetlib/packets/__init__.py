@@ -9,7 +9,9 @@ from .internal_packets import *
 __all__ = [
     "NetPacket",
     "NetPacketPool",
+    "PacketSizeClass",
     "PacketProperty",
+    "PacketHeader",
     "NetConnectRequestPacket",
     "NetConnectAcceptPacket",
 ]
@@ -5,9 +5,15 @@ Network packet structure and properties
 """
 
 import struct
-from typing import Optional
+from typing import List, NamedTuple, Optional
 from ..constants import NetConstants
-from ..utils.fast_bit_converter import FastBitConverter
+
+# Precompiled header codecs (little-endian, matching C# layout)
+_UINT16 = struct.Struct("<H")
+_CHANNELED_HEADER = struct.Struct("<BHB")          # property, sequence, channel id
+_FRAGMENTED_HEADER = struct.Struct("<BHBHHH")      # + fragment id, part, total
+_SEQUENCE_CHANNEL = struct.Struct("<HB")
+_FRAGMENT_HEADER = struct.Struct("<HHH")
 
 
 class PacketProperty:
@@ -69,6 +75,23 @@ class PacketProperty:
         return cls._HEADER_SIZES.get(property_value, NetConstants.HeaderSize)
 
 
+class PacketHeader(NamedTuple):
+    """
+    Decoded channeled/fragmented packet header
+
+    Produced by NetPacket.read_header() in a single struct call. Fragment
+    fields are 0 when the packet is not fragmented.
+    """
+
+    property: int
+    sequence: int
+    channel_id: int
+    is_fragmented: bool
+    fragment_id: int = 0
+    fragment_part: int = 0
+    fragments_total: int = 0
+
+
 class NetPacket:
     """
     Network packet
@@ -76,6 +99,8 @@ class NetPacket:
     C# class: internal sealed class NetPacket
     """
 
+    __slots__ = ("_raw_data", "_size", "user_data", "next", "_release", "payload")
+
     def __init__(self, size: int, packet_property: Optional[int] = None):
         """
         Create packet
@@ -94,6 +119,8 @@ class NetPacket:
         self._size = size
         self.user_data = None
         self.next = None  # Pool node
+        self._release = None  # Owner callback for attached receive buffers
+        self.payload: Optional[memoryview] = None  # Zero-copy data sent after raw_data[:size]
 
     @property
     def raw_data(self) -> bytearray:
@@ -105,6 +132,52 @@ class NetPacket:
         """Set raw packet data"""
         self._raw_data = bytearray(value)
 
+    def attach_buffer(self, buffer, size: int, release) -> None:
+        """
+        Use an externally owned receive buffer as packet data without copying
+
+        Args:
+            buffer: memoryview over a bytearray (or the bytearray itself)
+            size: Number of valid bytes in buffer
+            release: Called with the buffer when the packet is recycled
+        """
+        if isinstance(buffer, memoryview):
+            buffer = buffer.obj
+        self._raw_data = buffer
+        self._size = size
+        self._release = release
+
+    def attach_view(self, view: memoryview, release) -> None:
+        """
+        Use a slice of another packet's buffer as packet data without copying
+
+        Unlike attach_buffer the view itself becomes raw_data, so packet data
+        starts at view[0]. Used for packets unpacked from a Merged datagram.
+
+        Args:
+            view: Writable memoryview holding exactly one packet
+            release: Called with the view when the packet is recycled
+        """
+        self._raw_data = view
+        self._size = len(view)
+        self._release = release
+
+    def release_buffer(self) -> bool:
+        """
+        Hand an attached buffer back to its owner
+
+        Returns:
+            True if a buffer was attached and has been released
+        """
+        release = self._release
+        if release is None:
+            return False
+        self._release = None
+        buffer = self._raw_data
+        self._raw_data = None
+        release(buffer)
+        return True
+
     @property
     def size(self) -> int:
         """Get packet size"""
@@ -115,6 +188,37 @@ class NetPacket:
         """Set packet size"""
         self._size = value
 
+    @property
+    def total_size(self) -> int:
+        """Get datagram size (raw data plus zero-copy payload)"""
+        payload = self.payload
+        return self._size if payload is None else self._size + payload.nbytes
+
+    def get_send_buffers(self) -> List[memoryview]:
+        """
+        Get the buffers making up the datagram for scatter-gather sending
+
+        Returns:
+            [raw_data[:size]] or [raw_data[:size], payload] when a zero-copy
+            payload is attached
+        """
+        header = memoryview(self._raw_data)[:self._size]
+        if self.payload is None:
+            return [header]
+        return [header, self.payload]
+
+    def get_view(self, offset: int = 0) -> memoryview:
+        """
+        Get a zero-copy view of the packet data
+
+        Args:
+            offset: Start offset (header size to skip the header)
+
+        Returns:
+            memoryview of raw_data[offset:size]
+        """
+        return memoryview(self._raw_data)[offset:self._size]
+
     # Using packet_property instead of 'property' to avoid conflict with Python built-in
     @property
     def packet_property(self) -> int:
@@ -160,12 +264,12 @@ class NetPacket:
 
         C# property: public ushort Sequence
         """
-        return struct.unpack_from("<H", self._raw_data, 1)[0]
+        return _UINT16.unpack_from(self._raw_data, 1)[0]
 
     @sequence.setter
     def sequence(self, value: int):
         """Set sequence number"""
-        FastBitConverter.get_bytes_uint16(self._raw_data, 1, value)
+        _UINT16.pack_into(self._raw_data, 1, value & 0xFFFF)
 
     @property
     def is_fragmented(self) -> bool:
@@ -205,12 +309,12 @@ class NetPacket:
 
         C# property: public ushort FragmentId
         """
-        return struct.unpack_from("<H", self._raw_data, 4)[0]
+        return _UINT16.unpack_from(self._raw_data, 4)[0]
 
     @fragment_id.setter
     def fragment_id(self, value: int):
         """Set fragment ID"""
-        FastBitConverter.get_bytes_uint16(self._raw_data, 4, value)
+        _UINT16.pack_into(self._raw_data, 4, value & 0xFFFF)
 
     @property
     def fragment_part(self) -> int:
@@ -219,12 +323,12 @@ class NetPacket:
 
         C# property: public ushort FragmentPart
         """
-        return struct.unpack_from("<H", self._raw_data, 6)[0]
+        return _UINT16.unpack_from(self._raw_data, 6)[0]
 
     @fragment_part.setter
     def fragment_part(self, value: int):
         """Set fragment part"""
-        FastBitConverter.get_bytes_uint16(self._raw_data, 6, value)
+        _UINT16.pack_into(self._raw_data, 6, value & 0xFFFF)
 
     @property
     def fragments_total(self) -> int:
@@ -233,12 +337,46 @@ class NetPacket:
 
         C# property: public ushort FragmentsTotal
         """
-        return struct.unpack_from("<H", self._raw_data, 8)[0]
+        return _UINT16.unpack_from(self._raw_data, 8)[0]
 
     @fragments_total.setter
     def fragments_total(self, value: int):
         """Set total fragments"""
-        FastBitConverter.get_bytes_uint16(self._raw_data, 8, value)
+        _UINT16.pack_into(self._raw_data, 8, value & 0xFFFF)
+
+    def read_header(self) -> Optional[PacketHeader]:
+        """
+        Decode the whole channeled (and fragment) header in one call
+
+        Returns:
+            PacketHeader view of property, sequence, channel id and fragment
+            fields, or None if the packet is shorter than its header (the
+            caller drops it)
+        """
+        raw = self._raw_data
+        size = self._size
+        if size < NetConstants.ChanneledHeaderSize:
+            return None
+        if raw[0] & 0x80:
+            if size < NetConstants.FragmentedHeaderTotalSize:
+                return None
+            b0, sequence, channel_id, fragment_id, fragment_part, fragments_total = \
+                _FRAGMENTED_HEADER.unpack_from(raw, 0)
+            return PacketHeader(b0 & 0x1F, sequence, channel_id, True,
+                                fragment_id, fragment_part, fragments_total)
+        b0, sequence, channel_id = _CHANNELED_HEADER.unpack_from(raw, 0)
+        return PacketHeader(b0 & 0x1F, sequence, channel_id, False)
+
+    def write_channeled_header(self, sequence: int, channel_id: int) -> None:
+        """Write sequence and channel id in one call"""
+        _SEQUENCE_CHANNEL.pack_into(self._raw_data, 1, sequence & 0xFFFF, channel_id & 0xFF)
+
+    def write_fragment_header(self, fragment_id: int, fragment_part: int, fragments_total: int) -> None:
+        """Write fragment id, part and total in one call and mark the packet fragmented"""
+        raw = self._raw_data
+        _FRAGMENT_HEADER.pack_into(raw, 4, fragment_id & 0xFFFF, fragment_part & 0xFFFF,
+                                   fragments_total & 0xFFFF)
+        raw[0] |= 0x80
 
     def get_header_size(self) -> int:
         """
@@ -279,4 +417,4 @@ class NetPacket:
         return True
 
 
-__all__ = ["PacketProperty", "NetPacket"]
+__all__ = ["PacketProperty", "PacketHeader", "NetPacket"]
@@ -2,14 +2,133 @@
 NetPacketPool.cs translation
 
 Object pool for network packets to reduce GC pressure
+
+Packets are pooled by size class (tiny ACK/control packets, MTU-sized
+packets and large reassembled messages). Each thread keeps its own free
+list per class, capped at thread_cache_size, and exchanges packets in
+batches with a shared, lock protected depot, so the common get/recycle path
+takes no lock. Hit and miss counters are kept per thread for the same
+reason. The cache of a thread that has exited goes back to the depot the
+next time a thread starts using the pool or statistics are read.
 """
 
 import threading
-from typing import Optional
-from .net_packet import NetPacket
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Sequence, Tuple
+from .net_packet import NetPacket, PacketProperty
 from ..constants import NetConstants
 
 
+class PacketSizeClass:
+    """
+    Slab size class
+
+    Every pooled buffer in a class is at least capacity bytes long. limit
+    bounds the shared depot; each thread may additionally cache up to the
+    pool's thread_cache_size packets.
+    """
+
+    __slots__ = ("name", "capacity", "limit", "overflows", "_hits", "_misses", "_counters",
+                 "_shared", "_lock")
+
+    def __init__(self, name: str, capacity: int, limit: int):
+        """
+        Initialize size class
+
+        Args:
+            name: Class name used in statistics
+            capacity: Buffer size allocated for this class
+            limit: Maximum packets held in the shared depot
+        """
+        self.name = name
+        self.capacity = capacity
+        self.limit = limit
+        self.overflows = 0    # recycled packet dropped because the class was full
+        # Counts of exited threads; live threads count in their own
+        # hits and misses lists (see _ThreadCache) so the get path needs no lock
+        self._hits = 0
+        self._misses = 0
+        self._counters: List[Tuple[List[int], List[int], int]] = []
+        self._shared: List[NetPacket] = []
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        """Get number of gets served from a free list"""
+        return self._hits + sum(hits[i] for hits, _, i in list(self._counters))
+
+    @property
+    def misses(self) -> int:
+        """Get number of gets that had to allocate"""
+        return self._misses + sum(misses[i] for _, misses, i in list(self._counters))
+
+    @property
+    def pooled_count(self) -> int:
+        """Get number of packets in the shared depot"""
+        return len(self._shared)
+
+    def _add_counter(self, hits: List[int], misses: List[int], index: int) -> None:
+        """Register a thread's counters, kept at index of its hits and misses lists"""
+        with self._lock:
+            self._counters.append((hits, misses, index))
+
+    def _retire(self, free: List[NetPacket], hits: List[int], misses: List[int], index: int) -> None:
+        """Take back an exited thread's free list and fold in its counters"""
+        self._spill(free, 0)
+        with self._lock:
+            self._counters = [c for c in self._counters if c[0] is not hits]
+            self._hits += hits[index]
+            self._misses += misses[index]
+
+    def _refill(self, free: List[NetPacket], count: int) -> None:
+        """Move up to count packets from the shared depot to a thread list"""
+        with self._lock:
+            shared = self._shared
+            if not shared:
+                return
+            take = min(count, len(shared))
+            free.extend(shared[-take:])
+            del shared[-take:]
+
+    def _spill(self, free: List[NetPacket], keep: int) -> None:
+        """Move all but keep packets from a thread list to the shared depot"""
+        extra = free[keep:]
+        del free[keep:]
+        with self._lock:
+            room = self.limit - len(self._shared)
+            if room < len(extra):
+                self.overflows += len(extra) - max(room, 0)
+                extra = extra[:max(room, 0)]
+            self._shared.extend(extra)
+
+    def clear(self) -> None:
+        """Drop pooled packets and reset counters"""
+        with self._lock:
+            self._shared.clear()
+            self._counters = []
+        self._hits = 0
+        self._misses = 0
+        self.overflows = 0
+
+    def __repr__(self) -> str:
+        return (f"PacketSizeClass({self.name}, capacity={self.capacity}, limit={self.limit}, "
+                f"hits={self.hits}, misses={self.misses}, overflows={self.overflows})")
+
+
+class _ThreadCache:
+    """Free lists and counters of one thread, one entry per size class"""
+
+    __slots__ = ("thread", "free_lists", "hits", "misses")
+
+    def __init__(self, size_classes: List[PacketSizeClass]):
+        self.thread = threading.current_thread()
+        self.free_lists: List[List[NetPacket]] = [[] for _ in size_classes]
+        self.hits = [0] * len(size_classes)
+        self.misses = [0] * len(size_classes)
+        for index, size_class in enumerate(size_classes):
+            size_class._add_counter(self.hits, self.misses, index)
+
+
 class NetPacketPool:
     """
     Packet object pool
@@ -17,48 +136,167 @@ class NetPacketPool:
     C# class: (embedded in NetPacketPool.cs, implemented as static class with pool management)
     """
 
-    def __init__(self):
-        """Initialize packet pool"""
-        self._head: Optional[NetPacket] = None
-        self._count: int = 0
-        self._lock = threading.Lock()
+    # (name, capacity, limit)
+    DEFAULT_SIZE_CLASSES: Tuple[Tuple[str, int, int], ...] = (
+        ("tiny", NetConstants.PacketPoolTinySize, NetConstants.PacketPoolSize),
+        ("mtu", NetConstants.PacketPoolMtuSize, NetConstants.PacketPoolSize),
+        ("fragment", NetConstants.PacketPoolFragmentSize, NetConstants.PacketPoolFragmentLimit),
+    )
 
-    def get_packet(self, size: int, property_value: int = None) -> NetPacket:
+    def __init__(
+        self,
+        size_classes: Optional[Sequence[Tuple[str, int, int]]] = None,
+        thread_cache_size: int = NetConstants.PacketPoolThreadCacheSize
+    ):
         """
-        Get packet from pool or create new one
+        Initialize packet pool
 
-        C# method: public static NetPacket GetPacket(int size)
+        Args:
+            size_classes: (name, capacity, limit) tuples (DEFAULT_SIZE_CLASSES if None)
+            thread_cache_size: Packets each thread keeps per class before spilling
         """
-        # Don't pool oversized packets
-        if size > NetConstants.MaxPacketSize:
-            return NetPacket(size, property_value)
+        classes = [PacketSizeClass(*c) for c in (size_classes or self.DEFAULT_SIZE_CLASSES)]
+        classes.sort(key=lambda c: c.capacity)
+        self._classes = classes
+        self._capacities = [c.capacity for c in classes]
+        # Packet wrappers for external receive buffers (see NetPacket.attach_buffer)
+        self._buffer_class = PacketSizeClass("buffer", 0, NetConstants.PacketPoolSize)
+        self._all_classes = classes + [self._buffer_class]
+        self.thread_cache_size = max(thread_cache_size, 2)
+        self.oversize = 0  # requests larger than the biggest class (never pooled)
+        self._local = threading.local()
+        # Every thread's cache, so caches of exited threads can be taken back
+        self._thread_caches: List[_ThreadCache] = []
+        self._thread_caches_lock = threading.Lock()
 
-        packet = None
+    @property
+    def size_classes(self) -> List[PacketSizeClass]:
+        """Get size classes ordered by capacity"""
+        return list(self._classes)
 
-        with self._lock:
-            packet = self._head
-            if packet is not None:
-                self._head = packet.next
-                self._count -= 1
+    def get_size_class(self, name: str) -> Optional[PacketSizeClass]:
+        """Get size class by name"""
+        for size_class in self._all_classes:
+            if size_class.name == name:
+                return size_class
+        return None
 
-        if packet is None:
-            return NetPacket(size, property_value)
+    def _thread_cache(self) -> _ThreadCache:
+        """Get the calling thread's cache, creating it on first use"""
+        try:
+            return self._local.cache
+        except AttributeError:
+            pass
+        self._release_exited_threads()
+        cache = _ThreadCache(self._all_classes)
+        with self._thread_caches_lock:
+            self._thread_caches.append(cache)
+        self._local.cache = cache
+        return cache
 
-        # Reset packet
-        packet.size = size
-        packet.next = None
-        packet.user_data = None
+    def _release_exited_threads(self) -> None:
+        """Return the free lists of threads that have exited to the shared depots"""
+        with self._thread_caches_lock:
+            exited = [c for c in self._thread_caches if not c.thread.is_alive()]
+            if not exited:
+                return
+            self._thread_caches = [c for c in self._thread_caches if c.thread.is_alive()]
+        for cache in exited:
+            for index, size_class in enumerate(self._all_classes):
+                size_class._retire(cache.free_lists[index], cache.hits, cache.misses, index)
+
+    def _take(self, index: int) -> Optional[NetPacket]:
+        """Pop a packet of class index, refilling from the shared depot if needed"""
+        try:
+            cache = self._local.cache
+        except AttributeError:
+            cache = self._thread_cache()
+        free = cache.free_lists[index]
+        if not free:
+            self._all_classes[index]._refill(free, self.thread_cache_size // 2)
+            if not free:
+                cache.misses[index] += 1
+                return None
+        cache.hits[index] += 1
+        return free.pop()
+
+    def _put(self, index: int, packet: NetPacket) -> None:
+        """Push a packet of class index, spilling to the shared depot over the cap"""
+        try:
+            free = self._local.cache.free_lists[index]
+        except AttributeError:
+            free = self._thread_cache().free_lists[index]
+        if len(free) >= self.thread_cache_size:
+            self._all_classes[index]._spill(free, self.thread_cache_size // 2)
+        free.append(packet)
 
-        # If property was specified, set it (this also sets header size)
+    def get_packet(self, size: int, property_value: int = None, reserve: int = 0) -> NetPacket:
+        """
+        Get packet from pool or create new one
+
+        C# method: public static NetPacket GetPacket(int size)
+
+        Args:
+            size: Packet size (payload size if property_value is given)
+            property_value: Packet property, adds its header size when given
+            reserve: Extra tail room in the buffer beyond size
+
+        Returns:
+            Packet with size set and a buffer of at least size + reserve bytes
+        """
         if property_value is not None:
-            # Need to resize and set property for recycled packet
-            from .net_packet import PacketProperty
             size += PacketProperty.get_header_size(property_value)
-            if len(packet._raw_data) < size:
-                packet._raw_data = bytearray(size)
+        capacity = size + reserve
+
+        index = bisect_left(self._capacities, capacity)
+        if index == len(self._classes):
+            self.oversize += 1
+            packet = NetPacket(capacity)
+        else:
+            packet = self._take(index)
+            if packet is None:
+                packet = NetPacket(self._classes[index].capacity)
+            else:
+                packet.user_data = None
+                packet.next = None
+                packet.payload = None
+
+        packet.size = size
+        if property_value is not None:
             packet.packet_property = property_value
-            packet.size = size
+        return packet
 
+    def get_buffer_packet(self, buffer, size: int, release) -> NetPacket:
+        """
+        Get packet wrapping an externally owned receive buffer
+
+        Args:
+            buffer: Receive buffer (see NetPacket.attach_buffer)
+            size: Number of valid bytes in buffer
+            release: Called with the buffer when the packet is recycled
+        """
+        packet = self._take(len(self._all_classes) - 1)
+        if packet is None:
+            packet = NetPacket(0)
+        else:
+            packet.user_data = None
+        packet.attach_buffer(buffer, size, release)
+        return packet
+
+    def get_view_packet(self, view: memoryview, release) -> NetPacket:
+        """
+        Get packet whose data is a slice of another buffer
+
+        Args:
+            view: Packet data (see NetPacket.attach_view)
+            release: Called with the view when the packet is recycled
+        """
+        packet = self._take(len(self._all_classes) - 1)
+        if packet is None:
+            packet = NetPacket(0)
+        else:
+            packet.user_data = None
+        packet.attach_view(view, release)
         return packet
 
     def recycle(self, packet: NetPacket) -> None:
@@ -67,19 +305,53 @@ class NetPacketPool:
 
         C# method: public static void Recycle(NetPacket packet)
         """
-        # Don't pool oversized packets
-        if packet.size > NetConstants.MaxPacketSize:
+        if packet.release_buffer():
+            self._put(len(self._all_classes) - 1, packet)
             return
 
-        # Don't exceed pool size
-        if self._count >= NetConstants.PacketPoolSize:
+        raw_data = packet.raw_data
+        capacity = len(raw_data) if raw_data is not None else 0
+
+        # Largest class the buffer can serve; oversized and undersized buffers are dropped
+        index = bisect_right(self._capacities, capacity) - 1
+        if index < 0 or capacity > self._capacities[-1]:
             return
 
-        self._count += 1
+        packet.user_data = None
+        packet.payload = None  # drop the reference to the sender's buffer
+        self._put(index, packet)
 
-        with self._lock:
-            packet.next = self._head
-            self._head = packet
+    def clear(self) -> None:
+        """Drop all pooled packets and reset counters"""
+        for size_class in self._all_classes:
+            size_class.clear()
+        with self._thread_caches_lock:
+            self._thread_caches = []
+        self._local = threading.local()
+        self.oversize = 0
+
+    def get_statistics(self) -> dict:
+        """
+        Get per-class counters
+
+        Returns:
+            {name: {"capacity", "limit", "pooled", "hits", "misses", "overflows"}}
+            plus "oversize" for unpooled large requests
+        """
+        self._release_exited_threads()
+        stats = {
+            c.name: {
+                "capacity": c.capacity,
+                "limit": c.limit,
+                "pooled": c.pooled_count,
+                "hits": c.hits,
+                "misses": c.misses,
+                "overflows": c.overflows,
+            }
+            for c in self._all_classes
+        }
+        stats["oversize"] = self.oversize
+        return stats
 
 
-__all__ = ["NetPacketPool"]
+__all__ = ["PacketSizeClass", "NetPacketPool"]
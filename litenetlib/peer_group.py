@@ -0,0 +1,302 @@
+"""
+Peer groups
+
+Named subsets of a NetManager's peers (rooms, teams, spatial cells) for
+targeted broadcasts. Membership changes are O(1), group sends encode the
+payload once like NetManager.send_to_all, and unions, differences and
+intersections of groups are lazy views that are never copied into lists.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, Optional, Tuple, TYPE_CHECKING
+
+from .constants import DeliveryMethod
+
+if TYPE_CHECKING:
+    from .net_manager import NetManager
+    from .net_peer import NetPeer
+    from .utils.net_data_writer import NetDataWriter
+
+
+class PeerSet(ABC):
+    """
+    Base class for groups and group expressions
+
+    Supports iteration, `in`, len() and the operators `|` (union),
+    `-` (difference) and `&` (intersection), which return lazy views over
+    their operands. A view always reflects the operands' current members.
+    """
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def manager(self) -> 'NetManager':
+        """Get the manager whose peers this set contains"""
+        pass
+
+    @abstractmethod
+    def __iter__(self) -> Iterator['NetPeer']:
+        pass
+
+    @abstractmethod
+    def __contains__(self, peer: object) -> bool:
+        pass
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __or__(self, other: 'PeerSet') -> 'PeerSet':
+        return self.union(other)
+
+    def __sub__(self, other: 'PeerSet') -> 'PeerSet':
+        return self.difference(other)
+
+    def __and__(self, other: 'PeerSet') -> 'PeerSet':
+        return self.intersection(other)
+
+    def union(self, *others: 'PeerSet') -> 'PeerSet':
+        """
+        Get peers in this set or any of the others
+
+        Returns:
+            Lazy view; a peer in several operands is yielded once
+        """
+        return _Union((self,) + others)
+
+    def difference(self, *others: 'PeerSet') -> 'PeerSet':
+        """
+        Get peers in this set but in none of the others
+
+        Returns:
+            Lazy view
+        """
+        return _Difference(self, others)
+
+    def intersection(self, *others: 'PeerSet') -> 'PeerSet':
+        """
+        Get peers in this set and in all of the others
+
+        Returns:
+            Lazy view
+        """
+        return _Intersection((self,) + others)
+
+    def send(
+        self,
+        data: bytes,
+        channel_number: int,
+        options: DeliveryMethod,
+        exclude_peer: Optional['NetPeer'] = None
+    ) -> None:
+        """
+        Send data to every peer in the set
+
+        Args:
+            data: Data to send (copied once if it is not bytes)
+            channel_number: Channel number
+            options: Delivery method
+            exclude_peer: Peer to skip
+        """
+        self.manager.send_to_group(self, data, channel_number, options, exclude_peer)
+
+    def send_with_writer(
+        self,
+        writer: 'NetDataWriter',
+        channel_number: int,
+        options: DeliveryMethod,
+        exclude_peer: Optional['NetPeer'] = None
+    ) -> None:
+        """
+        Send a writer's data to every peer in the set
+
+        Args:
+            writer: Writer holding the data
+            channel_number: Channel number
+            options: Delivery method
+            exclude_peer: Peer to skip
+        """
+        self.manager.send_to_group_with_writer(self, writer, channel_number, options, exclude_peer)
+
+
+class PeerGroup(PeerSet):
+    """
+    Set of peers of one manager
+
+    Created with NetManager.create_peer_group. Members are kept in a dict
+    for O(1) add, remove and `in`. Iteration walks an immutable tuple that
+    is rebuilt only after membership changed, so sends neither hold the
+    group lock nor copy the members. Peers leave all their groups when the
+    manager removes them.
+
+    Args:
+        manager: Owning manager
+        name: Optional name for the application's own bookkeeping
+    """
+
+    __slots__ = ("_manager", "name", "_members", "_snapshot", "_lock")
+
+    def __init__(self, manager: 'NetManager', name: Optional[str] = None):
+        self._manager = manager
+        self.name = name
+        self._members: Dict['NetPeer', None] = {}
+        self._snapshot: Optional[Tuple['NetPeer', ...]] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def manager(self) -> 'NetManager':
+        return self._manager
+
+    def __iter__(self) -> Iterator['NetPeer']:
+        return iter(self.peers)
+
+    def __contains__(self, peer: object) -> bool:
+        return peer in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __repr__(self) -> str:
+        return f"PeerGroup({self.name!r}, {len(self._members)} peers)"
+
+    @property
+    def peers(self) -> Tuple['NetPeer', ...]:
+        """Get the current members (shared immutable snapshot)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(self._members)
+        return snapshot
+
+    def add(self, peer: 'NetPeer') -> bool:
+        """
+        Add a peer
+
+        Args:
+            peer: Peer of this group's manager
+
+        Returns:
+            False if the peer was already a member
+
+        Raises:
+            ValueError: If the peer belongs to another manager or is not
+                (or no longer) one of its peers
+        """
+        if peer.net_manager is not self._manager:
+            raise ValueError("Peer belongs to a different manager")
+        with self._lock:
+            if peer in self._members:
+                return False
+            # Register with the peer before checking the manager: remove_peer
+            # drops the peer from the manager first and then leaves the groups
+            # it lists, so either it sees this group or the check fails
+            peer._peer_groups[self] = None
+            if not self._manager._contains_peer(peer):
+                peer._peer_groups.pop(self, None)
+                raise ValueError("Peer is not connected to this manager")
+            self._members[peer] = None
+            self._snapshot = None
+        return True
+
+    def remove(self, peer: 'NetPeer') -> bool:
+        """
+        Remove a peer
+
+        Args:
+            peer: Peer to remove
+
+        Returns:
+            False if the peer was not a member
+        """
+        with self._lock:
+            if peer not in self._members:
+                return False
+            del self._members[peer]
+            self._snapshot = None
+        peer._peer_groups.pop(self, None)
+        return True
+
+    def clear(self) -> None:
+        """Remove all peers"""
+        with self._lock:
+            members = self._members
+            self._members = {}
+            self._snapshot = ()
+        for peer in members:
+            peer._peer_groups.pop(self, None)
+
+
+class _Union(PeerSet):
+    """Lazy union of peer sets"""
+
+    __slots__ = ("_sets",)
+
+    def __init__(self, sets: Tuple[PeerSet, ...]):
+        self._sets = sets
+
+    @property
+    def manager(self) -> 'NetManager':
+        return self._sets[0].manager
+
+    def __iter__(self) -> Iterator['NetPeer']:
+        sets = self._sets
+        yield from sets[0]
+        for i in range(1, len(sets)):
+            previous = sets[:i]
+            for peer in sets[i]:
+                if not any(peer in s for s in previous):
+                    yield peer
+
+    def __contains__(self, peer: object) -> bool:
+        return any(peer in s for s in self._sets)
+
+
+class _Difference(PeerSet):
+    """Lazy difference of peer sets"""
+
+    __slots__ = ("_base", "_excluded")
+
+    def __init__(self, base: PeerSet, excluded: Tuple[PeerSet, ...]):
+        self._base = base
+        self._excluded = excluded
+
+    @property
+    def manager(self) -> 'NetManager':
+        return self._base.manager
+
+    def __iter__(self) -> Iterator['NetPeer']:
+        excluded = self._excluded
+        for peer in self._base:
+            if not any(peer in s for s in excluded):
+                yield peer
+
+    def __contains__(self, peer: object) -> bool:
+        return peer in self._base and not any(peer in s for s in self._excluded)
+
+
+class _Intersection(PeerSet):
+    """Lazy intersection of peer sets"""
+
+    __slots__ = ("_sets",)
+
+    def __init__(self, sets: Tuple[PeerSet, ...]):
+        self._sets = sets
+
+    @property
+    def manager(self) -> 'NetManager':
+        return self._sets[0].manager
+
+    def __iter__(self) -> Iterator['NetPeer']:
+        base, others = self._sets[0], self._sets[1:]
+        for peer in base:
+            if all(peer in s for s in others):
+                yield peer
+
+    def __contains__(self, peer: object) -> bool:
+        return all(peer in s for s in self._sets)
+
+
+__all__ = ["PeerSet", "PeerGroup"]
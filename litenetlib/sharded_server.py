@@ -0,0 +1,255 @@
+"""
+SO_REUSEPORT sharded server
+
+Runs one manager per worker process, each with its own SO_REUSEPORT socket
+bound to the same port. The kernel hashes the UDP 4-tuple to pick a socket,
+so every remote peer stays pinned to a single worker. The parent process
+controls the shards over pipes.
+"""
+
+import multiprocessing
+import time
+from typing import Callable, List, Optional
+
+from .constants import DeliveryMethod
+from .debug import NetDebug
+from .net_socket import NetSocket
+from .net_statistics import NetStatistics
+
+
+def _shard_worker_main(
+    manager_factory: Callable,
+    port: int,
+    listen_ipv4: bool,
+    listen_ipv6: bool,
+    conn
+) -> None:
+    """
+    Worker process entry point
+
+    Creates the manager and its socket (NetSocket.start makes it the
+    manager's net_socket, so sends go out on the shared port), then serves
+    parent commands until told to stop. Between commands the manager is driven every update_time
+    milliseconds through update_logic (resends, pings, timeouts, flushing
+    queued sends) and poll_events where the manager provides them. Every
+    command is answered with (True, result) or (False, error message).
+    """
+    manager = manager_factory()
+    net_socket = NetSocket(manager, reuse_port=True)
+    started = net_socket.start(port, listen_ipv4, listen_ipv6)
+    conn.send(started)
+    if not started:
+        conn.close()
+        return
+
+    update_logic = getattr(manager, "update_logic", None)
+    poll_events = getattr(manager, "poll_events", None)
+    last_update = time.monotonic()
+    try:
+        while True:
+            update_interval = getattr(manager, "update_time", 15) / 1000.0
+            timeout = max(0.0, last_update + update_interval - time.monotonic())
+            if conn.poll(timeout):
+                command, args = conn.recv()
+                if command == "stop":
+                    break
+                try:
+                    if command == "broadcast":
+                        if getattr(manager, "net_socket", net_socket) is not net_socket:
+                            reply = (False, "Manager is not sending through the shard socket")
+                        else:
+                            manager.send_to_all(*args)
+                            reply = (True, None)
+                    elif command == "statistics":
+                        reply = (True, manager.statistics)
+                    else:
+                        reply = (False, f"Unknown command: {command}")
+                except Exception as ex:
+                    reply = (False, f"{type(ex).__name__}: {ex}")
+                conn.send(reply)
+
+            now = time.monotonic()
+            if now - last_update < update_interval:
+                continue
+            elapsed = (now - last_update) * 1000.0
+            last_update = now
+            try:
+                if update_logic is not None:
+                    update_logic(elapsed)
+                if poll_events is not None:
+                    poll_events()
+            except Exception as ex:
+                NetDebug.write_error(f"[Shard] Update error: {ex}")
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        net_socket.stop()
+        conn.close()
+
+
+class ShardedNetServer:
+    """
+    Multi-process server sharded with SO_REUSEPORT
+
+    manager_factory is called in each worker to build its NetManager and must
+    be picklable (a module-level function or class).
+    """
+
+    def __init__(
+        self,
+        manager_factory: Callable,
+        workers: int = None,
+        mp_context: Optional[str] = None
+    ):
+        """
+        Initialize sharded server
+
+        Args:
+            manager_factory: Creates a manager inside a worker process
+            workers: Number of worker processes (CPU count if None)
+            mp_context: multiprocessing start method (default if None)
+        """
+        self._manager_factory = manager_factory
+        self._workers = workers or multiprocessing.cpu_count()
+        self._context = multiprocessing.get_context(mp_context)
+        self._processes: List[multiprocessing.Process] = []
+        self._connections: list = []
+        self._port = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Check if shards are running"""
+        return len(self._processes) > 0
+
+    @property
+    def shards_count(self) -> int:
+        """Get number of running shards"""
+        return len(self._processes)
+
+    @property
+    def port(self) -> int:
+        """Get shared listening port"""
+        return self._port
+
+    def start(self, port: int, listen_ipv4: bool = True, listen_ipv6: bool = False) -> bool:
+        """
+        Start worker processes
+
+        Args:
+            port: Port shared by all shards (must be non-zero)
+            listen_ipv4: Listen on IPv4
+            listen_ipv6: Listen on IPv6
+
+        Returns:
+            True if every shard bound its socket
+        """
+        if self.is_running or port == 0 or not NetSocket.reuse_port_support():
+            return False
+
+        for _ in range(self._workers):
+            parent_conn, child_conn = self._context.Pipe()
+            process = self._context.Process(
+                target=_shard_worker_main,
+                args=(self._manager_factory, port, listen_ipv4, listen_ipv6, child_conn),
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._processes.append(process)
+            self._connections.append(parent_conn)
+
+        started = True
+        for conn in self._connections:
+            try:
+                started = conn.recv() and started
+            except EOFError:
+                started = False
+
+        if not started:
+            self.stop()
+            return False
+
+        self._port = port
+        return True
+
+    def _run_command(self, command: str, args: tuple) -> list:
+        """
+        Send a command to every shard and collect the replies
+
+        Returns:
+            Per shard (ok, result or error message). A shard whose process
+            died is reported as failed instead of raising
+        """
+        sent = []
+        for conn in self._connections:
+            try:
+                conn.send((command, args))
+                sent.append(True)
+            except (OSError, EOFError):
+                sent.append(False)
+
+        replies = []
+        for index, (conn, ok) in enumerate(zip(self._connections, sent)):
+            reply = (False, "Shard process is not running")
+            if ok:
+                try:
+                    reply = conn.recv()
+                except (OSError, EOFError):
+                    pass
+            if not reply[0]:
+                NetDebug.write_error(f"[Shard] Shard {index} failed {command}: {reply[1]}")
+            replies.append(reply)
+        return replies
+
+    def broadcast(
+        self,
+        data: bytes,
+        channel_number: int = 0,
+        options: DeliveryMethod = DeliveryMethod.ReliableOrdered
+    ) -> List[int]:
+        """
+        Send data to every peer on every shard
+
+        Mirrors NetManager.send_to_all(data, channel_number, options)
+
+        Returns:
+            Indices of shards that failed (died or raised); empty on success
+        """
+        replies = self._run_command("broadcast", (data, channel_number, options))
+        return [index for index, (ok, _) in enumerate(replies) if not ok]
+
+    def get_shard_statistics(self) -> List[Optional[NetStatistics]]:
+        """Collect NetStatistics from each shard (None for a failed shard)"""
+        return [result if ok else None for ok, result in self._run_command("statistics", ())]
+
+    def get_statistics(self) -> NetStatistics:
+        """Collect NetStatistics aggregated over all live shards"""
+        total = NetStatistics()
+        for shard_statistics in self.get_shard_statistics():
+            if shard_statistics is not None:
+                total.add(shard_statistics)
+        return total
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop all worker processes"""
+        for conn in self._connections:
+            try:
+                conn.send(("stop", ()))
+            except (OSError, EOFError):
+                pass
+
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        for conn in self._connections:
+            conn.close()
+
+        self._processes = []
+        self._connections = []
+        self._port = 0
+
+
+__all__ = ["ShardedNetServer"]
@@ -11,6 +11,8 @@ from .net_serializer import *
 from .net_packet_processor import *
 from .ntp_packet import *
 from .ntp_request import *
+from .timer_wheel import *
+from .sendmmsg import *
 
 __all__ = [
     "INetSerializable",
@@ -27,4 +29,8 @@ __all__ = [
     "NtpMode",
     "NtpPacket",
     "NtpRequest",
+    "TimerHandle",
+    "TimerWheel",
+    "SENDMMSG_AVAILABLE",
+    "sendmmsg",
 ]
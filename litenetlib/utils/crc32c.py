@@ -3,9 +3,29 @@ CRC32C.cs translation
 
 CRC32C (Castagnoli) checksum implementation
 Implementation from Crc32.NET
+
+Uses a hardware-accelerated C extension when one is importable (the
+``crc32c`` or ``google_crc32c`` packages) and falls back to a pure Python
+slicing-by-8 table engine otherwise. Both give the same results as the
+byte-at-a-time C# implementation.
 """
 
-from typing import List
+import struct
+from typing import Callable, List, Optional
+
+try:
+    from crc32c import crc32c as _native_crc32c
+    _NATIVE_ENGINE = "crc32c"
+except ImportError:
+    try:
+        from google_crc32c import value as _native_crc32c
+        _NATIVE_ENGINE = "google_crc32c"
+    except ImportError:
+        _native_crc32c = None
+        _NATIVE_ENGINE = None
+
+# Eight bytes per slicing-by-8 step
+_BLOCK = struct.Struct("<8B")
 
 
 class CRC32C:
@@ -22,18 +42,24 @@ class CRC32C:
     _POLY = 0x82F63B78
 
     _TABLE: List[int] = None
+    # Slicing-by-8 tables, _TABLES[0] is _TABLE
+    _TABLES: List[List[int]] = None
+
+    # Native engine (None when no C extension is available)
+    _native: Optional[Callable] = _native_crc32c
+    engine: str = _NATIVE_ENGINE or "slicing-by-8"
 
     @classmethod
     def _initialize_table(cls) -> None:
         """
-        Initialize CRC32C lookup table
+        Initialize CRC32C lookup tables
 
         C# method: static CRC32C()
         """
         if cls._TABLE is not None:
             return
 
-        cls._TABLE = [0] * 256
+        table = [0] * 256
         for i in range(256):
             res = i
             for _ in range(8):
@@ -41,7 +67,30 @@ class CRC32C:
                     res = cls._POLY ^ (res >> 1)
                 else:
                     res = res >> 1
-            cls._TABLE[i] = res & 0xFFFFFFFF
+            table[i] = res & 0xFFFFFFFF
+
+        tables = [table]
+        for k in range(1, 8):
+            prev = tables[k - 1]
+            tables.append([(prev[i] >> 8) ^ table[prev[i] & 0xFF] for i in range(256)])
+
+        cls._TABLES = tables
+        cls._TABLE = table
+
+    @classmethod
+    def use_native(cls, enabled: bool) -> bool:
+        """
+        Select native or pure Python engine
+
+        Args:
+            enabled: Prefer the C extension when available
+
+        Returns:
+            True if the native engine is now active
+        """
+        cls._native = _native_crc32c if enabled else None
+        cls.engine = _NATIVE_ENGINE if cls._native is not None else "slicing-by-8"
+        return cls._native is not None
 
     @classmethod
     def compute(cls, data, offset: int = 0, length: int = None) -> int:
@@ -51,33 +100,52 @@ class CRC32C:
         C# method: public static uint Compute(byte[] input, int offset, int length)
 
         Args:
-            data: Input data as bytes or bytearray
+            data: Input data (bytes, bytearray, memoryview or other buffer)
             offset: Starting offset in data
             length: Length of data to process (None for remaining data)
 
         Returns:
             CRC32C checksum as uint32
         """
-        # Initialize table if needed
-        cls._initialize_table()
-
-        # Convert bytearray to bytes if needed
-        if isinstance(data, bytearray):
-            data = bytes(data)
-
         if length is None:
             length = len(data) - offset
 
         if length == 0:
             return 0
 
-        crc_local = 0xFFFFFFFF
+        view = memoryview(data)[offset:offset + length]
+        if cls._native is not None:
+            return cls._native(view)
+        return cls.compute_python(view)
+
+    @classmethod
+    def compute_python(cls, view) -> int:
+        """
+        Pure Python slicing-by-8 engine
+
+        Args:
+            view: Buffer to checksum
+
+        Returns:
+            CRC32C checksum as uint32
+        """
+        cls._initialize_table()
+        t0, t1, t2, t3, t4, t5, t6, t7 = cls._TABLES
+
+        view = memoryview(view).cast("B")
+        length = len(view)
+        aligned = length & ~7
+        crc = 0xFFFFFFFF
+
+        for b0, b1, b2, b3, b4, b5, b6, b7 in _BLOCK.iter_unpack(view[:aligned]):
+            crc = (t7[(crc ^ b0) & 0xFF] ^ t6[((crc >> 8) ^ b1) & 0xFF]
+                   ^ t5[((crc >> 16) ^ b2) & 0xFF] ^ t4[(crc >> 24) ^ b3]
+                   ^ t3[b4] ^ t2[b5] ^ t1[b6] ^ t0[b7])
 
-        # Process all bytes
-        for i in range(length):
-            crc_local = cls._TABLE[((crc_local ^ data[offset + i]) & 0xFF)] ^ (crc_local >> 8)
+        for byte in view[aligned:]:
+            crc = t0[(crc ^ byte) & 0xFF] ^ (crc >> 8)
 
-        return (crc_local ^ 0xFFFFFFFF) & 0xFFFFFFFF
+        return crc ^ 0xFFFFFFFF
 
 
 __all__ = ["CRC32C"]
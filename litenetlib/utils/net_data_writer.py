@@ -122,7 +122,7 @@ class NetDataWriter:
 
         C# method: public byte[] CopyData()
         """
-        return bytes(self._data[: self._position])
+        return bytes(memoryview(self._data)[: self._position])
 
     def set_position(self, position: int) -> int:
         """
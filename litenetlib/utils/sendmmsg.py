@@ -0,0 +1,247 @@
+"""
+sendmmsg binding
+
+Sends many UDP datagrams with one system call through the Linux
+sendmmsg(2) call via ctypes. Each datagram is a list of buffers (any
+bytes-like objects) that the kernel gathers through one iovec per buffer,
+so zero-copy payloads are never joined or copied. Message headers and
+iovecs are packed with struct into a single control buffer so the
+per-datagram cost stays close to one sendto call's Python overhead.
+
+SENDMMSG_AVAILABLE is False on platforms without sendmmsg; callers fall
+back to one sendto/sendmsg per datagram.
+"""
+
+import ctypes
+import errno
+import select
+import socket
+import struct
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+# Messages per sendmmsg call (UIO_MAXIOV)
+MAX_BATCH = 1024
+
+# A full socket send buffer is waited out this many times (for at most
+# SEND_RETRY_WAIT seconds each) before the blocked datagram is dropped
+SEND_RETRIES = 3
+SEND_RETRY_WAIT = 0.005
+_RETRY_ERRNOS = (errno.EAGAIN, errno.EWOULDBLOCK, errno.ENOBUFS)
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.c_void_p),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+# Headers are packed with struct, which is much cheaper than setting
+# ctypes fields one by one: msg_name, msg_namelen, msg_iov, msg_iovlen
+_MSGHDR = struct.Struct("@PIPN")
+_IOVEC = struct.Struct("@PN")
+_MMSGHDR_SIZE = ctypes.sizeof(_MMsgHdr)
+
+
+def _layout_matches() -> bool:
+    """Check the struct formats against the C layout"""
+    return (_MSGHDR.size == _MsgHdr.msg_iovlen.offset + ctypes.sizeof(ctypes.c_size_t)
+            and struct.calcsize("@PIP") == _MsgHdr.msg_iovlen.offset
+            and _IOVEC.size == 2 * ctypes.sizeof(ctypes.c_void_p))
+
+
+def _load_sendmmsg():
+    """Get libc sendmmsg, or None if unavailable"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    func.restype = ctypes.c_int
+    return func
+
+
+class _PyBuffer(ctypes.Structure):
+    """Py_buffer, filled by PyObject_GetBuffer"""
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+_PyBUF_SIMPLE = 0
+
+
+def _load_buffer_api():
+    """Get PyObject_GetBuffer and PyBuffer_Release, or None outside CPython"""
+    try:
+        get_buffer = ctypes.pythonapi.PyObject_GetBuffer
+        release_buffer = ctypes.pythonapi.PyBuffer_Release
+    except AttributeError:
+        return None
+    get_buffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+    get_buffer.restype = ctypes.c_int
+    release_buffer.argtypes = [ctypes.POINTER(_PyBuffer)]
+    release_buffer.restype = None
+    return get_buffer, release_buffer
+
+
+def _bytes_data_offset() -> int:
+    """Offset of a bytes object's data from its id(), or -1 if unknown"""
+    probe = b"offset probe"
+    try:
+        offset = ctypes.cast(ctypes.c_char_p(probe), ctypes.c_void_p).value - id(probe)
+    except (TypeError, ValueError):
+        return -1
+    return offset if 0 < offset < 256 else -1
+
+
+_buffer_api = _load_buffer_api()
+# bytes (the common case: packet headers) are addressed directly, other
+# buffers are pinned with PyObject_GetBuffer for the duration of the call
+_BYTES_OFFSET = _bytes_data_offset()
+
+_sendmmsg = _load_sendmmsg() if _layout_matches() and _buffer_api is not None else None
+SENDMMSG_AVAILABLE = _sendmmsg is not None
+
+# Encoded sockaddr per (family, address) as (buffer, address, length);
+# the buffer is kept alive while cached
+_sockaddr_cache: Dict[Tuple[int, Tuple[str, int]], Tuple[ctypes.Array, int, int]] = {}
+_SOCKADDR_CACHE_LIMIT = 4096
+
+
+def _sockaddr(family: int, address: Tuple[str, int]) -> Tuple[ctypes.Array, int, int]:
+    """Encode address as sockaddr_in/sockaddr_in6 for family"""
+    key = (family, address)
+    name = _sockaddr_cache.get(key)
+    if name is not None:
+        return name
+
+    host, port = address[0], address[1]
+    if family == socket.AF_INET6:
+        if ":" not in host:
+            host = "::ffff:" + host  # IPv4 through a dual-stack socket
+        raw = (struct.pack("=H", socket.AF_INET6) + struct.pack("!HI", port, 0)
+               + socket.inet_pton(socket.AF_INET6, host) + struct.pack("=I", 0))
+    else:
+        raw = (struct.pack("=H", socket.AF_INET) + struct.pack("!H", port)
+               + socket.inet_aton(host) + bytes(8))
+
+    if len(_sockaddr_cache) >= _SOCKADDR_CACHE_LIMIT:
+        _sockaddr_cache.clear()
+    buffer = ctypes.create_string_buffer(raw, len(raw))
+    name = (buffer, ctypes.addressof(buffer), len(raw))
+    _sockaddr_cache[key] = name
+    return name
+
+
+def sendmmsg(sock: socket.socket, datagrams: Sequence[Tuple[Sequence, Tuple[str, int]]]) -> Tuple[int, int]:
+    """
+    Send datagrams with as few system calls as possible
+
+    Every buffer becomes one iovec pointing at the caller's memory, so
+    nothing is joined or copied. When the socket buffer is full (EAGAIN,
+    ENOBUFS) the call waits for the socket to become writable and retries
+    up to SEND_RETRIES times. A datagram that still cannot be sent, or that
+    the kernel rejects, is skipped and the rest are still sent, matching
+    the per-datagram sendto path that ignores send errors. Skipped
+    datagrams are the difference between len(datagrams) and the sent count.
+
+    Args:
+        sock: UDP socket
+        datagrams: (buffers, address) pairs, buffers are sent back to back
+
+    Returns:
+        (datagrams sent, system calls made)
+    """
+    count = len(datagrams)
+    if count == 0:
+        return 0, 0
+
+    # One control buffer holds the mmsghdr array followed by the iovec
+    # array, so only its address is taken per call whatever the batch size
+    family = sock.family
+    iov_count = sum(len(buffers) for buffers, _ in datagrams)
+    control = bytearray(count * _MMSGHDR_SIZE + iov_count * _IOVEC.size)
+    control_ref = (ctypes.c_char * len(control)).from_buffer(control)
+    get_buffer, release_buffer = _buffer_api
+    pinned: List[_PyBuffer] = []
+    try:
+        control_address = ctypes.addressof(control_ref)
+        iov = count * _MMSGHDR_SIZE
+        iov_size = _IOVEC.size
+        pack_msghdr = _MSGHDR.pack_into
+        pack_iovec = _IOVEC.pack_into
+        bytes_offset = _BYTES_OFFSET
+        names: List[Tuple[ctypes.Array, int, int]] = []
+        for i, (buffers, address) in enumerate(datagrams):
+            name = _sockaddr(family, address)
+            names.append(name)
+            first_iov = iov
+            for buffer in buffers:
+                if type(buffer) is bytes and bytes_offset > 0:
+                    pack_iovec(control, iov, id(buffer) + bytes_offset, len(buffer))
+                else:
+                    view = _PyBuffer()
+                    if get_buffer(buffer, ctypes.byref(view), _PyBUF_SIMPLE) != 0:
+                        raise BufferError("Cannot get buffer address")
+                    pinned.append(view)
+                    pack_iovec(control, iov, view.buf or 0, view.len)
+                iov += iov_size
+            pack_msghdr(control, i * _MMSGHDR_SIZE, name[1], name[2],
+                        control_address + first_iov, len(buffers))
+
+        fd = sock.fileno()
+        done = 0
+        sent = 0
+        syscalls = 0
+        retries = 0
+        while done < count:
+            result = _sendmmsg(fd, control_address + done * _MMSGHDR_SIZE, min(count - done, MAX_BATCH), 0)
+            syscalls += 1
+            if result > 0:
+                done += result
+                sent += result
+                retries = 0
+                continue
+            error = ctypes.get_errno() if result < 0 else 0
+            if error == errno.EINTR:
+                continue
+            if error in _RETRY_ERRNOS and retries < SEND_RETRIES:
+                retries += 1
+                select.select((), (fd,), (), SEND_RETRY_WAIT)
+                continue
+            # Error is reported for the first unsent datagram, skip it
+            done += 1
+            retries = 0
+        return sent, syscalls
+    finally:
+        # Release the exports so the buffers can be resized or freed
+        for view in pinned:
+            release_buffer(ctypes.byref(view))
+        del control_ref
+
+
+__all__ = ["SENDMMSG_AVAILABLE", "sendmmsg"]
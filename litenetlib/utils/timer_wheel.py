@@ -0,0 +1,207 @@
+"""
+Hierarchical timing wheel
+
+Schedules resend, ping, MTU probe and timeout deadlines so that an update
+only touches timers that are due. Time is advanced explicitly by the owner
+(see LiteNetManager.manual_update), so the wheel has no clock of its own.
+
+Level 0 has one slot per tick, each higher level covers wheel_size times
+the span of the level below. A timer is stored in the lowest level whose
+span covers its remaining delay and moves down a level each time the
+slot it sits in comes around, so every timer is handled at most once per
+level before it fires.
+"""
+
+import math
+import threading
+from typing import Callable, List, Optional
+
+from ..debug import NetDebug
+
+
+class TimerHandle:
+    """
+    Scheduled timer
+
+    Returned by TimerWheel.schedule. Call cancel() to stop the timer.
+    """
+
+    __slots__ = ("deadline", "callback", "args", "_wheel")
+
+    def __init__(self, deadline: int, callback: Callable, args: tuple, wheel: 'TimerWheel'):
+        self.deadline = deadline  # tick at which the timer fires
+        self.callback = callback
+        self.args = args
+        self._wheel: Optional['TimerWheel'] = wheel
+
+    @property
+    def active(self) -> bool:
+        """Check if the timer is still scheduled"""
+        return self._wheel is not None
+
+    def cancel(self) -> bool:
+        """
+        Cancel timer
+
+        Returns:
+            True if the timer was still scheduled
+        """
+        wheel = self._wheel
+        if wheel is None:
+            return False
+        with wheel._lock:
+            if self._wheel is None:
+                return False
+            self._wheel = None
+            wheel._count -= 1
+        return True
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel
+
+    Args:
+        tick_ms: Resolution in milliseconds
+        wheel_bits: log2 of slots per level
+        levels: Number of levels (level k spans 2**(wheel_bits * (k + 1)) ticks)
+    """
+
+    def __init__(self, tick_ms: float = 1.0, wheel_bits: int = 6, levels: int = 4):
+        self.tick_ms = tick_ms
+        self._bits = wheel_bits
+        self._mask = (1 << wheel_bits) - 1
+        self._levels = levels
+        self._wheels: List[List[List[TimerHandle]]] = [
+            [[] for _ in range(1 << wheel_bits)] for _ in range(levels)
+        ]
+        self._current_tick = 0
+        self._time_ms = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+        # Counters
+        self.fired_count = 0
+
+    def __len__(self) -> int:
+        """Get number of scheduled timers"""
+        return self._count
+
+    @property
+    def now_ms(self) -> float:
+        """Get wheel time in milliseconds"""
+        return self._time_ms
+
+    def schedule(self, delay_ms: float, callback: Callable, *args) -> TimerHandle:
+        """
+        Schedule callback(*args) to run after delay_ms
+
+        The callback runs inside advance() on the thread driving the wheel.
+        Delays are rounded up to whole ticks (at least one).
+
+        Args:
+            delay_ms: Delay in milliseconds
+            callback: Function to call
+            *args: Arguments for callback
+
+        Returns:
+            TimerHandle that can be cancelled
+        """
+        ticks = max(1, math.ceil(delay_ms / self.tick_ms))
+        with self._lock:
+            handle = TimerHandle(self._current_tick + ticks, callback, args, self)
+            self._insert(handle)
+            self._count += 1
+        return handle
+
+    def _insert(self, handle: TimerHandle) -> None:
+        """Put handle into the lowest level covering its remaining delay"""
+        delta = handle.deadline - self._current_tick
+        level = 0
+        bits = self._bits
+        while level < self._levels - 1 and delta >= (1 << (bits * (level + 1))):
+            level += 1
+        index = (handle.deadline >> (bits * level)) & self._mask
+        self._wheels[level][index].append(handle)
+
+    def _cascade(self, tick: int) -> None:
+        """Move the slots whose span starts at tick down one level"""
+        bits = self._bits
+        level = 1
+        while level < self._levels and tick & ((1 << (bits * level)) - 1) == 0:
+            level += 1
+        # Higher levels first so their timers can land in the lower slots cascaded next
+        for level in range(level - 1, 0, -1):
+            wheel = self._wheels[level]
+            index = (tick >> (bits * level)) & self._mask
+            slot = wheel[index]
+            if slot:
+                wheel[index] = []
+                for handle in slot:
+                    if handle._wheel is not None:
+                        self._insert(handle)
+
+    def advance(self, elapsed_ms: float) -> int:
+        """
+        Advance wheel time and run due timers
+
+        Args:
+            elapsed_ms: Milliseconds since the previous advance
+
+        Returns:
+            Number of timer callbacks that ran without raising (a raising
+            callback is logged through NetDebug and the rest still run)
+        """
+        expired: List[TimerHandle] = []
+        with self._lock:
+            self._time_ms += elapsed_ms
+            target = int(self._time_ms / self.tick_ms)
+            wheel0 = self._wheels[0]
+            mask = self._mask
+            while self._current_tick < target:
+                if self._count == 0:
+                    # Nothing scheduled, jump straight to the target tick
+                    self._current_tick = target
+                    break
+                self._current_tick += 1
+                tick = self._current_tick
+                if tick & mask == 0:
+                    self._cascade(tick)
+                index = tick & mask
+                slot = wheel0[index]
+                if slot:
+                    wheel0[index] = []
+                    for handle in slot:
+                        if handle._wheel is None:
+                            continue
+                        if handle.deadline > tick:
+                            self._insert(handle)
+                            continue
+                        handle._wheel = None
+                        self._count -= 1
+                        expired.append(handle)
+
+        fired = 0
+        for handle in expired:
+            try:
+                handle.callback(*handle.args)
+            except Exception as ex:
+                # One failing callback must not drop the other timers due this tick
+                NetDebug.write_error(f"[TimerWheel] Timer callback error: {ex}")
+                continue
+            fired += 1
+        self.fired_count += fired
+        return fired
+
+    def clear(self) -> None:
+        """Cancel all timers"""
+        with self._lock:
+            for wheel in self._wheels:
+                for index, slot in enumerate(wheel):
+                    for handle in slot:
+                        handle._wheel = None
+                    wheel[index] = []
+            self._count = 0
+
+
+__all__ = ["TimerHandle", "TimerWheel"]
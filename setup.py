@@ -40,6 +40,9 @@ setup(
             'pytest>=7.0.0',
             'pytest-asyncio>=0.20.0',
         ],
+        'fast': [
+            'crc32c>=2.0',
+        ],
     },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
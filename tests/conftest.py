@@ -0,0 +1,37 @@
+"""
+测试共用的fixture
+
+回环发送测试使用的接收socket和只用于发送的NetSocket
+"""
+
+import socket
+
+import pytest
+from litenetlib import NetSocket
+
+
+class _NullManager:
+    """只用于发送的socket不处理接收"""
+
+    def on_message_received(self, data, address, release=None):
+        pass
+
+    def on_network_error(self, address, error):
+        pass
+
+
+@pytest.fixture
+def receiver():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(1.0)
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def net_socket():
+    net_socket = NetSocket(_NullManager())
+    assert net_socket.start(0, True, False)
+    yield net_socket
+    net_socket.stop()
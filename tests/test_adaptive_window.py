@@ -0,0 +1,164 @@
+"""
+自适应可靠窗口测试
+
+测试可配置的窗口大小、按需创建的发送槽位，
+以及发送窗口随确认增长、随丢包和RTT增长收缩
+"""
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.channels.reliable_channel import ReliableChannel
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+from litenetlib.packets.net_packet import PacketProperty
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    return manager
+
+
+def _peer(manager):
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.sent = []
+    peer.send_user_data = lambda packet: peer.sent.append(packet.sequence)
+    return peer
+
+
+def _channel(peer, count):
+    channel = peer.create_channel(DeliveryMethod.ReliableUnordered)
+    for i in range(count):
+        peer.send(b"m%d" % i, 0, DeliveryMethod.ReliableUnordered)
+    channel.send_next_packets()
+    return channel
+
+
+def _ack(channel, window_start, sequences):
+    ack = NetPacket(channel._outgoing_acks.size)
+    ack.packet_property = PacketProperty.Ack
+    ack.channel_id = channel._id
+    ack.sequence = window_start
+    for seq in sequences:
+        idx = seq % channel.window_size
+        ack.raw_data[NetConstants.ChanneledHeaderSize + idx // 8] |= 1 << (idx % 8)
+    return ack
+
+
+class TestWindowSize:
+    """测试窗口大小配置"""
+
+    def test_default_unchanged(self, manager):
+        """测试默认窗口大小和ACK包大小不变"""
+        channel = _channel(_peer(manager), 100)
+        assert channel.window_size == channel.send_window == NetConstants.DefaultWindowSize
+        assert channel._outgoing_acks.size == NetConstants.ChanneledHeaderSize + 9
+
+    def test_large_window(self, manager):
+        """测试大窗口一次发出更多包，槽位只为在途的包创建"""
+        manager.reliable_window_size = 1024
+        peer = _peer(manager)
+        channel = _channel(peer, 300)
+        assert len(peer.sent) == 300
+        assert channel._outgoing_acks.size == NetConstants.ChanneledHeaderSize + 1024 // 8 + 1
+        assert sum(p is not None for p in channel._pending_packets) == 300
+
+    @pytest.mark.parametrize("size", [100, 4, 4096, 16384, 32768])
+    def test_invalid_window_rejected(self, manager, size):
+        """测试不能整除序号空间或超出范围的窗口大小"""
+        manager.reliable_window_size = size
+        with pytest.raises(ValueError):
+            _peer(manager).create_channel(DeliveryMethod.ReliableUnordered)
+
+    def test_max_window_ack_fits_min_mtu(self, manager):
+        """测试最大窗口的ACK包不超过最小MTU"""
+        manager.reliable_window_size = ReliableChannel.MAX_WINDOW
+        channel = _peer(manager).create_channel(DeliveryMethod.ReliableUnordered)
+        assert channel._outgoing_acks.size <= NetConstants.get_possible_mtu()[0]
+
+    def test_sequence_wrap(self, manager):
+        """测试非默认窗口在序号回绕时确认全部包"""
+        manager.reliable_window_size = 128
+        peer = _peer(manager)
+        channel = peer.create_channel(DeliveryMethod.ReliableUnordered)
+        start = NetConstants.MaxSequence - 5
+        channel._local_sequence = channel._local_window_start = start
+        _channel(peer, 10)
+        assert channel._local_sequence == 5
+        channel.process_packet(_ack(channel, start, peer.sent))
+        assert channel._local_window_start == 5
+        assert not channel._pending_mask
+        _channel(peer, 1)
+        assert peer.sent[-1] == 5
+
+    def test_fixed_window_does_not_grow(self, manager):
+        """测试非自适应模式下发送窗口固定"""
+        peer = _peer(manager)
+        channel = _channel(peer, 200)
+        channel.process_packet(_ack(channel, 0, range(64)))
+        assert channel.send_window == 64
+
+
+class TestAdaptiveWindow:
+    """测试自适应发送窗口"""
+
+    @pytest.fixture
+    def peer(self, manager):
+        manager.reliable_window_size = 1024
+        manager.adaptive_reliable_window = True
+        return _peer(manager)
+
+    def test_slow_start(self, peer):
+        """测试受窗口限制时每轮确认后窗口翻倍"""
+        channel = _channel(peer, 1000)
+        assert channel.send_window == NetConstants.DefaultWindowSize
+        channel.process_packet(_ack(channel, 0, range(64)))
+        assert channel.send_window == 128
+
+        peer.sent.clear()
+        channel.send_next_packets()
+        assert peer.sent == list(range(64, 192))
+
+    def test_capped_at_window_size(self, peer):
+        """测试不超过窗口大小"""
+        channel = _channel(peer, 5000)
+        sent = 64
+        while channel.send_window < channel.window_size:
+            channel.process_packet(_ack(channel, channel._local_window_start,
+                                        range(channel._local_window_start, sent)))
+            channel.send_next_packets()
+            sent = channel._local_sequence
+        channel.process_packet(_ack(channel, channel._local_window_start,
+                                    range(channel._local_window_start, sent)))
+        assert channel.send_window == channel.window_size
+
+    def test_no_growth_when_not_window_limited(self, peer):
+        """测试发送量不受窗口限制时不增长"""
+        channel = _channel(peer, 10)
+        channel.process_packet(_ack(channel, 0, range(10)))
+        assert channel.send_window == NetConstants.DefaultWindowSize
+
+    def test_loss_halves_once_per_window(self, peer):
+        """测试丢包时减半，之前发出的包再丢失不重复减半"""
+        channel = _channel(peer, 1000)
+        channel.process_packet(_ack(channel, 0, range(1, 10)))   # 先确认9个，再因0丢失减半
+        assert channel.send_window == (64 + 9) // 2
+        channel.process_packet(_ack(channel, 0, [*range(1, 10), *range(11, 20)]))  # 10在减半前发出
+        assert channel.send_window == (64 + 9) // 2
+
+    def test_resend_timeout_shrinks(self, peer, manager):
+        """测试重发定时器到期时减半"""
+        channel = _channel(peer, 100)
+        manager.manual_update(peer.resend_delay + 20)
+        assert channel.send_window == 32
+
+    def test_rtt_growth_stops_increase(self, peer):
+        """测试RTT超过最小RTT两倍时不再增大窗口"""
+        channel = _channel(peer, 1000)
+        peer._avg_rtt = 20
+        channel.process_packet(_ack(channel, 0, range(32)))
+        assert channel.send_window == 96
+        peer._avg_rtt = 50
+        channel.process_packet(_ack(channel, 0, range(64)))
+        assert channel.send_window == 96
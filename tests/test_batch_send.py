@@ -0,0 +1,196 @@
+"""
+批量发送测试
+
+测试sendmmsg绑定、NetSocket.send_batch，以及manager每次更新批量发送和统计
+"""
+
+import ctypes
+import errno
+import socket
+import sys
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetSocket
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+from litenetlib.packets.net_packet import PacketProperty
+from litenetlib.utils.sendmmsg import SENDMMSG_AVAILABLE, sendmmsg
+
+# litenetlib.utils re-exports the sendmmsg function under the module's name
+sendmmsg_module = sys.modules["litenetlib.utils.sendmmsg"]
+
+
+def _receive(sock, count):
+    return [sock.recvfrom(2048)[0] for _ in range(count)]
+
+
+@pytest.mark.skipif(not SENDMMSG_AVAILABLE, reason="sendmmsg not available")
+class TestSendmmsg:
+    """测试sendmmsg绑定"""
+
+    def test_one_syscall(self, receiver):
+        """测试多个数据报一次系统调用发出，支持多缓冲区和只读缓冲区"""
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        address = receiver.getsockname()
+        datagrams = [((b"h%d" % i, memoryview(b"payload")[i:]), address) for i in range(5)]
+        assert sendmmsg(sender, datagrams) == (5, 1)
+        assert _receive(receiver, 5) == [b"h%d" % i + b"payload"[i:] for i in range(5)]
+        sender.close()
+
+    def test_writable_buffers_released(self, receiver):
+        """测试可写缓冲区直接发送，调用后可再调整大小"""
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        payload = bytearray(b"payload")
+        datagrams = [((b"h", memoryview(payload)[2:], payload), receiver.getsockname())]
+        assert sendmmsg(sender, datagrams) == (1, 1)
+        assert _receive(receiver, 1) == [b"hyload" + b"payload"]
+        del datagrams  # Drop the test's own memoryview export
+        payload.extend(b"more")
+        sender.close()
+
+    def test_retry_when_buffer_full(self, receiver, monkeypatch):
+        """测试发送缓冲区满时等待后重试"""
+        real = sendmmsg_module._sendmmsg
+        calls = []
+
+        def full_once(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                ctypes.set_errno(errno.EAGAIN)
+                return -1
+            return real(*args)
+
+        monkeypatch.setattr(sendmmsg_module, "_sendmmsg", full_once)
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        datagrams = [((b"d%d" % i,), receiver.getsockname()) for i in range(3)]
+        assert sendmmsg(sender, datagrams) == (3, 2)
+        assert _receive(receiver, 3) == [b"d0", b"d1", b"d2"]
+        sender.close()
+
+    def test_drop_after_retries(self, receiver, monkeypatch):
+        """测试重试耗尽后跳过数据报并报告少发"""
+        def always_full(*args):
+            ctypes.set_errno(errno.EAGAIN)
+            return -1
+
+        monkeypatch.setattr(sendmmsg_module, "_sendmmsg", always_full)
+        monkeypatch.setattr(sendmmsg_module, "SEND_RETRY_WAIT", 0)
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        datagrams = [((b"d%d" % i,), receiver.getsockname()) for i in range(2)]
+        assert sendmmsg(sender, datagrams) == (0, 2 * (sendmmsg_module.SEND_RETRIES + 1))
+        sender.close()
+
+
+class TestNetSocketSendBatch:
+    """测试NetSocket.send_batch"""
+
+    def test_batch(self, net_socket, receiver):
+        """测试批量发送"""
+        address = receiver.getsockname()
+        sent, syscalls = net_socket.send_batch([((bytes([i]) * 10,), address) for i in range(8)])
+        assert sent == 8
+        assert syscalls == (1 if SENDMMSG_AVAILABLE else 8)
+        assert _receive(receiver, 8) == [bytes([i]) * 10 for i in range(8)]
+
+    def test_sendto_fallback(self, net_socket, receiver):
+        """测试关闭sendmmsg时逐个发送"""
+        net_socket.use_sendmmsg = False
+        address = receiver.getsockname()
+        assert net_socket.send_batch([((b"a", b"b"), address), ((b"c",), address)]) == (2, 2)
+        assert _receive(receiver, 2) == [b"ab", b"c"]
+
+
+@pytest.fixture
+def manager(net_socket):
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    manager.enable_statistics = True
+    manager.net_socket = net_socket
+    return manager
+
+
+class TestManagerBatchSend:
+    """测试manager每次更新批量发送"""
+
+    def test_flush_per_update(self, manager, receiver):
+        """测试更新期间的发送在更新结束时一次发出"""
+        peers = []
+        for i in range(10):
+            peer = NetPeer(manager, receiver.getsockname(), i)
+            manager.add_peer(peer)
+            peer.send(b"msg%d" % i, 0, DeliveryMethod.ReliableUnordered)
+            peers.append(peer)
+
+        manager.manual_update(1)
+
+        data = _receive(receiver, 10)
+        assert sorted(d[-4:] for d in data) == sorted(b"msg%d" % i for i in range(10))
+        stats = manager.statistics
+        assert stats.send_batches == 1
+        assert stats.last_batch_size == 10
+        assert stats.send_syscalls == (1 if SENDMMSG_AVAILABLE else 10)
+
+    def test_staged_header_is_snapshot(self, manager, receiver):
+        """测试暂存后修改或回收包不影响发送内容"""
+        packet = NetPacket(4, PacketProperty.Unreliable)
+        packet.raw_data[1:] = b"abcd"
+        manager.send_raw_and_recycle(packet, receiver.getsockname())
+        packet.raw_data[1:5] = b"XXXX"
+        assert manager.flush_send_queue() == 1
+        assert _receive(receiver, 1) == [bytes([PacketProperty.Unreliable]) + b"abcd"]
+
+    def test_batch_send_disabled(self, manager, receiver):
+        """测试关闭批量发送时立即发送"""
+        manager.batch_send = False
+        packet = NetPacket(1, PacketProperty.Unreliable)
+        manager.send_raw_to(packet, receiver.getsockname())
+        assert manager.flush_send_queue() == 0
+        assert len(_receive(receiver, 1)[0]) == 2
+        assert manager.statistics.send_syscalls == 1
+
+    def test_statistics_disabled(self, manager, receiver):
+        """测试关闭统计时不记录批量发送"""
+        manager.enable_statistics = False
+        packet = NetPacket(1, PacketProperty.Unreliable)
+        manager.send_raw_to(packet, receiver.getsockname())
+        assert manager.flush_send_queue() == 1
+        manager.batch_send = False
+        manager.send_raw_to(packet, receiver.getsockname())
+        assert len(_receive(receiver, 2)) == 2
+        assert manager.statistics.send_batches == 0
+        assert manager.statistics.send_syscalls == 0
+
+    def test_pong_sent_immediately(self, manager, receiver):
+        """测试pong不等更新结束立即发送"""
+        peer = NetPeer(manager, receiver.getsockname(), 0)
+        ping = NetPacket(0, PacketProperty.Ping)
+        ping.sequence = 1
+        peer.process_ping(ping)
+        data = _receive(receiver, 1)[0]
+        assert data[0] & 0x1F == PacketProperty.Pong
+        assert manager.flush_send_queue() == 0
+
+
+class TestSocketWiring:
+    """测试NetSocket启动后接管manager的发送"""
+
+    @pytest.mark.parametrize("batch_send", [True, False])
+    def test_send_reaches_peer(self, receiver, batch_send):
+        """测试不手动设置net_socket时peer的发送也能到达对端"""
+        manager = NetManager(EventBasedNetListener())
+        manager._manual_mode = True
+        manager.batch_send = batch_send
+        net_socket = NetSocket(manager)
+        assert net_socket.start(0, True, False)
+        try:
+            assert manager.net_socket is net_socket
+            peer = NetPeer(manager, receiver.getsockname(), 0)
+            manager.add_peer(peer)
+            peer.send(b"end-to-end", 0, DeliveryMethod.Unreliable)
+            manager.manual_update(1)
+            data = []
+            while not any(d.endswith(b"end-to-end") for d in data):
+                data.append(receiver.recvfrom(2048)[0])
+        finally:
+            net_socket.stop()
+        assert manager.net_socket is None
@@ -0,0 +1,131 @@
+"""
+广播测试
+
+测试send_to_all只编码一次负载：所有peer的包共享负载和分片切片，
+每个peer只有自己的包头，发送时不持有_peer_lock
+"""
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.utils import NetDataWriter
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager.received = []
+    manager.create_receive_event = lambda packet, method, channel, header_size, peer: \
+        manager.received.append(bytes(packet.get_view(header_size)))
+    return manager
+
+
+@pytest.fixture
+def peers(manager):
+    peers = [NetPeer(manager, ("127.0.0.1", 9050 + i), i) for i in range(3)]
+    for peer in peers:
+        manager.add_peer(peer)
+    return peers
+
+
+def _queued(peer, delivery_method=DeliveryMethod.ReliableOrdered):
+    channel = peer.create_channel(delivery_method)
+    packets = list(channel.outgoing_queue)
+    channel.outgoing_queue.clear()
+    return packets
+
+
+def _wire(packet):
+    """按发送时的布局拼出数据报"""
+    data = b"".join(packet.get_send_buffers())
+    received = NetPacket(len(data))
+    received.raw_data[:] = data
+    return received
+
+
+class TestSharedPayload:
+    """测试共享负载"""
+
+    def test_small_message_shared(self, manager, peers):
+        """测试所有peer的包引用同一个bytes"""
+        data = b"state update"
+        manager.send_to_all(data, 0, DeliveryMethod.ReliableUnordered)
+        packets = [_queued(peer, DeliveryMethod.ReliableUnordered) for peer in peers]
+        assert all(len(p) == 1 for p in packets)
+        assert all(p[0].payload.obj is data for p in packets)
+        assert all(p[0].size == NetConstants.ChanneledHeaderSize for p in packets)
+        assert len({id(p[0]) for p in packets}) == len(peers)
+
+    def test_fragments_sliced_once(self, manager, peers):
+        """测试分片切片只生成一次，分片包头属于各自的peer"""
+        peers[1]._fragment_id = 40
+        data = bytes(i % 251 for i in range(20000))
+        manager.send_to_all(data, 0, DeliveryMethod.ReliableOrdered)
+        packets = [_queued(peer) for peer in peers]
+
+        assert len(packets[0]) > 1
+        for other in packets[1:]:
+            assert len(other) == len(packets[0])
+            assert all(a.payload is b.payload for a, b in zip(packets[0], other))
+        assert {p.fragment_id for p in packets[1]} == {41}
+        assert {p.fragment_id for p in packets[0]} == {1}
+
+        for packet in packets[2]:
+            packet.channel_id = DeliveryMethod.ReliableOrdered
+            peers[2].add_reliable_packet(DeliveryMethod.ReliableOrdered, _wire(packet))
+        assert manager.received == [data]
+
+    def test_different_mtu(self, manager, peers):
+        """测试MTU不同的peer按各自的MTU分片"""
+        peers[0]._set_mtu(len(NetConstants.get_possible_mtu()) - 1)
+        data = b"m" * 5000
+        manager.send_to_all(data, 0, DeliveryMethod.ReliableOrdered)
+        big, small = _queued(peers[0]), _queued(peers[1])
+        assert len(big) < len(small)
+        assert b"".join(bytes(p.payload) for p in big) == data
+        assert b"".join(bytes(p.payload) for p in small) == data
+
+    def test_mutable_data_copied_once(self, manager, peers):
+        """测试可变缓冲区先复制一次，之后修改不影响已入队的包"""
+        data = bytearray(b"abc")
+        manager.send_to_all(data, 0, DeliveryMethod.ReliableOrdered)
+        data[:] = b"xyz"
+        packets = [_queued(peer)[0] for peer in peers]
+        assert all(bytes(p.payload) == b"abc" for p in packets)
+        assert len({id(p.payload.obj) for p in packets}) == 1
+
+    def test_writer_sends_length_bytes(self, manager, peers):
+        """测试使用writer时只发送已写入的字节"""
+        writer = NetDataWriter()
+        writer.put_int(7)
+        manager.send_to_all_with_writer(writer, 0, DeliveryMethod.ReliableOrdered)
+        writer.reset()
+        writer.put_int(8)
+        assert all(bytes(_queued(peer)[0].payload) == b"\x07\x00\x00\x00" for peer in peers)
+
+    def test_exclude_peer(self, manager, peers):
+        """测试排除的peer不发送"""
+        manager.send_to_all(b"x", 0, DeliveryMethod.ReliableOrdered, peers[1])
+        assert [len(_queued(peer)) for peer in peers] == [1, 0, 1]
+
+    def test_unreliable(self, manager, peers):
+        """测试不可靠包同样共享负载"""
+        data = b"position"
+        manager.send_to_all(data, 0, DeliveryMethod.Unreliable)
+        for peer in peers:
+            packet = peer._unreliable_channel[0]
+            assert peer._unreliable_pending_count == 1
+            assert packet.payload.obj is data
+
+
+class TestLocking:
+    """测试加锁范围"""
+
+    def test_lock_released_while_sending(self, manager, peers):
+        """测试入队时不持有_peer_lock"""
+        held = []
+        for peer in peers:
+            peer.send_shared = lambda *args: held.append(manager._peer_lock.locked())
+        manager.send_to_all(b"x", 0, DeliveryMethod.ReliableOrdered)
+        assert held == [False] * len(peers)
@@ -0,0 +1,100 @@
+"""
+通道出队队列测试
+
+测试ReliableChannel/SequencedChannel的deque出队队列、批量入队和高水位
+"""
+
+from collections import deque
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+from litenetlib.packets.net_packet import PacketProperty
+
+
+@pytest.fixture
+def manager():
+    return NetManager(EventBasedNetListener())
+
+
+@pytest.fixture
+def peer(manager):
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.sent = []
+    peer.send_user_data = peer.sent.append
+    return peer
+
+
+def _channel(peer, delivery_method, channel_number=0):
+    return peer.create_channel(channel_number * NetConstants.ChannelTypeCount + delivery_method)
+
+
+class TestOutgoingQueue:
+    """测试出队队列"""
+
+    @pytest.mark.parametrize("method", [
+        DeliveryMethod.ReliableOrdered,
+        DeliveryMethod.ReliableUnordered,
+        DeliveryMethod.Sequenced,
+        DeliveryMethod.ReliableSequenced,
+    ])
+    def test_queue_is_deque(self, peer, method):
+        """测试所有通道使用deque"""
+        assert isinstance(_channel(peer, method).outgoing_queue, deque)
+
+    def test_bulk_enqueue_fragments(self, peer):
+        """测试分片一次性入队"""
+        peer.send(b"x" * 3000, 0, DeliveryMethod.ReliableOrdered)
+        channel = _channel(peer, DeliveryMethod.ReliableOrdered)
+        parts = [p.fragment_part for p in channel.outgoing_queue]
+        assert parts == list(range(len(parts)))
+        assert channel.outgoing_queue_size == len(parts)
+        assert peer.get_outgoing_queue_size(0, DeliveryMethod.ReliableOrdered) == len(parts)
+
+    def test_reliable_drains_in_order_up_to_window(self, peer):
+        """测试可靠通道按顺序出队直到窗口满"""
+        channel = _channel(peer, DeliveryMethod.ReliableOrdered)
+        packets = [NetPacket(10, PacketProperty.Channeled) for _ in range(10000)]
+        channel.add_range_to_queue(packets)
+        assert channel.send_next_packets()
+
+        window = NetConstants.DefaultWindowSize
+        assert peer.sent == packets[:window]
+        assert [p.sequence for p in peer.sent] == list(range(window))
+        assert channel.outgoing_queue_size == 10000 - window
+        assert channel.outgoing_queue[0] is packets[window]
+
+    def test_sequenced_drains_all(self, peer):
+        """测试序列通道出队全部包"""
+        channel = _channel(peer, DeliveryMethod.Sequenced)
+        packets = [NetPacket(10, PacketProperty.Channeled) for _ in range(100)]
+        channel.add_range_to_queue(packets)
+        channel.send_next_packets()
+        assert peer.sent == packets
+        assert channel.outgoing_queue_size == 0
+
+
+class TestHighWaterMark:
+    """测试高水位背压"""
+
+    def test_disabled_by_default(self, peer):
+        """测试默认不限制"""
+        channel = _channel(peer, DeliveryMethod.ReliableOrdered)
+        channel.add_range_to_queue(NetPacket(10) for _ in range(5000))
+        assert not channel.is_over_high_water_mark
+        assert peer.can_send(0, DeliveryMethod.ReliableOrdered)
+
+    def test_can_send(self, manager, peer):
+        """测试达到高水位后can_send返回False"""
+        manager.outgoing_queue_high_water_mark = 3
+        for _ in range(2):
+            peer.send(b"data", 0, DeliveryMethod.ReliableUnordered)
+        assert peer.can_send(0, DeliveryMethod.ReliableUnordered)
+        peer.send(b"data", 0, DeliveryMethod.ReliableUnordered)
+        assert not peer.can_send(0, DeliveryMethod.ReliableUnordered)
+        assert peer.can_send(0, DeliveryMethod.ReliableOrdered)
+        assert peer.can_send(0, DeliveryMethod.Unreliable)
+
+        _channel(peer, DeliveryMethod.ReliableUnordered).send_next_packets()
+        assert peer.can_send(0, DeliveryMethod.ReliableUnordered)
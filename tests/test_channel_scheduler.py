@@ -0,0 +1,144 @@
+"""
+通道调度测试
+
+测试peer内按优先级和字节配额在通道间分配每次更新的发送量，
+以及每个通道的排队延迟
+"""
+
+from collections import deque
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.net_peer import NetPeer
+
+PAYLOAD = b"x" * 96  # 加上4字节通道包头共100字节
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    manager.channels_count = 8
+    return manager
+
+
+@pytest.fixture
+def peer(manager):
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.sent = []
+    peer.send_user_data = lambda packet: peer.sent.append(packet.channel_id // NetConstants.ChannelTypeCount)
+    return peer
+
+
+def _queue(peer, channel_number, count, method=DeliveryMethod.Sequenced):
+    for _ in range(count):
+        peer.send(PAYLOAD, channel_number, method)
+
+
+class TestPriority:
+    """测试严格优先级"""
+
+    def test_ready_set_is_deque(self, peer):
+        """测试就绪通道集合不使用带锁的Queue"""
+        assert isinstance(peer._ready_channels, deque)
+
+    def test_high_priority_first(self, manager, peer):
+        """测试后入队的高优先级通道先发送"""
+        manager.channel_priorities = {5: 1}
+        _queue(peer, 5, 20, DeliveryMethod.ReliableUnordered)
+        _queue(peer, 0, 3, DeliveryMethod.ReliableUnordered)
+        manager.manual_update(1)
+        assert peer.sent == [0] * 3 + [5] * 20
+
+    def test_budget_goes_to_high_priority(self, manager, peer):
+        """测试每次更新的字节数先分配给高优先级通道"""
+        manager.channel_priorities = {5: 1}
+        manager.channel_send_budget = 1000
+        _queue(peer, 5, 50)
+        _queue(peer, 0, 5)
+        manager.manual_update(1)
+        assert peer.sent == [0] * 5 + [5] * 5
+
+        _queue(peer, 0, 20)
+        peer.sent.clear()
+        manager.manual_update(1)
+        assert peer.sent == [0] * 10
+
+    def test_rest_sent_next_update(self, manager, peer):
+        """测试超出字节数的包留到之后的更新"""
+        manager.channel_send_budget = 1000
+        _queue(peer, 0, 25)
+        for expected in (10, 20, 25):
+            manager.manual_update(15)
+            assert len(peer.sent) == expected
+
+    def test_acks_sent_without_budget(self, manager, peer):
+        """测试字节数用完后低优先级通道仍发送ACK"""
+        manager.channel_priorities = {5: 1}
+        manager.channel_send_budget = 500
+        channel = peer.create_channel(5 * NetConstants.ChannelTypeCount + DeliveryMethod.ReliableOrdered)
+        channel._must_send_acks = True
+        channel.add_to_peer_channel_send_queue()
+        _queue(peer, 0, 20)
+        manager.manual_update(1)
+        assert peer.sent.count(5) == 1
+        assert peer.sent.count(0) == 5
+
+
+class TestWeightedShare:
+    """测试同一优先级内按配额分配"""
+
+    def test_quota_ratio(self, manager, peer):
+        """测试按字节配额3:1分配"""
+        manager.channel_quotas = {0: 300, 1: 100}
+        manager.channel_send_budget = 2000
+        _queue(peer, 0, 100)
+        _queue(peer, 1, 100)
+        manager.manual_update(1)
+        assert peer.sent.count(0) == 15
+        assert peer.sent.count(1) == 5
+
+    def test_unused_share_goes_to_others(self, manager, peer):
+        """测试一个通道发完后其余字节给同一优先级的其他通道"""
+        manager.channel_send_budget = 2000
+        _queue(peer, 0, 3)
+        _queue(peer, 1, 100)
+        manager.manual_update(1)
+        assert peer.sent.count(0) == 3
+        assert peer.sent.count(1) == 17
+
+    def test_blocked_channel_does_not_bank_credit(self, manager, peer):
+        """测试因窗口受限没有用完额度的通道不累积额度"""
+        manager.channel_send_budget = 100000
+        _queue(peer, 0, 100, DeliveryMethod.ReliableUnordered)
+        manager.manual_update(1)
+        channel = peer.create_channel(DeliveryMethod.ReliableUnordered)
+        assert len(peer.sent) == NetConstants.DefaultWindowSize
+        assert channel._deficit == 0
+
+
+class TestQueueDelay:
+    """测试排队延迟"""
+
+    def test_delay_measured_in_update_time(self, manager, peer):
+        """测试包在下次更新时发送，延迟为一个更新周期"""
+        _queue(peer, 0, 1)
+        manager.manual_update(15)
+        channel = peer.create_channel(DeliveryMethod.Sequenced)
+        assert channel.max_queue_delay == 15
+        assert peer.get_queue_delay(0, DeliveryMethod.Sequenced) == pytest.approx(15 / 8)
+
+    def test_budget_increases_delay(self, manager, peer):
+        """测试字节数受限时后面的包排队更久"""
+        manager.channel_send_budget = 500
+        _queue(peer, 0, 20)
+        for _ in range(4):
+            manager.manual_update(15)
+        channel = peer.create_channel(DeliveryMethod.Sequenced)
+        assert channel.max_queue_delay == 60
+        assert not channel.outgoing_queue
+
+    def test_unreliable_and_missing_channels(self, peer):
+        """测试不可靠和未创建的通道返回0"""
+        assert peer.get_queue_delay(0, DeliveryMethod.Unreliable) == 0
+        assert peer.get_queue_delay(3, DeliveryMethod.ReliableOrdered) == 0
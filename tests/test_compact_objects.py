@@ -0,0 +1,30 @@
+"""
+紧凑对象测试
+
+测试高频分配的对象使用__slots__，不带实例__dict__
+"""
+
+import pytest
+from litenetlib.net_event import NetEvent
+from litenetlib.packets import NetPacket
+from litenetlib.channels.reliable_channel import PendingPacket
+from litenetlib.lite_net_peer import IncomingFragments
+
+
+@pytest.mark.parametrize("factory", [
+    lambda: NetPacket(16),
+    lambda: NetEvent(),
+    PendingPacket,
+    IncomingFragments,
+], ids=["NetPacket", "NetEvent", "PendingPacket", "IncomingFragments"])
+class TestSlots:
+    """测试__slots__布局"""
+
+    def test_no_instance_dict(self, factory):
+        """测试实例没有__dict__"""
+        assert not hasattr(factory(), "__dict__")
+
+    def test_unknown_attribute_rejected(self, factory):
+        """测试不能添加未声明的属性"""
+        with pytest.raises(AttributeError):
+            factory().unknown_attribute = 1
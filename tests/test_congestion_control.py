@@ -0,0 +1,242 @@
+"""
+拥塞控制测试
+
+测试AIMD和BBR-lite控制器、令牌桶限速器，
+以及peer按拥塞窗口和限速推迟可靠包的首次发送
+"""
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.congestion import AimdController, BbrLiteController, BbrMode, TokenBucketPacer
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+from litenetlib.packets.net_packet import PacketProperty
+
+MSS = 1000
+
+
+class TestTokenBucketPacer:
+    """测试令牌桶限速器"""
+
+    def test_unpaced(self):
+        """测试速率为0时不限速"""
+        pacer = TokenBucketPacer()
+        assert all(pacer.try_consume(1000, 0.0) for _ in range(100))
+
+    def test_burst_then_refill(self):
+        """测试先发出一桶，之后按速率补充"""
+        pacer = TokenBucketPacer(100000.0, 3000)
+        assert [pacer.try_consume(1000, 0.0) for _ in range(4)] == [True, True, True, False]
+        assert pacer.try_consume(1000, 5.0)
+        assert not pacer.try_consume(1000, 10.0)
+        assert pacer.try_consume(1000, 20.0)
+
+    def test_refill_capped_at_burst(self):
+        """测试长时间空闲后令牌不超过桶大小"""
+        pacer = TokenBucketPacer(100000.0, 3000)
+        pacer.try_consume(1000, 0.0)
+        pacer.try_consume(1000, 10000.0)
+        assert pacer.tokens == 2000
+
+    def test_debt(self):
+        """测试大于剩余令牌的包也能发出，余额为负"""
+        pacer = TokenBucketPacer(100000.0, 1000)
+        assert pacer.try_consume(1500, 0.0)
+        assert pacer.tokens == -500
+        pacer.consume(1000, 0.0)
+        assert not pacer.try_consume(1, 10.0)
+        assert pacer.try_consume(1, 20.0)
+
+
+class TestAimdController:
+    """测试AIMD控制器"""
+
+    def test_slow_start(self):
+        """测试慢启动按确认字节数增长，应用受限时不增长"""
+        controller = AimdController(MSS)
+        assert controller.congestion_window == 10 * MSS
+        controller.on_packets_acked(10 * MSS, 0.0, False)
+        assert controller.congestion_window == 20 * MSS
+        controller.on_packets_acked(10 * MSS, 0.0, True)
+        assert controller.congestion_window == 20 * MSS
+
+    def test_loss_halves_once_per_rtt(self):
+        """测试丢包减半，同一RTT内的丢包只算一次"""
+        controller = AimdController(MSS)
+        controller.on_rtt_sample(50, 0.0)
+        controller.on_packets_lost(1, 100.0)
+        assert controller.congestion_window == 5 * MSS
+        controller.on_packets_lost(3, 140.0)
+        assert controller.congestion_window == 5 * MSS
+        controller.on_packets_lost(1, 151.0)
+        assert controller.congestion_window == 2.5 * MSS
+
+    def test_min_window(self):
+        """测试窗口不小于两个包"""
+        controller = AimdController(MSS)
+        for i in range(10):
+            controller.on_packets_lost(1, i * 1000.0)
+        assert controller.congestion_window == 2 * MSS
+
+    def test_congestion_avoidance(self):
+        """测试慢启动之后每确认一个窗口增加一个包"""
+        controller = AimdController(MSS)
+        controller.on_packets_lost(1, 0.0)
+        assert not controller.in_slow_start
+        controller.on_packets_acked(5 * MSS, 1000.0, False)
+        assert controller.congestion_window == 6 * MSS
+
+    def test_pacing_rate(self):
+        """测试有RTT样本后按窗口/SRTT限速"""
+        controller = AimdController(MSS)
+        assert controller.pacing_rate == 0
+        controller.on_rtt_sample(100, 0.0)
+        assert controller.pacing_rate == pytest.approx(2.0 * 10 * MSS * 10)
+        controller.on_packets_lost(1, 0.0)
+        assert controller.pacing_rate == pytest.approx(1.25 * 5 * MSS * 10)
+
+
+class TestBbrLiteController:
+    """测试BBR-lite控制器"""
+
+    @staticmethod
+    def _deliver(controller, rate, rounds, rtt=50.0, start=0.0, app_limited=False):
+        """每个RTT按rate（字节/秒）确认数据"""
+        now = start
+        for _ in range(rounds):
+            now += rtt
+            controller.on_packets_acked(int(rate * rtt / 1000), now, app_limited)
+        return now
+
+    def test_estimates(self):
+        """测试带宽和最小RTT估计，窗口为增益乘以BDP"""
+        controller = BbrLiteController(MSS)
+        controller.on_rtt_sample(50, 0.0)
+        self._deliver(controller, 200000, 3)
+        assert controller.bottleneck_bandwidth == pytest.approx(200000)
+        assert controller.congestion_window == pytest.approx(2.885 * 200000 * 0.05, abs=1)
+        assert controller.pacing_rate == pytest.approx(2.885 * 200000)
+
+    def test_startup_exit_and_probe_cycle(self):
+        """测试带宽不再增长三轮后退出启动，排空一轮后循环探测增益"""
+        controller = BbrLiteController(MSS)
+        controller.on_rtt_sample(50, 0.0)
+        now = self._deliver(controller, 200000, 4)  # 第一个ACK开始计时，之后三轮
+        assert controller.mode == BbrMode.Startup
+        now = self._deliver(controller, 200000, 1, start=now)
+        assert controller.mode == BbrMode.Drain
+        assert controller.pacing_gain < 1
+        now = self._deliver(controller, 200000, 1, start=now)
+        assert controller.mode == BbrMode.ProbeBandwidth
+        assert controller.pacing_gain == 1.25
+        assert controller.congestion_window == pytest.approx(2.0 * 200000 * 0.05, abs=1)
+        self._deliver(controller, 200000, 1, start=now)
+        assert controller.pacing_gain == 0.75
+
+    def test_loss_ends_startup(self):
+        """测试启动阶段丢包后开始排空"""
+        controller = BbrLiteController(MSS)
+        controller.on_packets_lost(1, 0.0)
+        assert controller.mode == BbrMode.Drain
+
+    def test_app_limited_samples(self):
+        """测试应用受限的低速样本不计入，也不结束启动"""
+        controller = BbrLiteController(MSS)
+        controller.on_rtt_sample(50, 0.0)
+        now = self._deliver(controller, 200000, 2)
+        self._deliver(controller, 10000, 20, start=now, app_limited=True)
+        assert controller.bottleneck_bandwidth == pytest.approx(200000)
+        assert controller.mode == BbrMode.Startup
+
+    def test_min_rtt_expires(self):
+        """测试最小RTT过期后采用新样本"""
+        controller = BbrLiteController(MSS)
+        controller.on_rtt_sample(50, 0.0)
+        controller.on_rtt_sample(80, 1000.0)
+        assert controller.min_rtt == 50
+        controller.on_rtt_sample(80, 20000.0)
+        assert controller.min_rtt == 80
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    manager.congestion_control = AimdController
+    return manager
+
+
+@pytest.fixture
+def peer(manager):
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.sent = []
+    peer.send_user_data = lambda packet: peer.sent.append(packet.sequence)
+    return peer
+
+
+def _send(peer, count, size=200):
+    for i in range(count):
+        peer.send(bytes([i % 256]) * size, 0, DeliveryMethod.ReliableUnordered)
+    peer.net_manager.manual_update(1)
+    return peer.create_channel(DeliveryMethod.ReliableUnordered)
+
+
+def _ack(channel, sequences):
+    ack = NetPacket(channel._outgoing_acks.size)
+    ack.packet_property = PacketProperty.Ack
+    ack.channel_id = channel._id
+    ack.sequence = channel._local_window_start
+    for seq in sequences:
+        idx = seq % channel.window_size
+        ack.raw_data[NetConstants.ChanneledHeaderSize + idx // 8] |= 1 << (idx % 8)
+    return ack
+
+
+class TestPeerCongestionControl:
+    """测试peer的拥塞控制"""
+
+    def test_disabled_by_default(self):
+        """测试默认不启用"""
+        peer = NetPeer(NetManager(EventBasedNetListener()), ("127.0.0.1", 9050), 1)
+        assert peer.congestion_controller is None
+        assert peer.statistics.congestion_window == 0
+
+    def test_window_limits_first_send(self, peer):
+        """测试只发出拥塞窗口内的包，其余留在队列中"""
+        channel = _send(peer, 40)
+        cwnd = 10 * peer.mtu
+        assert len(peer.sent) == cwnd // 204
+        assert peer.bytes_in_flight == len(peer.sent) * 204
+        assert len(channel.outgoing_queue) == 40 - len(peer.sent)
+        assert peer.statistics.congestion_window == cwnd
+
+    def test_ack_opens_window(self, peer, manager):
+        """测试确认后窗口增大，下次更新发出更多包"""
+        channel = _send(peer, 100)
+        first = list(peer.sent)
+        channel.process_packet(_ack(channel, first))
+        assert peer.bytes_in_flight == 0
+        assert peer.statistics.congestion_window == 10 * peer.mtu + len(first) * 204
+        manager.manual_update(1)
+        assert len(peer.sent) - len(first) == peer.statistics.congestion_window // 204
+
+    def test_loss_shrinks_window(self, peer):
+        """测试快速重传时窗口减半"""
+        channel = _send(peer, 40)
+        channel.process_packet(_ack(channel, peer.sent[1:5]))
+        assert peer.statistics.congestion_window == (10 * peer.mtu + 4 * 204) // 2
+
+    def test_pacing_spreads_sends(self, peer, manager):
+        """测试限速后每次更新只发出约一个周期的数据量"""
+        peer.add_rtt_sample(100)
+        rate = peer.statistics.pacing_rate
+        assert rate == pytest.approx(2.0 * 10 * peer.mtu * 10)
+        burst = max(2 * peer.mtu, int(rate * manager.update_time / 1000))
+
+        _send(peer, 40)
+        first = len(peer.sent)
+        manager.manual_update(manager.update_time)
+        second = len(peer.sent) - first
+        assert first == -(-burst // 204)
+        assert 0 < second <= first
+        assert first + second < 10 * peer.mtu // 204
@@ -0,0 +1,88 @@
+"""
+CRC32C引擎测试
+
+验证slicing-by-8引擎和原生引擎与逐字节实现结果一致
+"""
+
+import os
+import random
+
+import pytest
+from litenetlib.utils import CRC32C
+
+
+def _reference(data, offset, length):
+    """逐字节参考实现（与C#实现相同）"""
+    CRC32C._initialize_table()
+    crc = 0xFFFFFFFF
+    for i in range(length):
+        crc = CRC32C._TABLE[(crc ^ data[offset + i]) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+class TestSlicingBy8:
+    """测试纯Python slicing-by-8引擎"""
+
+    def test_known_vector(self):
+        """测试标准校验值"""
+        assert CRC32C.compute_python(b"123456789") == 0xE3069283
+
+    def test_matches_reference_all_lengths(self):
+        """测试0-64字节的所有长度与参考实现一致"""
+        data = os.urandom(64)
+        for length in range(65):
+            assert CRC32C.compute_python(data[:length]) == _reference(data, 0, length)
+
+    def test_matches_reference_random_offsets(self):
+        """测试随机偏移和长度"""
+        rng = random.Random(1234)
+        data = bytearray(rng.getrandbits(8) for _ in range(4096))
+        for _ in range(100):
+            offset = rng.randrange(0, 2048)
+            length = rng.randrange(0, 2048)
+            expected = _reference(data, offset, length)
+            CRC32C.use_native(False)
+            try:
+                assert CRC32C.compute(data, offset, length) == expected
+            finally:
+                CRC32C.use_native(True)
+
+    def test_buffer_types(self):
+        """测试bytes/bytearray/memoryview输入"""
+        data = os.urandom(1400)
+        expected = _reference(data, 0, len(data))
+        assert CRC32C.compute(data) == expected
+        assert CRC32C.compute(bytearray(data)) == expected
+        assert CRC32C.compute(memoryview(data)) == expected
+        assert CRC32C.compute(data, 0, 0) == 0
+
+
+class TestEngineSelection:
+    """测试引擎选择与回退"""
+
+    def test_fallback_engine(self):
+        """测试关闭原生引擎后使用slicing-by-8"""
+        try:
+            assert not CRC32C.use_native(False)
+            assert CRC32C.engine == "slicing-by-8"
+        finally:
+            CRC32C.use_native(True)
+
+    def test_native_dispatch(self, monkeypatch):
+        """测试原生引擎可用时由其计算"""
+        calls = []
+
+        def native(view):
+            calls.append(bytes(view))
+            return CRC32C.compute_python(view)
+
+        monkeypatch.setattr(CRC32C, "_native", native)
+        assert CRC32C.compute(b"abc123", 1, 4) == _reference(b"abc123", 1, 4)
+        assert calls == [b"bc12"]
+
+    @pytest.mark.skipif(CRC32C.engine == "slicing-by-8", reason="no native CRC32C extension")
+    def test_native_matches_reference(self):
+        """测试原生引擎与参考实现一致"""
+        data = os.urandom(3000)
+        for length in (0, 1, 7, 8, 9, 1400, 3000):
+            assert CRC32C.compute(data, 0, length) == _reference(data, 0, length)
@@ -0,0 +1,154 @@
+"""
+快速重传测试
+
+测试ReliableChannel按位图整块处理ACK、窗口移动，
+以及之后多个包被确认时立即重发丢失的包
+"""
+
+import random
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+from litenetlib.packets.net_packet import PacketProperty
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    manager.enable_statistics = True
+    return manager
+
+
+@pytest.fixture
+def peer(manager):
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.sent = []
+    peer.send_user_data = lambda packet: peer.sent.append(packet.sequence)
+    return peer
+
+
+def _channel(peer, count, first_sequence=0):
+    channel = peer.create_channel(DeliveryMethod.ReliableUnordered)
+    channel._local_sequence = channel._local_window_start = first_sequence
+    for i in range(count):
+        peer.send(b"m%d" % i, 0, DeliveryMethod.ReliableUnordered)
+    channel.send_next_packets()
+    peer.sent.clear()
+    return channel
+
+
+def _ack(channel, window_start, sequences):
+    ack = NetPacket(channel._outgoing_acks.size)
+    ack.packet_property = PacketProperty.Ack
+    ack.channel_id = channel._id
+    ack.sequence = window_start
+    for seq in sequences:
+        idx = seq % channel._window_size
+        ack.raw_data[NetConstants.ChanneledHeaderSize + idx // 8] |= 1 << (idx % 8)
+    return ack
+
+
+def _in_flight(channel):
+    return sorted(p._packet.sequence for p in channel._pending_packets if p is not None and p._packet is not None)
+
+
+class TestAckBitmap:
+    """测试ACK位图处理"""
+
+    def test_window_advances_over_acked(self, peer):
+        """测试窗口起点移到第一个未确认的包"""
+        channel = _channel(peer, 10)
+        channel.process_packet(_ack(channel, 0, [0, 1, 2, 4, 5]))
+        assert channel._local_window_start == 3
+        assert _in_flight(channel) == [3, 6, 7, 8, 9]
+
+        channel.process_packet(_ack(channel, 0, [0, 1, 2, 3, 4, 5]))
+        assert channel._local_window_start == 6
+
+    def test_all_acked(self, peer):
+        """测试全部确认后窗口追上发送序号"""
+        channel = _channel(peer, 5)
+        channel.process_packet(_ack(channel, 0, range(5)))
+        assert channel._local_window_start == 5
+        assert channel._pending_mask == 0
+
+    def test_wraparound(self, peer):
+        """测试序号回绕"""
+        start = NetConstants.MaxSequence - 3
+        channel = _channel(peer, 6, start)
+        sequences = [(start + i) % NetConstants.MaxSequence for i in range(6)]
+        channel.process_packet(_ack(channel, start, sequences[:4]))
+        assert channel._local_window_start == sequences[4]
+        assert _in_flight(channel) == sorted(sequences[4:])
+
+    def test_matches_per_packet_walk(self, peer):
+        """测试随机ACK与逐包比较的结果一致"""
+        rng = random.Random(7)
+        channel = _channel(peer, 50, NetConstants.MaxSequence - 20)
+        in_flight = set(_in_flight(channel))
+        window_start = channel._local_window_start
+        for _ in range(20):
+            acked = {seq for seq in in_flight if rng.random() < 0.3}
+            channel.process_packet(_ack(channel, window_start, acked))
+            in_flight -= acked
+            assert set(_in_flight(channel)) == in_flight
+            expected_start = min(in_flight, key=lambda s: (s - window_start) % NetConstants.MaxSequence) \
+                if in_flight else channel._local_sequence
+            assert channel._local_window_start == expected_start
+
+
+class TestFastRetransmit:
+    """测试快速重传"""
+
+    def test_resent_after_threshold(self, peer, manager):
+        """测试之后3个包被确认时丢失的包在下次发送时重发"""
+        channel = _channel(peer, 10)
+        channel.process_packet(_ack(channel, 0, [1, 2, 3]))
+        channel.send_next_packets()
+        assert peer.sent == [0]
+        assert peer.statistics.fast_retransmits == 1
+        assert manager.statistics.fast_retransmits == 1
+
+    def test_below_threshold(self, peer):
+        """测试之后被确认的包不够时不重发"""
+        channel = _channel(peer, 10)
+        channel.process_packet(_ack(channel, 0, [1, 2]))
+        channel.send_next_packets()
+        assert peer.sent == []
+
+    def test_only_packets_with_enough_later_acks(self, peer):
+        """测试只重发之后有足够确认的包"""
+        channel = _channel(peer, 10)
+        channel.process_packet(_ack(channel, 0, [1, 3, 5, 6]))
+        channel.send_next_packets()
+        assert sorted(peer.sent) == [0, 2]
+
+    def test_resent_once(self, peer):
+        """测试每个包只快速重传一次"""
+        channel = _channel(peer, 10)
+        channel.process_packet(_ack(channel, 0, [1, 2, 3]))
+        channel.send_next_packets()
+        channel.process_packet(_ack(channel, 0, [1, 2, 3, 4, 5]))
+        channel.send_next_packets()
+        assert peer.sent == [0]
+
+    def test_disabled(self, peer, manager):
+        """测试阈值为0时关闭"""
+        manager.fast_retransmit_threshold = 0
+        channel = _channel(peer, 10)
+        channel.process_packet(_ack(channel, 0, [1, 2, 3, 4, 5]))
+        channel.send_next_packets()
+        assert peer.sent == []
+
+    def test_resend_timer_rescheduled(self, peer, manager):
+        """测试快速重传后重发定时器重新计时，不会再按旧定时器重发"""
+        channel = _channel(peer, 10)
+        old_timer = channel._pending_packets[0].timer
+        channel.process_packet(_ack(channel, 0, [1, 2, 3]))
+        channel.send_next_packets()
+        assert not old_timer.active
+        assert channel._pending_packets[0].timer is not old_timer
+        assert channel._pending_packets[0].timer.active
@@ -0,0 +1,172 @@
+"""
+分片重组测试
+
+测试分片直接写入连续缓冲区、内存预算和超时丢弃
+"""
+
+import random
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    manager.received = []
+    manager.create_receive_event = lambda packet, method, channel, header_size, peer: \
+        manager.received.append((packet, header_size))
+    return manager
+
+
+@pytest.fixture
+def peer(manager):
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.send_user_data = lambda packet: None
+    return peer
+
+
+def _fragments(peer, data):
+    peer.send(data, 0, DeliveryMethod.ReliableOrdered)
+    channel = peer.create_channel(DeliveryMethod.ReliableOrdered)
+    packets = list(channel.outgoing_queue)
+    channel.outgoing_queue.clear()
+    for packet in packets:
+        packet.channel_id = DeliveryMethod.ReliableOrdered
+    return packets
+
+
+def _copy(packet):
+    copy = NetPacket(packet.size)
+    copy.raw_data[:] = packet.raw_data[:packet.size]
+    return copy
+
+
+class TestContiguousReassembly:
+    """测试连续缓冲区重组"""
+
+    def test_delivered_as_single_buffer(self, peer, manager):
+        """测试重组结果是一块连续缓冲区，可以零拷贝读取"""
+        data = bytes(random.getrandbits(8) for _ in range(10000))
+        packets = _fragments(peer, data)
+        random.shuffle(packets)
+        for packet in packets:
+            peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packet)
+
+        [(packet, header_size)] = manager.received
+        view = packet.get_view(header_size)
+        assert isinstance(view, memoryview)
+        assert view == data
+        assert view.obj is packet.raw_data
+        assert peer.fragments_memory == 0
+
+    def test_last_fragment_first(self, peer, manager):
+        """测试最后分片先到时，分片大小确定后再写入"""
+        data = bytes(range(256)) * 20
+        packets = _fragments(peer, data)
+        for packet in [packets[-1]] + packets[:-1]:
+            peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packet)
+        assert manager.received[0][0].get_view() == data
+
+    def test_fragments_recycled_on_arrival(self, peer, manager):
+        """测试分片写入后立即回收，不等到重组完成"""
+        packets = _fragments(peer, b"z" * 5000)
+        recycled = []
+        manager.pool_recycle = recycled.append
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packets[0])
+        assert recycled == [packets[0]]
+
+    def test_wrong_fragment_size_rejected(self, peer, manager):
+        """测试大小不一致的分片被丢弃"""
+        packets = _fragments(peer, b"q" * 5000)
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packets[0])
+        short = _copy(packets[1])
+        short.size -= 10
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, short)
+        assert peer._holded_fragments[packets[0].fragment_id].received_count == 1
+
+
+class TestReassemblyLimits:
+    """测试内存预算和超时丢弃"""
+
+    def test_memory_budget(self, peer, manager):
+        """测试超过内存预算的重组被拒绝"""
+        manager.fragment_memory_budget = 8000
+        small = _fragments(peer, b"a" * 3000)
+        large = _fragments(peer, b"b" * 9000)
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, small[0])
+        used = peer.fragments_memory
+        assert used > 0
+
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, large[0])
+        assert large[0].fragment_id not in peer._holded_fragments
+        assert peer.fragments_memory == used
+
+        for packet in small[1:]:
+            peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packet)
+        assert manager.received[0][0].get_view() == b"a" * 3000
+        assert peer.fragments_memory == 0
+
+    def test_stalled_reassembly_evicted(self, peer, manager):
+        """测试超时没有新分片的重组被丢弃"""
+        packets = _fragments(peer, b"c" * 5000)
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packets[0])
+        manager.manual_update(manager.fragment_timeout - 1)
+        assert peer._holded_fragments
+        manager.manual_update(2)
+        assert not peer._holded_fragments
+        assert peer.fragments_memory == 0
+        assert len(manager.timer_wheel) == 0
+
+    def test_progress_extends_timeout(self, peer, manager):
+        """测试收到新分片后重新计时"""
+        packets = _fragments(peer, b"d" * 5000)
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packets[0])
+        manager.manual_update(manager.fragment_timeout // 2)
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packets[1])
+        manager.manual_update(manager.fragment_timeout // 2 + 1)
+        assert packets[0].fragment_id in peer._holded_fragments
+
+        for packet in packets[2:]:
+            peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packet)
+        assert manager.received[0][0].get_view() == b"d" * 5000
+        assert len(manager.timer_wheel) == 0
+
+    def test_held_last_fragments_charged(self, peer, manager):
+        """测试只发送最后分片时保留的包计入内存预算"""
+        manager.fragment_memory_budget = 4000
+        held = 0
+        for _ in range(10):
+            last = _fragments(peer, b"e" * 3400)[-1]
+            peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, last)
+            held += last.fragment_id in peer._holded_fragments
+        assert 0 < held < 10
+        assert peer.fragments_memory <= manager.fragment_memory_budget
+
+        for fragment_id in list(peer._holded_fragments):
+            with peer._fragments_lock:
+                peer._drop_fragments(fragment_id)
+        assert peer.fragments_memory == 0
+
+    def test_concurrent_fragment_ids_capped(self, peer, manager):
+        """测试同时重组的分片ID数有上限，位图在创建时计入预算"""
+        manager.max_incoming_fragment_ids = 4
+        for _ in range(10):
+            first = _fragments(peer, b"f" * 3000)[0]
+            peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, first)
+        assert len(peer._holded_fragments) == 4
+        assert peer.fragments_memory == sum(f.memory for f in peer._holded_fragments.values())
+
+    def test_last_fragment_memory_released(self, peer, manager):
+        """测试保留的最后分片写入后释放其预算"""
+        packets = _fragments(peer, b"g" * 3000)
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packets[-1])
+        with_held = peer.fragments_memory
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packets[0])
+        incoming = peer._holded_fragments[packets[0].fragment_id]
+        assert incoming.last_fragment is None
+        assert peer.fragments_memory == incoming.memory == len(incoming.received) * (1 + incoming.fragment_size)
+        assert with_held > len(incoming.received)
@@ -0,0 +1,226 @@
+"""
+LayerPipeline测试
+
+测试多层包处理管道和包池尾部空间
+"""
+
+import os
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener
+from litenetlib.layers import LayerPipeline, Crc32cLayer, XorEncryptLayer, PacketLayerBase
+from litenetlib.net_peer import NetPeer
+from litenetlib.net_socket import ReceiveRing
+from litenetlib.packets import NetPacket
+from litenetlib.packets.net_packet import PacketProperty
+from litenetlib.utils import CRC32C
+
+
+class _RecordingLayer(PacketLayerBase):
+    """记录调用顺序的层"""
+
+    def __init__(self, name, log):
+        super().__init__(0)
+        self.name = name
+        self.log = log
+
+    def process_out_bound_packet(self, data, offset, length):
+        self.log.append(("out", self.name, type(data)))
+
+    def process_in_bound_packet(self, data, offset, length):
+        self.log.append(("in", self.name, type(data)))
+        return True
+
+
+class _FramingLayer(PacketLayerBase):
+    """在数据前加两字节、后加一字节的层"""
+
+    def __init__(self):
+        super().__init__(3, 2)
+
+    def process_out_bound_packet(self, data, offset, length):
+        data[offset - 2:offset] = b"<<"
+        data[offset + length:offset + length + 1] = b">"
+
+    def process_in_bound_packet(self, data, offset, length):
+        return data[offset:offset + 2] == b"<<" and data[offset + length - 1:offset + length] == b">"
+
+
+class TestLayerPipeline:
+    """测试层管道"""
+
+    def test_extra_size_is_sum(self):
+        """测试额外大小为所有层之和"""
+        pipeline = LayerPipeline([XorEncryptLayer(b"key"), Crc32cLayer(), Crc32cLayer()])
+        assert pipeline.extra_packet_size_for_layer == 8
+        assert LayerPipeline([]).extra_packet_size_for_layer == 0
+
+    def test_layer_order(self):
+        """测试出站正序、入站逆序，共享同一memoryview"""
+        log = []
+        pipeline = LayerPipeline([_RecordingLayer("a", log), _RecordingLayer("b", log)])
+        data = bytearray(10)
+        pipeline.process_out_bound_packet(data, 0, 10)
+        pipeline.process_in_bound_packet(data, 0, 10)
+        assert [(d, n) for d, n, _ in log] == [("out", "a"), ("out", "b"), ("in", "b"), ("in", "a")]
+        assert all(t is memoryview for _, _, t in log)
+
+    def test_round_trip_matches_sequential_layers(self):
+        """测试与逐层处理结果一致并可还原"""
+        payload = os.urandom(200)
+        pipeline = LayerPipeline([XorEncryptLayer(b"secret"), Crc32cLayer()])
+
+        data = bytearray(payload) + bytearray(pipeline.extra_packet_size_for_layer)
+        length = pipeline.process_out_bound_packet(data, 0, len(payload))
+        assert length == len(payload) + 4
+
+        expected = bytearray(payload) + bytearray(4)
+        XorEncryptLayer(b"secret").process_out_bound_packet(expected, 0, len(payload))
+        Crc32cLayer().process_out_bound_packet(expected, 0, len(payload))
+        assert data == expected
+
+        assert pipeline.process_in_bound_packet(data, 0, length)
+        assert bytes(data[:len(payload)]) == payload
+
+    def test_rejects_corrupted_packet(self):
+        """测试校验失败时停止处理"""
+        log = []
+        pipeline = LayerPipeline([_RecordingLayer("inner", log), Crc32cLayer()])
+        data = bytearray(b"hello") + bytearray(4)
+        length = pipeline.process_out_bound_packet(data, 0, 5)
+        data[0] ^= 0xFF
+        log.clear()
+        assert not pipeline.process_in_bound_packet(data, 0, length)
+        assert log == []
+
+    def test_head_room(self):
+        """测试前部空间按层累加，外层包在内层外面"""
+        pipeline = LayerPipeline([_FramingLayer(), Crc32cLayer(), _FramingLayer()])
+        assert pipeline.head_room_for_layer == 4
+        assert pipeline.extra_packet_size_for_layer == 10
+
+        data = bytearray(4) + bytearray(b"abc") + bytearray(6)
+        length = pipeline.process_out_bound_packet(data, 4, 3)
+        assert length == len(data) == 13
+        assert data[:6] == b"<<<<ab" and data[-1:] == b">"
+
+        assert pipeline.process_in_bound_packet(data, 0, length)
+        data[0] = 0
+        assert not pipeline.process_in_bound_packet(data, 0, length)
+
+    def test_invalid_head_room(self):
+        """测试前部空间不能超过额外大小"""
+        with pytest.raises(ValueError):
+            PacketLayerBase.__init__(_FramingLayer(), 1, 2)
+
+
+class TestManagerLayerSizing:
+    """测试管理器按层预留空间"""
+
+    def test_pool_packet_has_tail_room(self):
+        """测试包池分配的包有层所需尾部空间"""
+        pipeline = LayerPipeline([XorEncryptLayer(b"k"), Crc32cLayer()])
+        manager = NetManager(EventBasedNetListener(), pipeline)
+        assert manager.extra_packet_size_for_layer == 4
+
+        packet = manager.pool_get_packet(100)
+        assert packet.size == 100
+        assert len(packet.raw_data) >= 104
+        packet.raw_data[:100] = os.urandom(100)
+        length = pipeline.process_out_bound_packet(packet.raw_data, 0, packet.size)
+        assert length == 104
+        assert pipeline.process_in_bound_packet(packet.raw_data, 0, length)
+
+        manager.pool_recycle(packet)
+        assert len(manager.pool_get_packet(100).raw_data) >= 104
+
+    def test_peer_mtu_excludes_layer_size(self):
+        """测试peer的MTU扣除层大小"""
+        plain = NetPeer(NetManager(EventBasedNetListener()), ("127.0.0.1", 1), 1)
+        layered = NetPeer(
+            NetManager(EventBasedNetListener(), LayerPipeline([Crc32cLayer()])),
+            ("127.0.0.1", 1), 1
+        )
+        assert plain.mtu - layered.mtu == CRC32C.CHECKSUM_SIZE
+
+
+class TestManagerLayerPath:
+    """测试发送和接收路径经过包层"""
+
+    def _manager(self, layer, net_socket):
+        manager = NetManager(EventBasedNetListener(), layer)
+        manager.net_socket = net_socket
+        manager.received = []
+        manager.create_receive_event = lambda packet, method, channel, header_size, peer: \
+            manager.received.append(bytes(packet.get_view(header_size)))
+        return manager
+
+    @pytest.mark.parametrize("batch_send", [True, False])
+    def test_send_applies_layer(self, net_socket, receiver, batch_send):
+        """测试发送的数据报带有层的前后字节，包本身不变"""
+        manager = self._manager(LayerPipeline([_FramingLayer(), Crc32cLayer()]), net_socket)
+        manager.batch_send = batch_send
+        packet = NetPacket(3, PacketProperty.Unreliable)
+        packet.raw_data[1:4] = b"abc"
+        manager.send_raw_to(packet, receiver.getsockname())
+        manager.flush_send_queue()
+
+        data = receiver.recvfrom(2048)[0]
+        assert len(data) == 4 + 7
+        assert data[:3] == b"<<" + bytes([PacketProperty.Unreliable])
+        assert bytes(packet.raw_data[:4]) == bytes([PacketProperty.Unreliable]) + b"abc"
+
+    def test_send_zero_copy_payload(self, net_socket, receiver):
+        """测试零拷贝负载也经过层"""
+        manager = self._manager(XorEncryptLayer(b"key"), net_socket)
+        manager.batch_send = False
+        packet = NetPacket(0, PacketProperty.Unreliable)
+        packet.payload = memoryview(b"payload")
+        manager.send_raw_to(packet, receiver.getsockname())
+
+        data = bytearray(receiver.recvfrom(2048)[0])
+        assert XorEncryptLayer(b"key").process_in_bound_packet(data, 0, len(data))
+        assert data == bytes([PacketProperty.Unreliable]) + b"payload"
+
+    def test_receive_strips_layer(self, net_socket, receiver):
+        """测试收到的包经过层后再处理，被拒绝的包丢弃"""
+        manager = self._manager(LayerPipeline([_FramingLayer(), Crc32cLayer()]), net_socket)
+        manager.batch_send = False
+        peer = NetPeer(manager, receiver.getsockname(), 1)
+        packet = NetPacket(5, PacketProperty.Unreliable)
+        packet.raw_data[1:6] = b"hello"
+        manager.send_raw_to(packet, receiver.getsockname())
+        wire = receiver.recvfrom(2048)[0]
+
+        received = NetPacket(len(wire))
+        received.raw_data[:] = wire
+        peer.process_packet(received)
+        assert manager.received == [b"hello"]
+
+        corrupted = NetPacket(len(wire))
+        corrupted.raw_data[:] = wire
+        corrupted.raw_data[4] ^= 0xFF
+        peer.process_packet(corrupted)
+        short = NetPacket(2)
+        short.raw_data[:] = b"<<"
+        peer.process_packet(short)
+        assert manager.received == [b"hello"]
+
+    def test_receive_head_room_without_copy(self):
+        """测试有头部空间的层不移动数据，视图包回收时归还接收缓冲区"""
+        manager = NetManager(EventBasedNetListener(), _FramingLayer())
+        ring = ReceiveRing(1, 16)
+        idx = ring.acquire()
+        wire = b"<<" + bytes([PacketProperty.Unreliable]) + b"hello>"
+        ring.buffers[idx][:len(wire)] = wire
+
+        packet = manager.process_inbound_layer(
+            manager.pool_get_packet_from_buffer(ring.views[idx][:len(wire)], ring.release)
+        )
+        assert bytes(packet.get_view()) == wire[2:-1]
+        assert packet.packet_property == PacketProperty.Unreliable
+        assert bytes(ring.buffers[idx][:len(wire)]) == wire
+        assert ring.free_count == 0
+
+        manager.pool_recycle(packet)
+        assert ring.free_count == 1
@@ -0,0 +1,157 @@
+"""
+合并包测试
+
+测试小包在每次更新时合并为Merged数据报发送，
+以及接收端不复制数据地拆分
+"""
+
+import socket
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+from litenetlib.packets.net_packet import PacketProperty
+
+
+@pytest.fixture
+def sender(receiver, net_socket):
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    manager.enable_statistics = True
+    manager.net_socket = net_socket
+    peer = NetPeer(manager, receiver.getsockname(), 1)
+    manager.add_peer(peer)
+    return peer
+
+
+@pytest.fixture
+def remote():
+    """接收端peer，记录收到的用户数据"""
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    manager.received = []
+    manager.create_receive_event = lambda packet, method, channel, header_size, peer: \
+        manager.received.append((packet, header_size))
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.send_user_data = lambda packet: None
+    return peer
+
+
+def _datagrams(sock):
+    datagrams = []
+    sock.settimeout(0.2)
+    try:
+        while True:
+            datagrams.append(sock.recvfrom(2048)[0])
+    except socket.timeout:
+        return datagrams
+
+
+def _packet(data):
+    packet = NetPacket(len(data))
+    packet.raw_data[:] = data
+    return packet
+
+
+def _payloads(remote):
+    return [bytes(packet.get_view(header_size)) for packet, header_size in remote.net_manager.received]
+
+
+class TestMergedSend:
+    """测试发送端合并"""
+
+    def test_small_messages_merged(self, sender, receiver):
+        """测试一次更新内的小包合并为一个数据报"""
+        for i in range(50):
+            sender.send(b"state%02d" % i, 0, DeliveryMethod.Unreliable)
+        sender.net_manager.manual_update(1)
+
+        datagrams = _datagrams(receiver)
+        assert len(datagrams) == 1
+        assert datagrams[0][0] & 0x1F == PacketProperty.Merged
+        assert len(datagrams[0]) <= sender.mtu
+        assert sender.statistics.packets_sent == 1
+
+    def test_split_at_mtu(self, sender, receiver):
+        """测试超过MTU时分成多个数据报，每个不超过MTU"""
+        for i in range(200):
+            sender.send(bytes([i]) * 40, 0, DeliveryMethod.Unreliable)
+        sender.net_manager.manual_update(1)
+
+        datagrams = _datagrams(receiver)
+        assert len(datagrams) == -(-200 // ((sender.mtu - NetConstants.HeaderSize) // 43))
+        assert all(len(d) <= sender.mtu for d in datagrams)
+        assert sender.statistics.packets_sent == len(datagrams)
+
+    def test_single_message_not_wrapped(self, sender, receiver):
+        """测试只有一个包时按原包发送"""
+        sender.send(b"alone", 0, DeliveryMethod.Unreliable)
+        sender.net_manager.manual_update(1)
+        [datagram] = _datagrams(receiver)
+        assert datagram[0] & 0x1F == PacketProperty.Unreliable
+        assert datagram[NetConstants.HeaderSize:] == b"alone"
+
+    def test_large_packet_sent_directly(self, sender, receiver):
+        """测试接近MTU的包不进入合并缓冲区"""
+        size = sender.mtu - NetConstants.HeaderSize - 10
+        sender.send(b"s", 0, DeliveryMethod.Unreliable)
+        sender.send(b"L" * size, 0, DeliveryMethod.Unreliable)
+        sender.send(b"t", 0, DeliveryMethod.Unreliable)
+        sender.net_manager.manual_update(1)
+        datagrams = _datagrams(receiver)
+        assert sorted(len(d) for d in datagrams) == [1 + 2 * 3 + 2, size + 1]
+
+    def test_reliable_and_acks_merged(self, sender, receiver):
+        """测试可靠包也经过合并"""
+        for i in range(10):
+            sender.send(b"r%d" % i, 0, DeliveryMethod.ReliableUnordered)
+        sender.net_manager.manual_update(1)
+        datagrams = _datagrams(receiver)
+        assert len(datagrams) == 1
+        assert datagrams[0][0] & 0x1F == PacketProperty.Merged
+
+
+class TestMergedReceive:
+    """测试接收端拆分"""
+
+    def test_round_trip_without_copy(self, sender, receiver, remote):
+        """测试拆分后的子包引用Merged包的缓冲区"""
+        messages = [b"msg%d" % i for i in range(20)]
+        for message in messages:
+            sender.send(message, 0, DeliveryMethod.Unreliable)
+        sender.net_manager.manual_update(1)
+        [datagram] = _datagrams(receiver)
+
+        merged = _packet(datagram)
+        remote.process_packet(merged)
+        assert _payloads(remote) == messages
+        for packet, _ in remote.net_manager.received:
+            assert isinstance(packet.raw_data, memoryview)
+            assert packet.raw_data.obj is merged.raw_data
+
+    def test_parent_recycled_after_children(self, remote):
+        """测试所有子包回收后才回收Merged包"""
+        manager = remote.net_manager
+        recycled = []
+        original = manager.pool_recycle
+
+        def pool_recycle(packet):
+            recycled.append(packet)
+            original(packet)
+
+        manager.pool_recycle = pool_recycle
+        merged = _packet(bytes([PacketProperty.Merged]) + b"\x02\x00\x00a" + b"\x02\x00\x00b")
+        remote.process_packet(merged)
+        first, second = [packet for packet, _ in manager.received]
+
+        manager.pool_recycle(first)
+        assert merged not in recycled
+        manager.pool_recycle(second)
+        assert recycled[-1] is merged
+
+    def test_truncated_merged_packet(self, remote):
+        """测试长度字段超出数据时停止拆分"""
+        merged = _packet(bytes([PacketProperty.Merged]) + b"\x02\x00\x00a" + b"\x09\x00\x00b")
+        remote.process_packet(merged)
+        assert _payloads(remote) == [b"a"]
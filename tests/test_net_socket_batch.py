@@ -0,0 +1,169 @@
+"""
+NetSocket批量接收测试
+
+测试批量零拷贝接收路径和接收缓冲环
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+from litenetlib.constants import NetConstants
+from litenetlib.net_socket import NetSocket, ReceiveRing
+from litenetlib.packets import NetPacket
+
+
+class _CollectingManager:
+    """收集收到的消息的最小manager"""
+
+    def __init__(self, keep_buffers=False):
+        self.messages = []
+        self.errors = []
+        self.keep_buffers = keep_buffers
+        self.received = threading.Event()
+
+    def on_message_received(self, data, address, release=None):
+        self.messages.append((bytes(data), type(data)))
+        if release is not None and not self.keep_buffers:
+            release(data)
+        self.received.set()
+
+    def on_network_error(self, address, error):
+        self.errors.append(error)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestReceiveRing:
+    """测试接收缓冲环"""
+
+    def test_acquire_until_exhausted(self):
+        """测试缓冲区用尽后返回-1"""
+        ring = ReceiveRing(2, 16)
+        assert ring.acquire() == 0
+        assert ring.acquire() == 1
+        assert ring.acquire() == -1
+        assert ring.free_count == 0
+
+    def test_release_by_view(self):
+        """测试通过memoryview归还缓冲区"""
+        ring = ReceiveRing(1, 16)
+        idx = ring.acquire()
+        ring.release(ring.views[idx][:4])
+        assert ring.free_count == 1
+        assert ring.acquire() == idx
+
+    def test_packet_recycle_releases_buffer(self):
+        """测试包回收时归还附加的缓冲区"""
+        ring = ReceiveRing(1, 16)
+        idx = ring.acquire()
+        ring.buffers[idx][:3] = b"abc"
+
+        packet = NetPacket(0)
+        packet.attach_buffer(ring.views[idx][:3], 3, ring.release)
+        assert packet.size == 3
+        assert packet.raw_data is ring.buffers[idx]
+        assert ring.free_count == 0
+
+        assert packet.release_buffer()
+        assert packet.raw_data is None
+        assert ring.free_count == 1
+        assert not packet.release_buffer()
+
+
+class TestNetSocketBatchedReceive:
+    """测试NetSocket批量接收"""
+
+    def test_batched_receive_delivers_memoryview(self):
+        """测试批量模式以memoryview交付所有数据报"""
+        manager = _CollectingManager()
+        net_socket = NetSocket(manager, batch_receive=True)
+        assert net_socket.start(0, True, False)
+        try:
+            sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            payloads = [bytes([i]) * (i + 1) for i in range(20)]
+            for payload in payloads:
+                sender.sendto(payload, ("127.0.0.1", net_socket.local_port))
+            sender.close()
+
+            assert _wait_for(lambda: len(manager.messages) == len(payloads))
+            assert [m[0] for m in manager.messages] == payloads
+            assert all(m[1] is memoryview for m in manager.messages)
+            assert net_socket._receive_ring_v4.free_count == 256
+        finally:
+            net_socket.stop()
+
+    def test_exhausted_ring_falls_back_to_copy(self):
+        """测试缓冲区未归还时退回复制接收"""
+        manager = _CollectingManager(keep_buffers=True)
+        net_socket = NetSocket(manager, batch_receive=True, receive_ring_size=2)
+        assert net_socket.start(0, True, False)
+        try:
+            sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            for i in range(4):
+                sender.sendto(b"msg%d" % i, ("127.0.0.1", net_socket.local_port))
+            sender.close()
+
+            assert _wait_for(lambda: len(manager.messages) == 4)
+            assert [m[0] for m in manager.messages] == [b"msg0", b"msg1", b"msg2", b"msg3"]
+            assert [m[1] for m in manager.messages] == [memoryview, memoryview, bytes, bytes]
+        finally:
+            net_socket.stop()
+
+    def test_oversized_datagram_dropped(self):
+        """测试超过缓冲区的数据报被丢弃而不是截断交付"""
+        manager = _CollectingManager()
+        net_socket = NetSocket(manager, batch_receive=True)
+        assert net_socket.start(0, True, False)
+        try:
+            sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sender.sendto(b"x" * (NetConstants.PacketPoolMtuSize + 1), ("127.0.0.1", net_socket.local_port))
+            sender.sendto(b"y" * NetConstants.PacketPoolMtuSize, ("127.0.0.1", net_socket.local_port))
+            sender.close()
+
+            assert _wait_for(lambda: len(manager.messages) == 1)
+            assert manager.messages[0][0] == b"y" * NetConstants.PacketPoolMtuSize
+            assert net_socket.truncated_datagrams == 1
+            assert net_socket._receive_ring_v4.free_count == 256
+        finally:
+            net_socket.stop()
+
+    def test_failing_receiver_releases_buffer(self):
+        """测试on_message_received抛出异常时归还缓冲区"""
+        manager = _CollectingManager()
+        calls = []
+
+        def failing(data, address, release=None):
+            calls.append(address)
+            raise socket.error("receiver failed")
+
+        manager.on_message_received = failing
+        net_socket = NetSocket(manager, batch_receive=True)
+        assert net_socket.start(0, True, False)
+        try:
+            sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sender.sendto(b"data", ("127.0.0.1", net_socket.local_port))
+            sender.close()
+
+            assert _wait_for(lambda: len(manager.errors) == 1)
+            assert net_socket._receive_ring_v4.free_count == 256
+        finally:
+            net_socket.stop()
+
+    def test_stop_before_receive_thread_runs(self):
+        """测试receive线程注册socket之前就停止时线程正常退出"""
+        manager = _CollectingManager()
+        net_socket = NetSocket(manager, batch_receive=True)
+        ring = ReceiveRing(1, 16)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.close()
+        net_socket._receive_loop_batched(sock, ring)
+        assert manager.errors == []
@@ -0,0 +1,146 @@
+"""
+包头编解码测试
+
+测试预编译struct的包头一次解码/写入，以及分片重组使用的解码路径
+"""
+
+import random
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket, PacketHeader
+from litenetlib.packets.net_packet import PacketProperty
+
+
+class TestPacketHeader:
+    """测试PacketHeader解码和写入"""
+
+    def test_read_channeled_header(self):
+        """测试通道包头一次解码"""
+        packet = NetPacket(20, PacketProperty.Channeled)
+        packet.sequence = 1234
+        packet.channel_id = 7
+        header = packet.read_header()
+        assert isinstance(header, PacketHeader)
+        assert header == PacketHeader(PacketProperty.Channeled, 1234, 7, False)
+        assert header.fragment_id == 0
+
+    def test_read_fragmented_header(self):
+        """测试分片包头一次解码"""
+        packet = NetPacket(30, PacketProperty.Channeled)
+        packet.sequence = 65535
+        packet.channel_id = 2
+        packet.fragment_id = 500
+        packet.fragment_part = 3
+        packet.fragments_total = 9
+        packet.mark_fragmented()
+        header = packet.read_header()
+        assert header == PacketHeader(PacketProperty.Channeled, 65535, 2, True, 500, 3, 9)
+
+    def test_write_matches_properties(self):
+        """测试一次写入与逐字段属性一致"""
+        packet = NetPacket(30, PacketProperty.Channeled)
+        packet.write_channeled_header(321, 5)
+        packet.write_fragment_header(77, 1, 4)
+        assert packet.sequence == 321
+        assert packet.channel_id == 5
+        assert packet.is_fragmented
+        assert packet.packet_property == PacketProperty.Channeled
+        assert (packet.fragment_id, packet.fragment_part, packet.fragments_total) == (77, 1, 4)
+
+    def test_write_wraps_values(self):
+        """测试写入值按字段宽度截断"""
+        packet = NetPacket(10, PacketProperty.Channeled)
+        packet.write_channeled_header(65536 + 1, 256 + 3)
+        assert packet.read_header()[1:3] == (1, 3)
+
+    def test_short_packet_has_no_header(self):
+        """测试短于包头的包不解码"""
+        packet = NetPacket(30, PacketProperty.Channeled)
+        packet.size = NetConstants.ChanneledHeaderSize - 1
+        assert packet.read_header() is None
+        packet.mark_fragmented()
+        packet.size = NetConstants.FragmentedHeaderTotalSize - 1
+        assert packet.read_header() is None
+        packet.size = NetConstants.FragmentedHeaderTotalSize
+        assert packet.read_header().is_fragmented
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager.received = []
+    manager.create_receive_event = lambda packet, method, channel, header_size, peer: \
+        manager.received.append((bytes(packet.raw_data[header_size:packet.size]), method, channel))
+    return manager
+
+
+@pytest.fixture
+def peer(manager):
+    return NetPeer(manager, ("127.0.0.1", 9050), 1)
+
+
+def _fragments(peer, data, channel_number=0):
+    peer.send(data, channel_number, DeliveryMethod.ReliableOrdered)
+    channel = peer.create_channel(
+        channel_number * NetConstants.ChannelTypeCount + DeliveryMethod.ReliableOrdered
+    )
+    packets = list(channel.outgoing_queue)
+    for packet in packets:
+        packet.channel_id = channel_number * NetConstants.ChannelTypeCount + DeliveryMethod.ReliableOrdered
+    return packets
+
+
+class TestAddReliablePacket:
+    """测试可靠包交付和分片重组"""
+
+    def test_unfragmented_delivery(self, peer, manager):
+        """测试不分片包直接交付"""
+        packet = NetPacket(NetConstants.ChanneledHeaderSize + 3, PacketProperty.Channeled)
+        packet.write_channeled_header(0, NetConstants.ChannelTypeCount + DeliveryMethod.ReliableOrdered)
+        packet.raw_data[NetConstants.ChanneledHeaderSize:] = b"abc"
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packet)
+        assert manager.received == [(b"abc", DeliveryMethod.ReliableOrdered, 1)]
+
+    def test_reassembly_out_of_order(self, peer, manager):
+        """测试乱序分片重组"""
+        data = bytes(random.getrandbits(8) for _ in range(5000))
+        packets = _fragments(peer, data)
+        assert len(packets) > 1
+        random.shuffle(packets)
+        for packet in packets:
+            peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packet)
+        assert manager.received == [(data, DeliveryMethod.ReliableOrdered, 0)]
+        assert not peer._holded_fragments
+
+    def test_duplicate_fragment_rejected(self, peer, manager):
+        """测试重复分片被丢弃"""
+        packets = _fragments(peer, b"y" * 3000)
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, packets[0])
+        duplicate = NetPacket(packets[0].size)
+        duplicate.raw_data[:] = packets[0].raw_data[:packets[0].size]
+        peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, duplicate)
+        assert peer._holded_fragments[packets[0].fragment_id].received_count == 1
+        assert manager.received == []
+
+
+class TestShortPackets:
+    """测试截断的通道包被丢弃"""
+
+    @pytest.mark.parametrize("method", [
+        DeliveryMethod.ReliableOrdered, DeliveryMethod.ReliableUnordered,
+        DeliveryMethod.ReliableSequenced, DeliveryMethod.Sequenced,
+    ])
+    @pytest.mark.parametrize("size, fragmented", [
+        (2, False), (NetConstants.FragmentedHeaderTotalSize - 1, True),
+    ])
+    def test_dropped(self, peer, manager, method, size, fragmented):
+        """测试各通道丢弃短于包头的包"""
+        packet = NetPacket(NetConstants.FragmentedHeaderTotalSize, PacketProperty.Channeled)
+        packet.write_channeled_header(0, method)
+        if fragmented:
+            packet.write_fragment_header(1, 0, 2)
+        packet.size = size
+        peer.process_packet(packet)
+        assert manager.received == []
@@ -0,0 +1,203 @@
+"""
+包池测试
+
+测试按大小级别分配的NetPacketPool：级别选择、线程本地空闲链表、
+限额和命中/未命中/溢出计数
+"""
+
+import threading
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, NetConstants
+from litenetlib.packets import NetPacketPool
+from litenetlib.packets.net_packet import PacketProperty
+
+
+@pytest.fixture
+def pool():
+    return NetPacketPool(
+        size_classes=[("tiny", 64, 4), ("mtu", 1500, 4), ("fragment", 8192, 2)],
+        thread_cache_size=4,
+    )
+
+
+class TestSizeClasses:
+    """测试大小级别选择"""
+
+    @pytest.mark.parametrize("size,capacity", [(1, 64), (12, 64), (64, 64), (65, 1500), (1432, 1500), (5000, 8192)])
+    def test_class_capacity(self, pool, size, capacity):
+        """测试按请求大小选择级别"""
+        packet = pool.get_packet(size)
+        assert packet.size == size
+        assert len(packet.raw_data) == capacity
+
+    def test_reserve_counts_towards_class(self, pool):
+        """测试尾部预留空间计入级别选择"""
+        packet = pool.get_packet(62, reserve=4)
+        assert packet.size == 62
+        assert len(packet.raw_data) == 1500
+
+    def test_property_adds_header(self, pool):
+        """测试指定属性时包含包头"""
+        packet = pool.get_packet(10, PacketProperty.Channeled)
+        assert packet.size == 10 + NetConstants.ChanneledHeaderSize
+        assert packet.packet_property == PacketProperty.Channeled
+
+    def test_oversize_not_pooled(self, pool):
+        """测试超过最大级别的包不入池"""
+        packet = pool.get_packet(10000)
+        assert len(packet.raw_data) == 10000
+        assert pool.oversize == 1
+        pool.recycle(packet)
+        assert pool.get_packet(10000) is not packet
+
+
+class TestCounters:
+    """测试命中/未命中/溢出计数"""
+
+    def test_hit_and_miss(self, pool):
+        """测试重用计为命中"""
+        packet = pool.get_packet(100)
+        packet.user_data = object()
+        pool.recycle(packet)
+        again = pool.get_packet(200)
+        assert again is packet
+        assert again.user_data is None
+        mtu = pool.get_size_class("mtu")
+        assert (mtu.hits, mtu.misses) == (1, 1)
+
+    def test_recycle_goes_to_matching_class(self, pool):
+        """测试回收的包按缓冲区大小归入级别"""
+        packet = pool.get_packet(10)
+        pool.recycle(packet)
+        assert pool.get_packet(100) is not packet
+        assert pool.get_packet(10) is packet
+
+    def test_overflow_over_limit(self, pool):
+        """测试超过限额的回收被丢弃并计数"""
+        packets = [pool.get_packet(10) for _ in range(20)]
+        for packet in packets:
+            pool.recycle(packet)
+        tiny = pool.get_size_class("tiny")
+        assert tiny.pooled_count <= tiny.limit
+        assert tiny.overflows > 0
+        stats = pool.get_statistics()
+        assert stats["tiny"]["overflows"] == tiny.overflows
+        assert stats["tiny"]["misses"] == 20
+
+    def test_limit_is_configurable(self, pool):
+        """测试运行时调整限额"""
+        tiny = pool.get_size_class("tiny")
+        tiny.limit = 100
+        for packet in [pool.get_packet(10) for _ in range(50)]:
+            pool.recycle(packet)
+        assert tiny.overflows == 0
+
+
+class TestThreadCaches:
+    """测试线程本地空闲链表"""
+
+    def test_cross_thread_reuse(self, pool):
+        """测试一个线程回收的包经共享仓库被其他线程重用"""
+        packets = [pool.get_packet(10) for _ in range(8)]
+
+        def recycle_all():
+            for packet in packets:
+                pool.recycle(packet)
+
+        worker = threading.Thread(target=recycle_all)
+        worker.start()
+        worker.join()
+
+        reused = [pool.get_packet(10) for _ in range(4)]
+        assert all(any(p is q for q in packets) for p in reused)
+
+    def test_thread_local_lists(self, pool):
+        """测试线程本地链表中的包不会被其他线程取走"""
+        packet = pool.get_packet(10)
+        pool.recycle(packet)
+        result = []
+        worker = threading.Thread(target=lambda: result.append(pool.get_packet(10)))
+        worker.start()
+        worker.join()
+        assert result[0] is not packet
+        assert pool.get_packet(10) is packet
+
+
+    def test_thread_cache_capped(self, pool):
+        """测试线程本地链表超过上限时溢出到共享仓库"""
+        tiny = pool.get_size_class("tiny")
+        tiny.limit = 100
+        for packet in [pool.get_packet(10) for _ in range(10)]:
+            pool.recycle(packet)
+        assert len(pool._thread_cache().free_lists[0]) <= pool.thread_cache_size
+        assert tiny.pooled_count + len(pool._thread_cache().free_lists[0]) == 10
+
+    def test_exited_thread_cache_returned(self, pool):
+        """测试已退出线程缓存的包回到共享仓库，计数保留"""
+        packets = []
+
+        def use_pool():
+            packets.extend(pool.get_packet(10) for _ in range(3))
+            for packet in packets:
+                pool.recycle(packet)
+
+        worker = threading.Thread(target=use_pool)
+        worker.start()
+        worker.join()
+        tiny = pool.get_size_class("tiny")
+        assert tiny.pooled_count == 0
+
+        stats = pool.get_statistics()
+        assert stats["tiny"]["pooled"] == 3
+        assert stats["tiny"]["misses"] == 3
+        reused = [pool.get_packet(10) for _ in range(3)]
+        assert all(any(p is q for q in packets) for p in reused)
+
+    def test_concurrent_counters(self, pool):
+        """测试多线程并发时命中和未命中计数不丢失"""
+        def churn():
+            for _ in range(2000):
+                pool.recycle(pool.get_packet(100))
+
+        workers = [threading.Thread(target=churn) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        mtu = pool.get_size_class("mtu")
+        assert mtu.hits + mtu.misses == 8000
+
+
+class TestBufferPackets:
+    """测试外部接收缓冲区包装"""
+
+    def test_wrapper_released_and_reused(self, pool):
+        """测试回收时归还缓冲区并重用包装对象"""
+        released = []
+        buffer = bytearray(b"data")
+        packet = pool.get_buffer_packet(memoryview(buffer), 4, released.append)
+        assert packet.raw_data is buffer
+        pool.recycle(packet)
+        assert released == [buffer]
+        assert pool.get_buffer_packet(bytearray(2), 2, released.append) is packet
+        assert pool.get_size_class("buffer").hits == 1
+
+
+class TestManagerPool:
+    """测试LiteNetManager使用包池"""
+
+    def test_manager_uses_pool(self):
+        """测试manager通过包池获取和回收"""
+        manager = NetManager(EventBasedNetListener())
+        packet = manager.pool_get_packet(12)
+        manager.pool_recycle(packet)
+        assert manager.pool_get_packet(20) is packet
+        assert manager.packet_pool.get_statistics()["tiny"]["hits"] == 1
+
+    def test_pool_get_with_property(self):
+        """测试获取带属性的包"""
+        manager = NetManager(EventBasedNetListener())
+        packet = manager.pool_get_with_property(PacketProperty.Ping, 2)
+        assert packet.packet_property == PacketProperty.Ping
+        assert packet.size == PacketProperty.get_header_size(PacketProperty.Ping) + 2
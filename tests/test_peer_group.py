@@ -0,0 +1,160 @@
+"""
+Peer组测试
+
+测试PeerGroup的成员管理、惰性集合运算、组广播共享负载，
+以及peer被移除时退出所有组
+"""
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, PeerGroup, PeerSet
+from litenetlib.net_peer import NetPeer
+from litenetlib.utils import NetDataWriter
+
+
+@pytest.fixture
+def manager():
+    return NetManager(EventBasedNetListener())
+
+
+@pytest.fixture
+def peers(manager):
+    peers = [NetPeer(manager, ("127.0.0.1", 9050 + i), i) for i in range(6)]
+    for peer in peers:
+        manager.add_peer(peer)
+    return peers
+
+
+def _queued(peer):
+    channel = peer.create_channel(DeliveryMethod.ReliableOrdered)
+    packets = list(channel.outgoing_queue)
+    channel.outgoing_queue.clear()
+    return packets
+
+
+def _group(manager, peers):
+    group = manager.create_peer_group()
+    for peer in peers:
+        group.add(peer)
+    return group
+
+
+class TestMembership:
+    """测试成员管理"""
+
+    def test_add_remove(self, manager, peers):
+        """测试添加、重复添加和移除"""
+        group = manager.create_peer_group("room")
+        assert isinstance(group, PeerGroup)
+        assert group.add(peers[0])
+        assert not group.add(peers[0])
+        assert group.add(peers[1])
+        assert peers[0] in group and len(group) == 2
+        assert group.remove(peers[0])
+        assert not group.remove(peers[0])
+        assert list(group) == [peers[1]]
+
+    def test_snapshot_reused_until_changed(self, manager, peers):
+        """测试成员不变时迭代复用同一个快照"""
+        group = _group(manager, peers[:3])
+        snapshot = group.peers
+        assert group.peers is snapshot
+        group.add(peers[3])
+        assert group.peers is not snapshot
+        assert group.peers == tuple(peers[:4])
+
+    def test_iteration_unaffected_by_changes(self, manager, peers):
+        """测试迭代过程中修改成员不会出错"""
+        group = _group(manager, peers)
+        for peer in group:
+            group.remove(peer)
+        assert len(group) == 0
+
+    def test_other_manager_rejected(self, manager):
+        """测试不能添加其他manager的peer"""
+        other = NetPeer(NetManager(EventBasedNetListener()), ("127.0.0.1", 9050), 0)
+        with pytest.raises(ValueError):
+            manager.create_peer_group().add(other)
+
+    def test_removed_peer_rejected(self, manager, peers):
+        """测试不能添加已被manager移除的peer"""
+        manager.remove_peer(peers[0])
+        group = manager.create_peer_group()
+        with pytest.raises(ValueError):
+            group.add(peers[0])
+        assert len(group) == 0 and not peers[0]._peer_groups
+
+    def test_peer_set_is_abstract(self):
+        """测试PeerSet不能直接实例化"""
+        with pytest.raises(TypeError):
+            PeerSet()
+
+    def test_removed_peer_leaves_groups(self, manager, peers):
+        """测试peer被manager移除时退出所有组"""
+        a = _group(manager, peers[:3])
+        b = _group(manager, peers[1:])
+        manager.remove_peer(peers[1])
+        assert peers[1] not in a and peers[1] not in b
+        assert len(a) == 2 and len(b) == 4
+
+    def test_clear(self, manager, peers):
+        """测试清空后peer不再引用组"""
+        group = _group(manager, peers)
+        group.clear()
+        assert len(group) == 0
+        assert all(not peer._peer_groups for peer in peers)
+
+
+class TestSetAlgebra:
+    """测试集合运算"""
+
+    def test_union(self, manager, peers):
+        """测试并集中同时属于多个组的peer只出现一次"""
+        a, b, c = _group(manager, peers[:3]), _group(manager, peers[2:4]), _group(manager, peers[3:5])
+        assert list(a | b) == peers[:4]
+        assert list(a.union(b, c)) == peers[:5]
+        assert len(a | b | c) == 5
+        assert peers[5] not in a | b | c
+
+    def test_difference_and_intersection(self, manager, peers):
+        """测试差集和交集"""
+        a, b = _group(manager, peers[:4]), _group(manager, peers[2:])
+        assert list(a - b) == peers[:2]
+        assert list(a & b) == peers[2:4]
+        assert peers[3] in a & b and peers[3] not in a - b
+
+    def test_views_are_lazy(self, manager, peers):
+        """测试集合运算结果反映组的当前成员"""
+        a, b = _group(manager, peers[:2]), manager.create_peer_group()
+        view = a - b
+        b.add(peers[0])
+        a.add(peers[5])
+        assert list(view) == [peers[1], peers[5]]
+
+
+class TestGroupSend:
+    """测试组广播"""
+
+    def test_only_members_receive(self, manager, peers):
+        """测试只有组内peer收到，负载共享"""
+        data = b"room state"
+        group = _group(manager, peers[:3])
+        group.send(data, 0, DeliveryMethod.ReliableOrdered, exclude_peer=peers[1])
+        packets = [_queued(peer) for peer in peers]
+        assert [len(p) for p in packets] == [1, 0, 1, 0, 0, 0]
+        assert packets[0][0].payload.obj is data
+        assert packets[2][0].payload.obj is data
+
+    def test_send_to_expression(self, manager, peers):
+        """测试向集合运算结果发送，每个peer只发送一次"""
+        a, b, muted = _group(manager, peers[:3]), _group(manager, peers[2:5]), _group(manager, [peers[4]])
+        manager.send_to_group((a | b) - muted, bytearray(b"x" * 3000), 0, DeliveryMethod.ReliableOrdered)
+        counts = [len(_queued(peer)) for peer in peers]
+        assert counts[:4] == [counts[0]] * 4 and counts[0] > 1
+        assert counts[4:] == [0, 0]
+
+    def test_send_with_writer(self, manager, peers):
+        """测试使用writer发送已写入的字节"""
+        writer = NetDataWriter()
+        writer.put_int(5)
+        _group(manager, peers[:2]).send_with_writer(writer, 0, DeliveryMethod.ReliableOrdered)
+        assert [bytes(p.payload) for peer in peers[:2] for p in _queued(peer)] == [b"\x05\x00\x00\x00"] * 2
@@ -0,0 +1,152 @@
+"""
+Peer索引测试
+
+测试LiteNetManager的端点索引和ID索引
+"""
+
+import threading
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener
+from litenetlib.lite_net_peer import ConnectionState
+from litenetlib.net_event import NetEvent, NetEventType
+
+
+class _IndexPeer:
+    """只包含索引所需字段的peer"""
+
+    def __init__(self, id, remote_end_point):
+        self.id = id
+        self.remote_end_point = remote_end_point
+        self.next_peer = None
+        self.prev_peer = None
+        self.connection_state = ConnectionState.EndPointChange
+
+    def finish_end_point_change(self, new_end_point):
+        self.connection_state = ConnectionState.Connected
+        self.remote_end_point = new_end_point
+
+
+@pytest.fixture
+def manager():
+    return NetManager(EventBasedNetListener())
+
+
+class TestPeerIndex:
+    """测试peer索引"""
+
+    def test_add_and_lookup(self, manager):
+        """测试添加后可按端点和ID查找"""
+        peers = [_IndexPeer(i, ("127.0.0.1", 5000 + i)) for i in range(10)]
+        for peer in peers:
+            manager.add_peer(peer)
+
+        for peer in peers:
+            assert manager.try_get_peer(peer.remote_end_point) == (True, peer)
+            assert manager.try_get_peer_by_id(peer.id) == (True, peer)
+        assert manager.try_get_peer(("127.0.0.1", 1)) == (False, None)
+        assert manager.try_get_peer_by_id(99) == (False, None)
+        assert len(manager.get_peers()) == 10
+
+    def test_remove(self, manager):
+        """测试移除后索引同步"""
+        a = _IndexPeer(1, ("127.0.0.1", 5001))
+        b = _IndexPeer(2, ("127.0.0.1", 5002))
+        manager.add_peer(a)
+        manager.add_peer(b)
+        manager.remove_peer(a)
+
+        assert manager.try_get_peer(a.remote_end_point) == (False, None)
+        assert manager.try_get_peer_by_id(1) == (False, None)
+        assert manager.try_get_peer(b.remote_end_point) == (True, b)
+        assert manager.get_peers() == [b]
+
+    def test_remove_does_not_drop_replacement(self, manager):
+        """测试移除旧peer不影响同端点的新peer"""
+        old = _IndexPeer(1, ("127.0.0.1", 5001))
+        manager.add_peer(old)
+        new = _IndexPeer(2, ("127.0.0.1", 5001))
+        manager.add_peer(new)
+        manager.remove_peer(old)
+        assert manager.try_get_peer(("127.0.0.1", 5001)) == (True, new)
+
+    def test_finish_end_point_change(self, manager):
+        """测试端点变更后重建索引"""
+        peer = _IndexPeer(1, ("127.0.0.1", 5001))
+        manager.add_peer(peer)
+        assert manager.finish_end_point_change(peer, ("127.0.0.1", 6001))
+
+        assert manager.try_get_peer(("127.0.0.1", 5001)) == (False, None)
+        assert manager.try_get_peer(("127.0.0.1", 6001)) == (True, peer)
+        assert manager.try_get_peer_by_id(1) == (True, peer)
+
+    def test_end_point_change_rejected(self, manager):
+        """测试已移除或不在变更状态的peer不变更端点"""
+        removed = _IndexPeer(1, ("127.0.0.1", 5001))
+        manager.add_peer(removed)
+        manager.remove_peer(removed)
+        assert not manager.finish_end_point_change(removed, ("127.0.0.1", 6001))
+        assert manager.try_get_peer(("127.0.0.1", 6001)) == (False, None)
+
+        connected = _IndexPeer(2, ("127.0.0.1", 5002))
+        connected.connection_state = ConnectionState.Connected
+        manager.add_peer(connected)
+        assert not manager.finish_end_point_change(connected, ("127.0.0.1", 6002))
+        assert manager.try_get_peer(("127.0.0.1", 5002)) == (True, connected)
+        assert manager.try_get_peer(("127.0.0.1", 6002)) == (False, None)
+
+    def test_address_changed_notified_only_on_success(self):
+        """测试只有端点变更完成时才通知监听器"""
+        class Listener(EventBasedNetListener):
+            def __init__(self):
+                super().__init__()
+                self.changes = []
+
+            def on_peer_address_changed(self, peer, previous_address):
+                self.changes.append((peer, previous_address))
+
+        listener = Listener()
+        manager = NetManager(listener)
+        peer = _IndexPeer(1, ("127.0.0.1", 5001))
+        manager.add_peer(peer)
+
+        evt = NetEvent()
+        evt.type = NetEventType.PeerAddressChanged
+        evt.peer = peer
+        evt.remote_end_point = ("127.0.0.1", 6001)
+        manager.process_event(evt)
+        assert listener.changes == [(peer, ("127.0.0.1", 5001))]
+
+        evt = NetEvent()
+        evt.type = NetEventType.PeerAddressChanged
+        evt.peer = peer
+        evt.remote_end_point = ("127.0.0.1", 7001)
+        manager.process_event(evt)
+        assert len(listener.changes) == 1
+        assert peer.remote_end_point == ("127.0.0.1", 6001)
+
+    def test_concurrent_lookup_during_updates(self, manager):
+        """测试并发查找与增删"""
+        stable = _IndexPeer(0, ("127.0.0.1", 4000))
+        manager.add_peer(stable)
+        stop = threading.Event()
+        failures = []
+
+        def reader():
+            while not stop.is_set():
+                if manager.try_get_peer(stable.remote_end_point) != (True, stable):
+                    failures.append(1)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for i in range(1, 2000):
+            peer = _IndexPeer(i, ("127.0.0.1", 4000 + i))
+            manager.add_peer(peer)
+            manager.remove_peer(peer)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        assert not failures
+        assert manager.get_peers() == [stable]
@@ -0,0 +1,212 @@
+"""
+RTT估计和重发超时测试
+
+测试RFC 6298的SRTT/RTTVAR/RTO计算、重发延迟加倍，
+以及可靠通道和序列通道按Karn算法采样RTT
+"""
+
+import time
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.congestion import RttEstimator
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+from litenetlib.packets.net_packet import PacketProperty
+
+
+class TestRttEstimator:
+    """测试RTT估计"""
+
+    def test_initial_rto(self):
+        """测试没有样本时使用初始值，并限制在上下限内"""
+        assert RttEstimator(25, 2000, 27).rto == 27
+        assert RttEstimator(100, 2000, 27).rto == 100
+
+    def test_first_sample(self):
+        """测试第一个样本：SRTT=R，RTTVAR=R/2"""
+        estimator = RttEstimator(1, 10000, 27)
+        estimator.add_sample(100)
+        assert estimator.srtt == 100
+        assert estimator.rttvar == 50
+        assert estimator.rto == 300
+
+    def test_smoothing(self):
+        """测试之后的样本按1/8和1/4平滑"""
+        estimator = RttEstimator(1, 10000, 27)
+        estimator.add_sample(100)
+        estimator.add_sample(60)
+        assert estimator.rttvar == pytest.approx(0.75 * 50 + 0.25 * 40)
+        assert estimator.srtt == pytest.approx(0.875 * 100 + 0.125 * 60)
+        assert estimator.rto == pytest.approx(estimator.srtt + 4 * estimator.rttvar)
+
+    def test_stable_rtt_converges_to_granularity(self):
+        """测试RTT稳定时RTO趋近SRTT加时钟粒度"""
+        estimator = RttEstimator(1, 10000, 27, granularity=15)
+        for _ in range(100):
+            estimator.add_sample(40)
+        assert estimator.rto == pytest.approx(55, abs=0.1)
+
+    def test_bounds(self):
+        """测试RTO限制在上下限内"""
+        estimator = RttEstimator(25, 500, 27)
+        estimator.add_sample(1)
+        assert estimator.rto == 25
+        estimator.add_sample(1000)
+        assert estimator.rto == 500
+
+    def test_backoff(self):
+        """测试每重发一次延迟加倍，不超过上限"""
+        estimator = RttEstimator(25, 1000, 100)
+        assert [estimator.backoff(n) for n in range(5)] == [100, 200, 400, 800, 1000]
+        assert estimator.backoff(100) == 1000
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    return manager
+
+
+@pytest.fixture
+def peer(manager):
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.sent = []
+    peer.send_user_data = lambda packet: peer.sent.append(packet)
+    return peer
+
+
+def _ack(channel, sequences):
+    ack = NetPacket(channel._outgoing_acks.size)
+    ack.packet_property = PacketProperty.Ack
+    ack.channel_id = channel._id
+    ack.sequence = channel._local_window_start
+    for seq in sequences:
+        idx = seq % channel.window_size
+        ack.raw_data[NetConstants.ChanneledHeaderSize + idx // 8] |= 1 << (idx % 8)
+    return ack
+
+
+def _sent_ms_ago(ms):
+    return int(time.time() * 10000000) - int(ms * 10000)
+
+
+class TestPeerResendDelay:
+    """测试peer的重发延迟"""
+
+    def test_samples_update_resend_delay(self, peer, manager):
+        """测试RTT样本决定重发延迟"""
+        assert peer.resend_delay == 27
+        peer.add_rtt_sample(100)
+        assert peer.resend_delay == 300
+        assert peer.get_resend_delay(1) == 600
+
+    def test_ping_average_does_not_change_resend_delay(self, peer):
+        """测试ping平均值只影响round_trip_time"""
+        peer._update_round_trip_time(100)
+        assert peer.round_trip_time == 100
+        assert peer.resend_delay == 27
+
+    def test_configured_bounds(self, manager):
+        """测试manager配置的上下限"""
+        manager.min_resend_delay = 50
+        manager.max_resend_delay = 400
+        peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+        assert peer.resend_delay == 50
+        peer.add_rtt_sample(1000)
+        assert peer.resend_delay == 400
+
+    def test_statistics(self, peer, manager):
+        """测试启用统计时记录RTT"""
+        manager.enable_statistics = True
+        peer.add_rtt_sample(40)
+        peer.add_rtt_sample(20)
+        assert (peer.statistics.rtt, peer.statistics.rtt_min, peer.statistics.rtt_max) == (20, 20, 40)
+
+
+class TestReliableChannelRtt:
+    """测试可靠通道采样RTT和重发退避"""
+
+    def test_ack_sample(self, peer, manager):
+        """测试确认只发送过一次的包时采样"""
+        peer.send(b"data", 0, DeliveryMethod.ReliableUnordered)
+        manager.manual_update(1)
+        channel = peer.create_channel(DeliveryMethod.ReliableUnordered)
+        channel._pending_packets[0]._time_stamp = _sent_ms_ago(80)
+        channel.process_packet(_ack(channel, [0]))
+        assert peer.rtt_estimator.samples == 1
+        assert peer.rtt_estimator.srtt == pytest.approx(80, abs=20)
+
+    def test_newest_packet_sampled(self, peer, manager):
+        """测试一个ACK确认多个包时用最近发出的包采样"""
+        for i in range(3):
+            peer.send(b"m%d" % i, 0, DeliveryMethod.ReliableUnordered)
+        manager.manual_update(1)
+        channel = peer.create_channel(DeliveryMethod.ReliableUnordered)
+        for idx, age in enumerate((300, 200, 100)):
+            channel._pending_packets[idx]._time_stamp = _sent_ms_ago(age)
+        channel.process_packet(_ack(channel, [0, 1, 2]))
+        assert peer.rtt_estimator.samples == 1
+        assert peer.rtt_estimator.srtt == pytest.approx(100, abs=20)
+
+    def test_karn_skips_retransmitted(self, peer, manager):
+        """测试重发过的包确认时不采样"""
+        peer.send(b"data", 0, DeliveryMethod.ReliableUnordered)
+        manager.manual_update(1)
+        manager.manual_update(peer.resend_delay + 1)
+        assert len(peer.sent) == 2
+        channel = peer.create_channel(DeliveryMethod.ReliableUnordered)
+        channel.process_packet(_ack(channel, [0]))
+        assert peer.rtt_estimator.samples == 0
+
+    def test_exponential_backoff(self, peer, manager):
+        """测试同一个包再次丢失时重发延迟加倍"""
+        rto = peer.resend_delay
+        peer.send(b"data", 0, DeliveryMethod.ReliableUnordered)
+        manager.manual_update(1)
+        sent_at = []
+        for step in range(int(rto * 8)):
+            count = len(peer.sent)
+            manager.manual_update(1)
+            if len(peer.sent) > count:
+                sent_at.append(step)
+        gaps = [b - a for a, b in zip(sent_at, sent_at[1:])]
+        assert len(sent_at) == 3
+        assert gaps == [pytest.approx(2 * rto, abs=2), pytest.approx(4 * rto, abs=2)]
+
+
+class TestSequencedChannelRtt:
+    """测试ReliableSequenced通道采样RTT和重发退避"""
+
+    @staticmethod
+    def _ack(peer, channel):
+        ack = NetPacket(0, PacketProperty.Ack)
+        ack.write_channeled_header(peer.sent[0].sequence, channel._id)
+        channel.process_packet(ack)
+
+    def test_ack_sample(self, peer, manager):
+        """测试确认未重发的last packet时采样"""
+        peer.send(b"state", 0, DeliveryMethod.ReliableSequenced)
+        manager.manual_update(1)
+        channel = peer.create_channel(DeliveryMethod.ReliableSequenced)
+        channel._last_packet_send_time = _sent_ms_ago(60)
+        self._ack(peer, channel)
+        assert peer.rtt_estimator.samples == 1
+        assert peer.rtt_estimator.srtt == pytest.approx(60, abs=20)
+
+    def test_karn_and_backoff(self, peer, manager):
+        """测试重发后延迟加倍，确认时不采样"""
+        rto = peer.resend_delay
+        peer.send(b"state", 0, DeliveryMethod.ReliableSequenced)
+        manager.manual_update(1)
+        manager.manual_update(rto + 1)
+        assert len(peer.sent) == 2
+        manager.manual_update(rto + 1)
+        assert len(peer.sent) == 2
+        manager.manual_update(rto)
+        assert len(peer.sent) == 3
+
+        channel = peer.create_channel(DeliveryMethod.ReliableSequenced)
+        self._ack(peer, channel)
+        assert peer.rtt_estimator.samples == 0
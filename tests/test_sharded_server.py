@@ -0,0 +1,190 @@
+"""
+SO_REUSEPORT分片服务器测试
+
+测试多进程分片、广播和统计聚合
+"""
+
+import socket
+import time
+
+import pytest
+from litenetlib import (
+    DeliveryMethod, EventBasedNetListener, NetManager, NetSocket, NetStatistics, ShardedNetServer
+)
+from litenetlib.net_peer import NetPeer
+
+pytestmark = pytest.mark.skipif(
+    not NetSocket.reuse_port_support(), reason="SO_REUSEPORT not supported"
+)
+
+
+class _CountingManager:
+    """统计收包和广播次数的最小manager"""
+
+    def __init__(self):
+        self.update_time = 5
+        self.statistics = NetStatistics()
+
+    def on_message_received(self, data, address, release=None):
+        self.statistics.increment_packets_received()
+        self.statistics.add_bytes_received(len(data))
+
+    def on_network_error(self, address, error):
+        pass
+
+    def send_to_all(self, data, channel_number, options):
+        if data == b"fail":
+            raise RuntimeError("send failed")
+        self.statistics.increment_packets_sent()
+        self.statistics.add_bytes_sent(len(data))
+
+    def update_logic(self, elapsed_milliseconds):
+        # 更新次数随统计一起返回给父进程
+        self.statistics.updates = getattr(self.statistics, "updates", 0) + 1
+
+
+class _PeerManager(NetManager):
+    """把每个发来数据的端点当作已连接peer的真实NetManager"""
+
+    def __init__(self):
+        super().__init__(EventBasedNetListener())
+        self.update_time = 5
+
+    def on_message_received(self, data, address, release=None):
+        self.statistics.increment_packets_received()
+        if not self.try_get_peer(address)[0]:
+            self.add_peer(NetPeer(self, address, self.get_next_peer_id()))
+        if release is not None:
+            release(data)
+
+    def on_network_error(self, address, error):
+        pass
+
+
+def _free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+@pytest.fixture
+def server():
+    sharded = ShardedNetServer(_CountingManager, workers=3, mp_context="fork")
+    assert sharded.start(_free_port())
+    yield sharded
+    sharded.stop()
+
+
+class TestShardedNetServer:
+    """测试分片服务器"""
+
+    def test_start_requires_port(self):
+        """测试端口0无法分片"""
+        sharded = ShardedNetServer(_CountingManager, workers=2)
+        assert not sharded.start(0)
+        assert not sharded.is_running
+
+    def test_statistics_aggregate_all_shards(self, server):
+        """测试所有分片的统计被聚合"""
+        assert server.shards_count == 3
+        clients = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM) for _ in range(8)]
+        for client in clients:
+            for _ in range(5):
+                client.sendto(b"abcd", ("127.0.0.1", server.port))
+
+        deadline = time.time() + 3
+        total = server.get_statistics()
+        while total.packets_received < 40 and time.time() < deadline:
+            time.sleep(0.02)
+            total = server.get_statistics()
+        for client in clients:
+            client.close()
+
+        assert total.packets_received == 40
+        assert total.bytes_received == 160
+        per_shard = server.get_shard_statistics()
+        assert sum(s.packets_received for s in per_shard) == 40
+        # 同一客户端（4元组）的包总是落在同一个分片
+        assert all(s.packets_received % 5 == 0 for s in per_shard)
+
+    def test_broadcast_reaches_every_shard(self, server):
+        """测试广播发送到每个分片"""
+        server.broadcast(b"hello")
+        per_shard = server.get_shard_statistics()
+        assert [s.packets_sent for s in per_shard] == [1, 1, 1]
+        assert server.get_statistics().bytes_sent == 15
+
+    def test_workers_drive_update(self, server):
+        """测试分片进程按update_time调用update_logic"""
+        time.sleep(0.2)
+        assert all(s.updates > 5 for s in server.get_shard_statistics())
+
+    def test_failing_command_keeps_worker(self, server):
+        """测试命令抛出异常时报告失败，分片继续运行"""
+        assert server.broadcast(b"fail") == [0, 1, 2]
+        assert server.broadcast(b"ok") == []
+
+    def test_dead_shard_reported(self, server):
+        """测试分片进程退出后广播和统计报告该分片而不抛出异常"""
+        server._processes[1].kill()
+        server._processes[1].join()
+        assert server.broadcast(b"hello") == [1]
+        per_shard = server.get_shard_statistics()
+        assert per_shard[1] is None
+        assert [s.packets_sent for s in (per_shard[0], per_shard[2])] == [1, 1]
+        assert server.get_statistics().packets_sent == 2
+
+    def test_stop(self, server):
+        """测试停止所有分片"""
+        server.stop()
+        assert not server.is_running
+        assert server.port == 0
+
+
+class TestShardedBroadcastDelivery:
+    """测试分片广播真正从共享端口发出"""
+
+    def test_broadcast_arrives_at_client(self):
+        """测试广播的数据报到达连接在分片端口上的客户端"""
+        sharded = ShardedNetServer(_PeerManager, workers=2, mp_context="fork")
+        assert sharded.start(_free_port())
+        client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        client.bind(("127.0.0.1", 0))
+        client.settimeout(2.0)
+        try:
+            client.sendto(b"join", ("127.0.0.1", sharded.port))
+            deadline = time.time() + 3
+            while sharded.get_statistics().packets_received < 1 and time.time() < deadline:
+                time.sleep(0.02)
+
+            assert sharded.broadcast(b"hello", 0, DeliveryMethod.Unreliable) == []
+            data = client.recvfrom(2048)
+            while not data[0].endswith(b"hello"):
+                data = client.recvfrom(2048)
+            assert data[1][1] == sharded.port
+        finally:
+            client.close()
+            sharded.stop()
+
+
+class TestNetStatisticsAdd:
+    """测试统计累加"""
+
+    def test_add(self):
+        """测试计数累加与RTT合并"""
+        a = NetStatistics()
+        b = NetStatistics()
+        a.increment_packets_sent()
+        b.increment_packets_sent()
+        b.increment_packet_loss()
+        a.update_rtt(30)
+        b.update_rtt(10)
+        b.update_rtt(50)
+        a.add(b)
+        assert a.packets_sent == 2
+        assert a.packet_loss == 1
+        assert a.rtt_min == 10
+        assert a.rtt_max == 50
+        assert a.rtt == 50
@@ -0,0 +1,214 @@
+"""
+Socket后端回环测试
+
+同一组回环测试分别运行于线程版NetSocket和asyncio版AsyncNetSocket
+"""
+
+import asyncio
+import threading
+
+import pytest
+from litenetlib import NetSocket, AsyncNetSocket, DeliveryMethod, EventBasedNetListener, NetManager
+from litenetlib.net_peer import NetPeer
+
+
+class _LoopbackManager:
+    """记录收到的消息和更新调用的最小manager"""
+
+    def __init__(self):
+        self.update_time = 15
+        self._manual_mode = False
+        self.messages = []
+        self.threads = set()
+        self.updates = []
+
+    def on_message_received(self, data, address, release=None):
+        self.messages.append((bytes(data), address))
+        self.threads.add(threading.get_ident())
+        if release is not None:
+            release(data)
+
+    def on_network_error(self, address, error):
+        pass
+
+    def manual_update(self, elapsed_milliseconds):
+        self.updates.append(elapsed_milliseconds)
+
+
+class _ReceiveListener(EventBasedNetListener):
+    """记录收到消息的peer和交付方式"""
+
+    def __init__(self):
+        super().__init__()
+        self.received = []
+
+    def on_network_receive(self, peer, reader, channel_number, delivery_method):
+        self.received.append((peer, delivery_method))
+
+
+BACKENDS = {
+    "thread": lambda manager: NetSocket(manager),
+    "thread-batched": lambda manager: NetSocket(manager, batch_receive=True),
+    "asyncio": lambda manager: AsyncNetSocket(manager),
+}
+
+
+async def _start(backend, manager):
+    sock = BACKENDS[backend](manager)
+    result = sock.start(0, True, False)
+    if asyncio.iscoroutine(result):
+        result = await result
+    assert result
+    return sock
+
+
+async def _wait_for(predicate, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        if predicate():
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+class TestSocketBackendLoopback:
+    """测试两种后端的回环收发"""
+
+    def test_send_and_receive(self, backend):
+        """测试回环发送和接收"""
+        async def scenario():
+            server_manager = _LoopbackManager()
+            client_manager = _LoopbackManager()
+            server = await _start(backend, server_manager)
+            client = await _start(backend, client_manager)
+            try:
+                payloads = [b"hello", b"\x00\x01\x02", b"x" * 1000]
+                for payload in payloads:
+                    sent = client.send_packet(payload, ("127.0.0.1", server.local_port))
+                    assert sent == len(payload)
+
+                assert await _wait_for(lambda: len(server_manager.messages) == len(payloads))
+                assert [m[0] for m in server_manager.messages] == payloads
+                assert server_manager.messages[0][1] == ("127.0.0.1", client.local_port)
+            finally:
+                client.stop()
+                server.stop()
+
+        asyncio.run(scenario())
+
+    def test_echo(self, backend):
+        """测试回环往返"""
+        async def scenario():
+            server_manager = _LoopbackManager()
+            client_manager = _LoopbackManager()
+            server = await _start(backend, server_manager)
+            client = await _start(backend, client_manager)
+            try:
+                client.send_packet(b"ping", ("127.0.0.1", server.local_port))
+                assert await _wait_for(lambda: server_manager.messages)
+                data, address = server_manager.messages[0]
+                server.send_packet(b"pong:" + data, address)
+                assert await _wait_for(lambda: client_manager.messages)
+                assert client_manager.messages[0][0] == b"pong:ping"
+            finally:
+                client.stop()
+                server.stop()
+
+        asyncio.run(scenario())
+
+    def test_stop(self, backend):
+        """测试停止后不再发送"""
+        async def scenario():
+            manager = _LoopbackManager()
+            sock = await _start(backend, manager)
+            assert sock.is_running
+            sock.stop()
+            assert not sock.is_running
+            assert sock.send_packet(b"data", ("127.0.0.1", 9)) == 0
+
+        asyncio.run(scenario())
+
+
+class TestAsyncNetSocket:
+    """测试asyncio后端特有行为"""
+
+    def test_callbacks_on_loop_thread(self):
+        """测试回调在事件循环线程执行"""
+        async def scenario():
+            manager = _LoopbackManager()
+            server = await _start("asyncio", manager)
+            sender = await _start("asyncio", _LoopbackManager())
+            try:
+                sender.send_packet(b"data", ("127.0.0.1", server.local_port))
+                assert await _wait_for(lambda: manager.messages)
+                assert manager.threads == {threading.get_ident()}
+                assert manager._manual_mode
+            finally:
+                sender.stop()
+                server.stop()
+
+        asyncio.run(scenario())
+
+    def test_stop_restores_manual_mode(self):
+        """测试stop恢复manager原来的手动模式"""
+        async def scenario():
+            manager = _LoopbackManager()
+            sock = await _start("asyncio", manager)
+            assert manager._manual_mode
+            sock.stop()
+            assert not manager._manual_mode
+
+            manager._manual_mode = True
+            sock = await _start("asyncio", manager)
+            sock.stop()
+            assert manager._manual_mode
+
+        asyncio.run(scenario())
+
+    def test_update_timer_drives_manual_update(self):
+        """测试循环定时器驱动manual_update"""
+        async def scenario():
+            manager = _LoopbackManager()
+            manager.update_time = 5
+            sock = await _start("asyncio", manager)
+            try:
+                assert await _wait_for(lambda: len(manager.updates) >= 3)
+                assert all(elapsed > 0 for elapsed in manager.updates)
+            finally:
+                sock.stop()
+            count = len(manager.updates)
+            await asyncio.sleep(0.03)
+            assert len(manager.updates) == count
+
+        asyncio.run(scenario())
+
+    def test_real_manager_round_trip(self):
+        """测试真实NetManager通过asyncio后端收发peer消息"""
+        async def scenario():
+            server_listener = _ReceiveListener()
+            server_manager = NetManager(server_listener)
+            client_manager = NetManager(EventBasedNetListener())
+            server = AsyncNetSocket(server_manager)
+            client = AsyncNetSocket(client_manager)
+            assert await server.start(0, True, False)
+            assert await client.start(0, True, False)
+            try:
+                assert server_manager.net_socket is server
+                assert client_manager.net_socket is client
+                server_peer = NetPeer(server_manager, ("127.0.0.1", client.local_port), 0)
+                server_manager.add_peer(server_peer)
+                client_peer = NetPeer(client_manager, ("127.0.0.1", server.local_port), 0)
+                client_manager.add_peer(client_peer)
+
+                client_peer.send(b"hello", 0, DeliveryMethod.Unreliable)
+                assert await _wait_for(lambda: server_listener.received)
+                assert server_listener.received[0] == (server_peer, DeliveryMethod.Unreliable)
+            finally:
+                client.stop()
+                server.stop()
+            assert server_manager.net_socket is None
+            assert client_manager.net_socket is None
+
+        asyncio.run(scenario())
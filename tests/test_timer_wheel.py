@@ -0,0 +1,204 @@
+"""
+定时轮测试
+
+测试分层定时轮，以及基于定时轮的重发和peer超时
+"""
+
+import random
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.lite_net_peer import ConnectionState
+from litenetlib.net_peer import NetPeer
+from litenetlib.utils.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+    """测试TimerWheel"""
+
+    def test_fires_at_deadline(self):
+        """测试定时器在截止时间触发"""
+        wheel = TimerWheel()
+        fired = []
+        wheel.schedule(10, fired.append, "a")
+        assert wheel.advance(9) == 0
+        assert wheel.advance(1) == 1
+        assert fired == ["a"]
+        assert len(wheel) == 0
+
+    def test_cancel(self):
+        """测试取消的定时器不触发"""
+        wheel = TimerWheel()
+        fired = []
+        handle = wheel.schedule(5, fired.append, 1)
+        assert handle.active
+        assert handle.cancel()
+        assert not handle.cancel()
+        wheel.advance(10)
+        assert fired == []
+        assert len(wheel) == 0
+
+    @pytest.mark.parametrize("wheel_bits,levels", [(2, 2), (3, 3), (6, 4)])
+    def test_random_deadlines_cascade(self, wheel_bits, levels):
+        """测试跨层级的随机截止时间都在对应的advance中触发"""
+        rng = random.Random(wheel_bits)
+        wheel = TimerWheel(wheel_bits=wheel_bits, levels=levels)
+        deadlines = {i: rng.randint(1, 5000) for i in range(1000)}
+        window = [0, 0]
+        late = []
+
+        def on_fire(i):
+            if not window[0] < deadlines[i] <= window[1]:
+                late.append(i)
+
+        for i, deadline in deadlines.items():
+            wheel.schedule(deadline, on_fire, i)
+
+        now = 0
+        while len(wheel):
+            step = rng.randint(1, 97)
+            window[:] = [now, now + step]
+            now += step
+            wheel.advance(step)
+
+        assert late == []
+        assert wheel.fired_count == len(deadlines)
+
+    def test_callback_can_reschedule(self):
+        """测试回调中可以重新调度"""
+        wheel = TimerWheel()
+        fired = []
+
+        def tick():
+            fired.append(wheel.now_ms)
+            if len(fired) < 3:
+                wheel.schedule(10, tick)
+
+        wheel.schedule(10, tick)
+        for _ in range(5):
+            wheel.advance(10)
+        assert fired == [10, 20, 30]
+
+    def test_raising_callback_does_not_drop_others(self):
+        """测试一个回调抛出异常时同一tick的其他定时器仍然执行"""
+        wheel = TimerWheel()
+        fired = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        wheel.schedule(10, fired.append, 1)
+        wheel.schedule(10, fail)
+        wheel.schedule(10, fired.append, 2)
+        assert wheel.advance(10) == 2
+        assert sorted(fired) == [1, 2]
+        assert wheel.fired_count == 2
+        assert len(wheel) == 0
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    return manager
+
+
+@pytest.fixture
+def peer(manager):
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.sent = []
+    peer.send_user_data = peer.sent.append
+    peer.recycle_and_deliver = lambda packet: None
+    manager.add_peer(peer)
+    return peer
+
+
+def _ack(channel, sequence):
+    """构造确认sequence的ACK包"""
+    from litenetlib.packets import NetPacket
+    from litenetlib.packets.net_packet import PacketProperty
+    acks = NetPacket(channel._outgoing_acks.size)
+    acks.packet_property = PacketProperty.Ack
+    acks.write_channeled_header(0, channel._id)
+    idx = sequence % channel._window_size
+    acks.raw_data[NetConstants.ChanneledHeaderSize + idx // 8] |= 1 << (idx % 8)
+    return acks
+
+
+class TestReliableResend:
+    """测试可靠通道重发"""
+
+    def test_resend_only_when_due(self, manager, peer):
+        """测试重发延迟到期前不重发"""
+        peer.send(b"data", 0, DeliveryMethod.ReliableOrdered)
+        manager.manual_update(1)
+        assert len(peer.sent) == 1
+
+        manager.manual_update(peer.resend_delay - 5)
+        assert len(peer.sent) == 1
+
+        manager.manual_update(10)
+        assert len(peer.sent) == 2
+        assert peer.sent[1] is peer.sent[0]
+
+    def test_ack_cancels_resend(self, manager, peer):
+        """测试确认后不再重发"""
+        peer.send(b"data", 0, DeliveryMethod.ReliableOrdered)
+        manager.manual_update(1)
+        channel = peer.create_channel(DeliveryMethod.ReliableOrdered)
+        timers = len(manager.timer_wheel)
+
+        channel.process_packet(_ack(channel, 0))
+        assert len(manager.timer_wheel) == timers - 1
+
+        manager.manual_update(peer.resend_delay * 4)
+        assert len(peer.sent) == 1
+
+    def test_idle_update_touches_no_peers(self, manager, peer):
+        """测试没有到期定时器时更新不处理peer"""
+        peer.send(b"data", 0, DeliveryMethod.ReliableOrdered)
+        manager.manual_update(1)
+        assert manager.update_peers() == 0
+
+
+class TestSequencedResend:
+    """测试ReliableSequenced通道重发last packet"""
+
+    def test_last_packet_resent(self, manager, peer):
+        """测试last packet在重发延迟后重发，确认后停止"""
+        peer.send(b"state", 0, DeliveryMethod.ReliableSequenced)
+        manager.manual_update(1)
+        assert len(peer.sent) == 1
+
+        manager.manual_update(peer.resend_delay + 1)
+        assert len(peer.sent) == 2
+
+        channel = peer.create_channel(DeliveryMethod.ReliableSequenced)
+        from litenetlib.packets import NetPacket
+        from litenetlib.packets.net_packet import PacketProperty
+        ack = NetPacket(0, PacketProperty.Ack)
+        ack.write_channeled_header(peer.sent[0].sequence, channel._id)
+        channel.process_packet(ack)
+
+        manager.manual_update(peer.resend_delay * 4)
+        assert len(peer.sent) == 2
+
+
+class TestPeerTimeout:
+    """测试基于定时器的peer超时"""
+
+    def test_disconnected_peer_removed(self, manager, peer):
+        """测试断开的peer超时后移除"""
+        peer._connection_state = ConnectionState.Disconnected
+        manager.manual_update(manager.disconnect_timeout - 100)
+        assert manager.try_get_peer_by_id(peer.id)[0]
+        manager.manual_update(200)
+        assert not manager.try_get_peer_by_id(peer.id)[0]
+
+    def test_connected_peer_kept(self, manager, peer):
+        """测试连接中的peer不会被移除，定时器不会累积"""
+        timers = len(manager.timer_wheel)
+        for _ in range(3):
+            manager.manual_update(manager.disconnect_timeout)
+        assert manager.try_get_peer_by_id(peer.id)[0]
+        assert len(manager.timer_wheel) == timers
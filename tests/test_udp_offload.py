@@ -0,0 +1,157 @@
+"""
+UDP GSO/GRO测试
+
+测试NetSocket在Linux上检测UDP_SEGMENT/UDP_GRO支持、
+把等长数据报合并为一次GSO发送，以及把GRO合并的数据报拆分回来
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+from litenetlib import NetSocket
+
+
+class _RecordingManager:
+    """记录收到的数据报"""
+
+    def __init__(self):
+        self.received = []
+        self.lock = threading.Lock()
+
+    def on_message_received(self, data, address, release=None):
+        with self.lock:
+            self.received.append(bytes(data))
+
+    def on_network_error(self, address, error):
+        pass
+
+    def wait(self, count, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while len(self.received) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.received
+
+
+@pytest.fixture
+def offload_socket():
+    net_socket = NetSocket(_RecordingManager(), udp_offload=True)
+    assert net_socket.start(0, True, False)
+    yield net_socket
+    net_socket.stop()
+
+
+@pytest.fixture
+def receiver():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(1.0)
+    yield sock
+    sock.close()
+
+
+def _receive(sock, count):
+    return [sock.recvfrom(65536)[0] for _ in range(count)]
+
+
+def _fragments(count, size, last_size):
+    datagrams = [(bytes([i]) * 4, bytes([i]) * (size - 4)) for i in range(count - 1)]
+    datagrams.append((b"last", b"L" * (last_size - 4)))
+    return datagrams
+
+
+class TestDetection:
+    """测试支持检测和回退"""
+
+    def test_off_by_default(self):
+        """测试默认不启用"""
+        net_socket = NetSocket(_RecordingManager())
+        assert net_socket.start(0, True, False)
+        try:
+            assert not net_socket.gso_enabled
+            assert not net_socket.gro_enabled
+        finally:
+            net_socket.stop()
+
+    def test_unsupported_kernel_falls_back(self, monkeypatch, receiver):
+        """测试内核不支持时回退到普通发送"""
+        monkeypatch.setattr(NetSocket, "_enable_udp_offload", staticmethod(lambda sock: (False, False)))
+        net_socket = NetSocket(_RecordingManager(), udp_offload=True)
+        assert net_socket.start(0, True, False)
+        try:
+            assert not net_socket.gso_enabled
+            address = receiver.getsockname()
+            sent, _ = net_socket.send_batch([(buffers, address) for buffers in _fragments(4, 100, 50)])
+            assert sent == 4
+            assert len(_receive(receiver, 4)) == 4
+        finally:
+            net_socket.stop()
+
+    def test_flags_reset_on_stop(self, offload_socket):
+        """测试停止后清除标志"""
+        offload_socket.stop()
+        assert not offload_socket.gso_enabled
+        assert not offload_socket.gro_enabled
+
+
+class TestSegmentationOffload:
+    """测试GSO发送"""
+
+    @pytest.fixture(autouse=True)
+    def _require_gso(self, offload_socket):
+        if not offload_socket.gso_enabled:
+            pytest.skip("UDP_SEGMENT not supported")
+
+    def test_run_sent_in_one_call(self, offload_socket, receiver):
+        """测试等长分片加较短的最后分片一次系统调用发出，接收方收到独立数据报"""
+        address = receiver.getsockname()
+        fragments = _fragments(10, 1000, 300)
+        sent, syscalls = offload_socket.send_batch([(buffers, address) for buffers in fragments])
+        assert (sent, syscalls) == (10, 1)
+        assert _receive(receiver, 10) == [b"".join(buffers) for buffers in fragments]
+
+    def test_mixed_destinations_keep_order(self, offload_socket, receiver):
+        """测试不同目标和不等长数据报仍按顺序发送"""
+        other = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        other.bind(("127.0.0.1", 0))
+        other.settimeout(1.0)
+        try:
+            a, b = receiver.getsockname(), other.getsockname()
+            datagrams = [((b"x1",), b), ((b"a" * 500,), a), ((b"b" * 500,), a), ((b"c" * 500,), a),
+                         ((b"x2",), b), ((b"short",), a)]
+            sent, syscalls = offload_socket.send_batch(datagrams)
+            assert sent == 6
+            assert syscalls < 6
+            assert _receive(receiver, 4) == [b"a" * 500, b"b" * 500, b"c" * 500, b"short"]
+            assert _receive(other, 2) == [b"x1", b"x2"]
+        finally:
+            other.close()
+
+    def test_runs_split_at_segment_limit(self, offload_socket, receiver):
+        """测试超过单次GSO上限的连续数据报分成多次发送"""
+        address = receiver.getsockname()
+        fragments = _fragments(150, 200, 200)
+        sent, syscalls = offload_socket.send_batch([(buffers, address) for buffers in fragments])
+        assert sent == 150
+        assert syscalls == 3
+        assert _receive(receiver, 150) == [b"".join(buffers) for buffers in fragments]
+
+
+class TestReceiveOffload:
+    """测试GRO接收拆分"""
+
+    def test_coalesced_segments_split(self, offload_socket):
+        """测试合并到达的分段按分段大小拆分交给manager"""
+        if not offload_socket.gro_enabled:
+            pytest.skip("UDP_GRO not supported")
+        sender = NetSocket(_RecordingManager(), udp_offload=True)
+        assert sender.start(0, True, False)
+        try:
+            address = ("127.0.0.1", offload_socket.local_port)
+            fragments = _fragments(20, 1200, 700)
+            sender.send_batch([(buffers, address) for buffers in fragments])
+            received = offload_socket._net_manager.wait(20)
+            assert received == [b"".join(buffers) for buffers in fragments]
+        finally:
+            sender.stop()
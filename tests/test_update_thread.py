@@ -0,0 +1,205 @@
+"""
+更新引擎测试
+
+测试固定tick的更新线程、tick统计，以及定时轮驱动的ping和MTU探测
+"""
+
+import time
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants, TickStatistics
+from litenetlib.net_event import NetEventType
+from litenetlib.net_peer import NetPeer
+from litenetlib.net_socket import ReceiveRing
+from litenetlib.packets import NetPacket
+from litenetlib.packets.net_packet import PacketProperty
+
+
+class TestTickStatistics:
+    """测试TickStatistics"""
+
+    def test_add_tick(self):
+        """测试耗时、超时和抖动统计"""
+        stats = TickStatistics()
+        stats.add_tick(15, 15, 2, False)
+        stats.add_tick(15, 31, 20, True)
+        assert stats.ticks == 2
+        assert stats.overruns == 1
+        assert stats.last_duration == 20
+        assert stats.max_duration == 20
+        assert stats.average_duration == 11
+        assert stats.last_interval == 31
+        assert stats.jitter == pytest.approx(1.0)
+        assert stats.max_jitter == 16
+
+    def test_reset(self):
+        """测试重置"""
+        stats = TickStatistics()
+        stats.add_tick(15, 20, 1, True)
+        stats.reset()
+        assert stats.ticks == 0
+        assert stats.overruns == 0
+        assert stats.average_duration == 0.0
+
+
+class TestUpdateThread:
+    """测试更新线程"""
+
+    def test_thread_drives_update(self):
+        """测试线程按固定tick推进定时轮并记录统计"""
+        manager = NetManager(EventBasedNetListener())
+        manager.update_time = 5
+        fired = []
+        manager.timer_wheel.schedule(20, fired.append, True)
+
+        assert manager.start_update_thread()
+        assert manager.is_update_thread_running
+        assert not manager.start_update_thread()
+        time.sleep(0.2)
+        manager.stop_update_thread(1.0)
+        assert not manager.is_update_thread_running
+
+        stats = manager.tick_statistics
+        assert fired == [True]
+        assert stats.ticks >= 5
+        assert manager.timer_wheel.now_ms == pytest.approx(stats.ticks * 5, rel=0.5)
+        assert stats.average_duration < 5
+
+    def test_overrun_skips_missed_ticks(self):
+        """测试tick超时被计数且不会连续补跑"""
+        manager = NetManager(EventBasedNetListener())
+        manager.update_time = 5
+        calls = []
+
+        def slow_update(elapsed):
+            calls.append(elapsed)
+            if len(calls) == 2:
+                time.sleep(0.05)
+
+        manager.update_logic = slow_update
+        manager.start_update_thread()
+        time.sleep(0.1)
+        manager.stop_update_thread(1.0)
+
+        assert manager.tick_statistics.overruns >= 1
+        assert calls[2] >= 50
+        # 错过的tick被跳过，不会连续补跑（补跑会产生约10个接近0的间隔）
+        assert sum(1 for elapsed in calls[3:] if elapsed < 1) <= 2
+        assert manager.tick_statistics.max_jitter >= 40
+
+    def test_manual_mode_has_no_thread(self):
+        """测试手动模式不启动线程"""
+        manager = NetManager(EventBasedNetListener())
+        manager._manual_mode = True
+        assert not manager.start_update_thread()
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager._manual_mode = True
+    manager.sent_raw = []
+    manager.send_raw = lambda packet, peer, immediate=False: manager.sent_raw.append(
+        (packet.packet_property, bytes(packet.raw_data[:packet.size]))
+    )
+    return manager
+
+
+def _add_peer(manager):
+    peer = NetPeer(manager, ("127.0.0.1", 9050), 1)
+    peer.send_user_data = lambda packet: None
+    manager.add_peer(peer)
+    return peer
+
+
+class TestPing:
+    """测试定时轮驱动的ping/pong"""
+
+    def test_ping_every_interval(self, manager):
+        """测试每ping_interval发送一次ping"""
+        _add_peer(manager)
+        manager.manual_update(manager.ping_interval - 1)
+        assert manager.sent_raw == []
+        manager.manual_update(1)
+        manager.manual_update(manager.ping_interval)
+        pings = [data for prop, data in manager.sent_raw if prop == PacketProperty.Ping]
+        assert len(pings) == 2
+        assert pings[0][1:3] != pings[1][1:3]
+
+    def test_pong_updates_latency(self, manager):
+        """测试pong更新RTT并产生延迟事件"""
+        events = []
+        manager.process_event = lambda evt: events.append((evt.type, evt.latency))
+        peer = _add_peer(manager)
+        manager.manual_update(manager.ping_interval)
+        time.sleep(0.02)
+
+        pong = NetPacket(0, PacketProperty.Pong)
+        pong.sequence = peer._ping_packet.sequence
+        peer.process_pong(pong)
+
+        assert events and events[-1][0] == NetEventType.ConnectionLatencyUpdated
+        assert peer.round_trip_time >= 20
+        assert events[-1][1] == peer.round_trip_time // 2
+
+    def test_ping_answered_with_pong(self, manager):
+        """测试收到ping回复pong"""
+        peer = _add_peer(manager)
+        ping = NetPacket(0, PacketProperty.Ping)
+        ping.sequence = 7
+        peer.process_ping(ping)
+        prop, data = manager.sent_raw[-1]
+        assert prop == PacketProperty.Pong
+        assert data[1:3] == (7).to_bytes(2, "little")
+        assert len(data) == PacketProperty.get_header_size(PacketProperty.Pong)
+
+
+class TestMtuDiscovery:
+    """测试定时轮驱动的MTU探测"""
+
+    def test_probes_until_attempts_exhausted(self, manager):
+        """测试每MTU_CHECK_DELAY发送探测包，次数用完后停止"""
+        probes = []
+        manager.send_raw_and_recycle = lambda packet, end_point, immediate=False: probes.append(packet.size)
+        manager.mtu_discovery = True
+        peer = _add_peer(manager)
+
+        for _ in range(NetPeer.MAX_MTU_CHECK_ATTEMPTS + 2):
+            manager.manual_update(NetPeer.MTU_CHECK_DELAY)
+
+        expected = NetConstants._possible_mtu[1] - manager.extra_packet_size_for_layer
+        assert probes == [expected] * (NetPeer.MAX_MTU_CHECK_ATTEMPTS - 1)
+        assert "mtu" not in manager._peer_timers[peer.id]
+
+    def test_mtu_ok_increases_mtu(self, manager):
+        """测试MtuOk提升MTU"""
+        manager.mtu_discovery = True
+        peer = _add_peer(manager)
+        new_mtu = NetConstants._possible_mtu[1] - manager.extra_packet_size_for_layer
+        ok = NetPacket(new_mtu)
+        ok.packet_property = PacketProperty.MtuOk
+        ok.raw_data[1:5] = new_mtu.to_bytes(4, "little")
+        ok.raw_data[new_mtu - 4:new_mtu] = new_mtu.to_bytes(4, "little")
+        peer.process_mtu_packet(ok)
+        assert peer.mtu == new_mtu
+
+    @pytest.mark.parametrize("case", ["short", "mismatch", "duplicate", "skipped", "valid"])
+    def test_dropped_mtu_packets_release_ring_buffer(self, manager, case):
+        """测试不转发的MTU包也会回收，批量接收的缓冲区归还ReceiveRing"""
+        manager.mtu_discovery = True
+        peer = _add_peer(manager)
+        ring = ReceiveRing(1, NetConstants.MaxPacketSize)
+        idx = ring.acquire()
+        size = {
+            "short": NetConstants._possible_mtu[0] - 1,
+            "duplicate": peer.mtu,
+            "skipped": NetConstants._possible_mtu[2] - manager.extra_packet_size_for_layer,
+        }.get(case, NetConstants._possible_mtu[1] - manager.extra_packet_size_for_layer)
+        data = ring.buffers[idx]
+        data[0] = PacketProperty.MtuOk
+        data[1:5] = size.to_bytes(4, "little")
+        data[size - 4:size] = (size + (case == "mismatch")).to_bytes(4, "little")
+
+        peer.process_mtu_packet(manager.pool_get_packet_from_buffer(ring.views[idx][:size], ring.release))
+        assert ring.free_count == 1
+        assert (peer.mtu == size) == (case in ("valid", "duplicate"))
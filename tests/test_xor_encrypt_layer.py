@@ -0,0 +1,80 @@
+"""
+XorEncryptLayer测试
+
+验证密钥流实现与逐字节XOR（C#实现）结果一致
+"""
+
+import os
+
+import pytest
+from litenetlib.constants import NetConstants
+from litenetlib.layers import XorEncryptLayer
+
+
+def _reference(key, data, offset, length):
+    """逐字节参考实现（与C#实现相同）"""
+    out = bytearray(data)
+    for i in range(length):
+        out[offset + i] ^= key[i % len(key)]
+    return out
+
+
+class TestXorEncryptLayer:
+    """测试XOR加密层"""
+
+    @pytest.mark.parametrize("key", [b"k", b"secret", os.urandom(17)])
+    @pytest.mark.parametrize("offset,length", [(0, 0), (0, 1), (3, 100), (1, 1431), (0, 1432)])
+    def test_matches_bytewise(self, key, offset, length):
+        """测试与逐字节XOR一致"""
+        data = bytearray(os.urandom(offset + length + 5))
+        expected = _reference(key, data, offset, length)
+        XorEncryptLayer(key).process_out_bound_packet(data, offset, length)
+        assert data == expected
+
+    def test_round_trip(self):
+        """测试加密后解密还原"""
+        layer = XorEncryptLayer(b"round-trip")
+        original = os.urandom(500)
+        data = bytearray(original)
+        layer.process_out_bound_packet(data, 0, len(data))
+        assert bytes(data) != original
+        assert layer.process_in_bound_packet(data, 0, len(data))
+        assert bytes(data) == original
+
+    def test_longer_than_key_stream(self):
+        """测试超过MTU长度的数据"""
+        key = b"abc"
+        length = NetConstants.MaxPacketSize * 3 + 1
+        data = bytearray(os.urandom(length))
+        expected = _reference(key, data, 0, length)
+        XorEncryptLayer(key).process_out_bound_packet(data, 0, length)
+        assert data == expected
+
+    def test_memoryview_in_place(self):
+        """测试memoryview原地修改"""
+        buffer = bytearray(b"\x00" * 8)
+        XorEncryptLayer(b"\x01\x02").process_out_bound_packet(memoryview(buffer), 2, 4)
+        assert buffer == bytearray(b"\x00\x00\x01\x02\x01\x02\x00\x00")
+
+    def test_empty_key(self):
+        """测试空密钥不修改数据"""
+        data = bytearray(b"data")
+        XorEncryptLayer(b"").process_out_bound_packet(data, 0, 4)
+        assert data == bytearray(b"data")
+
+    def test_key_cache(self):
+        """测试同一长度复用密钥流整数，缓存有上限且结果不变"""
+        key = os.urandom(7)
+        layer = XorEncryptLayer(key)
+        data = bytearray(os.urandom(100))
+        layer.process_out_bound_packet(bytearray(data), 0, 100)
+        cached = layer._key_ints[100]
+        layer.process_out_bound_packet(bytearray(data), 0, 100)
+        assert layer._key_ints[100] is cached
+
+        for length in range(1, XorEncryptLayer._KEY_CACHE_LIMIT * 2):
+            data = bytearray(os.urandom(length))
+            expected = _reference(key, data, 0, length)
+            layer.process_out_bound_packet(data, 0, length)
+            assert data == expected
+        assert len(layer._key_ints) <= XorEncryptLayer._KEY_CACHE_LIMIT
@@ -0,0 +1,132 @@
+"""
+零拷贝发送测试
+
+测试send_zero_copy生成只含包头、负载引用原缓冲区的分片，
+以及NetSocket.send_packet_buffers的scatter-gather发送
+"""
+
+import array
+import mmap
+
+import pytest
+from litenetlib import NetManager, EventBasedNetListener, DeliveryMethod, NetConstants
+from litenetlib.net_peer import NetPeer
+from litenetlib.packets import NetPacket
+
+
+@pytest.fixture
+def manager():
+    manager = NetManager(EventBasedNetListener())
+    manager.received = []
+    manager.create_receive_event = lambda packet, method, channel, header_size, peer: \
+        manager.received.append(bytes(packet.get_view(header_size)))
+    return manager
+
+
+@pytest.fixture
+def peer(manager):
+    return NetPeer(manager, ("127.0.0.1", 9050), 1)
+
+
+def _queued(peer, delivery_method=DeliveryMethod.ReliableOrdered):
+    channel = peer.create_channel(delivery_method)
+    packets = list(channel.outgoing_queue)
+    channel.outgoing_queue.clear()
+    return packets
+
+
+def _wire(packet):
+    """按发送时的布局拼出数据报"""
+    data = b"".join(packet.get_send_buffers())
+    received = NetPacket(len(data))
+    received.raw_data[:] = data
+    return received
+
+
+class TestZeroCopyFragments:
+    """测试零拷贝分片"""
+
+    def test_one_megabyte_not_copied(self, peer, manager):
+        """测试1MB消息的分片负载都是原缓冲区的切片"""
+        data = bytearray(i % 251 for i in range(1024 * 1024))
+        peer.send_zero_copy(memoryview(data), 0, DeliveryMethod.ReliableOrdered)
+        packets = _queued(peer)
+
+        assert len(packets) > 700
+        assert all(p.payload.obj is data for p in packets)
+        assert all(p.size == NetConstants.FragmentedHeaderTotalSize for p in packets)
+        assert all(len(p.raw_data) <= NetConstants.PacketPoolTinySize for p in packets)
+        assert all(p.total_size <= peer.mtu for p in packets)
+
+        for packet in packets:
+            packet.channel_id = DeliveryMethod.ReliableOrdered
+            peer.add_reliable_packet(DeliveryMethod.ReliableOrdered, _wire(packet))
+        assert manager.received == [bytes(data)]
+
+    @pytest.mark.parametrize("make", [
+        lambda raw: raw,
+        lambda raw: bytearray(raw),
+        lambda raw: array.array("I", raw),
+    ], ids=["bytes", "bytearray", "array"])
+    def test_buffer_protocol_objects(self, peer, manager, make):
+        """测试任意缓冲区对象"""
+        raw = bytes(range(256)) * 16
+        peer.send_zero_copy(make(raw), 0, DeliveryMethod.ReliableOrdered)
+        packets = _queued(peer)
+        assert b"".join(bytes(p.payload) for p in packets) == raw
+
+    def test_mmap(self, peer):
+        """测试mmap缓冲区"""
+        buffer = mmap.mmap(-1, 5000)
+        buffer.write(b"m" * 5000)
+        peer.send_zero_copy(buffer, 0, DeliveryMethod.ReliableOrdered)
+        packets = _queued(peer)
+        assert b"".join(bytes(p.payload) for p in packets) == b"m" * 5000
+        for packet in packets:
+            packet.payload.release()
+        buffer.close()
+
+    def test_small_message(self, peer):
+        """测试不分片的消息也只分配包头"""
+        data = b"hello"
+        peer.send_zero_copy(data, 0, DeliveryMethod.ReliableUnordered)
+        [packet] = _queued(peer, DeliveryMethod.ReliableUnordered)
+        assert packet.size == NetConstants.ChanneledHeaderSize
+        assert packet.payload.obj is data
+        assert packet.total_size == NetConstants.ChanneledHeaderSize + len(data)
+
+    def test_send_still_copies(self, peer):
+        """测试send仍然复制数据"""
+        peer.send(b"x" * 3000, 0, DeliveryMethod.ReliableOrdered)
+        assert all(p.payload is None for p in _queued(peer))
+
+    def test_recycle_drops_payload(self, peer, manager):
+        """测试回收后不再引用发送方缓冲区"""
+        peer.send_zero_copy(b"abc", 0, DeliveryMethod.ReliableOrdered)
+        [packet] = _queued(peer)
+        manager.pool_recycle(packet)
+        assert packet.payload is None
+
+    def test_resize_pinned_until_recycled(self, peer, manager):
+        """测试bytearray在包回收前不能调整大小"""
+        data = bytearray(3000)
+        peer.send_zero_copy(data, 0, DeliveryMethod.ReliableOrdered)
+        packets = _queued(peer)
+        with pytest.raises(BufferError):
+            data.extend(b"x")
+        for packet in packets:
+            manager.pool_recycle(packet)
+        data.extend(b"x")
+
+
+class TestSendPacketBuffers:
+    """测试scatter-gather发送"""
+
+    def test_loopback(self, net_socket, receiver):
+        """测试多个缓冲区作为一个数据报发出"""
+        packet = NetPacket(NetConstants.ChanneledHeaderSize)
+        packet.payload = memoryview(b"payload")
+        sent = net_socket.send_packet_buffers(packet.get_send_buffers(), receiver.getsockname())
+        assert sent == packet.total_size
+        data, _ = receiver.recvfrom(2048)
+        assert data == bytes(NetConstants.ChanneledHeaderSize) + b"payload"